@@ -350,8 +350,7 @@ class EofWrapper:
     def _validate_eof(self, container: Container, metrics: bool = True) -> bool:
         eof_parse = EOFParse()
 
-        result = eof_parse.run(input_value=to_hex(container))
-        actual_message = result.stdout.strip()
+        actual_message = eof_parse.validate(Bytes(container), fork=EOFv1)
         if "OK" not in actual_message:
             if metrics:
                 _inc_counter(
@@ -1,7 +1,7 @@
 """Local pytest configuration used on multiple framework tests."""
 
 import os
-from typing import Dict, Generator
+from typing import Dict, Generator, List
 
 import pytest
 
@@ -9,6 +9,8 @@ from ethereum_clis import BesuTransitionTool, ExecutionSpecsTransitionTool, Tran
 
 DEFAULT_TRANSITION_TOOL_FOR_UNIT_TESTS = ExecutionSpecsTransitionTool
 
+RUN_FRAMEWORK_BENCHMARKS_ENV_VAR = "RUN_FRAMEWORK_BENCHMARKS"
+
 INSTALLED_TRANSITION_TOOLS = [
     transition_tool
     for transition_tool in TransitionTool.registered_tools
@@ -21,6 +23,31 @@ INSTALLED_TRANSITION_TOOLS = [
 ]
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the marker of the framework benchmarks."""
+    config.addinivalue_line(
+        "markers",
+        "framework_benchmark: benchmark of the framework that prints its timings, only "
+        f"run if the {RUN_FRAMEWORK_BENCHMARKS_ENV_VAR} environment variable is set",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Skip the framework benchmarks unless they are requested: their timings
+    are only meaningful without other tests running in parallel.
+    """
+    del config
+    if RUN_FRAMEWORK_BENCHMARKS_ENV_VAR in os.environ:
+        return
+    skip_benchmark = pytest.mark.skip(
+        reason=f"set {RUN_FRAMEWORK_BENCHMARKS_ENV_VAR}=1 to run the framework benchmarks"
+    )
+    for item in items:
+        if item.get_closest_marker("framework_benchmark") is not None:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(scope="session")
 def installed_transition_tool_instances() -> Generator[
     Dict[str, TransitionTool | Exception], None, None
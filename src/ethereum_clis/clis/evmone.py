@@ -13,7 +13,7 @@ from typing import Any, ClassVar, Dict, List, Optional
 
 import pytest
 
-from ethereum_clis.file_utils import dump_files_to_directory
+from ethereum_clis.file_utils import dump_files_to_directory, single_fixture_file
 from ethereum_clis.fixture_consumer_tool import FixtureConsumerTool
 from ethereum_test_exceptions import (
     EOFException,
@@ -143,6 +143,14 @@ class EvmoneFixtureConsumerCommon:
         function is cached in order to only call the command once and
         `consume_test` can simply select the result that was requested.
         """
+        return self._run_test_command(fixture_path, debug_output_path=debug_output_path)
+
+    def _run_test_command(
+        self,
+        fixture_path: Path,
+        debug_output_path: Optional[Path] = None,
+    ) -> Dict[str, Any]:
+        """Run `evmone-...test` on a file and return the parsed results."""
         global_options: List[str] = []
         if debug_output_path:
             global_options += ["--trace"]
@@ -189,11 +197,20 @@ class EvmoneFixtureConsumerCommon:
 
         Uses the cached result from `consume_test_file` in order to not
         call the command every time an select a single result from there.
+
+        If debug output is requested, only the selected fixture is executed,
+        from a file of its own, so that the traces only contain this fixture.
         """
-        file_results = self.consume_test_file(
-            fixture_path=fixture_path,
-            debug_output_path=debug_output_path,
-        )
+        if fixture_name and debug_output_path:
+            with single_fixture_file(fixture_path, fixture_name) as single_fixture_path:
+                file_results = self._run_test_command(
+                    single_fixture_path, debug_output_path=debug_output_path
+                )
+        else:
+            file_results = self.consume_test_file(
+                fixture_path=fixture_path,
+                debug_output_path=debug_output_path,
+            )
         assert len(file_results["testsuites"]) < 2, f"Multiple testsuites for {fixture_name}"
         assert len(file_results["testsuites"]) == 1, f"testsuite for {fixture_name} missing"
         test_suite = file_results["testsuites"][0]["testsuite"]
@@ -20,6 +20,7 @@ from ethereum_test_fixtures import BlockchainFixture, FixtureFormat, StateFixtur
 from ethereum_test_forks import Fork
 
 from ..ethereum_cli import EthereumCLI
+from ..file_utils import single_fixture_file
 from ..fixture_consumer_tool import FixtureConsumerTool
 from ..transition_tool import TransitionTool, dump_files_to_directory
 
@@ -229,18 +230,13 @@ class GethFixtureConsumer(
 ):
     """Geth's implementation of the fixture consumer."""
 
-    def consume_blockchain_test(
+    def _blockchain_test_command(
         self,
         fixture_path: Path,
         fixture_name: Optional[str] = None,
         debug_output_path: Optional[Path] = None,
-    ) -> None:
-        """
-        Consume a single blockchain test.
-
-        The `evm blocktest` command takes the `--run` argument which can be
-        used to select a specific fixture from the fixture file when executing.
-        """
+    ) -> List[str]:
+        """Build the `evm blocktest` command."""
         subcommand = "blocktest"
         global_options = []
         subcommand_options = []
@@ -251,7 +247,7 @@ class GethFixtureConsumer(
         if fixture_name:
             subcommand_options += ["--run", re.escape(fixture_name)]
 
-        command = (
+        return (
             [str(self.binary)]
             + global_options
             + [subcommand]
@@ -259,6 +255,13 @@ class GethFixtureConsumer(
             + [str(fixture_path)]
         )
 
+    def _run_blockchain_test_command(
+        self,
+        command: List[str],
+        fixture_path: Path,
+        debug_output_path: Optional[Path] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run an `evm blocktest` command and return the parsed results."""
         result = self._run_command(command)
 
         if debug_output_path:
@@ -272,6 +275,52 @@ class GethFixtureConsumer(
         result_json = json.loads(result.stdout)
         if not isinstance(result_json, list):
             raise Exception(f"Unexpected result from evm blocktest: {result_json}")
+        return result_json
+
+    @cache  # noqa
+    def consume_blockchain_test_file(
+        self,
+        fixture_path: Path,
+    ) -> List[Dict[str, Any]]:
+        """
+        Consume an entire blockchain test file.
+
+        The result is cached so that all fixtures of a file (e.g. a batch of
+        fixtures read from stdin) are executed with a single `evm blocktest`
+        call and `consume_blockchain_test` can select the requested result.
+        """
+        command = self._blockchain_test_command(fixture_path)
+        return self._run_blockchain_test_command(command, fixture_path)
+
+    def consume_blockchain_test(
+        self,
+        fixture_path: Path,
+        fixture_name: Optional[str] = None,
+        debug_output_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Consume a single blockchain test.
+
+        If debug output is requested, the `evm blocktest` command is executed
+        with the `--run` argument, which selects the specific fixture from the
+        fixture file, so that the traces only contain this fixture. Otherwise,
+        the cached result of the whole file from `consume_blockchain_test_file`
+        is used.
+        """
+        if fixture_name and not debug_output_path:
+            file_results = self.consume_blockchain_test_file(fixture_path=fixture_path)
+            result_json = [
+                test_result for test_result in file_results if test_result["name"] == fixture_name
+            ]
+            assert len(result_json) < 2, f"Multiple test results for {fixture_name}"
+            assert len(result_json) == 1, f"Test result for {fixture_name} missing"
+        else:
+            command = self._blockchain_test_command(
+                fixture_path, fixture_name=fixture_name, debug_output_path=debug_output_path
+            )
+            result_json = self._run_blockchain_test_command(
+                command, fixture_path, debug_output_path=debug_output_path
+            )
 
         if any(not test_result["pass"] for test_result in result_json):
             exception_text = "Blockchain test failed: \n" + "\n".join(
@@ -281,20 +330,12 @@ class GethFixtureConsumer(
             )
             raise Exception(exception_text)
 
-    @cache  # noqa
-    def consume_state_test_file(
+    def _run_state_test_command(
         self,
         fixture_path: Path,
         debug_output_path: Optional[Path] = None,
     ) -> List[Dict[str, Any]]:
-        """
-        Consume an entire state test file.
-
-        The `evm statetest` will always execute all the tests contained in a
-        file without the possibility of selecting a single test, so this
-        function is cached in order to only call the command once and
-        `consume_state_test` can simply select the result that was requested.
-        """
+        """Run `evm statetest` on a file and return the parsed results."""
         subcommand = "statetest"
         global_options: List[str] = []
         subcommand_options: List[str] = []
@@ -324,6 +365,22 @@ class GethFixtureConsumer(
             raise Exception(f"Unexpected result from evm statetest: {result_json}")
         return result_json
 
+    @cache  # noqa
+    def consume_state_test_file(
+        self,
+        fixture_path: Path,
+        debug_output_path: Optional[Path] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Consume an entire state test file.
+
+        The `evm statetest` will always execute all the tests contained in a
+        file without the possibility of selecting a single test, so this
+        function is cached in order to only call the command once and
+        `consume_state_test` can simply select the result that was requested.
+        """
+        return self._run_state_test_command(fixture_path, debug_output_path=debug_output_path)
+
     def consume_state_test(
         self,
         fixture_path: Path,
@@ -335,11 +392,20 @@ class GethFixtureConsumer(
 
         Uses the cached result from `consume_state_test_file` in order to not
         call the command every time an select a single result from there.
+
+        If debug output is requested, only the selected fixture is executed,
+        from a file of its own, so that the traces only contain this fixture.
         """
-        file_results = self.consume_state_test_file(
-            fixture_path=fixture_path,
-            debug_output_path=debug_output_path,
-        )
+        if fixture_name and debug_output_path:
+            with single_fixture_file(fixture_path, fixture_name) as single_fixture_path:
+                file_results = self._run_state_test_command(
+                    single_fixture_path, debug_output_path=debug_output_path
+                )
+        else:
+            file_results = self.consume_state_test_file(
+                fixture_path=fixture_path,
+                debug_output_path=debug_output_path,
+            )
         if fixture_name:
             test_result = [
                 test_result for test_result in file_results if test_result["name"] == fixture_name
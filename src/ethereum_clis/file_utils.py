@@ -2,8 +2,11 @@
 
 import os
 import stat
-from json import dump
-from typing import Any, Dict
+import tempfile
+from contextlib import contextmanager
+from json import dump, load
+from pathlib import Path
+from typing import Any, Dict, Generator
 
 from pydantic import BaseModel, RootModel
 
@@ -45,3 +48,18 @@ def dump_files_to_directory(output_path: str, files: Dict[str, Any]) -> None:
             if "x" in flags:
                 file_mode |= stat.S_IEXEC
             os.chmod(file_path, file_mode)
+
+
+@contextmanager
+def single_fixture_file(fixture_path: Path, fixture_name: str) -> Generator[Path, None, None]:
+    """
+    Write the fixture with the given name to a temporary file of its own, so
+    that a tool that runs every fixture of a file (e.g. a batch of fixtures
+    read from stdin) only runs this one.
+    """
+    with open(fixture_path) as f:
+        fixtures = load(f)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / fixture_path.name
+        write_json_file({fixture_name: fixtures[fixture_name]}, str(path))
+        yield path
@@ -0,0 +1,55 @@
+"""Test the fixture consumers that run whole fixture files."""
+
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+from ethereum_clis.clis.geth import GethFixtureConsumer
+from ethereum_test_fixtures import StateFixture
+
+# Mimics `evm statetest`: passes every fixture of the file given as last
+# argument and logs the fixtures it ran.
+FAKE_EVM = """\
+import json
+import sys
+
+with open(sys.argv[-1]) as f:
+    names = list(json.load(f))
+with open(sys.argv[1], "a") as log:
+    log.write(",".join(names) + "\\n")
+print(json.dumps([{"name": name, "pass": True} for name in names]))
+"""
+
+
+def test_geth_state_test_traces_single_fixture(tmp_path: Path) -> None:
+    """
+    Test that a batch of fixtures is run once, and only the selected fixture
+    of the batch is run when traces are dumped.
+    """
+    script = tmp_path / "evm.py"
+    script.write_text(FAKE_EVM)
+    log_path = tmp_path / "evm.log"
+    binary = tmp_path / "evm"
+    binary.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "{log_path}" "$@"\n')
+    binary.chmod(0o755)
+    fixture_path = tmp_path / "batch.json"
+    names = [f"test_{i}" for i in range(3)]
+    fixture_path.write_text(json.dumps({name: {} for name in names}))
+
+    def runs() -> List[str]:
+        return log_path.read_text().splitlines() if log_path.exists() else []
+
+    consumer = GethFixtureConsumer(binary=binary)
+    for name in names:
+        consumer.consume_fixture(StateFixture, fixture_path, fixture_name=name)
+    assert runs() == [",".join(names)]
+
+    log_path.unlink()
+    for name in names:
+        dump_dir = tmp_path / "dump" / name
+        consumer.consume_fixture(
+            StateFixture, fixture_path, fixture_name=name, debug_output_path=dump_dir
+        )
+        assert list(json.loads((dump_dir / "fixtures.json").read_text())) == [name]
+    assert runs() == names
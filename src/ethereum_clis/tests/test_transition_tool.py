@@ -2,6 +2,7 @@
 
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Type
 
@@ -15,6 +16,8 @@ from ethereum_clis import (
     NimbusTransitionTool,
     TransitionTool,
 )
+from ethereum_clis.transition_tool import get_valid_transition_tool_names
+from ethereum_test_forks import Osaka, get_development_forks, get_forks
 
 
 def test_default_tool() -> None:
@@ -87,3 +90,42 @@ def test_unknown_binary_path() -> None:
     """
     with pytest.raises(CLINotFoundInPathError):
         TransitionTool.from_binary_path(binary_path=Path("unknown_binary_path"))
+
+
+def test_valid_transition_tool_names() -> None:
+    """
+    Test that the cached transition tool fork names are the names of all
+    forks.
+    """
+    valid_names = {fork.transition_tool_name() for fork in get_forks() + get_development_forks()}
+    assert get_valid_transition_tool_names() == valid_names
+    assert Osaka.transition_tool_name() in get_valid_transition_tool_names()
+
+
+@pytest.mark.framework_benchmark
+def test_valid_transition_tool_names_benchmark() -> None:
+    """
+    Benchmark the validation of the transition tool fork name of every t8n
+    call against computing the valid names on every call.
+    """
+    fork_name = Osaka.transition_tool_name()
+    calls = 1_000
+
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        valid_names = {
+            fork.transition_tool_name() for fork in get_forks() + get_development_forks()
+        }
+        assert fork_name in valid_names
+    uncached_duration = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        assert fork_name in get_valid_transition_tool_names()
+    cached_duration = time.perf_counter() - start_time
+
+    print(
+        f"Transition tool fork name validation per call: "
+        f"{1e6 * uncached_duration / calls:.2f}us uncached, "
+        f"{1e6 * cached_duration / calls:.2f}us cached"
+    )
@@ -10,7 +10,17 @@ import time
 from abc import abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, LiteralString, Mapping, Optional, Type
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    LiteralString,
+    Mapping,
+    Optional,
+    Type,
+)
 from urllib.parse import urlencode
 
 from requests import Response
@@ -22,7 +32,7 @@ from ethereum_test_base_types import BlobSchedule
 from ethereum_test_base_types.composite_types import ForkBlobSchedule
 from ethereum_test_exceptions import ExceptionMapper
 from ethereum_test_forks import Fork
-from ethereum_test_forks.helpers import get_development_forks, get_forks
+from ethereum_test_forks.helpers import get_transition_tool_fork_names
 from ethereum_test_types import Alloc, Environment, Transaction
 
 from .cli_types import (
@@ -46,12 +56,14 @@ NORMAL_SERVER_TIMEOUT = 600
 SLOW_REQUEST_TIMEOUT = 600
 
 
-def get_valid_transition_tool_names() -> set[str]:
+VALID_TRANSITION_TOOL_NAMES = frozenset(get_transition_tool_fork_names().values())
+
+
+def get_valid_transition_tool_names() -> FrozenSet[str]:
     """
     Get all valid transition tool names from deployed and development forks.
     """
-    all_available_forks = get_forks() + get_development_forks()
-    return {fork.transition_tool_name() for fork in all_available_forks}
+    return VALID_TRANSITION_TOOL_NAMES
 
 
 class TransitionTool(EthereumCLI):
@@ -560,8 +572,7 @@ class TransitionTool(EthereumCLI):
         """Safely construct t8n arguments with validated inputs."""
         # Validate fork name against actual transition tool names from all
         # available forks
-        valid_forks = get_valid_transition_tool_names()
-        if fork_name not in valid_forks:
+        if fork_name not in VALID_TRANSITION_TOOL_NAMES:
             raise ValueError(f"Invalid fork name: {fork_name}")
 
         # Validate chain ID (should be positive integer)
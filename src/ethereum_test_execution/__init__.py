@@ -1,13 +1,19 @@
 """Ethereum test execution package."""
 
 from .base import BaseExecute, ExecuteFormat, LabeledExecuteFormat
+from .benchmark_metrics import BENCHMARK_METRICS_PROPERTY, BenchmarkMetrics, BlockMetrics
 from .blob_transaction import BlobTransaction
+from .post_state import PostStateVerifier
 from .transaction_post import TransactionPost
 
 __all__ = [
+    "BENCHMARK_METRICS_PROPERTY",
     "BaseExecute",
+    "BenchmarkMetrics",
+    "BlockMetrics",
     "ExecuteFormat",
     "BlobTransaction",
     "LabeledExecuteFormat",
+    "PostStateVerifier",
     "TransactionPost",
 ]
@@ -39,8 +39,12 @@ class BaseExecute(CamelModel):
         eth_rpc: EthRPC,
         engine_rpc: EngineRPC | None,
         request: FixtureRequest,
+        collect_benchmark_metrics: bool = False,
     ) -> None:
-        """Execute the format."""
+        """
+        Execute the format, recording the client throughput of the benchmark
+        blocks in the user properties of the test if requested.
+        """
         pass
 
 
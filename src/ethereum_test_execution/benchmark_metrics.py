@@ -0,0 +1,138 @@
+"""Client throughput metrics of the blocks of an executed benchmark test."""
+
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from typing import Any, Dict, List
+
+import requests
+
+from ethereum_test_base_types import Hash
+from ethereum_test_rpc import EthRPC, Web3RPC
+from ethereum_test_rpc.rpc_types import JSONRPCError
+
+BENCHMARK_METRICS_PROPERTY = "benchmark_metrics"
+
+
+@cache
+def client_version(url: str) -> str:
+    """Return the `web3_clientVersion` of the client at the URL, if known."""
+    try:
+        return Web3RPC(url).client_version()
+    except (JSONRPCError, requests.RequestException):
+        return "unknown"
+
+
+@dataclass(kw_only=True)
+class BlockMetrics:
+    """Metrics of a block that includes transactions of a benchmark test."""
+
+    number: int
+    hash: str
+    gas_used: int
+    transaction_count: int
+    timestamp: int
+    block_time: int
+    new_payload_latency: float | None = None
+
+
+@dataclass(kw_only=True)
+class BenchmarkMetrics:
+    """Throughput metrics of the blocks of a benchmark test."""
+
+    test_id: str
+    client: str
+    gas_benchmark_value: int | None = None
+    blocks: List[BlockMetrics] = field(default_factory=list)
+
+    @property
+    def gas_used(self) -> int:
+        """Return the gas used by all the blocks."""
+        return sum(block.gas_used for block in self.blocks)
+
+    @property
+    def transaction_count(self) -> int:
+        """Return the number of transactions of all the blocks."""
+        return sum(block.transaction_count for block in self.blocks)
+
+    @property
+    def new_payload_time(self) -> float | None:
+        """
+        Return the total `engine_newPayload` latency of the blocks, or None
+        if it is not known for all of them.
+        """
+        latencies = [block.new_payload_latency for block in self.blocks]
+        if not latencies or any(latency is None for latency in latencies):
+            return None
+        return sum(latency for latency in latencies if latency is not None)
+
+    @property
+    def mgas_per_second(self) -> float | None:
+        """Return the Mgas/s estimate from the `engine_newPayload` latency."""
+        new_payload_time = self.new_payload_time
+        if not new_payload_time:
+            return None
+        return self.gas_used / new_payload_time / 1e6
+
+    @property
+    def block_time_mgas_per_second(self) -> float | None:
+        """
+        Return the Mgas/s estimate from the block timestamps, which is only
+        meaningful on networks where the block time is driven by the client.
+        """
+        block_time = sum(block.block_time for block in self.blocks)
+        if not block_time:
+            return None
+        return self.gas_used / block_time / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkMetrics":
+        """Return the metrics from a dictionary created by `to_dict`."""
+        data = dict(data)
+        blocks = [BlockMetrics(**block) for block in data.pop("blocks")]
+        return cls(**data, blocks=blocks)
+
+    @classmethod
+    def collect(
+        cls,
+        eth_rpc: EthRPC,
+        receipts: List[Dict[str, Any]],
+        *,
+        test_id: str,
+        gas_benchmark_value: int | None = None,
+    ) -> "BenchmarkMetrics":
+        """
+        Collect the metrics of the blocks that include the transactions of
+        the receipts, using a single batch request for the blocks and their
+        parents.
+        """
+        block_numbers = sorted({int(receipt["blockNumber"], 16) for receipt in receipts})
+        requested = sorted(set(block_numbers) | {number - 1 for number in block_numbers} - {-1})
+        blocks = dict(zip(requested, eth_rpc.get_blocks_by_number(requested), strict=True))
+        metrics = cls(
+            test_id=test_id,
+            client=client_version(eth_rpc.url),
+            gas_benchmark_value=gas_benchmark_value,
+        )
+        for number in block_numbers:
+            block = blocks[number]
+            assert block is not None, f"Failed to get block {number}"
+            parent = blocks.get(number - 1)
+            timestamp = int(block["timestamp"], 16)
+            metrics.blocks.append(
+                BlockMetrics(
+                    number=number,
+                    hash=block["hash"],
+                    gas_used=int(block["gasUsed"], 16),
+                    transaction_count=len(block["transactions"]),
+                    timestamp=timestamp,
+                    block_time=(
+                        timestamp - int(parent["timestamp"], 16) if parent is not None else 0
+                    ),
+                    new_payload_latency=eth_rpc.block_import_latency(Hash(block["hash"])),
+                )
+            )
+        return metrics
@@ -68,8 +68,10 @@ class BlobTransaction(BaseExecute):
         eth_rpc: EthRPC,
         engine_rpc: EngineRPC | None,
         request: FixtureRequest,
+        collect_benchmark_metrics: bool = False,
     ) -> None:
         """Execute the format."""
+        del collect_benchmark_metrics
         assert engine_rpc is not None, "Engine RPC is required for this format."
         versioned_hashes: Dict[Hash, BlobAndProofV1 | BlobAndProofV2] = {}
         sent_txs: List[Transaction] = []
@@ -0,0 +1,163 @@
+"""Post-state verification of an `Alloc` against a remote client."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from ethereum_test_base_types import Account, Address, Alloc, Bytes, Hash
+from ethereum_test_rpc import EthRPC
+from ethereum_test_rpc.rpc_types import JSONRPCError
+
+EMPTY_CODE_HASH = Bytes(b"").keccak256()
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(kw_only=True)
+class AccountState:
+    """The state of an account as fetched from the client."""
+
+    balance: int
+    nonce: int
+    code: Bytes
+    storage: Dict[int, Hash] = field(default_factory=dict)
+
+
+class PostStateVerifier:
+    """
+    Verify the expected post-state of a test against the state of a client.
+
+    The balance, nonce, code hash and all expected storage slots of each
+    account are fetched with a single `eth_getProof` request, and the code is
+    only requested when its hash does not match the expected code. If the
+    client does not support `eth_getProof`, the values are fetched with a
+    single batch of individual requests per account.
+
+    Accounts are fetched concurrently by a bounded pool of workers, while the
+    checks are performed in the order of the expected post-state, so the
+    first reported mismatch does not depend on the order of the responses.
+    """
+
+    eth_rpc: EthRPC
+    max_workers: int
+    use_proofs: bool
+
+    def __init__(self, eth_rpc: EthRPC, *, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initialize the verifier."""
+        self.eth_rpc = eth_rpc
+        self.max_workers = max_workers
+        self.use_proofs = True
+
+    def verify(self, post: Alloc) -> None:
+        """
+        Verify the post-state at the current block of the client.
+        Raises an assertion error on the first unexpected value.
+        """
+        if not post.root:
+            return
+        block_number = self.eth_rpc.block_number()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures: List[Future[AccountState]] = [
+                executor.submit(self.fetch_account, address, account, block_number)
+                for address, account in post.root.items()
+            ]
+            for (address, account), future in zip(post.root.items(), futures, strict=True):
+                self.check_account(address, account, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_account(
+        self, address: Address, account: Account | None, block_number: int
+    ) -> AccountState:
+        """Fetch the state of an account required to check it."""
+        storage_keys: List[Hash] = []
+        if account is not None and "storage" in account.model_fields_set:
+            storage_keys = [Hash(key) for key in account.storage.keys()]
+        if self.use_proofs:
+            try:
+                return self.fetch_account_proof(address, account, storage_keys, block_number)
+            except JSONRPCError:
+                # Fall back to individual requests for the rest of the session.
+                self.use_proofs = False
+        return self.fetch_account_batch(address, storage_keys, block_number)
+
+    def fetch_account_proof(
+        self,
+        address: Address,
+        account: Account | None,
+        storage_keys: List[Hash],
+        block_number: int,
+    ) -> AccountState:
+        """Fetch the state of an account using `eth_getProof`."""
+        proof = self.eth_rpc.get_proof(address, storage_keys, block_number)
+        expected_code = Bytes(b"") if account is None else account.code
+        code_checked = account is None or "code" in account.model_fields_set
+        if proof.code_hash in (EMPTY_CODE_HASH, Hash(0)):
+            code = Bytes(b"")
+        elif proof.code_hash == expected_code.keccak256() or not code_checked:
+            # The actual code is only needed to report a mismatch.
+            code = expected_code
+        else:
+            code = self.eth_rpc.get_code(address, block_number)
+        return AccountState(
+            balance=int(proof.balance),
+            nonce=int(proof.nonce),
+            code=code,
+            storage={
+                int(storage_proof.key): Hash(int(storage_proof.value))
+                for storage_proof in proof.storage_proof
+            },
+        )
+
+    def fetch_account_batch(
+        self, address: Address, storage_keys: List[Hash], block_number: int
+    ) -> AccountState:
+        """Fetch the state of an account using a batch of requests."""
+        block = hex(block_number)
+        results = self.eth_rpc.post_batch_request(
+            calls=[
+                ("getBalance", [f"{address}", block]),
+                ("getCode", [f"{address}", block]),
+                ("getTransactionCount", [f"{address}", block]),
+            ]
+            + [("getStorageAt", [f"{address}", f"{key}", block]) for key in storage_keys]
+        )
+        for result in results:
+            if isinstance(result, JSONRPCError):
+                raise result
+        balance, code, nonce, *storage_values = results
+        return AccountState(
+            balance=int(balance, 16),
+            nonce=int(nonce, 16),
+            code=Bytes(code),
+            storage={
+                int.from_bytes(key): Hash(value)
+                for key, value in zip(storage_keys, storage_values, strict=True)
+            },
+        )
+
+    @staticmethod
+    def check_account(address: Address, account: Account | None, state: AccountState) -> None:
+        """Check the fetched state of an account against the expected one."""
+        balance, code, nonce = state.balance, state.code, state.nonce
+        if account is None:
+            assert balance == 0, f"Balance of {address} is {balance}, expected 0."
+            assert code == b"", f"Code of {address} is {code}, expected 0x."
+            assert nonce == 0, f"Nonce of {address} is {nonce}, expected 0."
+            return
+        if "balance" in account.model_fields_set:
+            assert balance == account.balance, (
+                f"Balance of {address} is {balance}, expected {account.balance}."
+            )
+        if "code" in account.model_fields_set:
+            assert code == account.code, f"Code of {address} is {code}, expected {account.code}."
+        if "nonce" in account.model_fields_set:
+            assert nonce == account.nonce, (
+                f"Nonce of {address} is {nonce}, expected {account.nonce}."
+            )
+        if "storage" in account.model_fields_set:
+            for key, value in account.storage.items():
+                storage_value = state.storage[int(key)]
+                assert storage_value == value, (
+                    f"Storage value at {key} of {address} is {storage_value},expected {value}."
+                )
@@ -0,0 +1 @@
+"""Unit tests for the `ethereum_test_execution` package."""
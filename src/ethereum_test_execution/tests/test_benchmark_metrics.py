@@ -0,0 +1,77 @@
+"""Test the collection of the client throughput metrics of benchmarks."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Hash
+from ethereum_test_rpc import EthRPC
+
+from .. import benchmark_metrics
+from ..benchmark_metrics import BenchmarkMetrics
+
+
+class FakeChain(EthRPC):
+    """Chain with one block per second and known import latencies."""
+
+    def __init__(self, latencies: Dict[int, float]):
+        """Initialize the chain with the import latency of some blocks."""
+        super().__init__("http://localhost")
+        self.latencies = latencies
+        self.requested: List[List[int]] = []
+
+    def get_blocks_by_number(
+        self, block_numbers: List[int], full_txs: bool = False
+    ) -> List[Any | None]:
+        """Return blocks using 10M gas per transaction."""
+        assert not full_txs
+        self.requested.append(block_numbers)
+        return [
+            {
+                "hash": str(Hash(number)),
+                "gasUsed": hex(number * 10_000_000),
+                "timestamp": hex(number * 2),
+                "transactions": [str(Hash(i)) for i in range(number)],
+            }
+            for number in block_numbers
+        ]
+
+    def block_import_latency(self, block_hash: Hash) -> float | None:
+        """Return the import latency of the block, if known."""
+        return self.latencies.get(int.from_bytes(block_hash))
+
+
+@pytest.fixture(autouse=True)
+def client_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Avoid requesting the client version."""
+    monkeypatch.setattr(benchmark_metrics, "client_version", lambda _: "client/v1")
+
+
+def receipts(*block_numbers: int) -> List[Dict[str, Any]]:
+    """Create receipts of transactions included in the blocks."""
+    return [{"blockNumber": hex(number), "gasUsed": "0x5208"} for number in block_numbers]
+
+
+def test_collect() -> None:
+    """Test that the blocks and their parents are requested in one batch."""
+    chain = FakeChain({2: 0.1, 3: 0.4})
+    metrics = BenchmarkMetrics.collect(
+        chain, receipts(3, 2, 3), test_id="test_a", gas_benchmark_value=60_000_000
+    )
+    assert chain.requested == [[1, 2, 3]]
+    assert [block.number for block in metrics.blocks] == [2, 3]
+    assert metrics.client == "client/v1"
+    assert metrics.gas_used == 50_000_000
+    assert metrics.transaction_count == 5
+    assert metrics.new_payload_time == pytest.approx(0.5)
+    assert metrics.mgas_per_second == pytest.approx(100)
+    assert metrics.block_time_mgas_per_second == pytest.approx(12.5)
+    assert BenchmarkMetrics.from_dict(metrics.to_dict()) == metrics
+
+
+def test_collect_unknown_latency() -> None:
+    """Test that the newPayload estimate requires the latency of all blocks."""
+    metrics = BenchmarkMetrics.collect(FakeChain({2: 0.1}), receipts(2, 3), test_id="test_a")
+    assert metrics.new_payload_time is None
+    assert metrics.mgas_per_second is None
+    assert metrics.block_time_mgas_per_second is not None
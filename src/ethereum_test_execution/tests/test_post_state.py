@@ -0,0 +1,153 @@
+"""Test the post-state verification of the execute formats."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Account, Address, Alloc, Bytes, Hash, HashInt
+from ethereum_test_rpc import EthRPC
+from ethereum_test_rpc.tests.helpers import FakeJSONRPCServer
+
+from ..post_state import PostStateVerifier
+
+
+class FakeState(FakeJSONRPCServer):
+    """In-memory state that answers the JSON-RPC state requests."""
+
+    def __init__(self, alloc: Alloc, *, supports_proofs: bool = True):
+        """Initialize the state with the given allocation."""
+        self.alloc = alloc
+        self.supports_proofs = supports_proofs
+        self.requests: List[str] = []
+
+    def account(self, address: str) -> Account:
+        """Return the account at the address, or an empty account."""
+        account = self.alloc.root.get(Address(address))
+        return account if account is not None else Account()
+
+    def handle(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Answer a single request."""
+        self.requests.append(method)
+        if method == "eth_blockNumber":
+            return {"result": "0x10"}
+        account = self.account(params[0])
+        if method == "eth_getProof":
+            if not self.supports_proofs:
+                return {"error": {"code": -32601, "message": "method not found"}}
+            return {
+                "result": {
+                    "address": params[0],
+                    "balance": hex(account.balance),
+                    "codeHash": str(account.code.keccak256()),
+                    "nonce": hex(account.nonce),
+                    "storageHash": str(Hash(0)),
+                    "accountProof": [],
+                    "storageProof": [
+                        {
+                            "key": key,
+                            "value": hex(account.storage.root.get(HashInt(int(key, 16)), 0)),
+                            "proof": [],
+                        }
+                        for key in params[1]
+                    ],
+                }
+            }
+        if method == "eth_getBalance":
+            return {"result": hex(account.balance)}
+        if method == "eth_getCode":
+            return {"result": account.code.hex()}
+        if method == "eth_getTransactionCount":
+            return {"result": hex(account.nonce)}
+        if method == "eth_getStorageAt":
+            return {"result": str(Hash(account.storage.root.get(HashInt(int(params[1], 16)), 0)))}
+        raise Exception(f"Unexpected method {method}")
+
+
+CODE = Bytes(b"\x60\x00\x60\x00\x55")
+
+STATE = Alloc(
+    {
+        Address(0x100): Account(balance=10, nonce=1, code=CODE, storage={1: 2, 3: 4}),
+        Address(0x200): Account(balance=5),
+    }
+)
+
+
+def make_verifier(state: FakeState) -> PostStateVerifier:
+    """Create a verifier connected to the fake state."""
+    eth_rpc = EthRPC("http://localhost")
+    state.connect(eth_rpc)
+    return PostStateVerifier(eth_rpc, max_workers=2)
+
+
+@pytest.mark.parametrize("supports_proofs", [True, False])
+def test_verify_matching_post(supports_proofs: bool) -> None:
+    """Test that a matching post-state is verified with the expected calls."""
+    state = FakeState(STATE, supports_proofs=supports_proofs)
+    verifier = make_verifier(state)
+    verifier.verify(
+        Alloc(
+            {
+                Address(0x100): Account(balance=10, nonce=1, code=CODE, storage={1: 2, 3: 4}),
+                Address(0x200): Account(balance=5),
+                Address(0x300): Account.NONEXISTENT,
+            }
+        )
+    )
+    if supports_proofs:
+        assert state.requests.count("eth_getProof") == 3
+        assert "eth_getCode" not in state.requests
+        assert "eth_getStorageAt" not in state.requests
+    else:
+        assert verifier.use_proofs is False
+        assert state.requests.count("eth_getStorageAt") == 2
+
+
+@pytest.mark.parametrize("supports_proofs", [True, False])
+@pytest.mark.parametrize(
+    "post,message",
+    [
+        pytest.param(
+            {Address(0x100): Account(balance=11)},
+            f"Balance of {Address(0x100)} is 10, expected 0x0b.",
+            id="balance",
+        ),
+        pytest.param(
+            {Address(0x100): Account(nonce=2)},
+            f"Nonce of {Address(0x100)} is 1, expected 0x02.",
+            id="nonce",
+        ),
+        pytest.param(
+            {Address(0x100): Account(code=b"\x00")},
+            f"Code of {Address(0x100)} is {CODE}, expected 0x00.",
+            id="code",
+        ),
+        pytest.param(
+            {Address(0x100): Account(storage={3: 5})},
+            f"Storage value at 0x03 of {Address(0x100)} is {Hash(4)},expected 0x05.",
+            id="storage",
+        ),
+        pytest.param(
+            {Address(0x200): Account.NONEXISTENT},
+            f"Balance of {Address(0x200)} is 5, expected 0.",
+            id="unexpected_account",
+        ),
+    ],
+)
+def test_verify_mismatch_messages(
+    supports_proofs: bool, post: Dict[Address, Account | None], message: str
+) -> None:
+    """Test that mismatches are reported with the same messages as before."""
+    verifier = make_verifier(FakeState(STATE, supports_proofs=supports_proofs))
+    with pytest.raises(AssertionError) as e:
+        verifier.verify(Alloc(post))
+    assert str(e.value).startswith(message)
+
+
+def test_verify_reports_first_mismatch_in_order() -> None:
+    """Test that the first mismatch in the post-state order is reported."""
+    verifier = make_verifier(FakeState(STATE))
+    post = Alloc({Address(0x100 * i): Account(balance=i) for i in range(1, 20)})
+    with pytest.raises(AssertionError) as e:
+        verifier.verify(post)
+    assert str(e.value).startswith(f"Balance of {Address(0x100)} is 10, expected 0x01.")
@@ -0,0 +1,70 @@
+"""Test the gas validation and metrics of the transaction-post format."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Alloc, Hash
+from ethereum_test_forks import Prague
+from ethereum_test_rpc import EthRPC
+
+from ..benchmark_metrics import BENCHMARK_METRICS_PROPERTY
+from ..transaction_post import TransactionPost
+
+
+class FakeEthRPC(EthRPC):
+    """Client that records the receipt requests of the benchmark."""
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        super().__init__("http://localhost")
+        self.receipt_requests: List[List[Hash]] = []
+
+    def get_transaction_receipts(
+        self, transaction_hashes: List[Hash], *, batch_size: int = 100
+    ) -> List[Dict[str, Any] | None]:
+        """Record the request and return no receipts."""
+        del batch_size
+        self.receipt_requests.append(transaction_hashes)
+        return []
+
+
+def fake_request() -> Any:
+    """Return a request of a test."""
+    return SimpleNamespace(node=SimpleNamespace(nodeid="test_benchmark", user_properties=[]))
+
+
+@pytest.mark.parametrize(
+    "skip_gas_used_validation,collect_benchmark_metrics,fetches_receipts",
+    [
+        (False, False, True),
+        (True, False, False),
+        (True, True, True),
+    ],
+)
+def test_benchmark_receipts(
+    skip_gas_used_validation: bool, collect_benchmark_metrics: bool, fetches_receipts: bool
+) -> None:
+    """
+    Test that the receipts are only fetched to validate the gas used or to
+    collect the metrics of the benchmark report.
+    """
+    eth_rpc = FakeEthRPC()
+    request = fake_request()
+    TransactionPost(
+        blocks=[],
+        post=Alloc(),
+        expected_benchmark_gas_used=0,
+        skip_gas_used_validation=skip_gas_used_validation,
+    ).execute(
+        fork=Prague,
+        eth_rpc=eth_rpc,
+        engine_rpc=None,
+        request=request,
+        collect_benchmark_metrics=collect_benchmark_metrics,
+    )
+    assert bool(eth_rpc.receipt_requests) == fetches_receipts
+    assert (
+        BENCHMARK_METRICS_PROPERTY in dict(request.node.user_properties)
+    ) == collect_benchmark_metrics
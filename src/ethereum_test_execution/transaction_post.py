@@ -5,12 +5,14 @@ from typing import ClassVar, List
 import pytest
 from pytest import FixtureRequest
 
-from ethereum_test_base_types import Address, Alloc, Hash
+from ethereum_test_base_types import Address, Alloc
 from ethereum_test_forks import Fork
 from ethereum_test_rpc import EngineRPC, EthRPC, SendTransactionExceptionError
 from ethereum_test_types import Transaction, TransactionTestMetadata
 
 from .base import BaseExecute
+from .benchmark_metrics import BENCHMARK_METRICS_PROPERTY, BenchmarkMetrics
+from .post_state import PostStateVerifier
 
 
 class TransactionPost(BaseExecute):
@@ -35,6 +37,7 @@ class TransactionPost(BaseExecute):
         eth_rpc: EthRPC,
         engine_rpc: EngineRPC | None,
         request: FixtureRequest,
+        collect_benchmark_metrics: bool = False,
     ) -> None:
         """Execute the format."""
         del fork
@@ -79,47 +82,44 @@ class TransactionPost(BaseExecute):
 
         # Perform gas validation if required for benchmarking
         # Ensures benchmark tests consume exactly the expected gas
-        if not self.skip_gas_used_validation and self.expected_benchmark_gas_used is not None:
-            total_gas_used = 0
-            # Fetch transaction receipts to get actual gas used
-            for tx_hash in all_tx_hashes:
-                receipt = eth_rpc.get_transaction_receipt(tx_hash)
-                assert receipt is not None, f"Failed to get receipt for transaction {tx_hash}"
-                gas_used = int(receipt["gasUsed"], 16)
-                total_gas_used += gas_used
-
-            # Verify that the total gas consumed matches expectations
-            assert total_gas_used == self.expected_benchmark_gas_used, (
-                f"Total gas used ({total_gas_used}) does not match "
-                f"expected benchmark gas ({self.expected_benchmark_gas_used}), "
-                f"difference: {total_gas_used - self.expected_benchmark_gas_used}"
-            )
-
-        for address, account in self.post.root.items():
-            balance = eth_rpc.get_balance(address)
-            code = eth_rpc.get_code(address)
-            nonce = eth_rpc.get_transaction_count(address)
-            if account is None:
-                assert balance == 0, f"Balance of {address} is {balance}, expected 0."
-                assert code == b"", f"Code of {address} is {code}, expected 0x."
-                assert nonce == 0, f"Nonce of {address} is {nonce}, expected 0."
-            else:
-                if "balance" in account.model_fields_set:
-                    assert balance == account.balance, (
-                        f"Balance of {address} is {balance}, expected {account.balance}."
-                    )
-                if "code" in account.model_fields_set:
-                    assert code == account.code, (
-                        f"Code of {address} is {code}, expected {account.code}."
-                    )
-                if "nonce" in account.model_fields_set:
-                    assert nonce == account.nonce, (
-                        f"Nonce of {address} is {nonce}, expected {account.nonce}."
-                    )
-                if "storage" in account.model_fields_set:
-                    for key, value in account.storage.items():
-                        storage_value = eth_rpc.get_storage_at(address, Hash(key))
-                        assert storage_value == value, (
-                            f"Storage value at {key} of {address} is {storage_value},"
-                            f"expected {value}."
-                        )
+        expected_gas_used = (
+            None if self.skip_gas_used_validation else self.expected_benchmark_gas_used
+        )
+        # Record the client throughput of the benchmark blocks if requested.
+        collect_metrics = (
+            self.expected_benchmark_gas_used is not None and collect_benchmark_metrics
+        )
+        if expected_gas_used is not None or collect_metrics:
+            # Fetch the receipts of the benchmark transactions in batches
+            receipts = eth_rpc.get_transaction_receipts(all_tx_hashes)
+            benchmark_receipts = [receipt for receipt in receipts if receipt is not None]
+
+            if collect_metrics:
+                callspec = getattr(request.node, "callspec", None)
+                metrics = BenchmarkMetrics.collect(
+                    eth_rpc,
+                    benchmark_receipts,
+                    test_id=request.node.nodeid,
+                    gas_benchmark_value=(
+                        callspec.params.get("gas_benchmark_value")
+                        if callspec is not None
+                        else None
+                    ),
+                )
+                request.node.user_properties.append(
+                    (BENCHMARK_METRICS_PROPERTY, metrics.to_dict())
+                )
+
+            if expected_gas_used is not None:
+                for tx_hash, receipt in zip(all_tx_hashes, receipts, strict=True):
+                    assert receipt is not None, f"Failed to get receipt for transaction {tx_hash}"
+                total_gas_used = sum(int(receipt["gasUsed"], 16) for receipt in benchmark_receipts)
+
+                # Verify that the total gas consumed matches expectations
+                assert total_gas_used == expected_gas_used, (
+                    f"Total gas used ({total_gas_used}) does not match "
+                    f"expected benchmark gas ({expected_gas_used}), "
+                    f"difference: {total_gas_used - expected_gas_used}"
+                )
+
+        PostStateVerifier(eth_rpc).verify(self.post)
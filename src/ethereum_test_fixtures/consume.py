@@ -1,9 +1,10 @@
 """Defines models for index files and consume test cases."""
 
 import datetime
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterator, List, Optional, TextIO
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 from pydantic import BaseModel, RootModel
 
@@ -11,7 +12,141 @@ from ethereum_test_base_types import HexNumber
 from ethereum_test_forks import Fork
 
 from .base import BaseFixture, FixtureFormat
-from .file import Fixtures
+
+STREAM_CHUNK_SIZE = 1 << 20
+JSON_WHITESPACE = " \t\n\r"
+
+
+def iter_json_object_items(
+    fd: TextIO, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally parse a top-level JSON object from a stream and yield its
+    key-value pairs as they become available.
+
+    Only the value that is currently being parsed is held in memory, which
+    allows consuming large fixture streams (e.g. piped from `fill --output
+    stdout`) without buffering the whole input.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        """Read more data into the buffer; return False on end of stream."""
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        # Grow the read size with the pending data so that re-parsing a
+        # partially received value stays amortized linear.
+        chunk = fd.read(max(chunk_size, len(buffer) - position))
+        buffer = buffer[position:] + chunk
+        position = 0
+        eof = not chunk
+        return not eof
+
+    def next_token() -> str:
+        """Skip whitespace and peek at the next character."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ""
+
+    def decode() -> Any:
+        """Decode the next complete JSON value, reading more data if needed."""
+        nonlocal position
+        next_token()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            if end == len(buffer) and not eof:
+                # A number may continue in the next chunk; re-parse once more
+                # data is available.
+                if fill():
+                    continue
+            position = end
+            return value
+
+    def expect(token: str) -> None:
+        """Consume the expected structural character."""
+        nonlocal position
+        found = next_token()
+        if found != token:
+            raise json.JSONDecodeError(f"Expected '{token}'", buffer, position)
+        position += 1
+
+    expect("{")
+    if next_token() == "}":
+        return
+    while True:
+        key = decode()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expected a string key", buffer, position)
+        expect(":")
+        yield key, decode()
+        if next_token() == "}":
+            return
+        expect(",")
+
+
+class FixtureBatchWriter:
+    """
+    Write fixtures to JSON fixture files, one file per fixture format and
+    batch of up to `batch_size` fixtures, or per fixture format if it is 0.
+
+    Each batch file is written as its fixtures arrive and closed once the
+    batch is full, so that consumers that execute whole files run once per
+    batch.
+    """
+
+    def __init__(self, directory: Path, batch_size: int):
+        """Initialize the writer of the batch files in the directory."""
+        self.directory = directory
+        self.batch_size = batch_size
+        self.counts: Dict[str, int] = {}
+        self.files: Dict[str, Tuple[Path, TextIO]] = {}
+
+    def write(self, fixture_name: str, format_name: str, fixture_json: Any) -> Path:
+        """
+        Append a fixture to the batch file of its format, and return the path
+        of the file relative to the directory.
+        """
+        count = self.counts.get(format_name, 0)
+        self.counts[format_name] = count + 1
+        batch_index = count // self.batch_size if self.batch_size > 0 else 0
+        json_path = Path(f"{format_name}_{batch_index}.json")
+        if format_name in self.files and self.files[format_name][0] != json_path:
+            self.close_file(format_name)
+        f: TextIO
+        if format_name not in self.files:
+            f = open(self.directory / json_path, "w")
+            f.write("{")
+            self.files[format_name] = (json_path, f)
+        else:
+            f = self.files[format_name][1]
+            f.write(",")
+        f.write(f"\n{json.dumps(fixture_name)}: {json.dumps(fixture_json)}")
+        return json_path
+
+    def close_file(self, format_name: str) -> None:
+        """Complete the current batch file of a fixture format."""
+        _, f = self.files.pop(format_name)
+        f.write("\n}\n")
+        f.close()
+
+    def close(self) -> None:
+        """Complete all the batch files."""
+        for format_name in list(self.files):
+            self.close_file(format_name)
 
 
 class FixtureConsumer(ABC):
@@ -143,19 +278,38 @@ class TestCases(RootModel):
         return f"{self.__class__.__name__}(root={self.root})"
 
     @classmethod
-    def from_stream(cls, fd: TextIO) -> "TestCases":
-        """Create a TestCases object from a stream."""
-        fixtures: Fixtures = Fixtures.model_validate_json(fd.read())
-        test_cases = [
-            TestCaseStream(
-                id=fixture_name,
-                fixture_hash=fixture.hash,
-                fork=fixture.get_fork(),
-                format=fixture.__class__,
-                fixture=fixture,
-            )
-            for fixture_name, fixture in fixtures.items()
-        ]
+    def from_stream(cls, fd: TextIO, directory: Path, batch_size: int = 0) -> "TestCases":
+        """
+        Create a TestCases object from a stream, writing its fixtures to
+        fixture files in a directory.
+
+        The stream is parsed incrementally, one fixture at a time, and every
+        fixture is written to its file before the next one is parsed, so that
+        only the test cases are held in memory. The fixtures of each format
+        are written to files of up to `batch_size` fixtures, or to a single
+        file if it is 0. The paths of the test cases are relative to the
+        directory.
+        """
+        test_cases: List[TestCaseIndexFile] = []
+        names = set()
+        writer = FixtureBatchWriter(directory, batch_size)
+        try:
+            for fixture_name, fixture_json in iter_json_object_items(fd):
+                if fixture_name in names:
+                    continue
+                names.add(fixture_name)
+                fixture = BaseFixture.model_validate(fixture_json)
+                test_cases.append(
+                    TestCaseIndexFile(
+                        id=fixture_name,
+                        fixture_hash=fixture.hash,
+                        fork=fixture.get_fork(),
+                        format=fixture.__class__,
+                        json_path=writer.write(fixture_name, fixture.format_name, fixture_json),
+                    )
+                )
+        finally:
+            writer.close()
         return cls(root=test_cases)
 
     @classmethod
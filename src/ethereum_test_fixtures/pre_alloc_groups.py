@@ -126,6 +126,42 @@ class PreAllocGroups(EthereumTestRootModel):
             instance._folder_source = folder
         return instance
 
+    def add_test(
+        self,
+        hash_key: str,
+        *,
+        test_id: str,
+        fork: Fork,
+        environment: Environment,
+        pre: Alloc,
+    ) -> None:
+        """
+        Add the pre-allocation of a test to its group, creating the group from
+        the fork's pre-allocation and the genesis environment if needed.
+        """
+        if hash_key in self:
+            # Update existing group - just merge pre-allocations. The group
+            # owns its pre-allocation, so only the test's accounts are copied.
+            group = self[hash_key]
+            group.pre.merge_in_place(
+                pre,
+                key_collision_mode=Alloc.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS,
+            )
+            group.fork = fork
+            group.test_ids.append(test_id)
+            self[hash_key] = group
+        else:
+            # Create new group - use Environment instead of expensive genesis
+            # generation
+            group_pre = Alloc.fork_pre_allocation(fork, blockchain=True)
+            group_pre.merge_in_place(pre)
+            self[hash_key] = PreAllocGroup(
+                test_ids=[test_id],
+                fork=fork,
+                environment=environment,
+                pre=group_pre,
+            )
+
     def to_folder(self, folder: Path) -> None:
         """Save PreAllocGroups to a folder of pre-allocation files."""
         for key, value in self.root.items():
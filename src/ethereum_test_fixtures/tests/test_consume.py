@@ -0,0 +1,71 @@
+"""Test cases for the ethereum_test_fixtures.consume module."""
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ..consume import TestCaseIndexFile, TestCases, iter_json_object_items
+from ..file import Fixtures
+from ..transaction import FixtureResult, TransactionFixture
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {},
+        {"a": 1},
+        {"a": 12345678901234567890, "b": [1, 2, {"c": "}{,:"}], "d": None},
+        {f"key_{i}": {"nested": list(range(i)), "text": "x" * i} for i in range(50)},
+    ],
+    ids=["empty", "single", "mixed", "many"],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_json_object_items(obj: Dict[str, Any], chunk_size: int, indent: int | None) -> None:
+    """Test that the incremental parser yields all the items of the object."""
+    stream = io.StringIO(json.dumps(obj, indent=indent))
+    assert dict(iter_json_object_items(stream, chunk_size=chunk_size)) == obj
+
+
+@pytest.mark.parametrize("data", ["", "[1, 2]", '{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}'])
+def test_iter_json_object_items_invalid(data: str) -> None:
+    """Test that malformed input raises a decode error."""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_object_items(io.StringIO(data), chunk_size=3))
+
+
+@pytest.mark.parametrize("batch_size,batch_files", [(0, 1), (2, 2), (3, 1)])
+def test_test_cases_from_stream(tmp_path: Path, batch_size: int, batch_files: int) -> None:
+    """
+    Test that fixtures streamed from stdin are written to batch files and
+    parsed into test cases.
+    """
+    fixtures = {}
+    for i in range(3):
+        fixture = TransactionFixture(
+            transaction=f"0x{i:04x}",
+            result={"Paris": FixtureResult(intrinsic_gas=i)},
+        )
+        fixture.fill_info(
+            "t8n-version",
+            "test_case_description",
+            fixture_source_url="fixture_source_url",
+            ref_spec=None,
+            _info_metadata={},
+        )
+        fixtures[f"test_{i}"] = fixture
+    stream = io.StringIO(
+        json.dumps({name: f.json_dict_with_info() for name, f in fixtures.items()}, indent=4)
+    )
+    test_cases = TestCases.from_stream(stream, tmp_path, batch_size)
+    assert [test_case.id for test_case in test_cases] == list(fixtures)
+    assert len(list(tmp_path.glob("*.json"))) == batch_files
+    for test_case in test_cases:
+        assert isinstance(test_case, TestCaseIndexFile)
+        assert test_case.format == TransactionFixture
+        assert test_case.fixture_hash == int(fixtures[test_case.id].hash, 16)
+        batch = Fixtures.model_validate_json((tmp_path / test_case.json_path).read_text())
+        assert batch[test_case.id].hash == fixtures[test_case.id].hash
@@ -0,0 +1,116 @@
+"""Test the building of pre-allocation groups."""
+
+import gc
+import time
+from typing import List
+
+import pytest
+
+from ethereum_test_base_types import Account
+from ethereum_test_forks import Prague
+from ethereum_test_types import Alloc, Environment
+
+from ..pre_alloc_groups import PreAllocGroups
+
+GROUP_HASH = "0x0000000000000001"
+
+
+def pres_of_tests(count: int) -> List[Alloc]:
+    """Return the pre-allocations of a number of tests of the same group."""
+    pres = [
+        Alloc(
+            {
+                0x10000 + 2 * i: Account(balance=10**18, nonce=1),
+                0x10001 + 2 * i: Account(code=b"\x60\x00", storage={0: i}),
+            }
+        )
+        for i in range(count)
+    ]
+    # Only the set fields of the accounts overwrite the fork's accounts.
+    system_contract = next(iter(Prague.pre_allocation_blockchain()))
+    pres[0][system_contract] = Account(storage={1: 1})
+    return pres
+
+
+def build_group(pres: List[Alloc]) -> PreAllocGroups:
+    """Build a single pre-allocation group from the pre-allocations."""
+    environment = Environment().set_fork_requirements(Prague)
+    pre_alloc_groups = PreAllocGroups(root={})
+    for i, pre in enumerate(pres):
+        pre_alloc_groups.add_test(
+            GROUP_HASH, test_id=f"test_{i}", fork=Prague, environment=environment, pre=pre
+        )
+    return pre_alloc_groups
+
+
+def test_add_test_matches_merge() -> None:
+    """Test that a group is the merge of the pre-allocations of its tests."""
+    pres = pres_of_tests(100)
+    pre_alloc_groups = build_group(pres)
+
+    expected_pre = Alloc.merge(Alloc.model_validate(Prague.pre_allocation_blockchain()), pres[0])
+    for pre in pres[1:]:
+        expected_pre = Alloc.merge(
+            expected_pre, pre, key_collision_mode=Alloc.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS
+        )
+    group = pre_alloc_groups[GROUP_HASH]
+    assert group.pre.model_dump_json(by_alias=True) == expected_pre.model_dump_json(by_alias=True)
+    assert group.test_ids == [f"test_{i}" for i in range(len(pres))]
+    # The pre-allocations of the tests are not modified.
+    assert pres[0] == pres_of_tests(1)[0]
+
+
+def test_add_test_collision() -> None:
+    """Test that different accounts at the same address are rejected."""
+    pres = pres_of_tests(2)
+    pres[1][0x10000] = Account(balance=1)
+    with pytest.raises(Alloc.CollisionError):
+        build_group(pres)
+
+
+def test_build_group_from_10k_tests() -> None:
+    """
+    Test building a group from 10k tests, which is only practical if adding a
+    test does not copy the whole group.
+    """
+    pres = pres_of_tests(10_000)
+    pre_alloc_groups = build_group(pres)
+    group = pre_alloc_groups[GROUP_HASH]
+    assert group.pre_account_count == 2 * len(pres) + len(Prague.pre_allocation_blockchain())
+    assert group.test_count == len(pres)
+
+
+@pytest.mark.framework_benchmark
+def test_build_group_from_10k_tests_benchmark() -> None:
+    """
+    Benchmark building a group from 10k tests: adding a test must not get
+    slower as the group grows.
+    """
+    pres = pres_of_tests(10_000)
+    environment = Environment().set_fork_requirements(Prague)
+    pre_alloc_groups = PreAllocGroups(root={})
+    durations: List[float] = []
+    gc_enabled = gc.isenabled()
+    # Garbage collection scans the whole group and would dominate.
+    gc.disable()
+    try:
+        for start in range(0, len(pres), 1_000):
+            start_time = time.perf_counter()
+            for i in range(start, start + 1_000):
+                pre_alloc_groups.add_test(
+                    GROUP_HASH,
+                    test_id=f"test_{i}",
+                    fork=Prague,
+                    environment=environment,
+                    pre=pres[i],
+                )
+            durations.append(time.perf_counter() - start_time)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    print(
+        f"Built a group from {len(pres)} tests in {sum(durations):.2f}s "
+        f"(first 1k tests: {durations[0]:.3f}s, last 1k tests: {durations[-1]:.3f}s)"
+    )
+    assert pre_alloc_groups[GROUP_HASH].test_count == len(pres)
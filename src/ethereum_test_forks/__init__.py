@@ -1,5 +1,10 @@
 """Ethereum test fork definitions."""
 
+from .base_decorators import (
+    ForkMethodCacheMutationError,
+    clear_fork_method_caches,
+    verify_fork_method_caches,
+)
 from .base_fork import ForkAttribute
 from .forks.forks import (
     BPO1,
@@ -68,6 +73,7 @@ from .helpers import (
     get_transition_fork_predecessor,
     get_transition_fork_successor,
     get_transition_forks,
+    get_transition_tool_fork_names,
     transition_fork_from_to,
     transition_fork_to,
 )
@@ -85,6 +91,7 @@ __all__ = [
     "TransitionForkAdapter",
     "TransitionForkOrNoneAdapter",
     "ForkAttribute",
+    "ForkMethodCacheMutationError",
     "Amsterdam",
     "ArrowGlacier",
     "Berlin",
@@ -120,6 +127,7 @@ __all__ = [
     "BPO4",
     "BPO5",
     "get_transition_forks",
+    "get_transition_tool_fork_names",
     "forks_from",
     "forks_from_until",
     "get_closest_fork",
@@ -137,5 +145,7 @@ __all__ = [
     "get_selected_fork_set",
     "transition_fork_from_to",
     "transition_fork_to",
+    "clear_fork_method_caches",
+    "verify_fork_method_caches",
     "GasCosts",
 ]
@@ -1,6 +1,8 @@
 """Decorators for the fork methods."""
 
-from typing import Callable, TypeVar
+from copy import copy
+from functools import wraps
+from typing import Any, Callable, Dict, List, Type, TypeVar
 
 F = TypeVar("F", bound=Callable)
 
@@ -9,3 +11,115 @@ def prefer_transition_to_method(method: F) -> F:
     """Call the `fork_to` implementation when transitioning."""
     method.__prefer_transition_to_method__ = True  # type: ignore
     return method
+
+
+def cache_per_fork(method: F) -> F:
+    """
+    Cache the results of all implementations of the method per fork, see
+    `cached_fork_method`.
+    """
+    method.__cache_per_fork__ = True  # type: ignore
+    return method
+
+
+class ForkMethodCacheMutationError(Exception):
+    """A cached result of a fork method was modified by a caller."""
+
+    def __init__(self, mutated_results: List[str]):
+        """Initialize the exception with the mutated results."""
+        super().__init__(
+            "Cached results of fork methods were modified by a caller, which changes the "
+            f"result of every later call: {', '.join(mutated_results)}"
+        )
+        self.mutated_results = mutated_results
+
+
+class ForkMethodCache:
+    """
+    Results of an implementation of a fork method, keyed on fork class.
+
+    The results are shared by all callers. A shallow copy of every list, dict
+    and set result is kept to detect callers that modify them.
+    """
+
+    name: str
+    results: Dict[Type[Any], Any]
+    snapshots: Dict[Type[Any], Any]
+
+    def __init__(self, name: str):
+        """Initialize the empty cache of the method."""
+        self.name = name
+        self.results = {}
+        self.snapshots = {}
+
+    def add(self, fork: Type[Any], result: Any) -> None:
+        """Add the result of a call to the cache."""
+        self.results[fork] = result
+        if isinstance(result, (list, dict, set)):
+            self.snapshots[fork] = copy(result)
+
+    def mutated_results(self) -> List[str]:
+        """Return the description of the results modified since cached."""
+        return [
+            f"{fork.name()}.{self.name}()"
+            for fork, snapshot in self.snapshots.items()
+            if self.results[fork] != snapshot
+        ]
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self.results.clear()
+        self.snapshots.clear()
+
+
+fork_method_caches: List[ForkMethodCache] = []
+
+
+def cached_fork_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Return the fork method implementation caching its results per fork class.
+
+    Implementations of the methods marked with `cache_per_fork` are wrapped
+    when the fork class is defined. Their results don't depend on the block
+    number and timestamp, which only select the fork of transition forks.
+    Transition forks are not cached themselves and dispatch to the cached
+    methods of the forks they transition from and to.
+    """
+    cache = ForkMethodCache(method.__name__)
+    fork_method_caches.append(cache)
+    results = cache.results
+
+    @wraps(method)
+    def wrapper(cls: Type[Any], *, block_number: int = 0, timestamp: int = 0) -> Any:
+        try:
+            return results[cls]
+        except KeyError:
+            pass
+        result = method(cls, block_number=block_number, timestamp=timestamp)
+        cache.add(cls, result)
+        return result
+
+    return wrapper
+
+
+def clear_fork_method_caches() -> None:
+    """
+    Clear the cached results of all fork methods, e.g. after patching a fork
+    method in a test.
+    """
+    for cache in fork_method_caches:
+        cache.clear()
+
+
+def verify_fork_method_caches() -> None:
+    """
+    Raise if a caller modified a cached result of a fork method, see the
+    `pytest_runtest_teardown` hook of the forks plugin.
+    """
+    mutated_results = [
+        mutated_result
+        for cache in fork_method_caches
+        for mutated_result in cache.mutated_results()
+    ]
+    if mutated_results:
+        raise ForkMethodCacheMutationError(mutated_results)
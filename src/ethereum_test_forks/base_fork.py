@@ -21,7 +21,7 @@ from ethereum_test_base_types import AccessList, Address, BlobSchedule
 from ethereum_test_base_types.conversions import BytesConvertible
 from ethereum_test_vm import EVMCodeType, Opcodes
 
-from .base_decorators import prefer_transition_to_method
+from .base_decorators import cache_per_fork, cached_fork_method, prefer_transition_to_method
 from .gas_costs import GasCosts
 
 
@@ -263,6 +263,13 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         cls._ignore = ignore
         cls._bpo_fork = bpo_fork
         cls._children = set()
+        # Cache the implementations of the methods marked with
+        # `cache_per_fork`.
+        for method_name, method in list(cls.__dict__.items()):
+            if isinstance(method, classmethod) and getattr(
+                getattr(BaseFork, method_name, None), "__cache_per_fork__", False
+            ):
+                setattr(cls, method_name, classmethod(cached_fork_method(method.__func__)))
         base_class = cls.__bases__[0]
         assert issubclass(base_class, BaseFork)
         if base_class != BaseFork:
@@ -326,12 +333,14 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
     # Gas related abstract methods
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def gas_costs(cls, *, block_number: int = 0, timestamp: int = 0) -> GasCosts:
         """Return dataclass with the gas costs constants for the fork."""
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def memory_expansion_gas_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -343,6 +352,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def calldata_gas_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -354,6 +364,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def base_fee_per_gas_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -364,6 +375,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def base_fee_change_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -393,6 +405,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def transaction_data_floor_cost_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -404,6 +417,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def transaction_intrinsic_cost_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -415,6 +429,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def blob_gas_price_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -425,6 +440,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def excess_blob_gas_calculator(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -519,12 +535,14 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
     # Transaction related abstract methods
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def tx_types(cls, *, block_number: int = 0, timestamp: int = 0) -> List[int]:
         """Return list of the transaction types supported by the fork."""
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def contract_creating_tx_types(cls, *, block_number: int = 0, timestamp: int = 0) -> List[int]:
         """
@@ -551,12 +569,14 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def precompiles(cls, *, block_number: int = 0, timestamp: int = 0) -> List[Address]:
         """Return list pre-compiles supported by the fork."""
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def system_contracts(cls, *, block_number: int = 0, timestamp: int = 0) -> List[Address]:
         """Return list system-contracts supported by the fork."""
@@ -705,6 +725,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
 
     # EVM information abstract methods
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def evm_code_types(cls, *, block_number: int = 0, timestamp: int = 0) -> List[EVMCodeType]:
         """Return list of EVM code types supported by the fork."""
@@ -735,6 +756,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def call_opcodes(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -746,12 +768,14 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def valid_opcodes(cls, *, block_number: int = 0, timestamp: int = 0) -> List[Opcodes]:
         """Return list of Opcodes that are valid to work on this fork."""
         pass
 
     @classmethod
+    @cache_per_fork
     @abstractmethod
     def create_opcodes(
         cls, *, block_number: int = 0, timestamp: int = 0
@@ -1,7 +1,20 @@
 """Helper methods to resolve forks during test filling."""
 
 import re
-from typing import Annotated, Any, Callable, FrozenSet, List, Optional, Set, Type
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from pydantic import (
     BaseModel,
@@ -54,6 +67,39 @@ ALL_FORKS_WITH_TRANSITIONS = frozenset(
     fork for fork in ALL_FORKS | ALL_TRANSITION_FORKS if not fork.ignore()
 )
 
+# The forks are defined once at import time, so the lookup tables used by the
+# helpers below are only computed once per process.
+DEPLOYED_FORKS: Tuple[Type[BaseFork], ...] = tuple(
+    fork for fork in all_forks if fork.is_deployed() and not fork.ignore()
+)
+DEVELOPMENT_FORKS: Tuple[Type[BaseFork], ...] = tuple(
+    fork for fork in all_forks if not fork.is_deployed()
+)
+FORKS_BY_NAME: Mapping[str, Type[BaseFork]] = MappingProxyType(
+    {fork.name(): fork for fork in all_forks}
+)
+TRANSITION_FORKS_BY_NAME: Mapping[str, Type[BaseFork]] = MappingProxyType(
+    {fork.name(): fork for fork in transition_forks}
+)
+TRANSITION_TOOL_FORK_NAMES: Mapping[str, str] = MappingProxyType(
+    {fork.name(): fork.transition_tool_name() for fork in all_forks}
+)
+"""Transition tool name of every fork, keyed by fork name."""
+
+
+def _group_transition_forks_by_target() -> Dict[Type[BaseFork], Set[Type[BaseFork]]]:
+    """Return the transition forks to every fork."""
+    transition_forks_to: Dict[Type[BaseFork], Set[Type[BaseFork]]] = {}
+    for transition_fork in transition_forks:
+        assert issubclass(transition_fork, TransitionBaseClass)
+        transition_forks_to.setdefault(transition_fork.transitions_to(), set()).add(
+            transition_fork
+        )
+    return transition_forks_to
+
+
+_transition_forks_to = _group_transition_forks_by_target()
+
 
 def get_forks() -> List[Type[BaseFork]]:
     """
@@ -68,7 +114,7 @@ def get_deployed_forks() -> List[Type[BaseFork]]:
     Return list of all the fork classes implemented by `ethereum_test_forks`
     that have been deployed to mainnet, chronologically ordered by deployment.
     """
-    return [fork for fork in get_forks() if fork.is_deployed() and not fork.ignore()]
+    return list(DEPLOYED_FORKS)
 
 
 def get_development_forks() -> List[Type[BaseFork]]:
@@ -77,7 +123,7 @@ def get_development_forks() -> List[Type[BaseFork]]:
     that have been not yet deployed to mainnet and are currently under
     development. The list is ordered by their planned deployment date.
     """
-    return [fork for fork in get_forks() if not fork.is_deployed()]
+    return list(DEVELOPMENT_FORKS)
 
 
 def get_parent_fork(fork: Type[BaseFork]) -> Type[BaseFork]:
@@ -95,6 +141,14 @@ def get_closest_fork(fork: Type[BaseFork]) -> Optional[Type[BaseFork]]:
     return fork
 
 
+def get_transition_tool_fork_names() -> Mapping[str, str]:
+    """
+    Return the read-only mapping of the names of all forks to the names of the
+    forks in the transition tool.
+    """
+    return TRANSITION_TOOL_FORK_NAMES
+
+
 def get_transition_forks() -> Set[Type[BaseFork]]:
     """Return all the transition forks."""
     return set(ALL_TRANSITION_FORKS)
@@ -205,13 +259,9 @@ def transition_fork_from_to(
     """
     Return transition fork that transitions to and from the specified forks.
     """
-    for transition_fork in get_transition_forks():
-        if not issubclass(transition_fork, TransitionBaseClass):
-            continue
-        if (
-            transition_fork.transitions_to() == fork_to
-            and transition_fork.transitions_from() == fork_from
-        ):
+    for transition_fork in _transition_forks_to.get(fork_to, set()):
+        assert issubclass(transition_fork, TransitionBaseClass)
+        if transition_fork.transitions_from() == fork_from:
             return transition_fork
 
     return None
@@ -219,14 +269,7 @@ def transition_fork_from_to(
 
 def transition_fork_to(fork_to: Type[BaseFork]) -> Set[Type[BaseFork]]:
     """Return transition fork that transitions to the specified fork."""
-    transition_forks: Set[Type[BaseFork]] = set()
-    for transition_fork in get_transition_forks():
-        if not issubclass(transition_fork, TransitionBaseClass):
-            continue
-        if transition_fork.transitions_to() == fork_to:
-            transition_forks.add(transition_fork)
-
-    return transition_forks
+    return set(_transition_forks_to.get(fork_to, set()))
 
 
 def forks_from_until(
@@ -276,13 +319,10 @@ def get_relative_fork_markers(
     is not found, otherwise, simply return the provided (str) `fork_identifier`
     (this is required to run `consume` with forks that are unknown to EEST).
     """
-    all_forks = set(get_forks()) | set(get_transition_forks())
     if isinstance(fork_identifier, str):
-        fork_class = None
-        for candidate in all_forks:
-            if candidate.name() == fork_identifier:
-                fork_class = candidate
-                break
+        fork_class = FORKS_BY_NAME.get(fork_identifier) or TRANSITION_FORKS_BY_NAME.get(
+            fork_identifier
+        )
         if strict_mode and fork_class is None:
             raise InvalidForkError(f"Unknown fork: {fork_identifier}")
         return [fork_identifier]
@@ -297,10 +337,7 @@ def get_relative_fork_markers(
 
 def get_fork_by_name(fork_name: str) -> Type[BaseFork] | None:
     """Get a fork by name."""
-    for fork in get_forks():
-        if fork.name() == fork_name:
-            return fork
-    return None
+    return FORKS_BY_NAME.get(fork_name)
 
 
 class ForkRangeDescriptor(BaseModel):
@@ -7,6 +7,12 @@ from pydantic import BaseModel
 
 from ethereum_test_base_types import BlobSchedule
 
+from ..base_decorators import (
+    ForkMethodCacheMutationError,
+    clear_fork_method_caches,
+    verify_fork_method_caches,
+)
+from ..base_fork import BaseFork
 from ..forks.forks import (
     BPO1,
     BPO2,
@@ -39,10 +45,15 @@ from ..helpers import (
     ForkAdapter,
     ForkOrNoneAdapter,
     ForkSetAdapter,
+    InvalidForkError,
     forks_from,
     forks_from_until,
     get_deployed_forks,
+    get_fork_by_name,
     get_forks,
+    get_relative_fork_markers,
+    get_transition_forks,
+    get_transition_tool_fork_names,
     transition_fork_from_to,
     transition_fork_to,
 )
@@ -542,3 +553,86 @@ def test_fork_adapters() -> None:  # noqa: D103
     assert {Osaka} == ForkSetAdapter.validate_python("Osaka")
     assert {Osaka} == ForkSetAdapter.validate_python({Osaka})
     assert set() == ForkSetAdapter.validate_python("")
+
+
+CACHED_FORK_METHODS = [
+    method_name
+    for method_name in dir(BaseFork)
+    if getattr(getattr(BaseFork, method_name), "__cache_per_fork__", False)
+]
+
+
+@pytest.mark.parametrize("fork", get_forks() + list(get_transition_forks()))
+def test_cached_fork_methods(fork: Fork) -> None:
+    """
+    Test that the cached fork methods return the results of the uncached
+    implementations, and that non-transition forks compute them once per fork.
+    """
+    clear_fork_method_caches()
+    for method_name in CACHED_FORK_METHODS:
+        method = getattr(fork, method_name)
+        implementation = getattr(method, "__wrapped__", None)
+        for block_number, timestamp in [(0, 0), (4, 14_999), (5, 15_000)]:
+            try:
+                result = method(block_number=block_number, timestamp=timestamp)
+            except NotImplementedError:
+                continue
+            assert method(block_number=block_number, timestamp=timestamp) is result
+            if implementation is not None:
+                assert method() is result
+            if implementation is not None and not callable(result):
+                assert result == implementation(
+                    fork, block_number=block_number, timestamp=timestamp
+                )
+    verify_fork_method_caches()
+
+
+def test_cached_fork_methods_at_transition() -> None:
+    """
+    Test that transition forks return the cached results of the fork at the
+    block number and timestamp.
+    """
+    assert CancunToPragueAtTime15k.precompiles(timestamp=14_999) == Cancun.precompiles()
+    assert CancunToPragueAtTime15k.precompiles(timestamp=15_000) == Prague.precompiles()
+    assert Prague.precompiles() != Cancun.precompiles()
+    for fork, timestamp in [(Osaka, 14_999), (BPO1, 15_000)]:
+        assert OsakaToBPO1AtTime15k.blob_gas_price_calculator(timestamp=timestamp)(
+            excess_blob_gas=10_000_000
+        ) == fork.blob_gas_price_calculator()(excess_blob_gas=10_000_000)
+    assert Osaka.blob_gas_price_calculator()(
+        excess_blob_gas=10_000_000
+    ) != BPO1.blob_gas_price_calculator()(excess_blob_gas=10_000_000)
+
+
+def test_cached_fork_method_mutation() -> None:
+    """Test that modifying a cached result of a fork method is detected."""
+    clear_fork_method_caches()
+    verify_fork_method_caches()
+    Prague.precompiles().pop()
+    with pytest.raises(ForkMethodCacheMutationError, match=r"Prague.precompiles\("):
+        verify_fork_method_caches()
+    clear_fork_method_caches()
+    assert Prague.precompiles() == CancunToPragueAtTime15k.precompiles(timestamp=15_000)
+    verify_fork_method_caches()
+
+
+def test_fork_lookup_tables() -> None:
+    """Test the lookups of the fork helpers that are computed at import."""
+    transition_tool_fork_names = get_transition_tool_fork_names()
+    assert transition_tool_fork_names == {
+        fork.name(): fork.transition_tool_name() for fork in get_forks()
+    }
+    with pytest.raises(TypeError):
+        transition_tool_fork_names["Osaka"] = "Prague"  # type: ignore[index]
+
+    assert get_fork_by_name("Osaka") is Osaka
+    assert get_fork_by_name("PragueToOsakaAtTime15k") is None
+    assert get_relative_fork_markers("PragueToOsakaAtTime15k") == ["PragueToOsakaAtTime15k"]
+    with pytest.raises(InvalidForkError):
+        get_relative_fork_markers("Unknown")
+
+    deployed_forks = get_deployed_forks()
+    deployed_forks.pop()
+    assert get_deployed_forks()[-1] == LAST_DEPLOYED
+    assert transition_fork_to(Osaka) == {PragueToOsakaAtTime15k}
+    assert transition_fork_to(Frontier) == set()
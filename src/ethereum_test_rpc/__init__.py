@@ -10,6 +10,9 @@ from .rpc import (
     EthRPC,
     NetRPC,
     SendTransactionExceptionError,
+    TransactionWaitStrategy,
+    TxpoolRPC,
+    Web3RPC,
 )
 from .rpc_types import (
     BlobAndProofV1,
@@ -17,6 +20,8 @@ from .rpc_types import (
     EthConfigResponse,
     ForkConfig,
     ForkConfigBlobSchedule,
+    GetProofResponse,
+    StorageProofResponse,
 )
 
 __all__ = [
@@ -30,6 +35,11 @@ __all__ = [
     "EthRPC",
     "ForkConfig",
     "ForkConfigBlobSchedule",
+    "GetProofResponse",
     "NetRPC",
     "SendTransactionExceptionError",
+    "StorageProofResponse",
+    "TransactionWaitStrategy",
+    "TxpoolRPC",
+    "Web3RPC",
 ]
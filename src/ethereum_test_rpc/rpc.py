@@ -7,7 +7,7 @@ import os
 import time
 from itertools import count
 from pprint import pprint
-from typing import Any, ClassVar, Dict, List, Literal
+from typing import Any, Callable, ClassVar, Dict, List, Literal, Sequence, Set, Tuple
 
 import requests
 from jwt import encode
@@ -30,6 +30,7 @@ from .rpc_types import (
     ForkchoiceUpdateResponse,
     GetBlobsResponse,
     GetPayloadResponse,
+    GetProofResponse,
     JSONRPCError,
     PayloadAttributes,
     PayloadStatus,
@@ -38,6 +39,7 @@ from .rpc_types import (
 
 logger = get_logger(__name__)
 BlockNumberType = int | Literal["latest", "earliest", "pending"]
+TransactionWaitStrategy = Literal["poll", "blocks"]
 
 
 class SendTransactionExceptionError(Exception):
@@ -110,7 +112,7 @@ class BaseRPC:
     def _make_request(
         self,
         url: str,
-        json_payload: dict[str, Any],
+        json_payload: dict[str, Any] | List[dict[str, Any]],
         headers: dict[str, str],
         timeout: int | None,
     ) -> requests.Response:
@@ -179,6 +181,67 @@ class BaseRPC:
         result = response_json["result"]
         return result
 
+    def post_batch_request(
+        self,
+        *,
+        calls: Sequence[Tuple[str, List[Any]]],
+        extra_headers: Dict[str, str] | None = None,
+        timeout: int | None = None,
+    ) -> List[Any]:
+        """
+        Send multiple JSON-RPC requests to the client RPC server in a single
+        batch POST request.
+
+        Each call is a `(method, params)` tuple, where the method is given
+        without the namespace prefix. The results are returned in the same
+        order as the calls; calls that failed are returned as `JSONRPCError`
+        instances instead of being raised, so the caller can handle each error
+        individually.
+        """
+        if not calls:
+            return []
+        if extra_headers is None:
+            extra_headers = {}
+
+        assert self.namespace, "RPC namespace not set"
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": f"{self.namespace}_{method}",
+                "params": params,
+                "id": next(self.request_id_counter),
+            }
+            for method, params in calls
+        ]
+        headers = {"Content-Type": "application/json"} | extra_headers
+
+        logger.debug(
+            f"Sending batch RPC request to {self.url}, calls={len(calls)}, timeout={timeout}..."
+        )
+
+        response = self._make_request(self.url, payload, headers, timeout)
+        response.raise_for_status()
+        response_json = response.json()
+
+        if isinstance(response_json, dict):
+            # Servers that do not support batching reply with a single error.
+            if "error" in response_json:
+                raise JSONRPCError(**response_json["error"])
+            raise Exception(f"Unexpected batch RPC response: {response_json}")
+
+        responses_by_id = {item["id"]: item for item in response_json}
+        results: List[Any] = []
+        for request in payload:
+            item = responses_by_id.get(request["id"])
+            if item is None:
+                results.append(JSONRPCError(-32603, "Missing response in batch"))
+            elif "error" in item:
+                results.append(JSONRPCError(**item["error"]))
+            else:
+                results.append(item.get("result"))
+        return results
+
 
 class EthRPC(BaseRPC):
     """
@@ -188,6 +251,8 @@ class EthRPC(BaseRPC):
 
     transaction_wait_timeout: int = 60
     poll_interval: float = 1.0  # how often to poll for tx inclusion
+    transaction_wait_strategy: TransactionWaitStrategy = "poll"
+    confirmation_depth: int = 0
 
     BlockNumberType = int | Literal["latest", "earliest", "pending"]
 
@@ -196,14 +261,30 @@ class EthRPC(BaseRPC):
         *args: Any,
         transaction_wait_timeout: int = 60,
         poll_interval: float | None = None,
+        transaction_wait_strategy: TransactionWaitStrategy = "poll",
+        confirmation_depth: int = 0,
         **kwargs: Any,
     ) -> None:
         """
         Initialize EthRPC class with the given url and transaction wait
         timeout.
+
+        The transaction wait strategy defines how transaction inclusion is
+        awaited:
+
+        - "poll": poll `eth_getTransactionByHash` for every pending
+          transaction on each interval.
+        - "blocks": follow the new blocks of the chain and resolve every
+          pending transaction found in each block in one pass, falling back to
+          "poll" if the client does not support the required requests. A
+          transaction is only returned once `confirmation_depth` blocks have
+          been built on top of its block and the block is still canonical.
         """
         super().__init__(*args, **kwargs)
         self.transaction_wait_timeout = transaction_wait_timeout
+        self.transaction_wait_strategy = transaction_wait_strategy
+        assert confirmation_depth >= 0, "Confirmation depth must be non-negative"
+        self.confirmation_depth = confirmation_depth
 
         # Allow overriding via env "flag" EEST_POLL_INTERVAL or ctor arg
         # Priority: ctor arg > env var > default (1.0)
@@ -244,6 +325,11 @@ class EthRPC(BaseRPC):
         response = self.post_request(method="chainId", timeout=10)
         return int(response, 16)
 
+    def block_number(self) -> int:
+        """`eth_blockNumber`: Returns the number of the most recent block."""
+        response = self.post_request(method="blockNumber")
+        return int(response, 16)
+
     def get_block_by_number(
         self, block_number: BlockNumberType = "latest", full_txs: bool = True
     ) -> Any | None:
@@ -305,6 +391,34 @@ class EthRPC(BaseRPC):
             pprint(e.errors())
             raise e
 
+    def get_transactions_by_hash(
+        self, transaction_hashes: List[Hash]
+    ) -> List[TransactionByHashResponse | None]:
+        """
+        `eth_getTransactionByHash`: Returns the details of multiple
+        transactions using a single batch request.
+        """
+        responses = self.post_batch_request(
+            calls=[("getTransactionByHash", [f"{tx_hash}"]) for tx_hash in transaction_hashes]
+        )
+        results: List[TransactionByHashResponse | None] = []
+        for response in responses:
+            if isinstance(response, JSONRPCError):
+                raise response
+            if response is None:
+                results.append(None)
+                continue
+            try:
+                results.append(
+                    TransactionByHashResponse.model_validate(
+                        response, context=self.response_validation_context
+                    )
+                )
+            except ValidationError as e:
+                pprint(e.errors())
+                raise e
+        return results
+
     def get_transaction_receipt(self, transaction_hash: Hash) -> dict[str, Any] | None:
         """
         `eth_getTransactionReceipt`: Returns transaction receipt.
@@ -317,6 +431,65 @@ class EthRPC(BaseRPC):
         )
         return response
 
+    def get_transaction_receipts(
+        self, transaction_hashes: List[Hash], *, batch_size: int = 100
+    ) -> List[dict[str, Any] | None]:
+        """
+        `eth_getTransactionReceipt`: Returns the receipts of multiple
+        transactions using batch requests of at most `batch_size` calls.
+
+        If the client does not support batch requests, the receipts are
+        requested one by one.
+        """
+        results: List[dict[str, Any] | None] = []
+        for i in range(0, len(transaction_hashes), batch_size):
+            chunk = transaction_hashes[i : i + batch_size]
+            try:
+                responses = self.post_batch_request(
+                    calls=[("getTransactionReceipt", [f"{tx_hash}"]) for tx_hash in chunk]
+                )
+            except (JSONRPCError, requests.HTTPError):
+                logger.warning("Batch requests are not supported, fetching receipts one by one.")
+                return results + [
+                    self.get_transaction_receipt(tx_hash) for tx_hash in transaction_hashes[i:]
+                ]
+            for response in responses:
+                if isinstance(response, JSONRPCError):
+                    raise response
+                results.append(response)
+        return results
+
+    def get_blocks_by_number(
+        self, block_numbers: List[int], full_txs: bool = False
+    ) -> List[Any | None]:
+        """
+        `eth_getBlockByNumber`: Returns information about multiple blocks
+        using a single batch request.
+
+        If the client does not support batch requests, the blocks are
+        requested one by one.
+        """
+        try:
+            responses = self.post_batch_request(
+                calls=[("getBlockByNumber", [hex(number), full_txs]) for number in block_numbers]
+            )
+        except (JSONRPCError, requests.HTTPError):
+            logger.warning("Batch requests are not supported, fetching blocks one by one.")
+            return [self.get_block_by_number(number, full_txs) for number in block_numbers]
+        for response in responses:
+            if isinstance(response, JSONRPCError):
+                raise response
+        return responses
+
+    def block_import_latency(self, block_hash: Hash) -> float | None:
+        """
+        Return the time the client took to import a block via
+        `engine_newPayload`, which is only known if the chain is driven by
+        this client via the Engine API.
+        """
+        del block_hash
+        return None
+
     def get_storage_at(
         self, address: Address, position: Hash, block_number: BlockNumberType = "latest"
     ) -> Hash:
@@ -329,6 +502,21 @@ class EthRPC(BaseRPC):
         response = self.post_request(method="getStorageAt", params=params)
         return Hash(response)
 
+    def get_proof(
+        self,
+        address: Address,
+        storage_keys: List[Hash],
+        block_number: BlockNumberType = "latest",
+    ) -> GetProofResponse:
+        """
+        `eth_getProof`: Returns the account and storage values of the given
+        address, including the Merkle proofs.
+        """
+        block = hex(block_number) if isinstance(block_number, int) else block_number
+        params = [f"{address}", [f"{key}" for key in storage_keys], block]
+        response = self.post_request(method="getProof", params=params)
+        return GetProofResponse.model_validate(response, context=self.response_validation_context)
+
     def gas_price(self) -> int:
         """
         `eth_gasPrice`: Returns the number of transactions sent from an
@@ -376,6 +564,43 @@ class EthRPC(BaseRPC):
         """
         return [self.send_transaction(tx) for tx in transactions]
 
+    def send_transactions_batch(
+        self, transactions: List[Transaction]
+    ) -> List[Hash | SendTransactionExceptionError]:
+        """
+        Use a single batch of `eth_sendRawTransaction` requests to send a list
+        of transactions to the client.
+
+        Rejected transactions are returned as `SendTransactionExceptionError`
+        instances instead of being raised, in the same order as the
+        transactions. If the client does not support batch requests, the
+        transactions are sent one by one.
+        """
+        try:
+            responses = self.post_batch_request(
+                calls=[("sendRawTransaction", [tx.rlp().hex()]) for tx in transactions]
+            )
+        except (JSONRPCError, requests.HTTPError):
+            logger.warning("Batch requests are not supported, sending transactions one by one.")
+            results: List[Hash | SendTransactionExceptionError] = []
+            for tx in transactions:
+                try:
+                    results.append(self.send_transaction(tx))
+                except SendTransactionExceptionError as e:
+                    results.append(e)
+            return results
+        results = []
+        for tx, response in zip(transactions, responses, strict=True):
+            if isinstance(response, JSONRPCError):
+                results.append(SendTransactionExceptionError(str(response), tx=tx))
+            elif response is None or Hash(response) != tx.hash:
+                results.append(
+                    SendTransactionExceptionError(f"Unexpected hash returned: {response}", tx=tx)
+                )
+            else:
+                results.append(tx.hash)
+        return results
+
     def storage_at_keys(
         self, account: Address, keys: List[Hash], block_number: BlockNumberType = "latest"
     ) -> Dict[Hash, Hash]:
@@ -394,6 +619,8 @@ class EthRPC(BaseRPC):
         Use `eth_getTransactionByHash` to wait until a transaction is included
         in a block.
         """
+        if self.transaction_wait_strategy == "blocks":
+            return self.wait_for_transactions([transaction])[0]
         tx_hash = transaction.hash
         start_time = time.time()
         while True:
@@ -409,6 +636,29 @@ class EthRPC(BaseRPC):
         )
 
     def wait_for_transactions(
+        self,
+        transactions: List[Transaction],
+        *,
+        strategy: TransactionWaitStrategy | None = None,
+    ) -> List[TransactionByHashResponse]:
+        """
+        Wait until all transactions in list are included in a block, using the
+        given or else the configured transaction wait strategy.
+        """
+        if strategy is None:
+            strategy = self.transaction_wait_strategy
+        if strategy == "blocks":
+            try:
+                return self.wait_for_transactions_by_block(transactions)
+            except (JSONRPCError, requests.HTTPError) as e:
+                logger.warning(
+                    f"Block-driven transaction wait is not supported by the client ({e}), "
+                    "falling back to polling each transaction."
+                )
+                self.transaction_wait_strategy = "poll"
+        return self.poll_for_transactions(transactions)
+
+    def poll_for_transactions(
         self, transactions: List[Transaction]
     ) -> List[TransactionByHashResponse]:
         """
@@ -441,6 +691,137 @@ class EthRPC(BaseRPC):
             f"after {self.transaction_wait_timeout} seconds"
         )
 
+    def wait_for_transactions_by_block(
+        self,
+        transactions: List[Transaction],
+        *,
+        on_poll: Callable[[], None] | None = None,
+        poll_interval: float | None = None,
+    ) -> List[TransactionByHashResponse]:
+        """
+        Wait until all transactions in list are included in a block by
+        following the new blocks of the chain.
+
+        The inclusion status of all transactions is first checked with a
+        single batch of `eth_getTransactionByHash` requests, to find the
+        transactions that were already included before the wait started.
+        Afterwards, only `eth_blockNumber` is polled, and each new block is
+        fetched once with `eth_getBlockByNumber` to resolve all the pending
+        transactions it contains.
+
+        If `confirmation_depth` is non-zero, a transaction is only returned
+        once its block is `confirmation_depth` blocks deep and still
+        canonical; transactions whose block was reorged out are looked up
+        again.
+
+        `on_poll` is called on every poll interval while transactions are still
+        pending, e.g. to drive block production.
+
+        Returns the transaction details in the same order as `transactions`.
+        """
+        if poll_interval is None:
+            poll_interval = self.poll_interval
+        pending: Dict[Hash, Transaction] = {tx.hash: tx for tx in transactions}
+        included: Dict[Hash, TransactionByHashResponse] = {}
+        confirmed: Set[Hash] = set()
+
+        start_time = time.time()
+        next_block = self.block_number() + 1
+        self._resolve_transactions_by_hash(pending, included)
+
+        while True:
+            head = self.block_number()
+            for number in range(next_block, head + 1):
+                block = self.get_block_by_number(number, full_txs=True)
+                if block is None:
+                    break
+                for block_tx in block["transactions"]:
+                    tx_hash = Hash(block_tx["hash"])
+                    if tx_hash in pending:
+                        del pending[tx_hash]
+                        included[tx_hash] = TransactionByHashResponse.model_validate(
+                            block_tx, context=self.response_validation_context
+                        )
+                next_block = number + 1
+
+            self._confirm_transactions(pending, included, confirmed, head)
+
+            if not pending and len(confirmed) == len(included):
+                return [included[tx.hash] for tx in transactions]
+            if (time.time() - start_time) > self.transaction_wait_timeout:
+                break
+            if on_poll is not None:
+                on_poll()
+            time.sleep(poll_interval)
+
+        missing_txs_strings = [
+            f"{tx.hash} ({tx.model_dump_json()})"
+            for tx in transactions
+            if tx.hash in pending or tx.hash not in confirmed
+        ]
+        raise Exception(
+            f"Transactions {', '.join(missing_txs_strings)} not included in a block "
+            f"{f'{self.confirmation_depth} blocks deep ' if self.confirmation_depth else ''}"
+            f"after {self.transaction_wait_timeout} seconds"
+        )
+
+    def _resolve_transactions_by_hash(
+        self,
+        pending: Dict[Hash, Transaction],
+        included: Dict[Hash, TransactionByHashResponse],
+    ) -> None:
+        """
+        Move the pending transactions that are already included in a block to
+        `included`, using a single batch request.
+        """
+        tx_hashes = list(pending)
+        for tx_hash, tx in zip(tx_hashes, self.get_transactions_by_hash(tx_hashes), strict=True):
+            if tx is not None and tx.block_number is not None:
+                del pending[tx_hash]
+                included[tx_hash] = tx
+
+    def _confirm_transactions(
+        self,
+        pending: Dict[Hash, Transaction],
+        included: Dict[Hash, TransactionByHashResponse],
+        confirmed: Set[Hash],
+        head: int,
+    ) -> None:
+        """
+        Mark the included transactions whose block is deep enough as confirmed,
+        after checking that the block is still canonical.
+
+        Transactions whose block has been reorged out are moved back to
+        `pending` and looked up again.
+        """
+        if self.confirmation_depth == 0:
+            confirmed.update(included)
+            return
+        canonical_hashes: Dict[int, Hash | None] = {}
+        reorged: Dict[Hash, Transaction] = {}
+        for tx_hash, tx in included.items():
+            if tx_hash in confirmed:
+                continue
+            assert tx.block_number is not None
+            block_number = int(tx.block_number)
+            if block_number + self.confirmation_depth > head:
+                continue
+            if block_number not in canonical_hashes:
+                block = self.get_block_by_number(block_number, full_txs=False)
+                canonical_hashes[block_number] = Hash(block["hash"]) if block else None
+            if canonical_hashes[block_number] == tx.block_hash:
+                confirmed.add(tx_hash)
+            else:
+                logger.warning(
+                    f"Block {block_number} containing transaction {tx_hash} was reorged out."
+                )
+                reorged[tx_hash] = tx
+        if reorged:
+            for tx_hash in reorged:
+                del included[tx_hash]
+            pending.update(reorged)
+            self._resolve_transactions_by_hash(pending, included)
+
     def send_wait_transaction(self, transaction: Transaction) -> Any:
         """Send transaction and waits until it is included in a block."""
         self.send_transaction(transaction)
@@ -617,3 +998,23 @@ class AdminRPC(BaseRPC):
     def add_peer(self, enode: str) -> bool:
         """`admin_addPeer`: Add a peer by enode URL."""
         return self.post_request(method="addPeer", params=[enode])
+
+
+class TxpoolRPC(BaseRPC):
+    """Represents a txpool RPC class for transaction pool related RPC calls."""
+
+    def status(self) -> Dict[str, int]:
+        """
+        `txpool_status`: Get the number of pending and queued transactions in
+        the transaction pool of the client.
+        """
+        response = self.post_request(method="status")
+        return {key: int(value, 16) for key, value in response.items()}
+
+
+class Web3RPC(BaseRPC):
+    """Represents a web3 RPC class for client information RPC calls."""
+
+    def client_version(self) -> str:
+        """`web3_clientVersion`: Get the name and version of the client."""
+        return self.post_request(method="clientVersion")
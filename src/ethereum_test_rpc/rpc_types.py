@@ -88,6 +88,26 @@ class TransactionByHashResponse(Transaction):
         assert self.transaction_hash == self.hash
 
 
+class StorageProofResponse(CamelModel):
+    """Represents a storage slot proof of an `eth_getProof` response."""
+
+    key: HexNumber
+    value: HexNumber
+    proof: List[Bytes]
+
+
+class GetProofResponse(CamelModel):
+    """Represents the response of an `eth_getProof` request."""
+
+    address: Address
+    balance: HexNumber
+    code_hash: Hash
+    nonce: HexNumber
+    storage_hash: Hash
+    account_proof: List[Bytes]
+    storage_proof: List[StorageProofResponse]
+
+
 class ForkchoiceState(CamelModel):
     """Represents the forkchoice state of the beacon chain."""
 
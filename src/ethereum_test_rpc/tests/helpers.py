@@ -0,0 +1,56 @@
+"""In-memory JSON-RPC transport for the tests of the RPC clients."""
+
+from typing import Any, Dict, List
+
+from ethereum_test_rpc.rpc import BaseRPC
+
+
+class FakeResponse:
+    """Minimal stand-in for `requests.Response`."""
+
+    def __init__(self, json_data: Any):
+        """Store the JSON data to return."""
+        self.json_data = json_data
+
+    def raise_for_status(self) -> None:
+        """Never fails."""
+        pass
+
+    def json(self) -> Any:
+        """Return the JSON data."""
+        return self.json_data
+
+
+class FakeJSONRPCServer:
+    """
+    Answers the single and batch JSON-RPC requests of an RPC client
+    in-process, without HTTP.
+
+    Subclasses implement `handle`, which returns the `result` or `error`
+    member of the response to a single call.
+    """
+
+    supports_batch: bool = True
+
+    def handle(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Answer a single call."""
+        raise NotImplementedError
+
+    def respond(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the response object of a single call."""
+        return {"jsonrpc": "2.0", "id": call["id"]} | self.handle(call["method"], call["params"])
+
+    def make_request(self, url: str, payload: Any, headers: Any, timeout: Any) -> FakeResponse:
+        """Answer a single or batch JSON-RPC request."""
+        del url, headers, timeout
+        if not isinstance(payload, list):
+            return FakeResponse(self.respond(payload))
+        if not self.supports_batch:
+            return FakeResponse(
+                {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "no"}}
+            )
+        return FakeResponse([self.respond(call) for call in payload])
+
+    def connect(self, rpc: BaseRPC) -> None:
+        """Send the requests of the client to this server."""
+        rpc._make_request = self.make_request  # type: ignore[assignment]
@@ -0,0 +1,239 @@
+"""Test the transaction inclusion strategies of the `EthRPC` class."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Hash, to_json
+from ethereum_test_rpc import EthRPC, SendTransactionExceptionError
+from ethereum_test_rpc.rpc_types import JSONRPCError
+from ethereum_test_types import EOA, Transaction
+
+from .helpers import FakeJSONRPCServer, FakeResponse
+
+
+class FakeChain(FakeJSONRPCServer):
+    """
+    In-memory chain that answers the JSON-RPC requests required to wait for
+    transactions, and mines the pending transactions every few requests.
+    """
+
+    def __init__(self, *, mine_every: int, supports_batch: bool = True):
+        """Initialize the chain with the genesis block."""
+        self.blocks: List[Dict[str, Any]] = [self.make_block(0, [])]
+        self.mempool: List[Transaction] = []
+        self.mine_every = mine_every
+        self.supports_batch = supports_batch
+        self.requests: List[str] = []
+
+    @staticmethod
+    def make_block(number: int, txs: List[Transaction], fork_id: int = 0) -> Dict[str, Any]:
+        """Build a block containing the transactions."""
+        block_hash = Hash(number * 256 + fork_id + 1)
+        transactions = []
+        for tx in txs:
+            tx_json = to_json(tx)
+            tx_json |= {
+                "hash": str(tx.hash),
+                "from": str(tx.sender),
+                "blockNumber": hex(number),
+                "blockHash": str(block_hash),
+            }
+            transactions.append(tx_json)
+        return {"number": hex(number), "hash": str(block_hash), "transactions": transactions}
+
+    def mine(self) -> None:
+        """Include all the mempool transactions in a new block."""
+        self.blocks.append(self.make_block(len(self.blocks), self.mempool))
+        self.mempool = []
+
+    def reorg(self, number: int, txs: List[Transaction]) -> None:
+        """Replace the block at the given number with a block of `txs`."""
+        self.blocks[number] = self.make_block(number, txs, fork_id=1)
+
+    def handle(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Answer a single request."""
+        return {"result": self.result(method, params)}
+
+    def result(self, method: str, params: List[Any]) -> Any:
+        """Return the result of a single request."""
+        self.requests.append(method)
+        if len(self.requests) % self.mine_every == 0 and self.mempool:
+            self.mine()
+        if method == "eth_blockNumber":
+            return hex(len(self.blocks) - 1)
+        if method == "eth_getBlockByNumber":
+            number = int(params[0], 16)
+            if number >= len(self.blocks):
+                return None
+            block = self.blocks[number]
+            if params[1]:
+                return block
+            return block | {"transactions": [tx["hash"] for tx in block["transactions"]]}
+        if method == "eth_getTransactionByHash":
+            for block in self.blocks:
+                for tx in block["transactions"]:
+                    if tx["hash"] == params[0]:
+                        return tx
+            for pending_tx in self.mempool:
+                if str(pending_tx.hash) == params[0]:
+                    return to_json(pending_tx) | {
+                        "hash": str(pending_tx.hash),
+                        "from": str(pending_tx.sender),
+                    }
+            return None
+        raise Exception(f"Unexpected method {method}")
+
+
+def make_transactions(count: int) -> List[Transaction]:
+    """Create signed transactions."""
+    sender = EOA(key=1)
+    return [
+        Transaction(
+            sender=sender, to=0x1234, nonce=i, gas_limit=21_000
+        ).with_signature_and_sender()
+        for i in range(count)
+    ]
+
+
+def make_eth_rpc(chain: FakeChain, **kwargs: Any) -> EthRPC:
+    """Create an `EthRPC` instance connected to the fake chain."""
+    eth_rpc = EthRPC("http://localhost", poll_interval=0, transaction_wait_timeout=5, **kwargs)
+    chain.connect(eth_rpc)
+    return eth_rpc
+
+
+def test_post_batch_request_errors() -> None:
+    """Test that errors in batch responses are returned per call."""
+    eth_rpc = EthRPC("http://localhost")
+    response = FakeResponse(
+        [
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "nonce too low"}},
+            {"jsonrpc": "2.0", "id": 1, "result": "0x1"},
+        ]
+    )
+    eth_rpc._make_request = lambda *_: response  # type: ignore[assignment]
+    results = eth_rpc.post_batch_request(calls=[("blockNumber", []), ("blockNumber", [])])
+    assert results[0] == "0x1"
+    assert isinstance(results[1], JSONRPCError)
+    assert results[1].message == "nonce too low"
+
+
+@pytest.mark.parametrize("strategy", ["poll", "blocks"])
+def test_wait_for_transactions(strategy: str) -> None:
+    """Test that both strategies return all transactions in order."""
+    chain = FakeChain(mine_every=3)
+    transactions = make_transactions(20)
+    chain.mempool = transactions[:10]
+    chain.mine()
+    chain.mempool = transactions[10:]
+    eth_rpc = make_eth_rpc(chain, transaction_wait_strategy=strategy)
+    responses = eth_rpc.wait_for_transactions(transactions)
+    assert sorted(r.hash for r in responses) == sorted(tx.hash for tx in transactions)
+    assert all(r.block_number is not None for r in responses)
+    if strategy == "blocks":
+        assert [r.hash for r in responses] == [tx.hash for tx in transactions]
+        # One batch for the initial lookup, then only block requests.
+        assert chain.requests.count("eth_getTransactionByHash") == len(transactions)
+        assert chain.requests.count("eth_getBlockByNumber") == 1
+
+
+def test_wait_for_transactions_by_block_confirmation_depth() -> None:
+    """
+    Test that transactions are only returned once their block is deep enough,
+    and that transactions of a reorged block are looked up again.
+    """
+    chain = FakeChain(mine_every=1_000_000)
+    transactions = make_transactions(2)
+    chain.mempool = transactions[:1]
+    chain.mine()
+    chain.mempool = transactions[1:]
+    eth_rpc = make_eth_rpc(chain, transaction_wait_strategy="blocks", confirmation_depth=2)
+
+    polls = 0
+
+    def on_poll() -> None:
+        nonlocal polls
+        polls += 1
+        if polls == 1:
+            # Reorg the first transaction out of block 1 into block 2.
+            chain.reorg(1, [])
+            chain.mempool.append(transactions[0])
+        chain.mine()
+
+    responses = eth_rpc.wait_for_transactions_by_block(transactions, on_poll=on_poll)
+    assert [int(r.block_number or 0) for r in responses] == [2, 2]
+    assert all(r.block_hash == Hash(chain.blocks[2]["hash"]) for r in responses)
+    assert len(chain.blocks) - 1 == 4
+
+
+def test_wait_for_transactions_by_block_fallback() -> None:
+    """Test the fallback to polling if batch requests are not supported."""
+    chain = FakeChain(mine_every=2, supports_batch=False)
+    transactions = make_transactions(3)
+    chain.mempool = transactions[:]
+    eth_rpc = make_eth_rpc(chain, transaction_wait_strategy="blocks")
+    responses = eth_rpc.wait_for_transactions(transactions)
+    assert len(responses) == 3
+    assert eth_rpc.transaction_wait_strategy == "poll"
+
+
+def test_wait_for_transactions_by_block_timeout() -> None:
+    """Test that a timeout lists the transactions that were not included."""
+    chain = FakeChain(mine_every=1_000_000)
+    transactions = make_transactions(2)
+    eth_rpc = make_eth_rpc(chain, transaction_wait_strategy="blocks")
+    eth_rpc.transaction_wait_timeout = 0
+    with pytest.raises(Exception, match="not included in a block"):
+        eth_rpc.wait_for_transactions(transactions)
+
+
+def test_send_transactions_batch() -> None:
+    """Test that rejected transactions of a batch are returned as errors."""
+    transactions = make_transactions(2)
+    eth_rpc = EthRPC("http://localhost")
+    response = FakeResponse(
+        [
+            {"jsonrpc": "2.0", "id": 1, "result": str(transactions[0].hash)},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "nonce too low"}},
+        ]
+    )
+    eth_rpc._make_request = lambda *_: response  # type: ignore[assignment]
+    results = eth_rpc.send_transactions_batch(transactions)
+    assert results[0] == transactions[0].hash
+    assert isinstance(results[1], SendTransactionExceptionError)
+    assert results[1].tx == transactions[1]
+
+
+class ReceiptServer(FakeJSONRPCServer):
+    """Server that answers receipt requests and records the payloads."""
+
+    def __init__(self, *, supports_batch: bool):
+        """Initialize the server."""
+        self.supports_batch = supports_batch
+        self.payloads: List[Any] = []
+
+    def make_request(self, url: str, payload: Any, headers: Any, timeout: Any) -> FakeResponse:
+        """Record the payload and answer it."""
+        self.payloads.append(payload)
+        return super().make_request(url, payload, headers, timeout)
+
+    def handle(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Answer a receipt request."""
+        assert method == "eth_getTransactionReceipt"
+        del params
+        return {"result": {"gasUsed": "0x1"}}
+
+
+@pytest.mark.parametrize("supports_batch", [True, False])
+def test_get_transaction_receipts(supports_batch: bool) -> None:
+    """Test that receipts are fetched in batches of the given size."""
+    server = ReceiptServer(supports_batch=supports_batch)
+    eth_rpc = EthRPC("http://localhost")
+    server.connect(eth_rpc)
+    receipts = eth_rpc.get_transaction_receipts([Hash(i) for i in range(5)], batch_size=2)
+    assert receipts == [{"gasUsed": "0x1"}] * 5
+    if supports_batch:
+        assert [len(p) for p in server.payloads] == [2, 2, 1]
+    else:
+        assert len(server.payloads) == 6
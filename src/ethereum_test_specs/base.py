@@ -22,11 +22,10 @@ from ethereum_test_fixtures import (
     BaseFixture,
     FixtureFormat,
     LabeledFixtureFormat,
-    PreAllocGroup,
     PreAllocGroups,
 )
 from ethereum_test_forks import Fork
-from ethereum_test_types import Alloc, Environment, Withdrawal
+from ethereum_test_types import Environment, Withdrawal
 
 
 class HashMismatchExceptionError(Exception):
@@ -270,34 +269,13 @@ class BaseTest(BaseModel):
                 f"{self.__class__.__name__} does not have a 'pre' field. Pre-allocation groups "
                 "are only supported for test types that define pre-allocation."
             )
-        pre_alloc_hash = self.compute_pre_alloc_group_hash(fork=fork)
-
-        if pre_alloc_hash in pre_alloc_groups:
-            # Update existing group - just merge pre-allocations
-            group = pre_alloc_groups[pre_alloc_hash]
-            group.pre = Alloc.merge(
-                group.pre,
-                self.pre,
-                key_collision_mode=Alloc.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS,
-            )
-            group.fork = fork
-            group.test_ids.append(str(test_id))
-            pre_alloc_groups[pre_alloc_hash] = group
-        else:
-            # Create new group - use Environment instead of expensive genesis
-            # generation
-            genesis_env = self.get_genesis_environment(fork)
-            pre_alloc = Alloc.merge(
-                Alloc.model_validate(fork.pre_allocation_blockchain()),
-                self.pre,
-            )
-            group = PreAllocGroup(
-                test_ids=[str(test_id)],
-                fork=fork,
-                environment=genesis_env,
-                pre=pre_alloc,
-            )
-            pre_alloc_groups[pre_alloc_hash] = group
+        pre_alloc_groups.add_test(
+            self.compute_pre_alloc_group_hash(fork=fork),
+            test_id=str(test_id),
+            fork=fork,
+            environment=self.get_genesis_environment(fork),
+            pre=self.pre,
+        )
         return pre_alloc_groups
 
     def compute_pre_alloc_group_hash(self, fork: Fork) -> str:
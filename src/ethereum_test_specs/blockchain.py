@@ -475,10 +475,8 @@ class BlockchainTest(BaseTest):
 
         pre_alloc = self.pre
         if apply_pre_allocation_blockchain:
-            pre_alloc = Alloc.merge(
-                Alloc.model_validate(fork.pre_allocation_blockchain()),
-                pre_alloc,
-            )
+            pre_alloc = Alloc.fork_pre_allocation(fork, blockchain=True)
+            pre_alloc.merge_in_place(self.pre)
         if empty_accounts := pre_alloc.empty_accounts():
             raise Exception(f"Empty accounts in pre state: {empty_accounts}")
         state_root = pre_alloc.state_root()
@@ -506,7 +504,7 @@ class BlockchainTest(BaseTest):
         """
         env = block.set_environment(previous_env)
         env = env.set_fork_requirements(fork)
-        txs = [tx.with_signature_and_sender() for tx in block.txs]
+        txs = Transaction.list_with_signatures_and_senders(block.txs)
 
         if failing_tx_count := len([tx for tx in txs if tx.error]) > 0:
             if failing_tx_count > 1:
@@ -1,5 +1,7 @@
 """Ethereum EOF test spec definition and filler."""
 
+import os
+import select
 import subprocess
 import warnings
 from pathlib import Path
@@ -15,6 +17,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
 )
 
@@ -140,15 +143,125 @@ eof_exception_type_adapter: TypeAdapter[EOFExceptionWithMessage | UndefinedExcep
 )
 
 
+EOF_PARSE_WORKER_TIMEOUT = 60
+"""Seconds to wait for the verdict of a container from an eofparse worker."""
+
+
+class EOFParseWorker:
+    """
+    Long-running `evmone-eofparse` process that validates the hex containers
+    written to its input, one per line, and prints one verdict per line.
+
+    The process exits when its input is closed, at the latest when the process
+    that started it exits.
+    """
+
+    binary: Path
+    args: Tuple[str, ...]
+    process: Optional[subprocess.Popen] = None
+    output_fd: Optional[int] = None
+    output: bytes = b""
+
+    def __init__(self, binary: Path, *args: str):
+        """Initialize the worker, which is started on first use."""
+        self.binary = binary
+        self.args = args
+
+    def start(self) -> bool:
+        """
+        Start the process and return whether it was started, which requires
+        the POSIX pseudo-terminals.
+        """
+        # Only available on POSIX platforms.
+        try:
+            import pty
+            import tty
+        except ImportError:
+            return False
+        # The output of the process is only flushed after each verdict if it
+        # is a terminal.
+        output_fd, terminal_fd = pty.openpty()
+        tty.setraw(terminal_fd)
+        try:
+            self.process = subprocess.Popen(
+                [self.binary, *self.args],
+                stdin=subprocess.PIPE,
+                stdout=terminal_fd,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            os.close(output_fd)
+            raise
+        finally:
+            os.close(terminal_fd)
+        self.output_fd = output_fd
+        self.output = b""
+        return True
+
+    def validate(self, code: Bytes) -> str | None:
+        """
+        Return the verdict of a container, or `None` if the process could not
+        be started, crashed or did not answer, in which case it is restarted
+        on next use.
+        """
+        if self.process is None or self.process.poll() is not None:
+            self.shutdown()
+            if not self.start():
+                return None
+        assert self.process is not None and self.process.stdin is not None
+        assert self.output_fd is not None
+        try:
+            self.process.stdin.write(f"{code}\n".encode())
+            self.process.stdin.flush()
+        except OSError:
+            self.shutdown()
+            return None
+        while b"\n" not in self.output:
+            ready, _, _ = select.select([self.output_fd], [], [], EOF_PARSE_WORKER_TIMEOUT)
+            try:
+                chunk = os.read(self.output_fd, 65536) if ready else b""
+            except OSError:
+                # Reading a terminal whose process exited fails on Linux.
+                chunk = b""
+            if not chunk:
+                self.shutdown()
+                return None
+            self.output += chunk
+        line, self.output = self.output.split(b"\n", 1)
+        return line.decode().strip()
+
+    def shutdown(self) -> None:
+        """Stop the process if it was started."""
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+            self.process = None
+        if self.output_fd is not None:
+            os.close(self.output_fd)
+            self.output_fd = None
+
+
 class EOFParse:
-    """evmone-eofparse binary."""
+    """
+    evmone-eofparse binary.
+
+    Containers are validated by one worker process per container kind, and
+    their verdicts are cached for the lifetime of the (xdist worker) process.
+    """
 
     binary: Path
+    workers: Dict[Tuple[str, ...], EOFParseWorker]
+    results: Dict[Tuple[bytes, ContainerKind, Fork | None], str]
 
-    def __new__(cls) -> "EOFParse":
+    def __new__(cls, *args: Any, **kwargs: Any) -> "EOFParse":
         """Make EOF binary a singleton."""
+        del args, kwargs
         if not hasattr(cls, "instance"):
             cls.instance = super(EOFParse, cls).__new__(cls)
+            cls.instance.workers = {}
+            cls.instance.results = {}
         return cls.instance
 
     def __init__(
@@ -164,6 +277,9 @@ class EOFParse:
             raise FileNotFoundError(
                 "`evmone-eofparse` binary executable not found/not executable."
             )
+        if getattr(self, "binary", None) != Path(binary):
+            self.shutdown()
+            self.results.clear()
         self.binary = Path(binary)
 
     def run(self, *args: str, input_value: str | None = None) -> CompletedProcess:
@@ -180,6 +296,39 @@ class EOFParse:
             )
         return result
 
+    def validate(
+        self,
+        code: Bytes,
+        *,
+        container_kind: ContainerKind = ContainerKind.RUNTIME,
+        fork: Fork | None = None,
+    ) -> str:
+        """
+        Return the verdict of evmone on a container: `OK` followed by the
+        code sections, or the validation error.
+
+        A container that crashes the worker is validated again by a new
+        process, so that a failure is reported as by `run`, as are all the
+        containers on platforms without pseudo-terminals.
+        """
+        key = (bytes(code), container_kind, fork)
+        if key in self.results:
+            return self.results[key]
+        args = ("--initcode",) if container_kind == ContainerKind.INITCODE else ()
+        if args not in self.workers:
+            self.workers[args] = EOFParseWorker(self.binary, *args)
+        verdict = self.workers[args].validate(code)
+        if verdict is None:
+            verdict = self.run(*args, input_value=str(code)).stdout.strip()
+        self.results[key] = verdict
+        return verdict
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        for worker in self.workers.values():
+            worker.shutdown()
+        self.workers.clear()
+
 
 class EOFTest(BaseTest):
     """
@@ -388,22 +537,19 @@ class EOFTest(BaseTest):
             expected_result = vector.results.get(fork)
             if expected_result is None:
                 raise Exception(f"EOF Fixture missing vector result for fork: {fork}")
-            args = []
-            if vector.container_kind == ContainerKind.INITCODE:
-                args.append("--initcode")
-            result = eof_parse.run(*args, input_value=str(vector.code))
+            result = eof_parse.validate(
+                vector.code, container_kind=vector.container_kind, fork=fork
+            )
             self.verify_result(result, expected_result, vector.code)
 
         return fixture
 
-    def verify_result(
-        self, result: CompletedProcess, expected_result: Result, code: Bytes
-    ) -> None:
+    def verify_result(self, result: str, expected_result: Result, code: Bytes) -> None:
         """
         Check that the reported exception string matches the expected error.
         """
         evmone_exception_mapper = EvmoneExceptionMapper()
-        actual_exception_str = result.stdout.strip()
+        actual_exception_str = result
         actual_exception: EOFExceptionWithMessage | UndefinedException | None = None
         if not actual_exception_str.startswith("OK"):
             actual_exception = eof_exception_type_adapter.validate_python(
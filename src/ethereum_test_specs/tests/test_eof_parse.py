@@ -0,0 +1,108 @@
+"""Test the validation of EOF containers by eofparse worker processes."""
+
+import sys
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from ethereum_test_base_types import Bytes
+from ethereum_test_forks import Osaka, Prague
+from ethereum_test_types.eof.v1 import ContainerKind
+
+from ..eof import EOFParse
+
+# Mimics `evmone-eofparse`: one verdict per input line, written to a buffered
+# output, exits with code 1 on unexpected errors. Logs its starts and inputs.
+FAKE_EOFPARSE = """\
+import sys
+
+log = open(sys.argv[1], "a", buffering=1)
+args = sys.argv[2:]
+log.write(f"start {' '.join(args)}\\n")
+for line in sys.stdin:
+    line = line.strip()
+    log.write(f"validate {line}\\n")
+    if line == "0xdead":
+        sys.exit(1)
+    if line.startswith("0xef00"):
+        print(f"OK {line[6:]}{' initcode' if args else ''}")
+    else:
+        print("err: invalid_prefix")
+"""
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    """Return the log of the fake eofparse processes."""
+    return tmp_path / "eofparse.log"
+
+
+@pytest.fixture
+def eof_parse(
+    tmp_path: Path, log_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[EOFParse, None, None]:
+    """Return an `EOFParse` singleton running the fake eofparse."""
+    script = tmp_path / "eofparse.py"
+    script.write_text(FAKE_EOFPARSE)
+    binary = tmp_path / "evmone-eofparse"
+    binary.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "{log_path}" "$@"\n')
+    binary.chmod(0o755)
+    if hasattr(EOFParse, "instance"):
+        monkeypatch.delattr(EOFParse, "instance")
+    eof_parse = EOFParse(binary)
+    yield eof_parse
+    eof_parse.shutdown()
+    del EOFParse.instance
+
+
+def test_worker(eof_parse: EOFParse, log_path: Path) -> None:
+    """Test that containers are validated by one process and cached."""
+    for _ in range(2):
+        assert eof_parse.validate(Bytes("0xef0001"), fork=Osaka) == "OK 01"
+        assert eof_parse.validate(Bytes("0x00"), fork=Osaka) == "err: invalid_prefix"
+    assert eof_parse.validate(Bytes("0xef0001"), fork=Prague) == "OK 01"
+    assert eof_parse.validate(Bytes(), fork=Osaka) == "err: invalid_prefix"
+    assert eof_parse.validate(
+        Bytes("0xef0001"), container_kind=ContainerKind.INITCODE, fork=Osaka
+    ) == ("OK 01 initcode")
+    assert log_path.read_text().splitlines() == [
+        "start ",
+        "validate 0xef0001",
+        "validate 0x00",
+        "validate 0xef0001",
+        "validate 0x",
+        "start --initcode",
+        "validate 0xef0001",
+    ]
+
+
+def test_worker_crash(eof_parse: EOFParse, log_path: Path) -> None:
+    """Test that a crashing container is validated again by a new process."""
+    assert eof_parse.validate(Bytes("0xef0001")) == "OK 01"
+    assert eof_parse.validate(Bytes("0xdead")) == ""
+    assert eof_parse.validate(Bytes("0xef0002")) == "OK 02"
+    assert log_path.read_text().splitlines() == [
+        "start ",
+        "validate 0xef0001",
+        "validate 0xdead",
+        "start ",
+        "validate 0xdead",
+        "start ",
+        "validate 0xef0002",
+    ]
+
+
+def test_without_pseudo_terminals(
+    eof_parse: EOFParse, log_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that containers are validated by one-shot processes without pty."""
+    monkeypatch.setitem(sys.modules, "pty", None)
+    assert eof_parse.validate(Bytes("0xef0001")) == "OK 01"
+    assert eof_parse.validate(Bytes("0x00")) == "err: invalid_prefix"
+    assert log_path.read_text().splitlines() == [
+        "start ",
+        "validate 0xef0001",
+        "start ",
+        "validate 0x00",
+    ]
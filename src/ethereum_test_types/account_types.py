@@ -3,7 +3,7 @@
 import json
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, ItemsView, Iterator, List, Literal, Optional, Self, Tuple
+from typing import Any, Dict, ItemsView, Iterable, Iterator, List, Literal, Optional, Self, Tuple
 
 from coincurve.keys import PrivateKey
 from ethereum_types.bytes import Bytes20
@@ -24,6 +24,7 @@ from ethereum_test_base_types.conversions import (
     FixedSizeBytesConvertible,
     NumberConvertible,
 )
+from ethereum_test_forks import Fork
 from ethereum_test_vm import EVMCodeType
 
 from .trie import EMPTY_TRIE_ROOT, FrontierAccount, Trie, root, trie_get, trie_set
@@ -114,9 +115,7 @@ class EOA(Address):
         if address is None:
             if key is None:
                 raise ValueError("impossible to initialize EOA without address")
-            private_key = PrivateKey(Hash(key))
-            public_key = private_key.public_key
-            address = Address(keccak256(public_key.format(compressed=False)[1:])[32 - 20 :])
+            address = cls.address_of_key(key)
         elif isinstance(address, EOA):
             return address
         instance = super(EOA, cls).__new__(cls, address)
@@ -124,6 +123,12 @@ class EOA(Address):
         instance.nonce = Number(nonce)
         return instance
 
+    @staticmethod
+    def address_of_key(key: FixedSizeBytesConvertible) -> Address:
+        """Derive the address controlled by a private key."""
+        public_key = PrivateKey(Hash(key)).public_key
+        return Address(keccak256(public_key.format(compressed=False)[1:])[32 - 20 :])
+
     def get_nonce(self) -> Number:
         """Return current nonce of the EOA and increments it by one."""
         nonce = self.nonce
@@ -135,6 +140,10 @@ class EOA(Address):
         return self.__class__(Address(self), key=self.key, nonce=self.nonce)
 
 
+_fork_pre_allocations: Dict[Tuple[Fork, bool], "Alloc"] = {}
+"""Validated pre-allocations of the forks, see `Alloc.fork_pre_allocation`."""
+
+
 class Alloc(BaseAlloc):
     """Allocation of accounts in the state, pre and post test execution."""
 
@@ -208,6 +217,33 @@ class Alloc(BaseAlloc):
         OVERWRITE = auto()
         ALLOW_IDENTICAL_ACCOUNTS = auto()
 
+    @classmethod
+    def check_key_collisions(
+        cls,
+        alloc_1: "Alloc",
+        alloc_2: "Alloc",
+        overlapping_keys: Iterable[Address],
+        key_collision_mode: KeyCollisionMode,
+    ) -> None:
+        """Raise if the overlapping keys of two allocations collide."""
+        if key_collision_mode == cls.KeyCollisionMode.ERROR:
+            overlapping_keys = list(overlapping_keys)
+            if overlapping_keys:
+                raise Exception(
+                    f"Overlapping keys detected: {[key.hex() for key in overlapping_keys]}"
+                )
+        elif key_collision_mode == cls.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS:
+            # The overlapping keys must point to the exact same account
+            for key in overlapping_keys:
+                account_1 = alloc_1[key]
+                account_2 = alloc_2[key]
+                if account_1 != account_2:
+                    raise Alloc.CollisionError(
+                        address=key,
+                        account_1=account_1,
+                        account_2=account_2,
+                    )
+
     @classmethod
     def merge(
         cls,
@@ -216,23 +252,9 @@ class Alloc(BaseAlloc):
         key_collision_mode: KeyCollisionMode = KeyCollisionMode.OVERWRITE,
     ) -> "Alloc":
         """Return merged allocation of two sources."""
-        overlapping_keys = alloc_1.root.keys() & alloc_2.root.keys()
-        if overlapping_keys:
-            if key_collision_mode == cls.KeyCollisionMode.ERROR:
-                raise Exception(
-                    f"Overlapping keys detected: {[key.hex() for key in overlapping_keys]}"
-                )
-            elif key_collision_mode == cls.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS:
-                # The overlapping keys must point to the exact same account
-                for key in overlapping_keys:
-                    account_1 = alloc_1[key]
-                    account_2 = alloc_2[key]
-                    if account_1 != account_2:
-                        raise Alloc.CollisionError(
-                            address=key,
-                            account_1=account_1,
-                            account_2=account_2,
-                        )
+        cls.check_key_collisions(
+            alloc_1, alloc_2, alloc_1.root.keys() & alloc_2.root.keys(), key_collision_mode
+        )
         merged = alloc_1.model_dump()
 
         for address, other_account in alloc_2.root.items():
@@ -244,6 +266,60 @@ class Alloc(BaseAlloc):
 
         return Alloc(merged)
 
+    def merge_in_place(
+        self,
+        other: "Alloc",
+        key_collision_mode: KeyCollisionMode = KeyCollisionMode.OVERWRITE,
+    ) -> None:
+        """
+        Merge another allocation into this one, with the same result as
+        `Alloc.merge`.
+
+        Only the accounts of the other allocation are visited and copied, so
+        merging many small allocations into a large one takes linear time.
+        """
+        self.check_key_collisions(
+            self,
+            other,
+            (address for address in other.root if address in self.root),
+            key_collision_mode,
+        )
+        for address, other_account in other.root.items():
+            merged_account = Account.merge(self.root.get(address, None), other_account)
+            if merged_account:
+                self.root[address] = merged_account
+            else:
+                self.root.pop(address, None)
+
+    @classmethod
+    def fork_pre_allocation(cls, fork: Fork, *, blockchain: bool = False) -> "Alloc":
+        """
+        Return the pre-allocation required by the fork, for blockchain tests
+        if `blockchain` is set.
+
+        The pre-allocation is validated once per process and fork, and a
+        shallow copy is returned: accounts can be added, replaced (e.g. by
+        `merge_in_place`) or removed, but the accounts themselves are shared
+        with the cache and must not be modified.
+        """
+        key = (fork, blockchain)
+        if key not in _fork_pre_allocations:
+            pre_allocation = (
+                fork.pre_allocation_blockchain() if blockchain else fork.pre_allocation()
+            )
+            # All account fields are set, as in the accounts merged by
+            # `Alloc.merge`.
+            _fork_pre_allocations[key] = Alloc(Alloc.model_validate(pre_allocation).model_dump())
+        return Alloc.model_construct(root=dict(_fork_pre_allocations[key].root))
+
+    @staticmethod
+    def clear_fork_pre_allocation_cache() -> None:
+        """
+        Clear the cached pre-allocations of the forks, e.g. after patching the
+        pre-allocation of a fork in a test.
+        """
+        _fork_pre_allocations.clear()
+
     def __iter__(self) -> Iterator[Address]:  # type: ignore [override]
         """Return iterator over the allocation."""
         return iter(self.root)
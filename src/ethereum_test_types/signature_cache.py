@@ -0,0 +1,203 @@
+"""
+Process-wide cache of the recoverable signatures of transactions and
+authorization tuples.
+
+The same transaction is signed for every fork and fixture format a test is
+filled for. The signatures are deterministic (RFC 6979), so the signature and
+the signer address of a signing hash and private key are computed once and
+then reused. The cache can be stored to and loaded from a file to be reused
+across sessions; otherwise it holds at most `MAX_UNSAVED_SIGNATURES`.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from coincurve.keys import PrivateKey
+from filelock import FileLock
+
+from .utils import keccak256
+
+SIGNATURE_SIZE = 65
+SIGNER_SIZE = 20
+CACHE_KEY_SIZE = 32
+RECORD_SIZE = CACHE_KEY_SIZE + SIGNATURE_SIZE + SIGNER_SIZE
+BATCH_SIGNING_MIN_SIGNATURES = 1_000
+"""Number of missing signatures from which batches are signed in a pool."""
+MAX_UNSAVED_SIGNATURES = 100_000
+"""Number of signatures kept by a cache that is not saved to a file."""
+
+
+def default_max_workers() -> int:
+    """
+    Return the number of processes that sign a batch: one per CPU, or a
+    single one in a pytest-xdist worker, whose siblings already use the CPUs.
+    """
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        return 1
+    return os.cpu_count() or 1
+
+
+def signature_and_signer(secret_key: bytes, signing_hash: bytes) -> Tuple[bytes, bytes]:
+    """
+    Sign the hash with the private key and return the recoverable signature
+    and the address of the signer.
+    """
+    private_key = PrivateKey(secret=secret_key)
+    signature = private_key.sign_recoverable(signing_hash, hasher=None)
+    signer = keccak256(private_key.public_key.format(compressed=False)[1:])[32 - 20 :]
+    return signature, bytes(signer)
+
+
+def signatures_and_signers(requests: Sequence[Tuple[bytes, bytes]]) -> List[bytes]:
+    """
+    Sign a batch of hashes in a worker process and return each signature
+    followed by the address of the signer.
+    """
+    return [
+        b"".join(signature_and_signer(secret_key, signing_hash))
+        for secret_key, signing_hash in requests
+    ]
+
+
+def stored_records(data: bytes) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    Return the keys and entries of the complete records of a cache file; a
+    record that was only partially written is ignored.
+    """
+    for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+        yield (
+            data[offset : offset + CACHE_KEY_SIZE],
+            data[offset + CACHE_KEY_SIZE : offset + RECORD_SIZE],
+        )
+
+
+class SignatureCache:
+    """
+    Signatures and signer addresses keyed on the hash of the private key and
+    the signing hash, so that the private keys are not stored.
+
+    The keys of the signatures to save are only recorded if the cache is
+    `persistent`; otherwise the cache is emptied when it holds
+    `MAX_UNSAVED_SIGNATURES`.
+    """
+
+    entries: Dict[bytes, bytes]
+    new_keys: List[bytes]
+    persistent: bool
+
+    def __init__(self, *, persistent: bool = False) -> None:
+        """Initialize an empty cache."""
+        self.entries = {}
+        self.new_keys = []
+        self.persistent = persistent
+
+    @staticmethod
+    def cache_key(secret_key: bytes, signing_hash: bytes) -> bytes:
+        """Return the key of a signature in the cache."""
+        return bytes(keccak256(secret_key + signing_hash))
+
+    def sign(self, secret_key: bytes, signing_hash: bytes) -> Tuple[bytes, bytes]:
+        """
+        Return the recoverable signature of the hash and the address of the
+        signer, signing the hash only if it was not signed before.
+        """
+        key = self.cache_key(secret_key, signing_hash)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = b"".join(signature_and_signer(secret_key, signing_hash))
+            self.add(key, entry)
+        return entry[:SIGNATURE_SIZE], entry[SIGNATURE_SIZE:]
+
+    def sign_batch(
+        self, requests: Sequence[Tuple[bytes, bytes]], *, max_workers: int | None = None
+    ) -> None:
+        """
+        Add the signatures of all the (private key, signing hash) requests to
+        the cache.
+
+        If at least `BATCH_SIGNING_MIN_SIGNATURES` signatures are missing, they
+        are computed in a pool of `max_workers` processes, by default
+        `default_max_workers()`.
+        """
+        missing: Dict[bytes, Tuple[bytes, bytes]] = {}
+        for secret_key, signing_hash in requests:
+            key = self.cache_key(secret_key, signing_hash)
+            if key not in self.entries:
+                missing[key] = (secret_key, signing_hash)
+        if max_workers is None:
+            max_workers = default_max_workers()
+        if len(missing) < BATCH_SIGNING_MIN_SIGNATURES or max_workers == 1:
+            for secret_key, signing_hash in missing.values():
+                self.sign(secret_key, signing_hash)
+            return
+
+        missing_requests = list(missing.values())
+        chunk_size = -(-len(missing_requests) // max_workers)
+        chunks = [
+            missing_requests[i : i + chunk_size]
+            for i in range(0, len(missing_requests), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            entries = [
+                entry for chunk in executor.map(signatures_and_signers, chunks) for entry in chunk
+            ]
+        for key, entry in zip(missing, entries, strict=True):
+            self.add(key, entry)
+
+    def add(self, key: bytes, entry: bytes) -> None:
+        """Add a signature followed by the signer address to the cache."""
+        if self.persistent:
+            self.new_keys.append(key)
+        elif len(self.entries) >= MAX_UNSAVED_SIGNATURES:
+            self.entries.clear()
+        self.entries[key] = entry
+
+    def load(self, path: Path) -> int:
+        """
+        Load the signatures stored in the file and return how many were
+        loaded.
+        """
+        if not path.is_file():
+            return 0
+        with FileLock(path.with_suffix(".lock")):
+            data = path.read_bytes()
+        loaded = 0
+        for key, entry in stored_records(data):
+            if key not in self.entries:
+                self.entries[key] = entry
+                loaded += 1
+        return loaded
+
+    def save(self, path: Path) -> int:
+        """
+        Append the signatures added since the cache was created, loaded or
+        last saved to the file and return how many were saved.
+
+        Signatures that another process, e.g. a sibling pytest-xdist worker,
+        stored in the meantime are skipped, and a partially written record at
+        the end of the file is overwritten.
+        """
+        new_keys = dict.fromkeys(self.new_keys)
+        self.new_keys = []
+        if not new_keys:
+            return 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(path.with_suffix(".lock")):
+            data = path.read_bytes() if path.is_file() else b""
+            stored_keys = {key for key, _ in stored_records(data)}
+            records = [key + self.entries[key] for key in new_keys if key not in stored_keys]
+            with path.open("ab") as f:
+                f.truncate(len(data) - len(data) % RECORD_SIZE)
+                f.write(b"".join(records))
+        return len(records)
+
+    def clear(self) -> None:
+        """Remove all signatures from the cache."""
+        self.entries.clear()
+        self.new_keys = []
+
+
+signature_cache = SignatureCache()
+"""Signature cache of the process."""
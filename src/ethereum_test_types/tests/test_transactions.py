@@ -1,11 +1,16 @@
 """Test suite for transaction signing and serialization."""
 
+from pathlib import Path
 from typing import Tuple
 
 import pytest
+from coincurve.keys import PrivateKey
 
-from ethereum_test_base_types import AccessList, Hash
+from ethereum_test_base_types import AccessList, Hash, TestPrivateKey
 
+from .. import signature_cache as signature_cache_module
+from .. import transaction_types
+from ..signature_cache import RECORD_SIZE, SignatureCache, signature_cache
 from ..transaction_types import Transaction
 
 
@@ -263,3 +268,108 @@ def test_transaction_signing(
     assert tx.sender is not None
     assert tx.sender.hex() == expected_sender
     assert (tx.rlp().hex()) == expected_serialized
+
+
+def test_signature_cache() -> None:
+    """Test that signatures are reused and identical to fresh signatures."""
+    signature_cache.clear()
+    tx = Transaction(ty=2, nonce=5, max_fee_per_gas=7, max_priority_fee_per_gas=1)
+    signed_tx = tx.with_signature_and_sender()
+    assert len(signature_cache.entries) == 1
+
+    assert tx.copy().with_signature_and_sender() == signed_tx
+    tx.sign()
+    assert (tx.v, tx.r, tx.s, tx.sender) == (
+        signed_tx.v,
+        signed_tx.r,
+        signed_tx.s,
+        signed_tx.sender,
+    )
+    assert len(signature_cache.entries) == 1
+
+    signature = PrivateKey(secret=Hash(TestPrivateKey)).sign_recoverable(
+        signed_tx.rlp_signing_bytes().keccak256(), hasher=None
+    )
+    assert signed_tx.signature_bytes == signature
+
+
+def test_signature_cache_persistence(tmp_path: Path) -> None:
+    """Test that the signatures are appended to and loaded from a file."""
+    path = tmp_path / "signatures.bin"
+    cache = SignatureCache(persistent=True)
+    first_signature = cache.sign(Hash(TestPrivateKey), b"\x01" * 32)
+    assert cache.save(path) == 1
+    cache.sign(Hash(TestPrivateKey), b"\x02" * 32)
+    assert cache.save(path) == 1
+    assert cache.save(path) == 0
+    assert path.stat().st_size == 2 * RECORD_SIZE
+
+    # A partially written record is ignored.
+    with path.open("ab") as f:
+        f.write(b"\x00" * (RECORD_SIZE - 1))
+    loaded_cache = SignatureCache(persistent=True)
+    assert loaded_cache.load(path) == 2
+    assert loaded_cache.entries == cache.entries
+    assert loaded_cache.sign(Hash(TestPrivateKey), b"\x01" * 32) == first_signature
+    assert loaded_cache.save(path) == 0
+
+
+def test_signature_cache_concurrent_saves(tmp_path: Path) -> None:
+    """
+    Test that the signatures that another process already stored are not
+    appended again, as with the pytest-xdist workers of a session.
+    """
+    path = tmp_path / "signatures.bin"
+    workers = [SignatureCache(persistent=True) for _ in range(2)]
+    for cache in workers:
+        assert cache.load(path) == 0
+        cache.sign(Hash(TestPrivateKey), b"\x01" * 32)
+    workers[1].sign(Hash(TestPrivateKey), b"\x02" * 32)
+    assert workers[0].save(path) == 1
+    assert workers[1].save(path) == 1
+    assert path.stat().st_size == 2 * RECORD_SIZE
+
+    # A partially written record is overwritten by the next save.
+    with path.open("ab") as f:
+        f.write(b"\x00" * (RECORD_SIZE - 1))
+    workers[0].sign(Hash(TestPrivateKey), b"\x03" * 32)
+    assert workers[0].save(path) == 1
+    assert path.stat().st_size == 3 * RECORD_SIZE
+    loaded_cache = SignatureCache()
+    assert loaded_cache.load(path) == 3
+
+
+def test_list_with_signatures_and_senders(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that signing a batch in a process pool gives equal signatures."""
+    monkeypatch.setattr(signature_cache_module, "BATCH_SIGNING_MIN_SIGNATURES", 4)
+    monkeypatch.setattr(transaction_types, "BATCH_SIGNING_MIN_SIGNATURES", 4)
+    txs = [Transaction(nonce=nonce, secret_key=Hash(1 + nonce % 3)) for nonce in range(16)]
+
+    signature_cache.clear()
+    expected_txs = [tx.with_signature_and_sender() for tx in txs]
+    signature_cache.clear()
+    signed_txs = Transaction.list_with_signatures_and_senders(txs, max_workers=2)
+    assert len(signature_cache.entries) == len(txs)
+    assert signed_txs == expected_txs
+    assert [tx.sender for tx in signed_txs] == [tx.sender for tx in expected_txs]
+
+
+def test_signature_cache_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a cache that is not saved does not record the signatures to
+    save and is bounded.
+    """
+    monkeypatch.setattr(signature_cache_module, "MAX_UNSAVED_SIGNATURES", 4)
+    cache = SignatureCache()
+    for i in range(6):
+        cache.sign(Hash(TestPrivateKey), i.to_bytes(32, "big"))
+    assert cache.new_keys == []
+    assert len(cache.entries) == 2
+
+
+def test_default_max_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an xdist worker signs batches in a single process."""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+    assert signature_cache_module.default_max_workers() == 1
+    monkeypatch.delenv("PYTEST_XDIST_WORKER")
+    assert signature_cache_module.default_max_workers() >= 1
@@ -1,6 +1,7 @@
 """Test suite for `ethereum_test` module."""
 
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Mapping
 
 import pytest
 
@@ -15,6 +16,7 @@ from ethereum_test_base_types import (
     to_json,
 )
 from ethereum_test_base_types.pydantic import CopyValidateModel
+from ethereum_test_forks import Cancun, CancunToPragueAtTime15k, Fork, Frontier, Prague
 
 from ..account_types import EOA, Alloc
 from ..block_types import (
@@ -361,6 +363,120 @@ def test_account_check_alloc(
 def test_alloc_append(alloc_1: Alloc, alloc_2: Alloc, expected_alloc: Alloc) -> None:
     """Test `ethereum_test.types.alloc` merging."""
     assert Alloc.merge(alloc_1, alloc_2) == expected_alloc
+    alloc_2_before = alloc_2.copy()
+    alloc_1.merge_in_place(alloc_2)
+    assert alloc_1 == expected_alloc
+    assert alloc_2 == alloc_2_before
+
+
+@pytest.mark.parametrize(
+    ["key_collision_mode", "alloc_2", "expected_exception"],
+    [
+        pytest.param(
+            Alloc.KeyCollisionMode.ERROR,
+            Alloc({0x1: {"nonce": 1}}),  # type: ignore
+            Exception,
+            id="error",
+        ),
+        pytest.param(
+            Alloc.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS,
+            Alloc({0x1: {"nonce": 2}}),  # type: ignore
+            Alloc.CollisionError,
+            id="allow_identical_accounts",
+        ),
+    ],
+)
+def test_alloc_merge_collision(
+    key_collision_mode: Alloc.KeyCollisionMode,
+    alloc_2: Alloc,
+    expected_exception: type[Exception],
+) -> None:
+    """Test that both merges detect colliding accounts before merging."""
+    alloc_1 = Alloc({0x1: {"nonce": 1}, 0x2: {"nonce": 2}})  # type: ignore
+    with pytest.raises(expected_exception):
+        Alloc.merge(alloc_1, alloc_2, key_collision_mode=key_collision_mode)
+    with pytest.raises(expected_exception):
+        alloc_1.merge_in_place(alloc_2, key_collision_mode=key_collision_mode)
+    assert alloc_1 == Alloc({0x1: {"nonce": 1}, 0x2: {"nonce": 2}})  # type: ignore
+
+    alloc_1.merge_in_place(
+        Alloc({0x2: {"nonce": 2}, 0x3: None}),  # type: ignore
+        key_collision_mode=Alloc.KeyCollisionMode.ALLOW_IDENTICAL_ACCOUNTS,
+    )
+    assert alloc_1 == Alloc({0x1: {"nonce": 1}, 0x2: {"nonce": 2}})  # type: ignore
+
+
+@pytest.mark.parametrize("blockchain", [False, True])
+@pytest.mark.parametrize("fork", [Frontier, Cancun, Prague, CancunToPragueAtTime15k])
+def test_fork_pre_allocation(fork: Fork, blockchain: bool) -> None:
+    """
+    Test that merging with the cached pre-allocation of a fork is unchanged.
+    """
+    pre_allocation = fork.pre_allocation_blockchain() if blockchain else fork.pre_allocation()
+    pre = Alloc({0x1000: Account(balance=1), 0x1001: Account(code=b"\x00")})  # type: ignore
+    for address in pre_allocation:
+        pre[address] = Account(storage={1: 1})
+    expected_pre = Alloc.merge(Alloc.model_validate(pre_allocation), pre)
+
+    merged_pre = Alloc.fork_pre_allocation(fork, blockchain=blockchain)
+    merged_pre.merge_in_place(pre)
+    assert merged_pre.model_dump_json() == expected_pre.model_dump_json()
+
+    # The returned copies do not share the cached allocation.
+    for address in pre_allocation:
+        del merged_pre[address]
+    assert Alloc.fork_pre_allocation(fork, blockchain=blockchain) == Alloc.model_validate(
+        pre_allocation
+    )
+
+
+def test_fork_pre_allocation_cache_clear(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that clearing the cache reflects a patched fork pre-allocation."""
+
+    def pre_allocation_blockchain(cls: Fork, **kwargs: Any) -> Mapping:
+        del cls, kwargs
+        return {0x1000: {"nonce": 1}}
+
+    Alloc.fork_pre_allocation(Prague, blockchain=True)
+    monkeypatch.setattr(
+        Prague, "pre_allocation_blockchain", classmethod(pre_allocation_blockchain)
+    )
+    try:
+        assert 0x1000 not in Alloc.fork_pre_allocation(Prague, blockchain=True)
+        Alloc.clear_fork_pre_allocation_cache()
+        assert Alloc.fork_pre_allocation(Prague, blockchain=True) == Alloc(
+            {0x1000: Account(nonce=1)}  # type: ignore
+        )
+    finally:
+        monkeypatch.undo()
+        Alloc.clear_fork_pre_allocation_cache()
+    assert 0x1000 not in Alloc.fork_pre_allocation(Prague, blockchain=True)
+
+
+@pytest.mark.framework_benchmark
+def test_fork_pre_allocation_benchmark() -> None:
+    """
+    Benchmark merging the pre-allocation of a fork into the genesis of a
+    test.
+    """
+    pre = Alloc({0x1000 + i: Account(balance=10**18, nonce=1) for i in range(4)})  # type: ignore
+    tests = 200
+
+    start_time = time.perf_counter()
+    for _ in range(tests):
+        Alloc.merge(Alloc.model_validate(Prague.pre_allocation_blockchain()), pre)
+    uncached_duration = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(tests):
+        merged_pre = Alloc.fork_pre_allocation(Prague, blockchain=True)
+        merged_pre.merge_in_place(pre)
+    cached_duration = time.perf_counter() - start_time
+
+    print(
+        f"Prague genesis pre-allocation per test: {1e6 * uncached_duration / tests:.0f}us "
+        f"uncached, {1e6 * cached_duration / tests:.0f}us cached"
+    )
 
 
 @pytest.mark.parametrize(
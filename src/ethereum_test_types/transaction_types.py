@@ -6,7 +6,7 @@ from functools import cached_property
 from typing import Any, ClassVar, Dict, Generic, List, Literal, Sequence
 
 import ethereum_rlp as eth_rlp
-from coincurve.keys import PrivateKey, PublicKey
+from coincurve.keys import PublicKey
 from ethereum_types.numeric import Uint
 from pydantic import (
     AliasChoices,
@@ -40,6 +40,7 @@ from .blob_types import Blob
 from .chain_config_types import ChainConfigDefaults
 from .phase_manager import TestPhase, TestPhaseManager
 from .receipt_types import TransactionReceipt
+from .signature_cache import BATCH_SIGNING_MIN_SIGNATURES, signature_cache
 from .utils import int_to_bytes, keccak256
 
 logger = get_logger(__name__)
@@ -119,6 +120,7 @@ class AuthorizationTuple(AuthorizationTupleGeneric[HexNumber]):
     def sign(self: "AuthorizationTuple") -> None:
         """Signs the authorization tuple with a private key."""
         signature_bytes: bytes | None = None
+        signer: bytes | None = None
         rlp_signing_bytes = self.rlp_signing_bytes()
         if (
             "v" not in self.model_fields_set
@@ -134,8 +136,8 @@ class AuthorizationTuple(AuthorizationTupleGeneric[HexNumber]):
                 signing_key = eoa.key
             assert signing_key is not None, "secret_key or signer must be set"
 
-            signature_bytes = PrivateKey(secret=signing_key).sign_recoverable(
-                rlp_signing_bytes, hasher=keccak256
+            signature_bytes, signer = signature_cache.sign(
+                signing_key, rlp_signing_bytes.keccak256()
             )
             self.v, self.r, self.s = (
                 HexNumber(signature_bytes[64]),
@@ -147,6 +149,9 @@ class AuthorizationTuple(AuthorizationTupleGeneric[HexNumber]):
             self.model_fields_set.add("s")
 
         if self.signer is None:
+            if signer is not None:
+                self.signer = EOA(address=Address(signer))
+                return
             try:
                 if not signature_bytes:
                     signature_bytes = (
@@ -417,6 +422,7 @@ class Transaction(
     def sign(self: "Transaction") -> None:
         """Signs the authorization tuple with a private key."""
         signature_bytes: bytes | None = None
+        sender: bytes | None = None
         rlp_signing_bytes = self.rlp_signing_bytes()
         if (
             "v" not in self.model_fields_set
@@ -433,8 +439,8 @@ class Transaction(
                 signing_key = eoa.key
             assert signing_key is not None, "secret_key or signer must be set"
 
-            signature_bytes = PrivateKey(secret=signing_key).sign_recoverable(
-                rlp_signing_bytes, hasher=keccak256
+            signature_bytes, sender = signature_cache.sign(
+                signing_key, rlp_signing_bytes.keccak256()
             )
             v, r, s = (
                 signature_bytes[64],
@@ -452,6 +458,9 @@ class Transaction(
             self.model_fields_set.add("s")
 
         if self.sender is None:
+            if sender is not None:
+                self.sender = EOA(address=Address(sender))
+                return
             try:
                 if not signature_bytes:
                     v = self.v
@@ -499,18 +508,10 @@ class Transaction(
         if self.secret_key is None:
             raise ValueError("secret_key must be set to sign a transaction")
 
-        # Get the signing bytes
-        signing_hash = self.rlp_signing_bytes().keccak256()
-
-        # Sign the bytes
-        signature_bytes = PrivateKey(secret=self.secret_key).sign_recoverable(
-            signing_hash, hasher=None
-        )
-        public_key = PublicKey.from_signature_and_message(
-            signature_bytes, signing_hash, hasher=None
+        # Sign the signing hash, or reuse the signature of a previous call
+        signature_bytes, sender = signature_cache.sign(
+            self.secret_key, self.rlp_signing_bytes().keccak256()
         )
-
-        sender = keccak256(public_key.format(compressed=False)[1:])[32 - 20 :]
         updated_values["sender"] = Address(sender)
 
         v, r, s = (
@@ -681,6 +682,28 @@ class Transaction(
             t.set(eth_rlp.encode(Uint(i)), tx.rlp())
         return Hash(t.root_hash)
 
+    @staticmethod
+    def list_with_signatures_and_senders(
+        input_txs: Sequence["Transaction"], *, max_workers: int | None = None
+    ) -> List["Transaction"]:
+        """
+        Return signed versions of a list of transactions, as
+        `with_signature_and_sender`.
+
+        Large lists of transactions that were not signed before are signed in
+        a process pool of `max_workers` processes.
+        """
+        if len(input_txs) >= BATCH_SIGNING_MIN_SIGNATURES:
+            signature_cache.sign_batch(
+                [
+                    (tx.secret_key, tx.rlp_signing_bytes().keccak256())
+                    for tx in input_txs
+                    if tx.secret_key is not None and not {"v", "r", "s"} & tx.model_fields_set
+                ],
+                max_workers=max_workers,
+            )
+        return [tx.with_signature_and_sender() for tx in input_txs]
+
     @staticmethod
     def list_blob_versioned_hashes(input_txs: List["Transaction"]) -> List[Hash]:
         """
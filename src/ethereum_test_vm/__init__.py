@@ -1,13 +1,20 @@
 """Ethereum Virtual Machine related definitions and utilities."""
 
+from .analysis import BasicBlock, BytecodeAnalysis, DynamicCost, Loop
 from .bytecode import Bytecode
 from .evm_types import EVMCodeType
 from .helpers import MemoryVariable, call_return_code
 from .opcodes import Macro, Macros, Opcode, OpcodeCallArg, Opcodes, UndefinedOpcodes
+from .template import BytecodeTemplate
 
 __all__ = (
+    "BasicBlock",
     "Bytecode",
+    "BytecodeAnalysis",
+    "BytecodeTemplate",
+    "DynamicCost",
     "EVMCodeType",
+    "Loop",
     "Macro",
     "Macros",
     "MemoryVariable",
@@ -0,0 +1,504 @@
+"""
+Static gas and stack analysis of legacy EVM bytecode.
+
+The bytecode is split into basic blocks at the jump destinations and after the
+jumps and terminating opcodes, and the blocks are linked into a control flow
+graph. Jump destinations are resolved when the jump is immediately preceded by
+a push, which is how `Opcodes.JUMP(pc)` and `Opcodes.JUMPI(pc, condition)` are
+encoded.
+
+The static gas of an instruction is taken from `fork.gas_costs()`. Opcodes
+whose cost depends on the execution (memory expansion, account and storage
+access, copied words, etc.) are counted at their minimum cost, which for the
+account and storage access opcodes is the warm access cost, and reported in
+`BytecodeAnalysis.dynamic_costs`.
+
+The gas costs of the forks before Berlin, which changed the costs of the
+account and storage access opcodes several times, are not modeled.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from .bytecode import Bytecode
+from .opcodes import Opcodes
+
+if TYPE_CHECKING:
+    from ethereum_test_forks import Fork
+
+OPCODES_BY_BYTE: Dict[int, Opcodes] = {opcode.int(): opcode for opcode in Opcodes}
+
+STATIC_GAS_COSTS: Dict[Opcodes, Tuple[str, ...]] = {
+    Opcodes.STOP: (),
+    Opcodes.ADD: ("G_VERY_LOW",),
+    Opcodes.MUL: ("G_LOW",),
+    Opcodes.SUB: ("G_VERY_LOW",),
+    Opcodes.DIV: ("G_LOW",),
+    Opcodes.SDIV: ("G_LOW",),
+    Opcodes.MOD: ("G_LOW",),
+    Opcodes.SMOD: ("G_LOW",),
+    Opcodes.ADDMOD: ("G_MID",),
+    Opcodes.MULMOD: ("G_MID",),
+    Opcodes.EXP: ("G_EXP",),
+    Opcodes.SIGNEXTEND: ("G_LOW",),
+    Opcodes.LT: ("G_VERY_LOW",),
+    Opcodes.GT: ("G_VERY_LOW",),
+    Opcodes.SLT: ("G_VERY_LOW",),
+    Opcodes.SGT: ("G_VERY_LOW",),
+    Opcodes.EQ: ("G_VERY_LOW",),
+    Opcodes.ISZERO: ("G_VERY_LOW",),
+    Opcodes.AND: ("G_VERY_LOW",),
+    Opcodes.OR: ("G_VERY_LOW",),
+    Opcodes.XOR: ("G_VERY_LOW",),
+    Opcodes.NOT: ("G_VERY_LOW",),
+    Opcodes.BYTE: ("G_VERY_LOW",),
+    Opcodes.SHL: ("G_VERY_LOW",),
+    Opcodes.SHR: ("G_VERY_LOW",),
+    Opcodes.SAR: ("G_VERY_LOW",),
+    Opcodes.CLZ: ("G_LOW",),
+    Opcodes.SHA3: ("G_KECCAK_256",),
+    Opcodes.ADDRESS: ("G_BASE",),
+    Opcodes.BALANCE: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.ORIGIN: ("G_BASE",),
+    Opcodes.CALLER: ("G_BASE",),
+    Opcodes.CALLVALUE: ("G_BASE",),
+    Opcodes.CALLDATALOAD: ("G_VERY_LOW",),
+    Opcodes.CALLDATASIZE: ("G_BASE",),
+    Opcodes.CALLDATACOPY: ("G_VERY_LOW",),
+    Opcodes.CODESIZE: ("G_BASE",),
+    Opcodes.CODECOPY: ("G_VERY_LOW",),
+    Opcodes.GASPRICE: ("G_BASE",),
+    Opcodes.EXTCODESIZE: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.EXTCODECOPY: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.RETURNDATASIZE: ("G_BASE",),
+    Opcodes.RETURNDATACOPY: ("G_VERY_LOW",),
+    Opcodes.EXTCODEHASH: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.BLOCKHASH: ("G_BLOCKHASH",),
+    Opcodes.COINBASE: ("G_BASE",),
+    Opcodes.TIMESTAMP: ("G_BASE",),
+    Opcodes.NUMBER: ("G_BASE",),
+    Opcodes.PREVRANDAO: ("G_BASE",),
+    Opcodes.GASLIMIT: ("G_BASE",),
+    Opcodes.CHAINID: ("G_BASE",),
+    Opcodes.SELFBALANCE: ("G_LOW",),
+    Opcodes.BASEFEE: ("G_BASE",),
+    Opcodes.BLOBHASH: ("G_VERY_LOW",),
+    Opcodes.BLOBBASEFEE: ("G_BASE",),
+    Opcodes.POP: ("G_BASE",),
+    Opcodes.MLOAD: ("G_VERY_LOW",),
+    Opcodes.MSTORE: ("G_VERY_LOW",),
+    Opcodes.MSTORE8: ("G_VERY_LOW",),
+    Opcodes.SLOAD: ("G_WARM_SLOAD",),
+    Opcodes.SSTORE: ("G_WARM_SLOAD",),
+    Opcodes.JUMP: ("G_MID",),
+    Opcodes.JUMPI: ("G_HIGH",),
+    Opcodes.PC: ("G_BASE",),
+    Opcodes.MSIZE: ("G_BASE",),
+    Opcodes.GAS: ("G_BASE",),
+    Opcodes.JUMPDEST: ("G_JUMPDEST",),
+    Opcodes.TLOAD: ("G_WARM_SLOAD",),
+    Opcodes.TSTORE: ("G_WARM_SLOAD",),
+    Opcodes.MCOPY: ("G_VERY_LOW",),
+    Opcodes.PUSH0: ("G_BASE",),
+    **{
+        OPCODES_BY_BYTE[byte]: ("G_VERY_LOW",)
+        for byte in range(Opcodes.PUSH1.int(), Opcodes.SWAP16.int() + 1)
+    },
+    **{
+        OPCODES_BY_BYTE[Opcodes.LOG0.int() + topics]: ("G_LOG",) + ("G_LOG_TOPIC",) * topics
+        for topics in range(5)
+    },
+    Opcodes.CREATE: ("G_CREATE",),
+    Opcodes.CALL: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.CALLCODE: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.RETURN: (),
+    Opcodes.DELEGATECALL: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.CREATE2: ("G_CREATE",),
+    Opcodes.STATICCALL: ("G_WARM_ACCOUNT_ACCESS",),
+    Opcodes.REVERT: (),
+    Opcodes.SELFDESTRUCT: ("G_SELF_DESTRUCT",),
+}
+"""
+Names of the `GasCosts` constants that add up to the static gas of each legacy
+opcode.
+"""
+
+DYNAMIC_GAS_COSTS: Dict[Opcodes, str] = {
+    Opcodes.EXP: "exponent byte size",
+    Opcodes.SHA3: "hashed words and memory expansion",
+    Opcodes.BALANCE: "cold account access",
+    Opcodes.CALLDATACOPY: "copied words and memory expansion",
+    Opcodes.CODECOPY: "copied words and memory expansion",
+    Opcodes.EXTCODESIZE: "cold account access",
+    Opcodes.EXTCODECOPY: "cold account access, copied words and memory expansion",
+    Opcodes.RETURNDATACOPY: "copied words and memory expansion",
+    Opcodes.EXTCODEHASH: "cold account access",
+    Opcodes.MLOAD: "memory expansion",
+    Opcodes.MSTORE: "memory expansion",
+    Opcodes.MSTORE8: "memory expansion",
+    Opcodes.SLOAD: "cold storage access",
+    Opcodes.SSTORE: "cold storage access and storage writes",
+    Opcodes.MCOPY: "copied words and memory expansion",
+    **{
+        OPCODES_BY_BYTE[Opcodes.LOG0.int() + topics]: "logged bytes and memory expansion"
+        for topics in range(5)
+    },
+    Opcodes.CREATE: "init code, deployed code and memory expansion",
+    Opcodes.CALL: "cold account access, value transfer, memory expansion and forwarded gas",
+    Opcodes.CALLCODE: "cold account access, value transfer, memory expansion and forwarded gas",
+    Opcodes.RETURN: "memory expansion",
+    Opcodes.DELEGATECALL: "cold account access, memory expansion and forwarded gas",
+    Opcodes.CREATE2: "hashed init code, deployed code and memory expansion",
+    Opcodes.STATICCALL: "cold account access, memory expansion and forwarded gas",
+    Opcodes.REVERT: "memory expansion",
+    Opcodes.SELFDESTRUCT: "cold account access and new account",
+}
+"""Part of the gas cost of each opcode that depends on the execution."""
+
+HALTING_OPCODES: FrozenSet[Opcodes] = frozenset(
+    {
+        Opcodes.STOP,
+        Opcodes.RETURN,
+        Opcodes.REVERT,
+        Opcodes.SELFDESTRUCT,
+        Opcodes.JUMP,
+    }
+)
+"""
+Opcodes after which the execution never continues with the next one, besides
+the opcodes not defined in the fork, such as INVALID.
+"""
+
+
+@dataclass(kw_only=True, frozen=True)
+class Instruction:
+    """Instruction of the bytecode, `opcode` is None for undefined opcodes."""
+
+    pc: int
+    byte: int
+    opcode: Opcodes | None
+    immediate: bytes = b""
+
+
+@dataclass(kw_only=True, frozen=True)
+class DynamicCost:
+    """Instruction whose gas cost depends on the execution."""
+
+    pc: int
+    opcode: str
+    reason: str
+
+
+@dataclass(kw_only=True)
+class BasicBlock:
+    """
+    Straight-line sequence of instructions that is only entered at its first
+    instruction and only left after its last instruction.
+
+    The stack heights are relative to the stack height when entering the
+    block.
+    """
+
+    start: int
+    instructions: List[Instruction] = field(default_factory=list)
+    gas: int = 0
+    dynamic_costs: List[DynamicCost] = field(default_factory=list)
+    stack_required: int = 0
+    stack_delta: int = 0
+    stack_max_growth: int = 0
+    successors: List[int] = field(default_factory=list)
+    unresolved_jump: bool = False
+
+
+@dataclass(kw_only=True, frozen=True)
+class Loop:
+    """
+    Cycle of the control flow graph closed by a jump back to its head.
+
+    `gas_per_iteration` is the static gas of the most expensive path from the
+    head to the jump back, and `stack_delta_per_iteration` the stack height
+    change along that path.
+    """
+
+    head: int
+    back_edge_from: int
+    blocks: Tuple[int, ...]
+    gas_per_iteration: int
+    stack_delta_per_iteration: int
+    dynamic_costs: Tuple[DynamicCost, ...]
+
+
+class BytecodeAnalysis:
+    """
+    Control flow graph of legacy bytecode with the static gas and stack
+    requirements of its blocks and loops for a fork.
+    """
+
+    code: bytes
+    jumpdests: FrozenSet[int]
+    blocks: Dict[int, BasicBlock]
+    loops: List[Loop]
+    gas: int
+    max_stack_height: int
+    stack_underflows: List[int]
+
+    def __init__(self, code: Bytecode | bytes, fork: "Fork"):
+        """Analyze the bytecode for the fork."""
+        # Imported here because the forks depend on the opcodes.
+        from ethereum_test_forks import Berlin
+
+        if fork < Berlin:
+            raise ValueError(f"The gas costs of {fork.name()}, before Berlin, are not modeled")
+        self.code = bytes(code)
+        gas_costs = fork.gas_costs()
+        self.static_gas_costs = {
+            opcode: sum(getattr(gas_costs, name) for name in names)
+            for opcode, names in STATIC_GAS_COSTS.items()
+        }
+        self.valid_opcodes = frozenset(fork.valid_opcodes())
+        instructions = self.disassemble(self.code)
+        self.jumpdests = frozenset(
+            instruction.pc
+            for instruction in instructions
+            if instruction.opcode == Opcodes.JUMPDEST and instruction.opcode in self.valid_opcodes
+        )
+        self.blocks = self.build_blocks(instructions)
+        self.loops = []
+        self.gas = 0
+        self.max_stack_height = 0
+        self.stack_underflows = []
+        if self.blocks:
+            self.analyze_paths()
+
+    @staticmethod
+    def disassemble(code: bytes) -> List[Instruction]:
+        """Split the code into instructions, skipping the push data."""
+        instructions: List[Instruction] = []
+        pc = 0
+        while pc < len(code):
+            opcode = OPCODES_BY_BYTE.get(code[pc])
+            immediate_size = 0
+            if opcode is not None and Opcodes.PUSH1.int() <= code[pc] <= Opcodes.PUSH32.int():
+                immediate_size = opcode.data_portion_length
+            instructions.append(
+                Instruction(
+                    pc=pc,
+                    byte=code[pc],
+                    opcode=opcode,
+                    # Push data past the end of the code reads as zeros.
+                    immediate=code[pc + 1 : pc + 1 + immediate_size].ljust(immediate_size, b"\0"),
+                )
+            )
+            pc += 1 + immediate_size
+        return instructions
+
+    def build_blocks(self, instructions: List[Instruction]) -> Dict[int, BasicBlock]:
+        """Split the instructions into basic blocks and link them."""
+        blocks: Dict[int, BasicBlock] = {}
+        block: BasicBlock | None = None
+        for index, instruction in enumerate(instructions):
+            if block is None or instruction.pc in self.jumpdests:
+                new_block = BasicBlock(start=instruction.pc)
+                if block is not None:
+                    block.successors.append(new_block.start)
+                block = new_block
+                blocks[block.start] = block
+            self.add_instruction(block, instruction)
+
+            opcode = instruction.opcode
+            if opcode is None or opcode not in self.valid_opcodes:
+                block = None
+                continue
+            if opcode in (Opcodes.JUMP, Opcodes.JUMPI):
+                target = self.jump_target(block, instructions[index - 1] if index else None)
+                if target is None:
+                    block.unresolved_jump = True
+                elif target in self.jumpdests:
+                    block.successors.append(target)
+            if opcode == Opcodes.JUMPI and index + 1 < len(instructions):
+                if instructions[index + 1].pc not in block.successors:
+                    block.successors.append(instructions[index + 1].pc)
+            if opcode in HALTING_OPCODES or opcode == Opcodes.JUMPI:
+                block = None
+        return blocks
+
+    def add_instruction(self, block: BasicBlock, instruction: Instruction) -> None:
+        """Add the gas and the stack effect of the instruction to the block."""
+        block.instructions.append(instruction)
+        opcode = instruction.opcode
+        if opcode is None or opcode not in self.valid_opcodes:
+            block.dynamic_costs.append(
+                DynamicCost(
+                    pc=instruction.pc,
+                    opcode=f"0x{instruction.byte:02x}",
+                    reason="undefined opcode, consumes all the remaining gas",
+                )
+            )
+            return
+        if opcode in self.static_gas_costs:
+            block.gas += self.static_gas_costs[opcode]
+        else:
+            block.dynamic_costs.append(
+                DynamicCost(pc=instruction.pc, opcode=str(opcode), reason="unknown gas cost")
+            )
+        if opcode in DYNAMIC_GAS_COSTS:
+            block.dynamic_costs.append(
+                DynamicCost(
+                    pc=instruction.pc, opcode=str(opcode), reason=DYNAMIC_GAS_COSTS[opcode]
+                )
+            )
+        block.stack_required = max(
+            block.stack_required, opcode.min_stack_height - block.stack_delta
+        )
+        block.stack_delta += opcode.pushed_stack_items - opcode.popped_stack_items
+        block.stack_max_growth = max(block.stack_max_growth, block.stack_delta)
+
+    @staticmethod
+    def jump_target(block: BasicBlock, previous: Instruction | None) -> int | None:
+        """
+        Return the destination of a jump if it is pushed by the previous
+        instruction of the block.
+        """
+        if previous is None or previous.pc < block.start or previous.opcode is None:
+            return None
+        if not Opcodes.PUSH0.int() <= previous.byte <= Opcodes.PUSH32.int():
+            return None
+        return int.from_bytes(previous.immediate, "big")
+
+    def analyze_paths(self) -> None:
+        """
+        Find the loops, and the most expensive path and the stack height of
+        the blocks when every loop is executed once.
+        """
+        order: List[int] = []
+        back_edges: List[Tuple[int, int]] = []
+        on_path: Set[int] = {0}
+        visited: Set[int] = {0}
+        stack = [(0, iter(self.blocks[0].successors))]
+        while stack:
+            start, successors = stack[-1]
+            for successor in successors:
+                if successor in on_path:
+                    back_edges.append((start, successor))
+                elif successor not in visited:
+                    visited.add(successor)
+                    on_path.add(successor)
+                    stack.append((successor, iter(self.blocks[successor].successors)))
+                    break
+            else:
+                stack.pop()
+                on_path.remove(start)
+                order.append(start)
+        topological_order = order[::-1]
+        back_edge_set = set(back_edges)
+
+        def forward_successors(start: int) -> List[int]:
+            return [
+                successor
+                for successor in self.blocks[start].successors
+                if (start, successor) not in back_edge_set
+            ]
+
+        gas = {0: self.blocks[0].gas}
+        max_entry_height = {0: 0}
+        min_entry_height = {0: 0}
+        for start in topological_order:
+            block = self.blocks[start]
+            if min_entry_height[start] < block.stack_required:
+                self.stack_underflows.append(start)
+            self.max_stack_height = max(
+                self.max_stack_height, max_entry_height[start] + block.stack_max_growth
+            )
+            for successor in forward_successors(start):
+                successor_gas = gas[start] + self.blocks[successor].gas
+                gas[successor] = max(gas.get(successor, successor_gas), successor_gas)
+                height = max_entry_height[start] + block.stack_delta
+                max_entry_height[successor] = max(max_entry_height.get(successor, height), height)
+                height = min_entry_height[start] + block.stack_delta
+                min_entry_height[successor] = min(min_entry_height.get(successor, height), height)
+        self.gas = max(gas.values())
+
+        predecessors: Dict[int, List[int]] = {start: [] for start in visited}
+        for start in visited:
+            for successor in self.blocks[start].successors:
+                predecessors[successor].append(start)
+        for tail, head in back_edges:
+            body = {head}
+            pending = [tail]
+            while pending:
+                start = pending.pop()
+                if start not in body:
+                    body.add(start)
+                    pending.extend(predecessors[start])
+            # Most expensive path from the head to the tail within the loop.
+            path_costs = {head: (self.blocks[head].gas, self.blocks[head].stack_delta)}
+            for start in topological_order:
+                if start not in path_costs:
+                    continue
+                path_gas, path_stack_delta = path_costs[start]
+                for successor in forward_successors(start):
+                    if successor not in body:
+                        continue
+                    successor_cost = (
+                        path_gas + self.blocks[successor].gas,
+                        path_stack_delta + self.blocks[successor].stack_delta,
+                    )
+                    if successor not in path_costs or path_costs[successor] < successor_cost:
+                        path_costs[successor] = successor_cost
+            gas_per_iteration, stack_delta_per_iteration = path_costs[tail]
+            self.loops.append(
+                Loop(
+                    head=head,
+                    back_edge_from=tail,
+                    blocks=tuple(sorted(body)),
+                    gas_per_iteration=gas_per_iteration,
+                    stack_delta_per_iteration=stack_delta_per_iteration,
+                    dynamic_costs=tuple(
+                        dynamic_cost
+                        for start in sorted(body)
+                        for dynamic_cost in self.blocks[start].dynamic_costs
+                    ),
+                )
+            )
+        self.loops.sort(key=lambda loop: (loop.head, loop.back_edge_from))
+
+    @property
+    def dynamic_costs(self) -> List[DynamicCost]:
+        """Return the instructions whose gas cost depends on the execution."""
+        return [
+            dynamic_cost
+            for start in sorted(self.blocks)
+            for dynamic_cost in self.blocks[start].dynamic_costs
+        ]
+
+    @property
+    def unresolved_jumps(self) -> List[int]:
+        """Return the blocks ending in a jump to an unknown destination."""
+        return [start for start in sorted(self.blocks) if self.blocks[start].unresolved_jump]
+
+    def gas_cost_mismatches(self, trace: Iterable[Tuple[int, int]]) -> List[Tuple[int, int, int]]:
+        """
+        Compare the static gas of the instructions with the gas costs of an
+        execution trace of the code, given as (pc, gas cost) pairs, and return
+        the (pc, static gas, traced gas cost) of the instructions that differ.
+
+        Instructions with dynamic gas costs are not compared, and neither are
+        the trace entries whose pc is not an instruction of the code.
+        """
+        instructions = {
+            instruction.pc: instruction
+            for block in self.blocks.values()
+            for instruction in block.instructions
+        }
+        mismatches: List[Tuple[int, int, int]] = []
+        for pc, gas_cost in trace:
+            if pc not in instructions:
+                continue
+            opcode = instructions[pc].opcode
+            if opcode is None or opcode in DYNAMIC_GAS_COSTS:
+                continue
+            if opcode not in self.static_gas_costs or opcode not in self.valid_opcodes:
+                continue
+            if self.static_gas_costs[opcode] != gas_cost:
+                mismatches.append((pc, self.static_gas_costs[opcode], gas_cost))
+        return mismatches
@@ -1,6 +1,6 @@
 """Ethereum Virtual Machine bytecode primitives and utilities."""
 
-from typing import Any, Self, SupportsBytes
+from typing import TYPE_CHECKING, Any, Self, SupportsBytes
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core.core_schema import (
@@ -11,6 +11,9 @@ from pydantic_core.core_schema import (
 
 from ethereum_test_base_types import Bytes, Hash
 
+if TYPE_CHECKING:
+    from ethereum_test_forks import Fork
+
 
 class Bytecode:
     """
@@ -241,6 +244,20 @@ class Bytecode:
         """Return the keccak256 hash of the opcode byte representation."""
         return Bytes(self._bytes_).keccak256()
 
+    def estimate_gas(self, fork: "Fork") -> int:
+        """
+        Return the static gas of the most expensive path through the bytecode
+        when every loop is executed once, see `BytecodeAnalysis`.
+
+        Opcodes with dynamic gas costs are counted at their minimum cost.
+        Raises ValueError for the forks before Berlin.
+        """
+        # Imported here because the analysis depends on the opcodes, which
+        # are defined in terms of this class.
+        from .analysis import BytecodeAnalysis
+
+        return BytecodeAnalysis(self, fork).gas
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
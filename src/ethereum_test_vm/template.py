@@ -0,0 +1,149 @@
+"""
+Bytecode templates with placeholders for the pushed constants.
+
+Generators that emit the same code shape many times with different constants
+(e.g. one `Op.SSTORE(slot, value)` per storage slot) spend most of their time
+building and concatenating `Bytecode` objects. A `BytecodeTemplate` builds the
+code shape once and renders it by splicing the push instructions of the
+constants into the compiled bytes:
+
+```python
+sstore = BytecodeTemplate(lambda slot, value: Op.SSTORE(slot, value))
+code = sum(sstore.render(slot=i, value=i + 1) for i in range(1000))
+```
+"""
+
+import inspect
+import os
+import re
+from typing import Callable, Dict, List, Mapping, SupportsBytes, Tuple
+
+from ethereum_test_base_types import to_bytes
+
+from .bytecode import Bytecode
+from .opcodes import Opcodes, _get_int_size
+
+TemplateValue = int | bytes | SupportsBytes | str
+
+PUSH0_BYTE = Opcodes.PUSH0.int()
+
+
+def push_instruction(value: TemplateValue, size: int | None = None) -> bytes:
+    """
+    Return the push instruction of a constant.
+
+    Without size, the smallest push is used, as when a constant is passed to
+    an opcode: `PUSH1` for zero and `PUSH32` for negative integers. With size,
+    the constant is pushed with `PUSH<size>`, as `Opcodes.PUSH<size>[value]`.
+    """
+    if isinstance(value, Bytecode):
+        raise TypeError("Template values must be constants, not bytecode")
+    if isinstance(value, int):
+        signed = value < 0
+        data_size = _get_int_size(value) if size is None else size
+        if data_size > 32:
+            raise ValueError("Opcode stack data must be less than 32 bytes")
+        try:
+            data = value.to_bytes(length=max(data_size, 1), byteorder="big", signed=signed)
+        except OverflowError as e:
+            raise ValueError(f"Constant {value!r} does not fit in {data_size} bytes") from e
+    else:
+        data = to_bytes(value).lstrip(b"\0") or b"\x00"
+        if size is not None:
+            if len(data) > size:
+                raise ValueError(f"Constant {value!r} does not fit in {size} bytes")
+            data = data.rjust(size, b"\0")
+    if len(data) > 32:
+        raise ValueError("Opcode stack data must be less than 32 bytes")
+    return bytes([PUSH0_BYTE + len(data)]) + data
+
+
+class BytecodeTemplate:
+    """
+    Code shape built once with placeholders for its constants, see the module
+    documentation.
+
+    The code shape is built by calling `builder` with one placeholder per
+    parameter. A placeholder is a push instruction and can be used wherever a
+    constant can be passed to an opcode. The placeholders of the parameters
+    listed in `sizes` are rendered with a push of that size, the others with
+    the smallest push of the constant. Code shapes that contain absolute jump
+    destinations must only use fixed-size placeholders.
+
+    Every parameter must be used, and its placeholder must end up unchanged
+    in the code, or `ValueError` is raised.
+    """
+
+    parameters: Tuple[str, ...]
+    sizes: Dict[str, int]
+    parts: List[bytes]
+    placeholder_parts: List[Tuple[int, str]]
+    code: Bytecode
+
+    def __init__(
+        self,
+        builder: Callable[..., Bytecode],
+        *,
+        sizes: Mapping[str, int] | None = None,
+    ):
+        """Build the code shape and compile it."""
+        self.parameters = tuple(inspect.signature(builder).parameters)
+        self.sizes = dict(sizes or {})
+        unknown_parameters = set(self.sizes) - set(self.parameters)
+        if unknown_parameters:
+            raise ValueError(f"Sizes of unknown template parameters: {sorted(unknown_parameters)}")
+
+        # Each placeholder is a PUSH32 of random bytes, which has the same
+        # stack properties as the push of any constant.
+        markers = {
+            parameter: bytes([Opcodes.PUSH32.int()]) + os.urandom(32)
+            for parameter in self.parameters
+        }
+        self.code = builder(
+            **{
+                parameter: Bytecode(marker, popped_stack_items=0, pushed_stack_items=1)
+                for parameter, marker in markers.items()
+            }
+        )
+        parameters_by_marker = {marker: parameter for parameter, marker in markers.items()}
+        pattern = re.compile(b"|".join(re.escape(marker) for marker in parameters_by_marker))
+        self.parts = []
+        self.placeholder_parts = []
+        code = bytes(self.code)
+        position = 0
+        for match in pattern.finditer(code) if markers else ():
+            self.parts.append(code[position : match.start()])
+            self.placeholder_parts.append((len(self.parts), parameters_by_marker[match.group()]))
+            self.parts.append(b"")
+            position = match.end()
+        self.parts.append(code[position:])
+        missing_parameters = set(self.parameters) - {
+            parameter for _, parameter in self.placeholder_parts
+        }
+        if missing_parameters:
+            raise ValueError(
+                f"Template parameters without placeholder in the code: "
+                f"{sorted(missing_parameters)}, they must be passed unchanged to an opcode"
+            )
+
+    def render(self, **values: TemplateValue) -> Bytecode:
+        """Return the bytecode of the code shape with the constants."""
+        if values.keys() != set(self.parameters):
+            raise ValueError(
+                f"Template requires the values of {list(self.parameters)}, got {list(values)}"
+            )
+        pushes = {
+            parameter: push_instruction(value, self.sizes.get(parameter))
+            for parameter, value in values.items()
+        }
+        parts = self.parts.copy()
+        for index, parameter in self.placeholder_parts:
+            parts[index] = pushes[parameter]
+        return Bytecode(
+            b"".join(parts),
+            popped_stack_items=self.code.popped_stack_items,
+            pushed_stack_items=self.code.pushed_stack_items,
+            min_stack_height=self.code.min_stack_height,
+            max_stack_height=self.code.max_stack_height,
+            terminating=self.code.terminating,
+        )
@@ -0,0 +1,356 @@
+"""Test the static gas and stack analysis of bytecode."""
+
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+
+from ethereum_clis import ExecutionSpecsTransitionTool, TransitionTool
+from ethereum_test_base_types import Account, Address, TestAddress
+from ethereum_test_base_types.conversions import BytesConvertible
+from ethereum_test_benchmark import BenchmarkCodeGenerator, ExtCallGenerator, JumpLoopGenerator
+from ethereum_test_forks import (
+    Berlin,
+    Cancun,
+    Fork,
+    Frontier,
+    Istanbul,
+    Osaka,
+    Paris,
+    Prague,
+    get_forks,
+)
+from ethereum_test_types import Alloc, Environment, Transaction
+
+from ..analysis import STATIC_GAS_COSTS, BytecodeAnalysis
+from ..bytecode import Bytecode
+from ..opcodes import Opcodes as Op
+
+
+@pytest.mark.parametrize("fork", get_forks())
+def test_static_gas_costs_of_valid_opcodes(fork: Fork) -> None:
+    """Test that the static gas of every valid opcode of the fork is known."""
+    assert [opcode for opcode in fork.valid_opcodes() if opcode not in STATIC_GAS_COSTS] == []
+
+
+@pytest.mark.parametrize("fork", [Berlin, Cancun, Osaka])
+@pytest.mark.parametrize("size", [1, 32, 33])
+def test_straight_line_gas(fork: Fork, size: int) -> None:
+    """Test the gas of the attack block of the KECCAK256 benchmark."""
+    gsc = fork.gas_costs()
+    code = Op.POP(Op.SHA3(0, size))
+    analysis = BytecodeAnalysis(code, fork)
+    assert len(analysis.blocks) == 1
+    assert analysis.loops == []
+    # Static part of the cost computed by the benchmark test, the cost of the
+    # hashed words is reported as dynamic.
+    assert code.estimate_gas(fork) == 2 * gsc.G_VERY_LOW + gsc.G_KECCAK_256 + gsc.G_BASE
+    assert [(cost.pc, cost.opcode) for cost in analysis.dynamic_costs] == [(len(code) - 2, "SHA3")]
+
+
+@pytest.mark.parametrize("fork", [Frontier, Istanbul])
+def test_forks_before_berlin(fork: Fork) -> None:
+    """Test that the forks whose gas costs are not modeled are rejected."""
+    code = Op.SLOAD(0) + Op.BALANCE(0) + Op.STOP
+    with pytest.raises(ValueError, match="before Berlin"):
+        code.estimate_gas(fork)
+
+
+def test_undefined_opcodes() -> None:
+    """Test that opcodes not defined in the fork halt the execution."""
+    code = Op.PUSH0 + Op.CLZ + Op.STOP
+    assert code.estimate_gas(Paris) == 0
+    assert code.estimate_gas(Prague) == Prague.gas_costs().G_BASE
+    assert [cost.opcode for cost in BytecodeAnalysis(code, Prague).dynamic_costs] == ["0x1e"]
+    assert code.estimate_gas(Osaka) == Osaka.gas_costs().G_BASE + Osaka.gas_costs().G_LOW
+    assert BytecodeAnalysis(code, Osaka).dynamic_costs == []
+
+
+def test_jumpdest_analysis() -> None:
+    """Test that a JUMPDEST in push data is neither a block nor a target."""
+    code = Op.JUMP(3) + Op.PUSH1(Op.JUMPDEST.int()) + Op.JUMPDEST + Op.STOP
+    analysis = BytecodeAnalysis(code, Prague)
+    assert analysis.jumpdests == {5}
+    assert sorted(analysis.blocks) == [0, 3, 5]
+    # The jump to the push data fails, so the execution never reaches 3 or 5.
+    assert analysis.blocks[0].successors == []
+    assert analysis.gas == 3 + 8
+
+    code = Op.JUMP(5) + Op.PUSH1(Op.JUMPDEST.int()) + Op.JUMPDEST + Op.STOP
+    analysis = BytecodeAnalysis(code, Prague)
+    assert analysis.blocks[0].successors == [5]
+    assert analysis.gas == 3 + 8 + 1
+
+
+@pytest.mark.parametrize("fork", [Berlin, Prague])
+@pytest.mark.parametrize("setup", [Bytecode(), Op.MSTORE(0, 1)])
+def test_jump_loop(fork: Fork, setup: Bytecode) -> None:
+    """
+    Test the gas per iteration of the loop generated by the benchmark
+    `JumpLoopGenerator`: setup + JUMPDEST + attack * n + cleanup + JUMP.
+    """
+    gsc = fork.gas_costs()
+    attack_block = Op.POP(Op.ADD(Op.CALLDATASIZE, 1))
+    code = setup + Op.JUMPDEST + attack_block * 100 + Op.JUMP(len(setup))
+
+    analysis = BytecodeAnalysis(code, fork)
+    attack_gas = gsc.G_BASE + gsc.G_VERY_LOW + gsc.G_VERY_LOW + gsc.G_BASE
+    assert len(analysis.loops) == 1
+    loop = analysis.loops[0]
+    assert loop.head == len(setup)
+    assert loop.gas_per_iteration == (
+        gsc.G_JUMPDEST + 100 * attack_gas + gsc.G_VERY_LOW + gsc.G_MID
+    )
+    assert loop.stack_delta_per_iteration == 0
+    assert loop.dynamic_costs == ()
+    assert analysis.gas == setup.estimate_gas(fork) + loop.gas_per_iteration
+    assert analysis.max_stack_height == max(setup.max_stack_height, 2)
+
+
+def test_conditional_loop() -> None:
+    """Test a loop with two paths and a conditional jump back."""
+    code = (
+        Op.PUSH1(10)
+        + Op.JUMPDEST
+        + Op.JUMPI(11, Op.ISZERO(Op.DUP1))
+        + Op.PUSH1(1)
+        + Op.POP
+        + Op.JUMPDEST
+        + Op.PUSH1(1)
+        + Op.SWAP1
+        + Op.SUB
+        + Op.JUMPI(2, Op.DUP1)
+        + Op.STOP
+    )
+    analysis = BytecodeAnalysis(code, Prague)
+    assert sorted(analysis.blocks) == [0, 2, 8, 11, 20]
+    assert analysis.blocks[2].successors == [11, 8]
+    assert analysis.blocks[11].successors == [2, 20]
+    assert len(analysis.loops) == 1
+    loop = analysis.loops[0]
+    assert (loop.head, loop.back_edge_from, loop.blocks) == (2, 11, (2, 8, 11))
+    # JUMPDEST, DUP1, ISZERO, PUSH1, JUMPI, PUSH1, POP, JUMPDEST, PUSH1, SWAP1,
+    # SUB, DUP1, PUSH1, JUMPI
+    assert loop.gas_per_iteration == 1 + 3 + 3 + 3 + 10 + 3 + 2 + 1 + 3 + 3 + 3 + 3 + 3 + 10
+    assert loop.stack_delta_per_iteration == 0
+    assert analysis.gas == 3 + loop.gas_per_iteration
+    assert analysis.stack_underflows == []
+    assert analysis.max_stack_height == 3
+
+
+def test_stack_analysis() -> None:
+    """Test the detection of stack underflows and of growing loops."""
+    assert BytecodeAnalysis(Op.ADD(1, 2), Prague).stack_underflows == []
+    assert BytecodeAnalysis(Op.ADD, Prague).stack_underflows == [0]
+
+    code = Op.JUMPDEST + Op.PUSH1(1) + Op.JUMP(0)
+    analysis = BytecodeAnalysis(code, Prague)
+    assert analysis.loops[0].stack_delta_per_iteration == 1
+    assert analysis.max_stack_height == 2
+
+
+def test_unresolved_jump() -> None:
+    """Test that jumps to computed destinations are reported."""
+    code = Op.JUMP(Op.CALLDATALOAD(0)) + Op.JUMPDEST + Op.STOP
+    analysis = BytecodeAnalysis(code, Prague)
+    assert analysis.unresolved_jumps == [0]
+    assert analysis.blocks[0].successors == []
+    assert analysis.gas == 3 + 3 + 8
+
+
+def test_dynamic_costs() -> None:
+    """Test that opcodes with dynamic costs are counted at their minimum."""
+    gsc = Prague.gas_costs()
+    code = Op.MSTORE(0, 1) + Op.POP(Op.CALL(Op.GAS, 0x1234, 0, 0, 0, 0, 0)) + Op.INVALID
+    analysis = BytecodeAnalysis(code, Prague)
+    assert [cost.opcode for cost in analysis.dynamic_costs] == ["MSTORE", "CALL", "0xfe"]
+    assert analysis.gas == (
+        3 * gsc.G_VERY_LOW  # MSTORE(0, 1)
+        + gsc.G_BASE
+        + 6 * gsc.G_VERY_LOW
+        + gsc.G_WARM_ACCOUNT_ACCESS  # CALL(GAS, ...)
+        + gsc.G_BASE  # POP
+    )
+
+
+def test_gas_cost_mismatches() -> None:
+    """Test the comparison with the gas costs of an execution trace."""
+    code = Op.MSTORE(0, Op.ADD(1, 2)) + Op.SSTORE(0, Op.TLOAD(0)) + Op.STOP
+    analysis = BytecodeAnalysis(code, Cancun)
+    # (pc, gasCost) of the trace of the code executed by a Cancun client.
+    trace = [
+        (0, 3),
+        (2, 3),
+        (4, 3),
+        (5, 3),
+        (7, 6),
+        (8, 3),
+        (10, 100),
+        (11, 3),
+        (13, 22100),
+        (14, 0),
+    ]
+    assert analysis.gas_cost_mismatches(trace) == []
+    assert analysis.gas_cost_mismatches([(4, 5), (7, 3), (13, 0)]) == [(4, 3, 5)]
+    # Push data and pcs past the end of the code are not instructions.
+    assert analysis.gas_cost_mismatches([(1, 3), (100, 3)]) == []
+
+
+@pytest.fixture
+def tracing_t8n(
+    installed_transition_tool_instances: Dict[str, TransitionTool | Exception],
+) -> Generator[TransitionTool, None, None]:
+    """Return the default transition tool with tracing on, if installed."""
+    t8n = installed_transition_tool_instances.get(ExecutionSpecsTransitionTool.__name__)
+    if not isinstance(t8n, TransitionTool):
+        pytest.skip("The default transition tool is not available")
+    t8n.trace = True
+    t8n.reset_traces()
+    yield t8n
+    t8n.trace = False
+    t8n.reset_traces()
+
+
+class TracedAlloc(Alloc):
+    """Allocation that deploys contracts at consecutive addresses."""
+
+    def deploy_contract(self, code: BytesConvertible, **kwargs: Any) -> Address:
+        """Deploy a contract at the next address."""
+        address = Address(0x1000 + len(self.root))
+        self[address] = Account(code=code, balance=kwargs.get("balance", 0), nonce=1)
+        return address
+
+
+def traced_gas_costs(
+    t8n: TransitionTool, pre: Alloc, tx: Transaction, fork: Fork
+) -> Dict[int, List[Tuple[int, int]]]:
+    """
+    Execute the transaction with the transition tool and return the
+    (pc, gas cost) pairs of its trace by call depth.
+    """
+    alloc = Alloc.fork_pre_allocation(fork)
+    alloc.merge_in_place(pre)
+    alloc.merge_in_place(Alloc({TestAddress: Account(balance=10**18)}))
+    t8n.evaluate(
+        transition_tool_data=TransitionTool.TransitionToolData(
+            alloc=alloc,
+            txs=[tx.with_signature_and_sender()],
+            env=Environment().set_fork_requirements(fork),
+            fork=fork,
+            chain_id=1,
+            reward=0,
+            blob_schedule=fork.blob_schedule(),
+        ),
+    )
+    traces = t8n.get_traces()
+    assert traces is not None
+    gas_costs: Dict[int, List[Tuple[int, int]]] = {}
+    for line in traces[-1].root[0].traces:
+        if line.gas_cost is not None:
+            gas_costs.setdefault(line.depth, []).append((line.pc, int(line.gas_cost)))
+    return gas_costs
+
+
+@pytest.mark.parametrize("fork", [Berlin, Cancun, Prague])
+def test_gas_cost_mismatches_with_t8n(tracing_t8n: TransitionTool, fork: Fork) -> None:
+    """
+    Test the static gas costs against the trace of the transition tool of a
+    straight-line block followed by a loop executed ten times.
+    """
+    straight_line = Op.POP(Op.ADD(Op.CALLDATASIZE, 1)) * 10 + Op.POP(Op.SHR(1, Op.GAS))
+    loop = (
+        Op.PUSH1(10)
+        + Op.JUMPDEST
+        + Op.PUSH1(1)
+        + Op.SWAP1
+        + Op.SUB
+        + Op.JUMPI(len(straight_line) + 2, Op.DUP1)
+        + Op.STOP
+    )
+    code = straight_line + loop
+    analysis = BytecodeAnalysis(code, fork)
+    assert analysis.dynamic_costs == []
+
+    pre = TracedAlloc()
+    contract = pre.deploy_contract(code)
+    trace = traced_gas_costs(tracing_t8n, pre, Transaction(to=contract, gas_limit=1_000_000), fork)
+    assert list(trace) == [1]
+    assert {pc for pc, _ in trace[1]} == {
+        instruction.pc for block in analysis.blocks.values() for instruction in block.instructions
+    }
+    assert analysis.gas_cost_mismatches(trace[1]) == []
+    assert sum(gas_cost for pc, gas_cost in trace[1] if pc < len(straight_line)) == (
+        straight_line.estimate_gas(fork)
+    )
+
+
+BENCHMARK_CODE_GENERATORS = [
+    pytest.param(ExtCallGenerator(attack_block=Op.ADDRESS), id="test_worst_zero_param"),
+    pytest.param(
+        JumpLoopGenerator(
+            attack_block=Op.POP(Op.CALLDATASIZE), tx_kwargs={"data": b"\x00" * 1_000}
+        ),
+        id="test_worst_calldatasize",
+    ),
+    pytest.param(ExtCallGenerator(attack_block=Op.RETURNDATASIZE), id="test_worst_returndatasize"),
+    pytest.param(
+        ExtCallGenerator(
+            setup=Op.MLOAD(Op.SELFBALANCE) + Op.POP, attack_block=Op.MSIZE, contract_balance=1_000
+        ),
+        id="test_worst_msize",
+    ),
+    pytest.param(
+        JumpLoopGenerator(attack_block=Op.JUMPI(Op.PUSH0, Op.PUSH0)),
+        id="test_worst_jumpi_fallthrough",
+    ),
+    pytest.param(JumpLoopGenerator(attack_block=Op.JUMPDEST), id="test_worst_jumpdests"),
+    pytest.param(
+        JumpLoopGenerator(
+            setup=Op.CALLDATALOAD(0) + Op.CALLDATALOAD(32) + Op.DUP2 + Op.DUP2,
+            attack_block=Op.DUP2 + Op.ADD,
+            cleanup=Op.POP + Op.POP + Op.DUP2 + Op.DUP2,
+            tx_kwargs={"data": b"\x01" * 64},
+        ),
+        id="test_worst_binop_simple",
+    ),
+    pytest.param(JumpLoopGenerator(setup=Op.PUSH0, attack_block=Op.ISZERO), id="test_worst_unop"),
+    pytest.param(
+        JumpLoopGenerator(
+            setup=Op.PUSH1(41),
+            attack_block=Op.POP(Op.TLOAD(Op.DUP1)),
+            cleanup=Op.POP + Op.GAS + Op.TSTORE(Op.DUP2, Op.GAS),
+        ),
+        id="test_worst_tload",
+    ),
+    pytest.param(
+        JumpLoopGenerator(setup=Op.PUSH1(42), attack_block=Op.TSTORE(Op.DUP2, Op.GAS)),
+        id="test_worst_tstore",
+    ),
+    pytest.param(
+        JumpLoopGenerator(setup=Op.PUSH0 * 17, attack_block=Op.SWAP16), id="test_worst_swap"
+    ),
+    pytest.param(ExtCallGenerator(attack_block=Op.PUSH32[1]), id="test_worst_push"),
+]
+
+
+@pytest.mark.parametrize("fork", [Cancun, Prague])
+@pytest.mark.parametrize("code_generator", BENCHMARK_CODE_GENERATORS)
+def test_benchmark_code_generators_with_t8n(
+    tracing_t8n: TransitionTool, fork: Fork, code_generator: BenchmarkCodeGenerator
+) -> None:
+    """
+    Test the static gas costs against the trace of the transition tool of the
+    code of the benchmark code generators used by the benchmark tests.
+
+    The generators repeat the attack blocks of the named tests in
+    `tests/benchmark`. An `ExtCallGenerator` calls the contract of its attack
+    block from a loop, whose code is executed at depth 1.
+    """
+    pre = TracedAlloc()
+    contract = code_generator.deploy_contracts(pre=pre, fork=fork)
+    tx = Transaction(to=contract, gas_limit=100_000, **code_generator.tx_kwargs)
+    trace = traced_gas_costs(tracing_t8n, pre, tx, fork)
+    codes = {address: account.code for address, account in pre.root.items() if account}
+    codes = {contract: codes.pop(contract), **codes}
+    assert sorted(trace) == list(range(1, len(codes) + 1))
+    for depth, code in enumerate(codes.values(), start=1):
+        assert BytecodeAnalysis(code, fork).gas_cost_mismatches(trace[depth]) == []
@@ -0,0 +1,139 @@
+"""Test the bytecode templates."""
+
+import time
+from typing import List, Tuple
+
+import pytest
+
+from ethereum_test_base_types import Address
+
+from ..bytecode import Bytecode
+from ..opcodes import Opcodes as Op
+from ..template import BytecodeTemplate
+
+
+@pytest.mark.parametrize(
+    "slot,value",
+    [
+        (0, 0),
+        (1, 0xFF),
+        (0x100, 2**256 - 1),
+        (-1, 2**255),
+        (b"\x00\x01", b""),
+        (Address(0x1234), "0x00ab"),
+    ],
+)
+def test_render_equivalence(slot: int | bytes | Address, value: int | bytes | str) -> None:
+    """Test that rendering gives the bytecode of the code shape."""
+    template = BytecodeTemplate(
+        lambda slot, value: Op.SSTORE(slot, Op.ADD(value, Op.SLOAD(slot))) + Op.POP(value)
+    )
+    rendered = template.render(slot=slot, value=value)
+    expected = Op.SSTORE(slot, Op.ADD(value, Op.SLOAD(slot))) + Op.POP(value)
+    assert rendered == expected
+    assert (rendered.min_stack_height, rendered.max_stack_height) == (
+        expected.min_stack_height,
+        expected.max_stack_height,
+    )
+
+
+def test_render_stack_properties() -> None:
+    """Test that the stack properties of the code shape are kept."""
+    template = BytecodeTemplate(lambda a: a + Op.ADD + Op.DUP1 + Op.RETURN(0, 32))
+    rendered = template.render(a=7)
+    expected = Op.PUSH1(7) + Op.ADD + Op.DUP1 + Op.RETURN(0, 32)
+    assert rendered == expected
+    assert rendered.popped_stack_items == expected.popped_stack_items == 1
+    assert rendered.terminating
+
+
+def test_render_fixed_sizes() -> None:
+    """Test placeholders rendered with a push of a fixed size."""
+    template = BytecodeTemplate(
+        lambda target, value: Op.JUMP(target) + Op.JUMPDEST + Op.MSTORE(0, value),
+        sizes={"target": 2, "value": 20},
+    )
+    values: List[Tuple[int, int | bytes]] = [(0, 0), (3, Address(0xABCD)), (0xFFFF, b"\x01")]
+    for target, value in values:
+        assert template.render(target=target, value=value) == (
+            Op.JUMP(Op.PUSH2[target]) + Op.JUMPDEST + Op.MSTORE(0, Op.PUSH20[value])
+        )
+    with pytest.raises(ValueError):
+        template.render(target=0x10000, value=0)
+    with pytest.raises(ValueError):
+        template.render(target=0, value=b"\x01" + bytes(20))
+
+
+def test_render_repeated_code() -> None:
+    """Test templates whose placeholders appear in repeated code."""
+    template = BytecodeTemplate(lambda a, b: (Op.POP(Op.BALANCE(a)) + Op.MSTORE(b, a)) * 3)
+    assert template.render(a=Address(1), b=0x20) == (
+        (Op.POP(Op.BALANCE(Address(1))) + Op.MSTORE(0x20, Address(1))) * 3
+    )
+    template = BytecodeTemplate(lambda: Op.CALLER * 2)
+    assert template.render() == Op.CALLER * 2
+
+
+def test_render_invalid_values() -> None:
+    """Test that missing, unknown and non-constant values are rejected."""
+    template = BytecodeTemplate(lambda a, b: Op.ADD(a, b))
+    with pytest.raises(ValueError):
+        template.render(a=1)
+    with pytest.raises(ValueError):
+        template.render(a=1, b=2, c=3)
+    with pytest.raises(TypeError):
+        template.render(a=1, b=Op.CALLVALUE)
+    with pytest.raises(ValueError):
+        BytecodeTemplate(lambda a: Op.POP(a), sizes={"b": 1})
+
+
+def test_parameters_without_placeholder() -> None:
+    """Test that unused and transformed parameters are rejected."""
+
+    def unused_parameter(a: Bytecode, b: Bytecode) -> Bytecode:
+        del b
+        return Op.POP(a)
+
+    with pytest.raises(ValueError, match=r"\['b'\]"):
+        BytecodeTemplate(unused_parameter)
+    with pytest.raises(ValueError, match=r"\['a'\]"):
+        BytecodeTemplate(lambda a: Op.RETURN(0, len(a)))
+
+
+def test_render_many() -> None:
+    """Test that rendering many constants is equal to building the shapes."""
+    count = 1_000
+
+    def build(slot: int | Bytecode, address: Address | Bytecode) -> Bytecode:
+        return Op.SSTORE(slot, Op.BALANCE(address)) + Op.POP(Op.EXTCODESIZE(address))
+
+    addresses = [Address(0x1000 + i) for i in range(count)]
+    template = BytecodeTemplate(build)
+    assert [
+        template.render(slot=slot, address=address) for slot, address in enumerate(addresses)
+    ] == [build(slot, address) for slot, address in enumerate(addresses)]
+
+
+@pytest.mark.framework_benchmark
+def test_render_benchmark() -> None:
+    """Benchmark rendering a template against building the code shape."""
+    count = 10_000
+
+    def build(slot: int | Bytecode, address: Address | Bytecode) -> Bytecode:
+        return Op.SSTORE(slot, Op.BALANCE(address)) + Op.POP(Op.EXTCODESIZE(address))
+
+    addresses = [Address(0x1000 + i) for i in range(count)]
+    template = BytecodeTemplate(build)
+
+    durations: List[float] = []
+    codes: List[List[Bytecode]] = []
+    for render in (build, lambda slot, address: template.render(slot=slot, address=address)):
+        start_time = time.perf_counter()
+        codes.append([render(slot, address) for slot, address in enumerate(addresses)])
+        durations.append(time.perf_counter() - start_time)
+
+    assert codes[0] == codes[1]
+    print(
+        f"Building {count} code shapes: {1e6 * durations[0] / count:.1f}us built, "
+        f"{1e6 * durations[1] / count:.1f}us rendered"
+    )
@@ -2,9 +2,12 @@
 A pytest plugin providing common functionality for consuming test fixtures.
 """
 
+import datetime
 import re
+import shutil
 import sys
 import tarfile
+import tempfile
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -375,6 +378,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:  # noqa: D103
     )
     if "cache" in sys.argv:
         return
+    consume_group.addoption(
+        "--stdin-batch-size",
+        action="store",
+        dest="stdin_batch_size",
+        type=int,
+        default=256,
+        help=(
+            "When reading fixtures from stdin, write up to this many fixtures of the same format "
+            "to each temporary fixture file so that consumers that execute whole files run "
+            "once per batch (default: 256). Use 0 for a single file per fixture format."
+        ),
+    )
     consume_group.addoption(
         "--no-html",
         action="store_true",
@@ -457,7 +472,7 @@ def pytest_configure(config: pytest.Config) -> None:  # noqa: D103
         )
 
     if fixtures_source.is_stdin:
-        config.test_cases = TestCases.from_stream(sys.stdin)  # type: ignore[attr-defined]
+        config.test_cases = stdin_test_cases(config, fixtures_source)  # type: ignore[attr-defined]
         return
     index_file = fixtures_source.path / ".meta" / "index.json"
     index_file.parent.mkdir(parents=True, exist_ok=True)
@@ -504,6 +519,58 @@ def pytest_configure(config: pytest.Config) -> None:  # noqa: D103
         config.option.htmlpath = Path(default_html_report_file_path())
 
 
+def stdin_test_cases(config: pytest.Config, fixtures_source: FixturesSource) -> TestCases:
+    """
+    Return the test cases of the fixtures read from stdin, which are written
+    to batch files in a temporary directory that becomes the fixtures path.
+
+    Only the controller reads stdin: the xdist workers load the test cases
+    from the index file that it writes next to the batch files. The tests of
+    a batch are grouped so that `--dist loadgroup` sends them to the same
+    worker, which is the default distribution with stdin input.
+    """
+    if hasattr(config, "workerinput"):
+        fixtures_source.path = Path(config.workerinput["stdin_fixtures_path"])
+        # The workers parse the original command line, so they do not see
+        # the distribution mode chosen by the controller.
+        config.option.loadgroup = config.workerinput["stdin_loadgroup"]
+        index_file = fixtures_source.path / ".meta" / "index.json"
+        return TestCases(IndexFile.model_validate_json(index_file.read_text()).test_cases)
+    fixtures_source.path = Path(tempfile.mkdtemp(prefix="consume-stdin-"))
+    test_cases = TestCases.from_stream(
+        sys.stdin, fixtures_source.path, config.getoption("stdin_batch_size", 0)
+    )
+    index_file = fixtures_source.path / ".meta" / "index.json"
+    index_file.parent.mkdir()
+    index = IndexFile(
+        root_hash=None,
+        created_at=datetime.datetime.now(),
+        test_count=len(test_cases),
+        test_cases=test_cases.root,
+    )
+    index_file.write_text(index.model_dump_json(exclude_none=False, indent=2))
+    if config.getoption("dist", "no") == "load":
+        config.option.dist = "loadgroup"
+    return test_cases
+
+
+def pytest_configure_node(node: Any) -> None:
+    """Pass the directory of the fixtures read from stdin (xdist hook)."""
+    fixtures_source = node.config.fixtures_source
+    if fixtures_source.is_stdin:
+        node.workerinput["stdin_fixtures_path"] = str(fixtures_source.path)
+        node.workerinput["stdin_loadgroup"] = node.config.option.dist == "loadgroup"
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the fixtures read from stdin."""
+    fixtures_source = getattr(config, "fixtures_source", None)
+    if fixtures_source is None or not fixtures_source.is_stdin:
+        return
+    if not hasattr(config, "workerinput") and fixtures_source.path != Path():
+        shutil.rmtree(fixtures_source.path, ignore_errors=True)
+
+
 def pytest_html_report_title(report: Any) -> None:
     """Set the HTML report title (pytest-html plugin)."""
     report.title = "Consume Test Report"
@@ -543,6 +610,7 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
         return
 
     test_cases = metafunc.config.test_cases  # type: ignore[attr-defined]
+    fixtures_source: FixturesSource = metafunc.config.fixtures_source  # type: ignore[attr-defined]
     supported_fixture_formats: List[FixtureFormat] = getattr(
         metafunc.config, "supported_fixture_formats", []
     )
@@ -551,12 +619,12 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
         if test_case.format not in supported_fixture_formats:
             continue
         fork_markers = get_relative_fork_markers(test_case.fork, strict_mode=False)
-        param = pytest.param(
-            test_case,
-            id=test_case.id,
-            marks=[getattr(pytest.mark, m) for m in fork_markers]
-            + [getattr(pytest.mark, test_case.format.format_name)],
-        )
+        marks = [getattr(pytest.mark, m) for m in fork_markers] + [
+            getattr(pytest.mark, test_case.format.format_name)
+        ]
+        if fixtures_source.is_stdin:
+            marks.append(pytest.mark.xdist_group(str(test_case.json_path)))
+        param = pytest.param(test_case, id=test_case.id, marks=marks)
         param_list.append(param)
 
     metafunc.parametrize("test_case", param_list)
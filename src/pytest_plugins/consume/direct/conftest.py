@@ -5,17 +5,14 @@ A pytest plugin that configures the consume command to act as a test runner for
 For example, via go-ethereum's `evm blocktest` or `evm statetest` commands.
 """
 
-import json
-import tempfile
 import warnings
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any
 
 import pytest
 
 from ethereum_clis.ethereum_cli import EthereumCLI
 from ethereum_clis.fixture_consumer_tool import FixtureConsumerTool
-from ethereum_test_base_types import to_json
 from ethereum_test_fixtures import (
     BaseFixture,
     BlockchainFixture,
@@ -23,7 +20,6 @@ from ethereum_test_fixtures import (
     StateFixture,
 )
 from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
-from ethereum_test_fixtures.file import Fixtures
 from pytest_plugins.consume.consume import FixturesSource
 
 
@@ -123,25 +119,16 @@ def test_dump_dir(
 @pytest.fixture
 def fixture_path(
     test_case: TestCaseIndexFile | TestCaseStream, fixtures_source: FixturesSource
-) -> Generator[Path, None, None]:
+) -> Path:
     """
     Path to the current JSON fixture file.
 
-    If the fixture source is stdin, the fixture is written to a temporary json
-    file.
+    If the fixture source is stdin, the fixture is contained in a temporary
+    json file shared with other fixtures of the same format (see
+    `--stdin-batch-size`); the consumer selects the result by fixture name.
     """
-    if fixtures_source.is_stdin:
-        assert isinstance(test_case, TestCaseStream)
-        temp_dir = tempfile.TemporaryDirectory()
-        fixture_path = Path(temp_dir.name) / f"{test_case.id.replace('/', '_')}.json"
-        fixtures = Fixtures({test_case.id: test_case.fixture})
-        with open(fixture_path, "w") as f:
-            json.dump(to_json(fixtures), f, indent=4)
-        yield fixture_path
-        temp_dir.cleanup()
-    else:
-        assert isinstance(test_case, TestCaseIndexFile)
-        yield fixtures_source.path / test_case.json_path
+    assert isinstance(test_case, TestCaseIndexFile)
+    return fixtures_source.path / test_case.json_path
 
 
 @pytest.fixture(scope="function")
@@ -70,22 +70,16 @@ def fixture(
     test_case: TestCaseIndexFile | TestCaseStream,
 ) -> BaseFixture:
     """
-    Load the fixture from a file or from stream in any of the supported fixture
-    formats.
+    Load the fixture from a file in any of the supported fixture formats.
 
-    The fixture is either already available within the test case (if consume is
-    taking input on stdin) or loaded from the fixture json file if taking input
-    from disk (fixture directory with index file).
+    Fixtures read from stdin are loaded from the temporary batch files they
+    were written to, as fixtures from disk (fixture directory with index
+    file).
     """
-    fixture: BaseFixture
-    if fixtures_source.is_stdin:
-        assert isinstance(test_case, TestCaseStream), "Expected a stream test case"
-        fixture = test_case.fixture
-    else:
-        assert isinstance(test_case, TestCaseIndexFile), "Expected an index file test case"
-        fixtures_file_path = fixtures_source.path / test_case.json_path
-        fixtures: Fixtures = fixture_file_loader[fixtures_file_path]
-        fixture = fixtures[test_case.id]
+    assert isinstance(test_case, TestCaseIndexFile), "Expected an index file test case"
+    fixtures_file_path = fixtures_source.path / test_case.json_path
+    fixtures: Fixtures = fixture_file_loader[fixtures_file_path]
+    fixture = fixtures[test_case.id]
     assert isinstance(fixture, test_case.format), (
         f"Expected a {test_case.format.format_name} test fixture"
     )
@@ -1,7 +1,10 @@
 """Test timing class used to time tests."""
 
+import re
 import time
-from typing import Any, List, Self
+from typing import Any, Dict, Iterator, List, Self, Tuple
+
+PHASE_INDEX_PATTERN = re.compile(r"\s+\d+$")
 
 
 class TimingData:
@@ -39,6 +42,13 @@ class TimingData:
         """Record the time taken since the last time recorded."""
         self.end_time = time.perf_counter()
 
+    @property
+    def duration(self) -> float | None:
+        """Return the time taken by this section, if it has completed."""
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
     def time(self, sub_name: str) -> "TimingData":
         """Record the time taken in an execution section."""
         new_timing = TimingData(sub_name, self)
@@ -56,3 +66,37 @@ class TimingData:
         for timing in self.timings:
             formatted += timing.formatted(precision, indent + 2)
         return formatted
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the timing tree as a plain dictionary.
+
+        The result only contains built-in types so that it can be attached to a
+        test report and transferred from xdist workers to the controller.
+        """
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "timings": [timing.to_dict() for timing in self.timings],
+        }
+
+    @staticmethod
+    def phases(timing_dict: Dict[str, Any]) -> Iterator[Tuple[str, float]]:
+        """
+        Yield `(phase, duration)` pairs for every completed section below the
+        root of a timing tree produced by `to_dict`.
+
+        Phases are identified by the path of section names from the root, with
+        trailing indices removed (e.g. "Payload 3" becomes "Payload") so that
+        repeated sections of the same kind are aggregated together.
+        """
+
+        def walk(node: Dict[str, Any], prefix: str) -> Iterator[Tuple[str, float]]:
+            for child in node["timings"]:
+                name = PHASE_INDEX_PATTERN.sub("", child["name"])
+                phase = f"{prefix}/{name}" if prefix else name
+                if child["duration"] is not None:
+                    yield phase, child["duration"]
+                yield from walk(child, phase)
+
+        yield from walk(timing_dict, "")
@@ -0,0 +1,158 @@
+"""
+Session-wide aggregation of the timing data recorded by the Hive simulators.
+"""
+
+import csv
+import json
+import math
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .timing import TimingData
+
+TOTAL_PHASE = "Total"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Return the `pct` percentile of an ascending list of values using linear
+    interpolation between the closest ranks.
+    """
+    assert sorted_values, "Cannot compute the percentile of an empty list"
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+@dataclass(kw_only=True)
+class PhaseStatistics:
+    """Duration statistics of a phase for a client and fixture format."""
+
+    client: str
+    fixture_format: str
+    phase: str
+    count: int
+    total: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_durations(
+        cls, *, client: str, fixture_format: str, phase: str, durations: List[float]
+    ) -> "PhaseStatistics":
+        """Compute the statistics from the list of recorded durations."""
+        values = sorted(durations)
+        return cls(
+            client=client,
+            fixture_format=fixture_format,
+            phase=phase,
+            count=len(values),
+            total=sum(values),
+            mean=sum(values) / len(values),
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+            p99=percentile(values, 99),
+            max=values[-1],
+        )
+
+
+@dataclass(kw_only=True)
+class TestTiming:
+    """The total duration of a single test case."""
+
+    __test__ = False  # stop pytest from collecting this class as a test
+
+    test_id: str
+    client: str
+    fixture_format: str
+    duration: float
+
+
+@dataclass
+class TimingSummary:
+    """
+    Collect the timing trees of all test cases in a session and summarize them
+    per client, fixture format and phase.
+    """
+
+    durations: Dict[Tuple[str, str, str], List[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    tests: List[TestTiming] = field(default_factory=list)
+
+    def add(
+        self, *, test_id: str, client: str, fixture_format: str, timing: Dict[str, Any]
+    ) -> None:
+        """Add the timing tree (as returned by `TimingData.to_dict`)."""
+        if timing["duration"] is not None:
+            self.durations[(client, fixture_format, TOTAL_PHASE)].append(timing["duration"])
+            self.tests.append(
+                TestTiming(
+                    test_id=test_id,
+                    client=client,
+                    fixture_format=fixture_format,
+                    duration=timing["duration"],
+                )
+            )
+        for phase, duration in TimingData.phases(timing):
+            self.durations[(client, fixture_format, phase)].append(duration)
+
+    def __bool__(self) -> bool:
+        """Return whether any timing data has been collected."""
+        return bool(self.durations)
+
+    def statistics(self) -> List[PhaseStatistics]:
+        """Return the statistics of every (client, fixture format, phase)."""
+        return [
+            PhaseStatistics.from_durations(
+                client=client, fixture_format=fixture_format, phase=phase, durations=durations
+            )
+            for (client, fixture_format, phase), durations in sorted(self.durations.items())
+        ]
+
+    def slowest_tests(self, count: int) -> List[TestTiming]:
+        """Return the `count` test cases with the longest total duration."""
+        return sorted(self.tests, key=lambda t: t.duration, reverse=True)[:count]
+
+    def slowest_phases(self, count: int) -> List[PhaseStatistics]:
+        """
+        Return the `count` phases with the highest p95, excluding the total.
+        """
+        phases = [s for s in self.statistics() if s.phase != TOTAL_PHASE]
+        return sorted(phases, key=lambda s: s.p95, reverse=True)[:count]
+
+    def write(self, directory: Path, slowest_count: int) -> Tuple[Path, Path]:
+        """
+        Write the JSON and CSV summaries to the directory and return their
+        paths.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        statistics = self.statistics()
+        json_path = directory / "timing_summary.json"
+        csv_path = directory / "timing_summary.csv"
+        json_path.write_text(
+            json.dumps(
+                {
+                    "test_count": len(self.tests),
+                    "phases": [asdict(s) for s in statistics],
+                    "slowest_tests": [asdict(t) for t in self.slowest_tests(slowest_count)],
+                },
+                indent=2,
+            )
+        )
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(PhaseStatistics.__dataclass_fields__))
+            writer.writeheader()
+            for s in statistics:
+                writer.writerow(asdict(s))
+        return json_path, csv_path
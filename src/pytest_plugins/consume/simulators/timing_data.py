@@ -1,12 +1,17 @@
 """Pytest plugin that helps measure and log timing data in Hive simulators."""
 
+from pathlib import Path
 from typing import Generator
 
 import pytest
 import rich
+from _pytest.terminal import TerminalReporter
 from hive.client import Client
 
 from .helpers.timing import TimingData
+from .helpers.timing_summary import TimingSummary
+
+TIMING_DATA_PROPERTY = "timing_data"
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -21,6 +26,37 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Log the timing data for each test case execution.",
     )
+    consume_group.addoption(
+        "--timing-summary-dir",
+        action="store",
+        dest="timing_summary_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Write session-wide timing statistics (p50, p95, p99, max per phase, client and "
+            "fixture format) to timing_summary.json and timing_summary.csv in this directory."
+        ),
+    )
+    consume_group.addoption(
+        "--timing-summary-count",
+        action="store",
+        dest="timing_summary_count",
+        type=int,
+        default=10,
+        help="Number of slowest tests and phases listed in the timing summary (default: 10).",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the session-wide timing summary if requested."""
+    if timing_summary_enabled(config):
+        config.pluginmanager.register(TimingSummaryReporter(config), "timing-summary-reporter")
+
+
+def timing_summary_enabled(config: pytest.Config) -> bool:
+    """Return whether the session-wide timing summary was requested."""
+    return bool(config.getoption("timing_data") or config.getoption("timing_summary_dir"))
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -32,6 +68,25 @@ def total_timing_data(request: pytest.FixtureRequest) -> Generator[TimingData, N
         rich.print(f"\n{total_timing_data.formatted()}")
     if hasattr(request.node, "rep_call"):  # make available for test reports
         request.node.rep_call.timings = total_timing_data
+    if timing_summary_enabled(request.config):
+        # Attached to the teardown report, which xdist forwards to the
+        # controller where the session-wide summary is aggregated.
+        callspec = getattr(request.node, "callspec", None)
+        params = callspec.params if callspec is not None else {}
+        client_type = params.get("client_type")
+        test_case = params.get("test_case")
+        request.node.user_properties.append(
+            (
+                TIMING_DATA_PROPERTY,
+                {
+                    "client": client_type.name if client_type is not None else "unknown",
+                    "fixture_format": (
+                        test_case.format.format_name if test_case is not None else "unknown"
+                    ),
+                    "timing": total_timing_data.to_dict(),
+                },
+            )
+        )
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -43,3 +98,64 @@ def timing_data(
 
     with total_timing_data.time("Test case execution") as timing_data:
         yield timing_data
+
+
+class TimingSummaryReporter:
+    """
+    Pytest plugin class that aggregates the timing data of all test cases.
+
+    Under xdist, the timing trees are collected on the controller from the
+    teardown reports forwarded by the workers.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the plugin with the given pytest config."""
+        self.config = config
+        self.summary = TimingSummary()
+        self.summary_dir: Path | None = config.getoption("timing_summary_dir")
+        self.slowest_count: int = config.getoption("timing_summary_count")
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Add the timing data attached to a teardown report to the summary."""
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == TIMING_DATA_PROPERTY:
+                assert isinstance(value, dict)
+                self.summary.add(test_id=report.nodeid, **value)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Write the JSON and CSV summaries on the controller."""
+        if hasattr(session.config, "workerinput") or not self.summary:
+            return
+        if self.summary_dir is not None:
+            self.summary.write(self.summary_dir, self.slowest_count)
+
+    def pytest_terminal_summary(
+        self,
+        terminalreporter: TerminalReporter,
+        exitstatus: int,
+        config: pytest.Config,
+    ) -> None:
+        """List the slowest tests and phases."""
+        del exitstatus
+        if hasattr(config, "workerinput") or not self.summary:
+            return
+        terminalreporter.write_sep("=", "timing summary (seconds)", bold=True)
+        terminalreporter.write_line(f"Slowest {self.slowest_count} tests:")
+        for test in self.summary.slowest_tests(self.slowest_count):
+            terminalreporter.write_line(
+                f"  {test.duration:10.4f}  {test.client}  {test.fixture_format}  {test.test_id}"
+            )
+        terminalreporter.write_line(f"Slowest {self.slowest_count} phases (by p95):")
+        for phase in self.summary.slowest_phases(self.slowest_count):
+            terminalreporter.write_line(
+                f"  p50={phase.p50:.4f} p95={phase.p95:.4f} p99={phase.p99:.4f} "
+                f"max={phase.max:.4f} n={phase.count}  {phase.client}  "
+                f"{phase.fixture_format}  {phase.phase}"
+            )
+        if self.summary_dir is not None:
+            terminalreporter.write_line(
+                f"Timing summary written to: {self.summary_dir / 'timing_summary.json'}, "
+                f"{self.summary_dir / 'timing_summary.csv'}"
+            )
@@ -0,0 +1,96 @@
+"""Test the session-wide aggregation of the Hive simulator timing data."""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from ..simulators.helpers.timing import TimingData
+from ..simulators.helpers.timing_summary import TimingSummary, percentile
+
+
+def make_timing(payload_count: int) -> TimingData:
+    """Build a completed timing tree resembling the engine simulator's."""
+    with TimingData("Total (seconds)") as total:
+        with total.time("Start client"):
+            pass
+        with total.time("Test case execution") as execution:
+            with execution.time("Payloads execution") as payloads:
+                for i in range(payload_count):
+                    with payloads.time(f"Payload {i + 1}") as payload:
+                        with payload.time("engine_newPayloadV4"):
+                            pass
+    return total
+
+
+@pytest.mark.parametrize(
+    "values,pct,expected",
+    [
+        ([1.0], 99, 1.0),
+        ([1.0, 2.0, 3.0], 50, 2.0),
+        ([1.0, 2.0], 50, 1.5),
+        ([0.0, 10.0], 95, 9.5),
+        ([1.0, 2.0, 3.0, 4.0], 100, 4.0),
+    ],
+)
+def test_percentile(values: list[float], pct: float, expected: float) -> None:
+    """Test the linear interpolation of percentiles."""
+    assert percentile(values, pct) == pytest.approx(expected)
+
+
+def test_phases_strip_indices() -> None:
+    """Test that repeated sections are aggregated under the same phase."""
+    phases = [phase for phase, _ in TimingData.phases(make_timing(3).to_dict())]
+    assert phases.count("Test case execution/Payloads execution/Payload") == 3
+    assert phases.count("Test case execution/Payloads execution/Payload/engine_newPayloadV4") == 3
+    assert "Start client" in phases
+
+
+def test_phases_skip_incomplete_sections() -> None:
+    """Test that sections that never completed are not reported."""
+    timing = TimingData("Total (seconds)")
+    timing.time("Start client")
+    assert list(TimingData.phases(timing.to_dict())) == []
+
+
+def test_timing_summary(tmp_path: Path) -> None:
+    """Test the summary per client, fixture format and phase."""
+    summary = TimingSummary()
+    assert not summary
+    for i in range(4):
+        summary.add(
+            test_id=f"test_{i}",
+            client="go-ethereum",
+            fixture_format="blockchain_test_engine",
+            timing=make_timing(i + 1).to_dict(),
+        )
+    summary.add(
+        test_id="test_besu",
+        client="besu",
+        fixture_format="blockchain_test_engine",
+        timing=make_timing(1).to_dict(),
+    )
+    assert summary
+
+    statistics = {(s.client, s.phase): s for s in summary.statistics()}
+    new_payload = statistics[
+        ("go-ethereum", "Test case execution/Payloads execution/Payload/engine_newPayloadV4")
+    ]
+    assert new_payload.count == 1 + 2 + 3 + 4
+    assert new_payload.p50 <= new_payload.p95 <= new_payload.p99 <= new_payload.max
+    assert statistics[("go-ethereum", "Total")].count == 4
+    assert statistics[("besu", "Total")].count == 1
+
+    assert len(summary.slowest_tests(2)) == 2
+    assert all(s.phase != "Total" for s in summary.slowest_phases(100))
+
+    json_path, csv_path = summary.write(tmp_path / "timing", slowest_count=3)
+    report = json.loads(json_path.read_text())
+    assert report["test_count"] == 5
+    assert len(report["slowest_tests"]) == 3
+    assert len(report["phases"]) == len(statistics)
+    with open(csv_path) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(statistics)
+    assert set(rows[0]) >= {"client", "fixture_format", "phase", "p50", "p95", "p99", "max"}
@@ -0,0 +1,216 @@
+"""
+Pytest plugin that reports the client throughput of the benchmark tests run
+via execute.
+"""
+
+import csv
+import json
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+from _pytest.terminal import TerminalReporter
+
+from ethereum_test_execution import BENCHMARK_METRICS_PROPERTY, BenchmarkMetrics
+
+BENCHMARK_REPORTER_PLUGIN_NAME = "benchmark-reporter"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command-line options to pytest."""
+    benchmark_group = parser.getgroup(
+        "benchmark_report", "Arguments related to the benchmark throughput report"
+    )
+    benchmark_group.addoption(
+        "--benchmark-report-dir",
+        action="store",
+        dest="benchmark_report_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Write the client throughput (gas, transactions and Mgas/s per test and per client) "
+            "of the benchmark tests to benchmark_report.json and benchmark_report.csv in this "
+            "directory. Mgas/s is estimated from the engine_newPayload latency when execute "
+            "drives the chain via the Engine API, and from the block timestamps otherwise."
+        ),
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Register the benchmark reporter if requested, and request the execute
+    formats to collect the benchmark metrics it aggregates.
+    """
+    if config.getoption("benchmark_report_dir", None) is not None:
+        config.collect_benchmark_metrics = True  # type: ignore[attr-defined]
+        config.pluginmanager.register(BenchmarkReporter(config), BENCHMARK_REPORTER_PLUGIN_NAME)
+
+
+@dataclass(kw_only=True)
+class TestThroughput:
+    """The client throughput of a single benchmark test."""
+
+    __test__ = False  # stop pytest from collecting this class as a test
+
+    test_id: str
+    client: str
+    gas_benchmark_value: int | None
+    blocks: int
+    transactions: int
+    gas_used: int
+    new_payload_time: float | None
+    mgas_per_second: float | None
+    block_time_mgas_per_second: float | None
+
+    @classmethod
+    def from_metrics(cls, metrics: BenchmarkMetrics) -> "TestThroughput":
+        """Summarize the block metrics of a test."""
+        return cls(
+            test_id=metrics.test_id,
+            client=metrics.client,
+            gas_benchmark_value=metrics.gas_benchmark_value,
+            blocks=len(metrics.blocks),
+            transactions=metrics.transaction_count,
+            gas_used=metrics.gas_used,
+            new_payload_time=metrics.new_payload_time,
+            mgas_per_second=metrics.mgas_per_second,
+            block_time_mgas_per_second=metrics.block_time_mgas_per_second,
+        )
+
+
+@dataclass(kw_only=True)
+class ClientThroughput:
+    """The aggregated throughput of a client over all benchmark tests."""
+
+    client: str
+    tests: int
+    gas_used: int
+    new_payload_time: float | None
+    mgas_per_second: float | None
+    min_mgas_per_second: float | None
+
+
+@dataclass
+class BenchmarkReport:
+    """Collect the benchmark metrics of all tests of a session."""
+
+    tests: List[TestThroughput] = field(default_factory=list)
+
+    def add(self, metrics: BenchmarkMetrics) -> None:
+        """Add the metrics of a test."""
+        self.tests.append(TestThroughput.from_metrics(metrics))
+
+    def __bool__(self) -> bool:
+        """Return whether any benchmark metrics have been collected."""
+        return bool(self.tests)
+
+    def clients(self) -> List[ClientThroughput]:
+        """
+        Return the throughput of each client, computed from the total gas and
+        `engine_newPayload` time of the tests where the latency is known.
+        """
+        tests_by_client: Dict[str, List[TestThroughput]] = defaultdict(list)
+        for test in self.tests:
+            tests_by_client[test.client].append(test)
+        clients = []
+        for client, tests in sorted(tests_by_client.items()):
+            timed = [t for t in tests if t.new_payload_time]
+            new_payload_time = sum(t.new_payload_time or 0 for t in timed) if timed else None
+            rates = [t.mgas_per_second for t in timed if t.mgas_per_second is not None]
+            clients.append(
+                ClientThroughput(
+                    client=client,
+                    tests=len(tests),
+                    gas_used=sum(t.gas_used for t in tests),
+                    new_payload_time=new_payload_time,
+                    mgas_per_second=(
+                        sum(t.gas_used for t in timed) / new_payload_time / 1e6
+                        if new_payload_time
+                        else None
+                    ),
+                    min_mgas_per_second=min(rates) if rates else None,
+                )
+            )
+        return clients
+
+    def write(self, directory: Path) -> Tuple[Path, Path]:
+        """
+        Write the JSON and CSV reports to the directory and return their
+        paths.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path = directory / "benchmark_report.json"
+        csv_path = directory / "benchmark_report.csv"
+        json_path.write_text(
+            json.dumps(
+                {
+                    "clients": [asdict(c) for c in self.clients()],
+                    "tests": [asdict(t) for t in self.tests],
+                },
+                indent=2,
+            )
+        )
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(TestThroughput.__dataclass_fields__))
+            writer.writeheader()
+            for test in sorted(self.tests, key=lambda t: (t.client, t.test_id)):
+                writer.writerow(asdict(test))
+        return json_path, csv_path
+
+
+class BenchmarkReporter:
+    """
+    Pytest plugin class that aggregates the benchmark metrics of all tests.
+
+    Under xdist, the metrics are collected on the controller from the call
+    reports forwarded by the workers.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the plugin with the given pytest config."""
+        self.config = config
+        self.report = BenchmarkReport()
+        self.report_dir: Path = config.getoption("benchmark_report_dir")
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Add the benchmark metrics attached to a call report."""
+        if report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == BENCHMARK_METRICS_PROPERTY:
+                assert isinstance(value, dict)
+                self.report.add(BenchmarkMetrics.from_dict(value))
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Write the JSON and CSV reports on the controller."""
+        if hasattr(session.config, "workerinput") or not self.report:
+            return
+        self.report.write(self.report_dir)
+
+    def pytest_terminal_summary(
+        self,
+        terminalreporter: TerminalReporter,
+        exitstatus: int,
+        config: pytest.Config,
+    ) -> None:
+        """List the throughput of each client."""
+        del exitstatus
+        if hasattr(config, "workerinput") or not self.report:
+            return
+        terminalreporter.write_sep("=", "benchmark throughput", bold=True)
+        for client in self.report.clients():
+            rate = (
+                f"{client.mgas_per_second:.2f} Mgas/s (min {client.min_mgas_per_second:.2f})"
+                if client.mgas_per_second is not None and client.min_mgas_per_second is not None
+                else "newPayload latency unknown"
+            )
+            terminalreporter.write_line(
+                f"  {client.client}: {client.tests} tests, {client.gas_used} gas, {rate}"
+            )
+        terminalreporter.write_line(
+            f"Benchmark report written to: {self.report_dir / 'benchmark_report.json'}, "
+            f"{self.report_dir / 'benchmark_report.csv'}"
+        )
@@ -0,0 +1,133 @@
+"""
+Registry of contracts deployed on a live network that can be reused by
+other tests and sessions instead of being deployed again.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict
+
+from filelock import FileLock
+
+from ethereum_test_base_types import Address, Bytes, Hash, Storage
+from ethereum_test_rpc import EthRPC
+
+DEPLOYED_CONTRACT_NONCE = 1
+"""Nonce of a contract deployed by a transaction (EIP-161)."""
+PUSH1 = 0x60
+PUSH32 = 0x7F
+STATE_MUTATING_OPCODES = {
+    0x55,  # SSTORE
+    0xF0,  # CREATE
+    0xF1,  # CALL
+    0xF2,  # CALLCODE
+    0xF4,  # DELEGATECALL
+    0xF5,  # CREATE2
+    0xFF,  # SELFDESTRUCT
+}
+"""
+Opcodes that can modify the state of the executing contract itself (CALL can
+send value out of its balance), which would make a reused contract behave
+differently from a fresh deployment.
+"""
+
+
+def code_mutates_own_state(code: Bytes) -> bool:
+    """
+    Return whether the legacy bytecode contains an opcode that can modify the
+    storage, balance, nonce or existence of the contract, skipping push data.
+    """
+    i = 0
+    while i < len(code):
+        opcode = code[i]
+        if opcode in STATE_MUTATING_OPCODES:
+            return True
+        if PUSH1 <= opcode <= PUSH32:
+            i += opcode - PUSH1 + 1
+        i += 1
+    return False
+
+
+def storage_hash(storage: Storage) -> Hash:
+    """Return a hash of the constructor storage of a contract."""
+    return Bytes(
+        b"".join(
+            bytes(Hash(key)) + bytes(Hash(value)) for key, value in sorted(storage.root.items())
+        )
+    ).keccak256()
+
+
+class ContractRegistry:
+    """
+    Map the code, constructor storage and chain of a contract to the address
+    where it was already deployed.
+
+    The registry is persisted to a JSON file, protected by a lock file so it
+    can be shared by all the workers of a session and by later sessions. Only
+    contracts deployed without balance are registered. Every entry is verified
+    to still have the code, storage, zero balance and nonce of a fresh
+    deployment before being reused, and stale entries are dropped.
+    """
+
+    path: Path
+    lock: FileLock
+    chain_id: int
+    eth_rpc: EthRPC
+
+    def __init__(self, path: Path, *, chain_id: int, eth_rpc: EthRPC):
+        """Initialize the registry stored at the given path."""
+        self.path = path
+        self.lock = FileLock(path.with_name(f"{path.name}.lock"))
+        self.chain_id = chain_id
+        self.eth_rpc = eth_rpc
+
+    def key(self, code: Bytes, storage: Storage) -> str:
+        """Return the registry key of a contract."""
+        return f"{self.chain_id}:{code.keccak256()}:{storage_hash(storage)}"
+
+    def _load(self) -> Dict[str, str]:
+        """Load the registry entries."""
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text() or "{}")
+
+    def _store(self, entries: Dict[str, str]) -> None:
+        """Store the registry entries."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(entries, indent=2, sort_keys=True))
+
+    def lookup(self, code: Bytes, storage: Storage) -> Address | None:
+        """
+        Return the address of a verified deployment of the contract, or None
+        if there is none.
+        """
+        key = self.key(code, storage)
+        with self.lock:
+            address = self._load().get(key)
+        if address is None:
+            return None
+        contract_address = Address(address)
+        if (
+            self.eth_rpc.get_code(contract_address) == code
+            and all(
+                self.eth_rpc.get_storage_at(contract_address, Hash(slot)) == value
+                for slot, value in storage.root.items()
+            )
+            # Value sent to the contract by earlier tests must not carry over.
+            and self.eth_rpc.get_balance(contract_address) == 0
+            and self.eth_rpc.get_transaction_count(contract_address) == DEPLOYED_CONTRACT_NONCE
+        ):
+            return contract_address
+        with self.lock:
+            entries = self._load()
+            if entries.get(key) == address:
+                del entries[key]
+                self._store(entries)
+        return None
+
+    def register(self, code: Bytes, storage: Storage, address: Address) -> None:
+        """Register the address of a new deployment of the contract."""
+        with self.lock:
+            entries = self._load()
+            entries[self.key(code, storage)] = str(address)
+            self._store(entries)
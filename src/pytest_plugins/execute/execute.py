@@ -131,6 +131,42 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=0.3,
         help=("Time to wait after sending a forkchoice_updated before getting the payload."),
     )
+    execute_group.addoption(
+        "--block-production-mode",
+        action="store",
+        dest="block_production_mode",
+        choices=["fixed", "adaptive"],
+        default="fixed",
+        help=(
+            "How blocks are produced via the Engine API: 'fixed' waits --get-payload-wait-time "
+            "before getting each payload, 'adaptive' polls the payload until it contains all "
+            "pending transactions or stops growing (waiting at most --get-payload-wait-time), "
+            "and starts building the next payload while the current one is imported."
+        ),
+    )
+    execute_group.addoption(
+        "--tx-wait-strategy",
+        action="store",
+        dest="tx_wait_strategy",
+        choices=["poll", "blocks"],
+        default="poll",
+        help=(
+            "Strategy used to wait for transaction inclusion: 'poll' queries every pending "
+            "transaction on each interval, 'blocks' follows new blocks and resolves all pending "
+            "transactions found in each block at once (falls back to 'poll' if unsupported)."
+        ),
+    )
+    execute_group.addoption(
+        "--tx-confirmation-depth",
+        action="store",
+        dest="tx_confirmation_depth",
+        type=int,
+        default=0,
+        help=(
+            "Number of blocks that must be built on top of a transaction's block before it is "
+            "considered included (requires --tx-wait-strategy=blocks)."
+        ),
+    )
     execute_group.addoption(
         "--chain-id",
         action="store",
@@ -413,21 +449,32 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
 
                 # wait for pre-requisite transactions to be included in blocks
                 pre.wait_for_transactions()
+                deployment_errors = []
                 for deployed_contract, expected_code in pre._deployed_contracts:
                     actual_code = eth_rpc.get_code(deployed_contract)
                     if actual_code != expected_code:
-                        raise Exception(
+                        deployment_errors.append(
                             f"Deployed test contract didn't match expected code at address "
                             f"{deployed_contract} (not enough gas_limit?).\n"
                             f"Expected: {expected_code}\n"
                             f"Actual: {actual_code}"
                         )
+                if deployment_errors:
+                    raise Exception("\n".join(deployment_errors))
                 request.node.config.funded_accounts = ", ".join(
                     [str(eoa) for eoa in pre._funded_eoa]
                 )
 
                 execute = self.execute(fork=fork, execute_format=execute_format)
-                execute.execute(fork=fork, eth_rpc=eth_rpc, engine_rpc=engine_rpc, request=request)
+                execute.execute(
+                    fork=fork,
+                    eth_rpc=eth_rpc,
+                    engine_rpc=engine_rpc,
+                    request=request,
+                    collect_benchmark_metrics=getattr(
+                        request.config, "collect_benchmark_metrics", False
+                    ),
+                )
                 collector.collect(request.node.nodeid, execute)
 
         return BaseTestWrapper
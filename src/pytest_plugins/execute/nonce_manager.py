@@ -0,0 +1,175 @@
+"""Local nonce management of the accounts that send transactions in execute."""
+
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+from filelock import FileLock
+
+from ethereum_test_base_types import Number
+from ethereum_test_rpc import EthRPC, SendTransactionExceptionError
+from ethereum_test_tools import EOA, Transaction
+
+NONCE_ERROR_PATTERN = re.compile(
+    r"nonce too (low|high)|invalid nonce|nonce (is )?(lower|higher)|old nonce|future nonce",
+    re.IGNORECASE,
+)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Return whether a transaction was rejected because of its nonce."""
+    return NONCE_ERROR_PATTERN.search(str(error)) is not None
+
+
+class NonceManager:
+    """
+    Hand out the nonces of a sender locally and atomically.
+
+    The next nonce is only requested from the node on the first use, after a
+    transaction is rejected because of its nonce, after a nonce could not be
+    rolled back, and at explicit checkpoints (`reconcile`).
+
+    If a `nonce_file` is given, the next nonce is stored in the file and
+    protected by a lock file, so that the same sender can be shared by all the
+    processes of a session. Otherwise, the nonce is kept in memory and
+    protected by a thread lock.
+
+    The `nonce` of the sender EOA is kept in sync with the next nonce, so that
+    transactions built without an explicit nonce also use it.
+    """
+
+    sender: EOA
+    eth_rpc: EthRPC
+    nonce_file: Path | None
+    _next_nonce: int | None
+    _lock: threading.RLock
+    _file_lock: FileLock | None
+    _depth: int
+
+    def __init__(self, sender: EOA, eth_rpc: EthRPC, *, nonce_file: Path | None = None):
+        """Initialize the nonce manager of the sender."""
+        self.sender = sender
+        self.eth_rpc = eth_rpc
+        self.nonce_file = nonce_file
+        self._next_nonce = None
+        self._lock = threading.RLock()
+        self._file_lock = (
+            FileLock(nonce_file.with_suffix(".lock")) if nonce_file is not None else None
+        )
+        self._depth = 0
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Lock the nonce state. With a nonce file, the state is loaded from the
+        file when the outermost lock is acquired, and stored when released.
+        """
+        with self._lock:
+            if self.nonce_file is None or self._file_lock is None or self._depth > 0:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            with self._file_lock:
+                text = self.nonce_file.read_text() if self.nonce_file.exists() else ""
+                self._next_nonce = int(text) if text else None
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                    self.nonce_file.write_text(
+                        "" if self._next_nonce is None else str(self._next_nonce)
+                    )
+
+    def _fetch_nonce(self) -> int:
+        """Request the next nonce of the sender from the node."""
+        return self.eth_rpc.get_transaction_count(self.sender, block_number="pending")
+
+    def _set_next_nonce(self, nonce: int | None) -> None:
+        """Set the next nonce and keep the sender EOA in sync."""
+        self._next_nonce = nonce
+        if nonce is not None:
+            self.sender.nonce = Number(nonce)
+
+    def reconcile(self) -> int:
+        """Synchronize the next nonce with the node's view and return it."""
+        with self._locked():
+            self._set_next_nonce(self._fetch_nonce())
+            assert self._next_nonce is not None
+            return self._next_nonce
+
+    def invalidate(self) -> None:
+        """Request the next nonce from the node on the next use."""
+        with self._locked():
+            self._next_nonce = None
+
+    def next_nonce(self) -> int:
+        """Reserve and return the next nonce of the sender."""
+        with self._locked():
+            nonce = self._next_nonce if self._next_nonce is not None else self._fetch_nonce()
+            self._set_next_nonce(nonce + 1)
+            return nonce
+
+    def rollback(self, nonce: int) -> None:
+        """
+        Return a nonce of a transaction that was not accepted by the node.
+
+        If other nonces were handed out after it, the nonce cannot be reused
+        without leaving a gap, so the next nonce is requested from the node
+        instead.
+        """
+        with self._locked():
+            if self._next_nonce is not None and nonce == self._next_nonce - 1:
+                self._set_next_nonce(nonce)
+            else:
+                self._next_nonce = None
+
+    def send_transaction(self, build: Callable[[int], Transaction]) -> Transaction:
+        """
+        Build a transaction with the next nonce, using `build`, and send it.
+
+        If the node rejects the transaction because of its nonce, the nonce is
+        reconciled with the node and the transaction is rebuilt and sent once
+        more. If it is rejected for any other reason, the nonce is rolled back.
+
+        The nonce state stays locked until the transaction is sent, so that
+        transactions of a shared sender reach the node in nonce order.
+        """
+        with self._locked():
+            for attempt in range(2):
+                nonce = self.next_nonce()
+                transaction = build(nonce)
+                try:
+                    self.eth_rpc.send_transaction(transaction)
+                    return transaction
+                except SendTransactionExceptionError as e:
+                    if is_nonce_error(e) and attempt == 0:
+                        self.invalidate()
+                        continue
+                    self.rollback(nonce)
+                    raise
+        raise AssertionError("unreachable")
+
+    def send_transactions_batch(
+        self, builds: List[Callable[[int], Transaction]]
+    ) -> List[Transaction]:
+        """
+        Build a transaction with consecutive nonces for each of the `builds`
+        and send them all in a single batch.
+
+        If any of the transactions is rejected, the next nonce is requested
+        from the node on the next use and the first rejection is raised.
+        """
+        with self._locked():
+            transactions = [build(self.next_nonce()) for build in builds]
+            results = self.eth_rpc.send_transactions_batch(transactions)
+            for result in results:
+                if isinstance(result, SendTransactionExceptionError):
+                    self.invalidate()
+                    raise result
+            return transactions
@@ -22,7 +22,7 @@ from ethereum_test_base_types.conversions import (
     NumberConvertible,
 )
 from ethereum_test_forks import Fork
-from ethereum_test_rpc import EthRPC
+from ethereum_test_rpc import EthRPC, SendTransactionExceptionError
 from ethereum_test_rpc.rpc_types import TransactionByHashResponse
 from ethereum_test_tools import (
     EOA,
@@ -39,6 +39,9 @@ from ethereum_test_types import ChainConfig, TransactionTestMetadata
 from ethereum_test_types.eof.v1 import Container
 from ethereum_test_vm import Bytecode, EVMCodeType, Opcodes
 
+from .contract_registry import ContractRegistry, code_mutates_own_state
+from .nonce_manager import NonceManager
+
 MAX_BYTECODE_SIZE = 24576
 MAX_INITCODE_SIZE = MAX_BYTECODE_SIZE * 2
 
@@ -119,6 +122,29 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         type=int,
         help="The default amount of wei to fund each EOA in each test with.",
     )
+    pre_alloc_group.addoption(
+        "--deferred-deployment",
+        action="store_true",
+        dest="deferred_deployment",
+        default=False,
+        help=(
+            "Defer the pre-allocation transactions of each test until its setup is complete, "
+            "then send them in a single JSON-RPC batch and wait for all of them at once."
+        ),
+    )
+    pre_alloc_group.addoption(
+        "--contract-registry",
+        action="store",
+        dest="contract_registry",
+        type=Path,
+        default=None,
+        help=(
+            "Path to a JSON file used to reuse contracts already deployed on the network by "
+            "previous tests or sessions, instead of deploying identical contracts again. Only "
+            "contracts without balance and without opcodes that modify their own state are "
+            "reused, and never for tests marked with `mutable_contracts`."
+        ),
+    )
     pre_alloc_group.addoption(
         "--skip-cleanup",
         action="store_true",
@@ -128,6 +154,15 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the markers used by the execute pre-allocation."""
+    config.addinivalue_line(
+        "markers",
+        "mutable_contracts: always deploy fresh contracts for the test, even if a contract "
+        "registry is used.",
+    )
+
+
 @pytest.hookimpl(trylast=True)
 def pytest_report_header(config: pytest.Config) -> list[str]:
     """Pytest hook called to obtain the report header."""
@@ -158,6 +193,23 @@ def skip_cleanup(request: pytest.FixtureRequest) -> bool:
     return request.config.getoption("skip_cleanup")
 
 
+@pytest.fixture(scope="session")
+def deferred_deployment(request: pytest.FixtureRequest) -> bool:
+    """Return whether to defer the pre-allocation transactions of each test."""
+    return request.config.getoption("deferred_deployment")
+
+
+@pytest.fixture(scope="session")
+def contract_registry(
+    request: pytest.FixtureRequest, chain_config: ChainConfig, eth_rpc: EthRPC
+) -> ContractRegistry | None:
+    """Return the registry of reusable contracts, if enabled."""
+    registry_path: Path | None = request.config.getoption("contract_registry")
+    if registry_path is None:
+        return None
+    return ContractRegistry(registry_path, chain_id=chain_config.chain_id, eth_rpc=eth_rpc)
+
+
 @pytest.fixture(scope="session")
 def eoa_iterator(request: pytest.FixtureRequest) -> Iterator[EOA]:
     """Return an iterator that generates EOAs."""
@@ -166,13 +218,28 @@ def eoa_iterator(request: pytest.FixtureRequest) -> Iterator[EOA]:
     return iter(EOA(key=i, nonce=0) for i in count(start=eoa_start))
 
 
+def describe_setup_transaction(tx: Transaction) -> str:
+    """Describe the contract or account that a setup transaction sets up."""
+    metadata = tx.metadata
+    action = metadata.action if metadata is not None else None
+    target = metadata.target if metadata is not None else None
+    if tx.to is None:
+        description = f"deploy_contract of {target or 'unlabeled contract'}"
+        return f"{description} at {tx.created_contract} (nonce {int(tx.nonce)})"
+    return f"{action} of {target or tx.to} (nonce {int(tx.nonce)})"
+
+
 class Alloc(BaseAlloc):
     """A custom class that inherits from the original Alloc class."""
 
     _fork: Fork = PrivateAttr()
     _sender: EOA = PrivateAttr()
+    _nonce_manager: NonceManager = PrivateAttr()
     _eth_rpc: EthRPC = PrivateAttr()
     _txs: List[Transaction] = PrivateAttr(default_factory=list)
+    _deferred: bool = PrivateAttr(False)
+    _contract_registry: ContractRegistry | None = PrivateAttr(None)
+    _pending_txs: List[Transaction] = PrivateAttr(default_factory=list)
     _deployed_contracts: List[Tuple[Address, Bytes]] = PrivateAttr(default_factory=list)
     _funded_eoa: List[EOA] = PrivateAttr(default_factory=list)
     _evm_code_type: EVMCodeType | None = PrivateAttr(None)
@@ -192,12 +259,16 @@ class Alloc(BaseAlloc):
         evm_code_type: EVMCodeType | None = None,
         node_id: str = "",
         address_stubs: AddressStubs | None = None,
+        nonce_manager: NonceManager | None = None,
+        deferred: bool = False,
+        contract_registry: ContractRegistry | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the pre-alloc with the given parameters."""
         super().__init__(*args, **kwargs)
         self._fork = fork
         self._sender = sender
+        self._nonce_manager = nonce_manager or NonceManager(sender, eth_rpc)
         self._eth_rpc = eth_rpc
         self._eoa_iterator = eoa_iterator
         self._evm_code_type = evm_code_type
@@ -205,19 +276,69 @@ class Alloc(BaseAlloc):
         self._eoa_fund_amount_default = eoa_fund_amount_default
         self._node_id = node_id
         self._address_stubs = address_stubs or AddressStubs(root={})
+        self._deferred = deferred
+        self._contract_registry = contract_registry
+
+    def _send_sender_transaction(
+        self, *, action: str, target: str | None, **kwargs: Any
+    ) -> Transaction:
+        """
+        Send a setup transaction from the sender, using the next nonce handed
+        out by its nonce manager.
+
+        In deferred mode, the transaction is only signed, and sent later by
+        `send_pending_transactions`.
+        """
+
+        def build(nonce: int) -> Transaction:
+            tx = Transaction(sender=self._sender, nonce=nonce, **kwargs)
+            tx = tx.with_signature_and_sender()
+            tx.metadata = TransactionTestMetadata(
+                test_id=self._node_id,
+                phase="setup",
+                action=action,
+                target=target,
+                tx_index=len(self._txs),
+            )
+            return tx
 
-    # always refresh _sender nonce from RPC ("pending") before building tx
-    def _refresh_sender_nonce(self) -> None:
+        if self._deferred:
+            tx = build(self._nonce_manager.next_nonce())
+            self._pending_txs.append(tx)
+        else:
+            tx = self._nonce_manager.send_transaction(build)
+        self._txs.append(tx)
+        return tx
+
+    def send_pending_transactions(self) -> None:
         """
-        Synchronize self._sender.nonce with the node's view.
-        Prefer 'pending' to account for in-flight transactions.
+        Send all the deferred transactions in a single batch request.
+
+        Raises an exception that lists every transaction rejected by the node,
+        together with the contract or account it was meant to set up.
         """
-        try:
-            rpc_nonce = self._eth_rpc.get_transaction_count(self._sender, block_number="pending")
-        except TypeError:
-            # If EthRPC.get_transaction_count has no 'block' kwarg
-            rpc_nonce = self._eth_rpc.get_transaction_count(self._sender)
-        self._sender.nonce = Number(rpc_nonce)
+        pending_txs, self._pending_txs = self._pending_txs, []
+        if not pending_txs:
+            return
+        results = self._eth_rpc.send_transactions_batch(pending_txs)
+        errors = [
+            f"{describe_setup_transaction(tx)}: {result.args[0] if result.args else result}"
+            for tx, result in zip(pending_txs, results, strict=True)
+            if isinstance(result, SendTransactionExceptionError)
+        ]
+        if errors:
+            # The nonces of the rejected transactions cannot be reused.
+            self._nonce_manager.invalidate()
+            raise Exception(
+                f"{len(errors)} of {len(pending_txs)} pre-alloc transactions were rejected:\n"
+                + "\n".join(errors)
+            )
+
+    def discard_pending_transactions(self) -> None:
+        """Drop the deferred transactions that were never sent."""
+        if self._pending_txs:
+            self._pending_txs = []
+            self._nonce_manager.invalidate()
 
     def __setitem__(
         self,
@@ -298,6 +419,25 @@ class Alloc(BaseAlloc):
 
         assert len(code) <= MAX_BYTECODE_SIZE, f"code too large: {len(code)} > {MAX_BYTECODE_SIZE}"
 
+        contract_registry = self._contract_registry
+        if (
+            contract_registry is not None
+            and Number(balance) == 0
+            and Number(nonce) == 1
+            and not isinstance(code, Container)
+            and not code_mutates_own_state(Bytes(code))
+        ):
+            registered_address = contract_registry.lookup(Bytes(code), storage)
+            if registered_address is not None:
+                super().__setitem__(
+                    registered_address,
+                    Account(nonce=nonce, balance=balance, code=code, storage=storage),
+                )
+                registered_address.label = label
+                return registered_address
+        else:
+            contract_registry = None
+
         deploy_gas_limit += len(bytes(code)) * 200
 
         initcode: Bytecode | Container
@@ -321,27 +461,19 @@ class Alloc(BaseAlloc):
         deploy_gas_limit = min(deploy_gas_limit * 2, 30_000_000)
         print(f"Deploying contract with gas limit: {deploy_gas_limit}")
 
-        self._refresh_sender_nonce()
-
-        deploy_tx = Transaction(
-            sender=self._sender,
+        deploy_tx = self._send_sender_transaction(
+            action="deploy_contract",
+            target=label,
             to=None,
             data=initcode,
             value=balance,
             gas_limit=deploy_gas_limit,
-        ).with_signature_and_sender()
-        deploy_tx.metadata = TransactionTestMetadata(
-            test_id=self._node_id,
-            phase="setup",
-            action="deploy_contract",
-            target=label,
-            tx_index=len(self._txs),
         )
-        self._eth_rpc.send_transaction(deploy_tx)
-        self._txs.append(deploy_tx)
 
         contract_address = deploy_tx.created_contract
         self._deployed_contracts.append((contract_address, Bytes(code)))
+        if contract_registry is not None:
+            contract_registry.register(Bytes(code), storage, contract_address)
 
         assert Number(nonce) >= 1, "impossible to deploy contract with nonce lower than one"
 
@@ -377,7 +509,7 @@ class Alloc(BaseAlloc):
         if amount is None:
             amount = self._eoa_fund_amount_default
 
-        fund_tx: Transaction | None = None
+        fund_tx_kwargs: Dict[str, Any] | None = None
         if delegation is not None or storage is not None:
             if storage is not None:
                 sstore_address = self.deploy_contract(
@@ -386,10 +518,9 @@ class Alloc(BaseAlloc):
                     )
                 )
 
-                self._refresh_sender_nonce()
-
-                set_storage_tx = Transaction(
-                    sender=self._sender,
+                self._send_sender_transaction(
+                    action="eoa_storage_set",
+                    target=label,
                     to=eoa,
                     authorization_list=[
                         AuthorizationTuple(
@@ -400,27 +531,15 @@ class Alloc(BaseAlloc):
                         ),
                     ],
                     gas_limit=100_000,
-                ).with_signature_and_sender()
-                eoa.nonce = Number(eoa.nonce + 1)
-                set_storage_tx.metadata = TransactionTestMetadata(
-                    test_id=self._node_id,
-                    phase="setup",
-                    action="eoa_storage_set",
-                    target=label,
-                    tx_index=len(self._txs),
                 )
-                self._eth_rpc.send_transaction(set_storage_tx)
-                self._txs.append(set_storage_tx)
-
-            self._refresh_sender_nonce()
+                eoa.nonce = Number(eoa.nonce + 1)
 
             if delegation is not None:
                 if not isinstance(delegation, Address) and delegation == "Self":
                     delegation = eoa
                 # TODO: This tx has side-effects on the EOA state because of
                 # the delegation
-                fund_tx = Transaction(
-                    sender=self._sender,
+                fund_tx_kwargs = dict(
                     to=eoa,
                     value=amount,
                     authorization_list=[
@@ -432,11 +551,10 @@ class Alloc(BaseAlloc):
                         ),
                     ],
                     gas_limit=100_000,
-                ).with_signature_and_sender()
+                )
                 eoa.nonce = Number(eoa.nonce + 1)
             else:
-                fund_tx = Transaction(
-                    sender=self._sender,
+                fund_tx_kwargs = dict(
                     to=eoa,
                     value=amount,
                     authorization_list=[
@@ -449,29 +567,15 @@ class Alloc(BaseAlloc):
                         ),
                     ],
                     gas_limit=100_000,
-                ).with_signature_and_sender()
+                )
                 eoa.nonce = Number(eoa.nonce + 1)
 
         else:
             if Number(amount) > 0:
-                self._refresh_sender_nonce()
+                fund_tx_kwargs = dict(to=eoa, value=amount)
 
-                fund_tx = Transaction(
-                    sender=self._sender,
-                    to=eoa,
-                    value=amount,
-                ).with_signature_and_sender()
-
-        if fund_tx is not None:
-            fund_tx.metadata = TransactionTestMetadata(
-                test_id=self._node_id,
-                phase="setup",
-                action="fund_eoa",
-                target=label,
-                tx_index=len(self._txs),
-            )
-            self._eth_rpc.send_transaction(fund_tx)
-            self._txs.append(fund_tx)
+        if fund_tx_kwargs is not None:
+            self._send_sender_transaction(action="fund_eoa", target=label, **fund_tx_kwargs)
         super().__setitem__(
             eoa,
             Account(
@@ -489,22 +593,9 @@ class Alloc(BaseAlloc):
         If the address is already present in the pre-alloc the amount will be
         added to its existing balance.
         """
-        self._refresh_sender_nonce()
-
-        fund_tx = Transaction(
-            sender=self._sender,
-            to=address,
-            value=amount,
-        ).with_signature_and_sender()
-        fund_tx.metadata = TransactionTestMetadata(
-            test_id=self._node_id,
-            phase="setup",
-            action="fund_address",
-            target=address.label,
-            tx_index=len(self._txs),
+        self._send_sender_transaction(
+            action="fund_address", target=address.label, to=address, value=amount
         )
-        self._eth_rpc.send_transaction(fund_tx)
-        self._txs.append(fund_tx)
         if address in self:
             account = self[address]
             if account is not None:
@@ -545,8 +636,21 @@ class Alloc(BaseAlloc):
         return Address(eoa)
 
     def wait_for_transactions(self) -> List[TransactionByHashResponse]:
-        """Wait for all transactions to be included in blocks."""
-        return self._eth_rpc.wait_for_transactions(self._txs)
+        """
+        Wait for all transactions to be included in blocks, and reconcile the
+        nonce of the sender with the node afterwards.
+
+        In deferred mode, the pending transactions are sent first, and all the
+        transactions are waited for by following the new blocks.
+        """
+        if self._deferred:
+            self.send_pending_transactions()
+            responses = self._eth_rpc.wait_for_transactions(self._txs, strategy="blocks")
+        else:
+            responses = self._eth_rpc.wait_for_transactions(self._txs)
+        if self._txs:
+            self._nonce_manager.reconcile()
+        return responses
 
 
 @pytest.fixture(autouse=True)
@@ -565,10 +669,24 @@ def eoa_fund_amount_default(request: pytest.FixtureRequest) -> int:
     return request.config.option.eoa_fund_amount_default
 
 
+@pytest.fixture(scope="session")
+def sender_nonce_manager(sender_key: EOA, eth_rpc: EthRPC) -> NonceManager:
+    """
+    Return the nonce manager of the worker's sender key, shared by the
+    pre-allocations of all the tests of the session.
+    """
+    nonce_manager = NonceManager(sender_key, eth_rpc)
+    nonce_manager.reconcile()
+    return nonce_manager
+
+
 @pytest.fixture(autouse=True, scope="function")
 def pre(
     fork: Fork,
     sender_key: EOA,
+    sender_nonce_manager: NonceManager,
+    deferred_deployment: bool,
+    contract_registry: ContractRegistry | None,
     eoa_iterator: Iterator[EOA],
     eth_rpc: EthRPC,
     evm_code_type: EVMCodeType,
@@ -600,11 +718,18 @@ def pre(
         eoa_fund_amount_default=eoa_fund_amount_default,
         node_id=request.node.nodeid,
         address_stubs=address_stubs,
+        nonce_manager=sender_nonce_manager,
+        deferred=deferred_deployment,
+        contract_registry=(
+            None if request.node.get_closest_marker("mutable_contracts") else contract_registry
+        ),
     )
 
     # Yield the pre-alloc for usage during the test
     yield pre
 
+    pre.discard_pending_transactions()
+
     if not skip_cleanup:
         # Refund all EOAs (regardless of whether the test passed or failed)
         refund_txs = []
@@ -3,20 +3,27 @@ Chain builder Ethereum RPC that can drive the chain when new transactions are
 submitted.
 """
 
+import json
+import os
+import sqlite3
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterator, List
+from typing import Any, Dict, Iterable, Iterator, List, Literal
 
 from filelock import FileLock
 from pydantic import RootModel
 from typing_extensions import Self
 
-from ethereum_test_base_types import HexNumber
+from ethereum_test_base_types import Bytes, HexNumber
 from ethereum_test_forks import Fork
-from ethereum_test_rpc import EngineRPC
+from ethereum_test_rpc import EngineRPC, SendTransactionExceptionError, TransactionWaitStrategy
 from ethereum_test_rpc import EthRPC as BaseEthRPC
 from ethereum_test_rpc.rpc_types import (
     ForkchoiceState,
+    GetPayloadResponse,
+    JSONRPCError,
     PayloadAttributes,
     PayloadStatusEnum,
     TransactionByHashResponse,
@@ -27,36 +34,11 @@ from ethereum_test_tools import (
     Transaction,
 )
 from ethereum_test_types.trie import keccak256
+from pytest_plugins.custom_logging import get_logger
 
+logger = get_logger(__name__)
 
-class HashList(RootModel[List[Hash]]):
-    """Hash list class."""
-
-    root: List[Hash]
-
-    def append(self, item: Hash) -> None:
-        """Append an item to the list."""
-        self.root.append(item)
-
-    def clear(self) -> None:
-        """Clear the list."""
-        self.root.clear()
-
-    def remove(self, item: Hash) -> None:
-        """Remove an item from the list."""
-        self.root.remove(item)
-
-    def __contains__(self, item: Hash) -> bool:
-        """Check if an item is in the list."""
-        return item in self.root
-
-    def __len__(self) -> int:
-        """Get the length of the list."""
-        return len(self.root)
-
-    def __iter__(self) -> Iterator[Hash]:  # type: ignore
-        """Iterate over the list."""
-        return iter(self.root)
+BlockProductionMode = Literal["fixed", "adaptive"]
 
 
 class AddressList(RootModel[List[Address]]):
@@ -89,85 +71,250 @@ class AddressList(RootModel[List[Address]]):
         return iter(self.root)
 
 
+PAYLOAD_STABLE_POLLS = 5
+"""
+Number of consecutive polls without new transactions after which a payload
+is considered complete, so that a client that is still adding transactions
+between two polls does not produce an underfilled block.
+"""
+
+PENDING_TX_HASHES_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS pending_tx_hashes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash BLOB NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS pending_tx_count (count INTEGER NOT NULL);
+INSERT INTO pending_tx_count SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM pending_tx_count);
+CREATE TRIGGER IF NOT EXISTS pending_tx_hashes_insert AFTER INSERT ON pending_tx_hashes
+BEGIN
+    UPDATE pending_tx_count SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS pending_tx_hashes_delete AFTER DELETE ON pending_tx_hashes
+BEGIN
+    UPDATE pending_tx_count SET count = count - 1;
+END;
+CREATE TABLE IF NOT EXISTS block_import_latencies (
+    hash BLOB PRIMARY KEY,
+    latency REAL NOT NULL
+);
+COMMIT;
+"""
+"""
+Schema of the pending transaction hashes database. The count is maintained by
+triggers so that the number of pending hashes can be read without a scan. The
+database also keeps the import latency of the generated blocks.
+"""
+
+
 class PendingTxHashes:
     """
     A class to manage the pending transaction hashes in a multi-process
     environment.
 
-    It uses a lock file to ensure that only one process can access the pending
-    hashes file at a time.
+    The hashes are stored in a SQLite database in WAL mode that is shared by
+    all the processes of the session. Every operation is a single indexed
+    statement (or transaction) that is atomic on its own, so inserting,
+    removing and checking a hash does not require reading the whole set.
+
+    Entering the context acquires an exclusive lock file, which is used to
+    serialize block generation among all the processes.
     """
 
-    pending_hashes_file: Path
+    database_file: Path
     pending_hashes_lock: Path
-    pending_tx_hashes: HashList | None
     lock: FileLock | None
+    busy_timeout: float
+    _connection: sqlite3.Connection | None
+    _connection_pid: int | None
 
-    def __init__(self, temp_folder: Path):
+    def __init__(self, temp_folder: Path, *, busy_timeout: float = 60.0):
         """Initialize the pending transaction hashes manager."""
-        self.pending_hashes_file = temp_folder / "pending_tx_hashes"
+        self.database_file = temp_folder / "pending_tx_hashes.db"
         self.pending_hashes_lock = temp_folder / "pending_tx_hashes.lock"
-        self.pending_tx_hashes = None
         self.lock = None
+        self.busy_timeout = busy_timeout
+        self._connection = None
+        self._connection_pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Return the connection to the database of the current process, creating
+        the database if necessary.
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection = sqlite3.connect(
+                self.database_file,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(PENDING_TX_HASHES_SCHEMA)
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
 
     def __enter__(self) -> Self:
-        """Lock the pending hashes file and load it."""
+        """Acquire the exclusive lock used to serialize block generation."""
         assert self.lock is None, "Lock already acquired"
         self.lock = FileLock(self.pending_hashes_lock, timeout=-1)
         self.lock.acquire()
-        assert self.pending_tx_hashes is None, "Pending transaction hashes already loaded"
-        if self.pending_hashes_file.exists():
-            with open(self.pending_hashes_file, "r") as f:
-                self.pending_tx_hashes = HashList.model_validate_json(f.read())
-        else:
-            self.pending_tx_hashes = HashList([])
         return self
 
     def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
-        """Flush the pending hashes to the file and release the lock."""
+        """Release the lock."""
         assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None, "Pending transaction hashes not loaded"
-        with open(self.pending_hashes_file, "w") as f:
-            f.write(self.pending_tx_hashes.model_dump_json())
         self.lock.release()
         self.lock = None
-        self.pending_tx_hashes = None
 
     def append(self, tx_hash: Hash) -> None:
         """Add a transaction hash to the pending list."""
-        assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None, "Pending transaction hashes not loaded"
-        self.pending_tx_hashes.append(tx_hash)
+        self.connection.execute(
+            "INSERT OR IGNORE INTO pending_tx_hashes (hash) VALUES (?)", (bytes(tx_hash),)
+        )
+
+    def extend(self, tx_hashes: Iterable[Hash]) -> None:
+        """Add multiple transaction hashes to the pending list atomically."""
+        with self.transaction() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO pending_tx_hashes (hash) VALUES (?)",
+                ((bytes(tx_hash),) for tx_hash in tx_hashes),
+            )
 
     def clear(self) -> None:
-        """Remove a transaction hash from the pending list."""
-        assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None
-        self.pending_tx_hashes.clear()
+        """Remove all transaction hashes from the pending list."""
+        self.connection.execute("DELETE FROM pending_tx_hashes")
 
     def remove(self, tx_hash: Hash) -> None:
         """Remove a transaction hash from the pending list."""
-        assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None, "Pending transaction hashes not loaded"
-        self.pending_tx_hashes.remove(tx_hash)
+        cursor = self.connection.execute(
+            "DELETE FROM pending_tx_hashes WHERE hash = ?", (bytes(tx_hash),)
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(tx_hash)
+
+    def discard(self, tx_hashes: Iterable[Hash]) -> int:
+        """
+        Remove the transaction hashes that are in the pending list, and return
+        how many were removed.
+        """
+        with self.transaction() as connection:
+            cursor = connection.executemany(
+                "DELETE FROM pending_tx_hashes WHERE hash = ?",
+                ((bytes(tx_hash),) for tx_hash in tx_hashes),
+            )
+            return cursor.rowcount
+
+    def take(self, count: int) -> List[Hash]:
+        """
+        Atomically remove and return up to `count` of the oldest pending
+        transaction hashes, e.g. to be included in the next block.
+        """
+        with self.transaction() as connection:
+            rows = connection.execute(
+                "SELECT seq, hash FROM pending_tx_hashes ORDER BY seq LIMIT ?", (count,)
+            ).fetchall()
+            if rows:
+                connection.execute("DELETE FROM pending_tx_hashes WHERE seq <= ?", (rows[-1][0],))
+        return [Hash(tx_hash) for _, tx_hash in rows]
+
+    def record_block_import(self, block_hash: Hash, latency: float) -> None:
+        """Record the `engine_newPayload` latency of a generated block."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO block_import_latencies (hash, latency) VALUES (?, ?)",
+            (bytes(block_hash), latency),
+        )
+
+    def block_import_latency(self, block_hash: Hash) -> float | None:
+        """Return the `engine_newPayload` latency of a generated block."""
+        row = self.connection.execute(
+            "SELECT latency FROM block_import_latencies WHERE hash = ?", (bytes(block_hash),)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the statements in a write transaction."""
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
 
     def __contains__(self, tx_hash: Hash) -> bool:
         """Check if a transaction hash is in the pending list."""
-        assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None, "Pending transaction hashes not loaded"
-        return tx_hash in self.pending_tx_hashes
+        cursor = self.connection.execute(
+            "SELECT 1 FROM pending_tx_hashes WHERE hash = ?", (bytes(tx_hash),)
+        )
+        return cursor.fetchone() is not None
 
     def __len__(self) -> int:
         """Get the number of pending transaction hashes."""
-        assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None, "Pending transaction hashes not loaded"
-        return len(self.pending_tx_hashes)
+        return self.connection.execute("SELECT count FROM pending_tx_count").fetchone()[0]
 
     def __iter__(self) -> Iterator[Hash]:
-        """Iterate over the pending transaction hashes."""
-        assert self.lock is not None, "Lock not acquired"
-        assert self.pending_tx_hashes is not None, "Pending transaction hashes not loaded"
-        return iter(self.pending_tx_hashes)
+        """Iterate over the pending transaction hashes in insertion order."""
+        rows = self.connection.execute(
+            "SELECT hash FROM pending_tx_hashes ORDER BY seq"
+        ).fetchall()
+        return iter([Hash(tx_hash) for (tx_hash,) in rows])
+
+
+@dataclass(kw_only=True)
+class BlockProductionMetrics:
+    """Block production metrics of a chain builder process."""
+
+    blocks: int = 0
+    transactions: int = 0
+    production_time: float = 0.0
+    first_block_start: float | None = None
+    last_block_end: float | None = None
+
+    def add_block(self, *, start_time: float, end_time: float, transaction_count: int) -> None:
+        """Record a generated block."""
+        self.blocks += 1
+        self.transactions += transaction_count
+        self.production_time += end_time - start_time
+        if self.first_block_start is None:
+            self.first_block_start = start_time
+        self.last_block_end = end_time
+
+    @property
+    def blocks_per_second(self) -> float:
+        """
+        Return the number of blocks generated per second, between the start
+        of the first block and the end of the last one.
+        """
+        if self.first_block_start is None or self.last_block_end is None:
+            return 0.0
+        elapsed = self.last_block_end - self.first_block_start
+        return self.blocks / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def transactions_per_block(self) -> float:
+        """Return the average number of transactions per block."""
+        return self.transactions / self.blocks if self.blocks else 0.0
+
+    def __str__(self) -> str:
+        """Return a summary of the metrics."""
+        return (
+            f"{self.blocks} blocks, {self.blocks_per_second:.2f} blocks/s, "
+            f"{self.transactions_per_block:.2f} txs/block, "
+            f"{self.production_time:.2f}s producing blocks"
+        )
 
 
 class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
@@ -181,6 +328,10 @@ class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
     engine_rpc: EngineRPC
     transactions_per_block: int
     get_payload_wait_time: float
+    get_payload_poll_interval: float
+    block_production_mode: BlockProductionMode
+    block_production_metrics: BlockProductionMetrics
+    next_payload_file: Path
     pending_tx_hashes: PendingTxHashes
 
     def __init__(
@@ -192,19 +343,29 @@ class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
         transactions_per_block: int,
         session_temp_folder: Path,
         get_payload_wait_time: float,
+        get_payload_poll_interval: float = 0.02,
+        block_production_mode: BlockProductionMode = "fixed",
         initial_forkchoice_update_retries: int = 5,
         transaction_wait_timeout: int = 60,
+        transaction_wait_strategy: TransactionWaitStrategy = "poll",
+        confirmation_depth: int = 0,
     ):
         """Initialize the Ethereum RPC client for the hive simulator."""
         super().__init__(
             rpc_endpoint,
             transaction_wait_timeout=transaction_wait_timeout,
+            transaction_wait_strategy=transaction_wait_strategy,
+            confirmation_depth=confirmation_depth,
         )
         self.fork = fork
         self.engine_rpc = engine_rpc
         self.transactions_per_block = transactions_per_block
         self.pending_tx_hashes = PendingTxHashes(session_temp_folder)
         self.get_payload_wait_time = get_payload_wait_time
+        self.get_payload_poll_interval = get_payload_poll_interval
+        self.block_production_mode = block_production_mode
+        self.block_production_metrics = BlockProductionMetrics()
+        self.next_payload_file = session_temp_folder / "next_payload.json"
 
         # Send initial forkchoice updated only if we are the first worker
         base_name = "eth_rpc_forkchoice_updated"
@@ -242,24 +403,21 @@ class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
                 base_error_file.unlink()  # Success
                 base_file.touch()
 
-    def generate_block(self: "ChainBuilderEthRPC") -> None:
-        """Generate a block using the Engine API."""
-        # Get the head block hash
-        head_block = self.get_block_by_number("latest")
-        assert head_block is not None
-
-        forkchoice_state = ForkchoiceState(
-            head_block_hash=head_block["hash"],
-        )
-        parent_beacon_block_root = (
-            Hash(0) if self.fork.header_beacon_root_required(block_number=0, timestamp=0) else None
-        )
-        payload_attributes = PayloadAttributes(
-            timestamp=HexNumber(head_block["timestamp"]) + 1,
+    @property
+    def parent_beacon_block_root(self) -> Hash | None:
+        """Return the parent beacon block root of the generated blocks."""
+        if self.fork.header_beacon_root_required(block_number=0, timestamp=0):
+            return Hash(0)
+        return None
+
+    def payload_attributes(self, timestamp: int) -> PayloadAttributes:
+        """Return the attributes of a new payload with the given timestamp."""
+        return PayloadAttributes(
+            timestamp=HexNumber(timestamp),
             prev_randao=Hash(0),
             suggested_fee_recipient=Address(0),
             withdrawals=[] if self.fork.header_withdrawals_required() else None,
-            parent_beacon_block_root=parent_beacon_block_root,
+            parent_beacon_block_root=self.parent_beacon_block_root,
             target_blobs_per_block=(
                 self.fork.target_blobs_per_block(block_number=0, timestamp=0)
                 if self.fork.engine_payload_attribute_target_blobs_per_block(
@@ -275,61 +433,192 @@ class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
                 else None
             ),
         )
+
+    def forkchoice_updated(
+        self, head_block_hash: Hash, payload_attributes: PayloadAttributes | None
+    ) -> Bytes | None:
+        """
+        Update the head of the chain and, if payload attributes are given,
+        start building a new payload on top of it. Returns the payload ID.
+        """
         forkchoice_updated_version = self.fork.engine_forkchoice_updated_version()
         assert forkchoice_updated_version is not None, (
             "Fork does not support engine forkchoice_updated"
         )
         response = self.engine_rpc.forkchoice_updated(
-            forkchoice_state,
+            ForkchoiceState(head_block_hash=head_block_hash),
             payload_attributes,
             version=forkchoice_updated_version,
         )
         assert response.payload_status.status == PayloadStatusEnum.VALID, "Payload was invalid"
-        assert response.payload_id is not None, "payload_id was not returned by the client"
-        time.sleep(self.get_payload_wait_time)
+        if payload_attributes is not None:
+            assert response.payload_id is not None, "payload_id was not returned by the client"
+        return response.payload_id
+
+    def get_payload(self, payload_id: Bytes) -> GetPayloadResponse:
+        """Get the payload that is being built by the client."""
         get_payload_version = self.fork.engine_get_payload_version()
         assert get_payload_version is not None, "Fork does not support engine get_payload"
-        new_payload = self.engine_rpc.get_payload(
-            response.payload_id,
-            version=get_payload_version,
-        )
-        new_payload_args: List[Any] = [new_payload.execution_payload]
-        if new_payload.blobs_bundle is not None:
-            new_payload_args.append(new_payload.blobs_bundle.blob_versioned_hashes())
-        if parent_beacon_block_root is not None:
-            new_payload_args.append(parent_beacon_block_root)
-        if new_payload.execution_requests is not None:
-            new_payload_args.append(new_payload.execution_requests)
+        return self.engine_rpc.get_payload(payload_id, version=get_payload_version)
+
+    def new_payload(self, payload: GetPayloadResponse) -> None:
+        """Import a payload built by the client, recording its latency."""
+        new_payload_args: List[Any] = [payload.execution_payload]
+        if payload.blobs_bundle is not None:
+            new_payload_args.append(payload.blobs_bundle.blob_versioned_hashes())
+        if self.parent_beacon_block_root is not None:
+            new_payload_args.append(self.parent_beacon_block_root)
+        if payload.execution_requests is not None:
+            new_payload_args.append(payload.execution_requests)
         new_payload_version = self.fork.engine_new_payload_version()
         assert new_payload_version is not None, "Fork does not support engine new_payload"
+        start_time = time.perf_counter()
         new_payload_response = self.engine_rpc.new_payload(
             *new_payload_args, version=new_payload_version
         )
+        latency = time.perf_counter() - start_time
         assert new_payload_response.status == PayloadStatusEnum.VALID, "Payload was invalid"
+        self.pending_tx_hashes.record_block_import(payload.execution_payload.block_hash, latency)
 
-        new_forkchoice_state = ForkchoiceState(
-            head_block_hash=new_payload.execution_payload.block_hash,
+    def block_import_latency(self, block_hash: Hash) -> float | None:
+        """
+        Return the `engine_newPayload` latency of a block generated by any
+        process of the session.
+        """
+        return self.pending_tx_hashes.block_import_latency(block_hash)
+
+    def generate_block(self: "ChainBuilderEthRPC") -> None:
+        """Generate a block using the Engine API."""
+        start_time = time.time()
+        if self.block_production_mode == "adaptive":
+            payload = self.generate_block_adaptive()
+        else:
+            payload = self.generate_block_fixed()
+        transactions = payload.execution_payload.transactions
+        self.pending_tx_hashes.discard(Hash(keccak256(tx)) for tx in transactions)
+        self.block_production_metrics.add_block(
+            start_time=start_time, end_time=time.time(), transaction_count=len(transactions)
         )
-        response = self.engine_rpc.forkchoice_updated(
-            new_forkchoice_state,
-            None,
-            version=forkchoice_updated_version,
+        logger.debug(
+            f"Generated block {int(payload.execution_payload.number)} with "
+            f"{len(transactions)} transactions ({self.block_production_metrics})"
         )
-        assert response.payload_status.status == PayloadStatusEnum.VALID, "Payload was invalid"
-        for tx in new_payload.execution_payload.transactions:
-            tx_hash = Hash(keccak256(tx))
-            if tx_hash in self.pending_tx_hashes:
-                self.pending_tx_hashes.remove(tx_hash)
+
+    def generate_block_fixed(self) -> GetPayloadResponse:
+        """
+        Generate a block by waiting a fixed time between requesting a new
+        payload and getting it.
+        """
+        # Get the head block hash
+        head_block = self.get_block_by_number("latest")
+        assert head_block is not None
+        payload_id = self.forkchoice_updated(
+            head_block["hash"],
+            self.payload_attributes(HexNumber(head_block["timestamp"]) + 1),
+        )
+        assert payload_id is not None
+        time.sleep(self.get_payload_wait_time)
+        new_payload = self.get_payload(payload_id)
+        self.new_payload(new_payload)
+        self.forkchoice_updated(new_payload.execution_payload.block_hash, None)
+        return new_payload
+
+    def generate_block_adaptive(self) -> GetPayloadResponse:
+        """
+        Generate a block by polling the payload until it contains all pending
+        transactions, or until its transaction count stops growing, waiting at
+        most `get_payload_wait_time`.
+
+        The forkchoice update that sets the new block as head also starts the
+        next payload, so the client builds it while the current block is
+        imported and the next transactions are sent. Its ID is stored in the
+        session temporary folder, since the next block might be generated by
+        another process.
+        """
+        head_block = self.get_block_by_number("latest")
+        assert head_block is not None
+        new_payload: GetPayloadResponse | None = None
+        if self.next_payload_file.exists():
+            next_payload = json.loads(self.next_payload_file.read_text())
+            self.next_payload_file.unlink()
+            if Hash(next_payload["parent_hash"]) == Hash(head_block["hash"]):
+                try:
+                    new_payload = self.poll_payload(Bytes(next_payload["payload_id"]))
+                except JSONRPCError:
+                    # The client discarded the payload, start a new one.
+                    new_payload = None
+        if new_payload is None:
+            payload_id = self.forkchoice_updated(
+                head_block["hash"],
+                self.payload_attributes(HexNumber(head_block["timestamp"]) + 1),
+            )
+            assert payload_id is not None
+            new_payload = self.poll_payload(payload_id)
+        self.new_payload(new_payload)
+        execution_payload = new_payload.execution_payload
+        next_payload_id = self.forkchoice_updated(
+            execution_payload.block_hash,
+            self.payload_attributes(execution_payload.timestamp + 1),
+        )
+        self.next_payload_file.write_text(
+            json.dumps(
+                {
+                    "parent_hash": str(execution_payload.block_hash),
+                    "payload_id": str(next_payload_id),
+                }
+            )
+        )
+        return new_payload
+
+    def poll_payload(self, payload_id: Bytes) -> GetPayloadResponse:
+        """
+        Get the payload until it contains all pending transactions, or until
+        its transaction count stops growing for `PAYLOAD_STABLE_POLLS` polls,
+        or `get_payload_wait_time` passes.
+        """
+        pending_count = len(self.pending_tx_hashes)
+        deadline = time.time() + self.get_payload_wait_time
+        last_count: int | None = None
+        stable_polls = 0
+        while True:
+            payload = self.get_payload(payload_id)
+            count = len(payload.execution_payload.transactions)
+            stable_polls = stable_polls + 1 if count == last_count else 0
+            if (
+                count >= pending_count
+                or (count > 0 and stable_polls >= PAYLOAD_STABLE_POLLS)
+                or time.time() >= deadline
+            ):
+                return payload
+            last_count = count
+            time.sleep(self.get_payload_poll_interval)
 
     def send_transaction(self, transaction: Transaction) -> Hash:
         """`eth_sendRawTransaction`: Send a transaction to the client."""
         returned_hash = super().send_transaction(transaction)
-        with self.pending_tx_hashes:
-            self.pending_tx_hashes.append(transaction.hash)
-            if len(self.pending_tx_hashes) >= self.transactions_per_block:
-                self.generate_block()
+        self.pending_tx_hashes.append(transaction.hash)
+        if len(self.pending_tx_hashes) >= self.transactions_per_block:
+            with self.pending_tx_hashes:
+                # Another worker might have generated the block meanwhile.
+                if len(self.pending_tx_hashes) >= self.transactions_per_block:
+                    self.generate_block()
         return returned_hash
 
+    def send_transactions_batch(
+        self, transactions: List[Transaction]
+    ) -> List[Hash | SendTransactionExceptionError]:
+        """
+        Send a batch of transactions to the client, and generate a block if
+        enough transactions are pending.
+        """
+        results = super().send_transactions_batch(transactions)
+        self.pending_tx_hashes.extend(result for result in results if isinstance(result, Hash))
+        if len(self.pending_tx_hashes) >= self.transactions_per_block:
+            with self.pending_tx_hashes:
+                if len(self.pending_tx_hashes) >= self.transactions_per_block:
+                    self.generate_block()
+        return results
+
     def wait_for_transaction(self, transaction: Transaction) -> TransactionByHashResponse:
         """
         Wait for a specific transaction to be included in a block.
@@ -347,18 +636,23 @@ class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
         return self.wait_for_transactions([transaction])[0]
 
     def wait_for_transactions(
-        self, transactions: List[Transaction]
+        self,
+        transactions: List[Transaction],
+        *,
+        strategy: TransactionWaitStrategy | None = None,
     ) -> List[TransactionByHashResponse]:
         """
         Wait for all transactions in the provided list to be included in a
-        block.
+        block, generating blocks as necessary.
 
-        Waits for all transactions in the provided list to be included in a
-        block by polling `eth_getTransactionByHash` until they are confirmed or
-        a timeout occurs.
+        With the "blocks" wait strategy, the blocks generated while waiting
+        are followed to resolve all the pending transactions at once.
+        Otherwise, `eth_getTransactionByHash` is polled for every transaction
+        until they are confirmed or a timeout occurs.
 
         Args:
             transactions: A list of transactions to track.
+            strategy: The wait strategy, defaults to the configured one.
 
         Returns:
             A list of transaction details after they are included in a block.
@@ -368,12 +662,19 @@ class ChainBuilderEthRPC(BaseEthRPC, namespace="eth"):
                 within the timeout period.
 
         """
+        pending_transactions_handler = PendingTransactionHandler(self)
+        if strategy is None:
+            strategy = self.transaction_wait_strategy
+        if strategy == "blocks":
+            return self.wait_for_transactions_by_block(
+                transactions, on_poll=pending_transactions_handler.handle, poll_interval=0.1
+            )
+
         tx_hashes = [tx.hash for tx in transactions]
         responses: List[TransactionByHashResponse] = []
         pending_responses: Dict[Hash, TransactionByHashResponse] = {}
 
         start_time = time.time()
-        pending_transactions_handler = PendingTransactionHandler(self)
         while True:
             tx_id = 0
             pending_responses = {}
@@ -109,10 +109,8 @@ def base_pre_genesis(
         "parent_beacon_block_root must be empty at genesis"
     )
 
-    pre_alloc = Alloc.merge(
-        Alloc.model_validate(session_fork.pre_allocation_blockchain()),
-        base_pre,
-    )
+    pre_alloc = Alloc.fork_pre_allocation(session_fork, blockchain=True)
+    pre_alloc.merge_in_place(base_pre)
     if empty_accounts := pre_alloc.empty_accounts():
         raise Exception(f"Empty accounts in pre state: {empty_accounts}")
     state_root = pre_alloc.state_root()
@@ -361,7 +359,10 @@ def eth_rpc(
 ) -> EthRPC:
     """Initialize ethereum RPC client for the execution client under test."""
     get_payload_wait_time = request.config.getoption("get_payload_wait_time")
+    block_production_mode = request.config.getoption("block_production_mode", "fixed")
     tx_wait_timeout = request.config.getoption("tx_wait_timeout")
+    tx_wait_strategy = request.config.getoption("tx_wait_strategy")
+    tx_confirmation_depth = request.config.getoption("tx_confirmation_depth")
     return ChainBuilderEthRPC(
         rpc_endpoint=f"http://{client.ip}:8545",
         fork=session_fork,
@@ -369,5 +370,8 @@ def eth_rpc(
         transactions_per_block=transactions_per_block,
         session_temp_folder=session_temp_folder,
         get_payload_wait_time=get_payload_wait_time,
+        block_production_mode=block_production_mode,
         transaction_wait_timeout=tx_wait_timeout,
+        transaction_wait_strategy=tx_wait_strategy,
+        confirmation_depth=tx_confirmation_depth,
     )
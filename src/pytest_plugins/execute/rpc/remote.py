@@ -1,16 +1,22 @@
 """Pytest plugin to run the execute in remote-rpc-mode."""
 
 from pathlib import Path
+from typing import Generator
 
 import pytest
+from pytest_metadata.plugin import metadata_key
 
 from ethereum_test_forks import Fork
 from ethereum_test_rpc import EngineRPC, EthRPC
 from ethereum_test_types.chain_config_types import ChainConfigDefaults
+from pytest_plugins.custom_logging import get_logger
 
 from ..pre_alloc import AddressStubs
+from ..submission_controller import ControlledEthRPC
 from .chain_builder_eth_rpc import ChainBuilderEthRPC
 
+logger = get_logger(__name__)
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add command-line options to pytest."""
@@ -41,6 +47,25 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=60,
         help="Maximum time in seconds to wait for a transaction to be included in a block",
     )
+    remote_rpc_group.addoption(
+        "--tx-submission-rate",
+        action="store",
+        dest="tx_submission_rate",
+        type=float,
+        default=None,
+        help="Target number of transactions per second submitted by each worker. The rate is "
+        "halved on congestion errors (e.g. a full txpool) or when `txpool_status` reports a "
+        "large pool, and recovered gradually. Default: no rate control.",
+    )
+    remote_rpc_group.addoption(
+        "--max-in-flight-per-sender",
+        action="store",
+        dest="max_in_flight_per_sender",
+        type=int,
+        default=16,
+        help="Maximum number of transactions of a sender submitted without being included in a "
+        "block (requires --tx-submission-rate).",
+    )
     remote_rpc_group.addoption(
         "--address-stubs",
         action="store",
@@ -157,18 +182,45 @@ def eth_rpc(
     session_fork: Fork,
     transactions_per_block: int,
     session_temp_folder: Path,
-) -> EthRPC:
+) -> Generator[EthRPC, None, None]:
     """Initialize ethereum RPC client for the execution client under test."""
     tx_wait_timeout = request.config.getoption("tx_wait_timeout")
+    tx_wait_strategy = request.config.getoption("tx_wait_strategy", "poll")
+    tx_confirmation_depth = request.config.getoption("tx_confirmation_depth", 0)
+    tx_submission_rate = request.config.getoption("tx_submission_rate", None)
     if engine_rpc is None:
-        return EthRPC(rpc_endpoint, transaction_wait_timeout=tx_wait_timeout)
+        if tx_submission_rate is None:
+            yield EthRPC(
+                rpc_endpoint,
+                transaction_wait_timeout=tx_wait_timeout,
+                transaction_wait_strategy=tx_wait_strategy,
+                confirmation_depth=tx_confirmation_depth,
+            )
+            return
+        controlled_eth_rpc = ControlledEthRPC(
+            rpc_endpoint,
+            target_rate=tx_submission_rate,
+            max_in_flight_per_sender=request.config.getoption("max_in_flight_per_sender", 16),
+            transaction_wait_timeout=tx_wait_timeout,
+            transaction_wait_strategy=tx_wait_strategy,
+            confirmation_depth=tx_confirmation_depth,
+        )
+        yield controlled_eth_rpc
+        metrics = controlled_eth_rpc.submission_metrics
+        logger.info(f"Transaction submission: {metrics}")
+        request.config.stash[metadata_key]["Transaction submission"] = str(metrics)
+        return
     get_payload_wait_time = request.config.getoption("get_payload_wait_time")
-    return ChainBuilderEthRPC(
+    block_production_mode = request.config.getoption("block_production_mode", "fixed")
+    yield ChainBuilderEthRPC(
         rpc_endpoint=rpc_endpoint,
         fork=session_fork,
         engine_rpc=engine_rpc,
         transactions_per_block=transactions_per_block,
         session_temp_folder=session_temp_folder,
         get_payload_wait_time=get_payload_wait_time,
+        block_production_mode=block_production_mode,
         transaction_wait_timeout=tx_wait_timeout,
+        transaction_wait_strategy=tx_wait_strategy,
+        confirmation_depth=tx_confirmation_depth,
     )
@@ -1,16 +1,20 @@
-"""Sender mutex class that allows sending transactions one at a time."""
+"""Fixtures that fund the sender keys of the workers from the seed sender."""
 
+import json
+from functools import partial
 from pathlib import Path
-from typing import Generator, Iterator
+from typing import Any, Dict, Generator, Iterator, List
 
 import pytest
 from filelock import FileLock
 from pytest_metadata.plugin import metadata_key
 
-from ethereum_test_base_types import Number, Wei
+from ethereum_test_base_types import Hash, Wei
 from ethereum_test_rpc import EthRPC
 from ethereum_test_tools import EOA, Transaction
 
+from .nonce_manager import NonceManager
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add command-line options to pytest."""
@@ -121,82 +125,232 @@ def sender_key_initial_balance(
     return sender_key_initial_balance
 
 
+class SenderFunding:
+    """
+    Coordinate the funding and refund of the sender keys of all workers.
+
+    The first worker that requests a sender key generates the sender keys of
+    all workers, funds them from the seed sender with a single batch of
+    transactions and waits for all of them together, while the rest of the
+    workers wait on the lock of the funding plan. Each worker then claims one
+    of the funded sender keys.
+
+    When a worker is done, it releases its sender key. The last worker to
+    release its key sends the refunds of all released and unclaimed sender
+    keys in a single batch.
+
+    A worker that finds no funded sender key left to claim, e.g. because it
+    was restarted, must fund its own sender key instead.
+    """
+
+    seed_sender: EOA
+    seed_nonce_manager: NonceManager
+    eth_rpc: EthRPC
+    gas_limit: int
+    gas_price: int
+    plan_file: Path
+    lock: FileLock
+
+    def __init__(
+        self,
+        *,
+        seed_sender: EOA,
+        seed_nonce_manager: NonceManager,
+        eth_rpc: EthRPC,
+        session_temp_folder: Path,
+        gas_limit: int,
+        gas_price: int,
+    ):
+        """Initialize the funding coordinator of the session."""
+        self.seed_sender = seed_sender
+        self.seed_nonce_manager = seed_nonce_manager
+        self.eth_rpc = eth_rpc
+        self.gas_limit = gas_limit
+        self.gas_price = gas_price
+        self.plan_file = session_temp_folder / "sender_funding.json"
+        self.lock = FileLock(session_temp_folder / "sender_funding.lock")
+
+    def _load(self) -> Dict[str, Any] | None:
+        """Load the funding plan of the session, if it was already created."""
+        if not self.plan_file.exists():
+            return None
+        return json.loads(self.plan_file.read_text())
+
+    def _store(self, plan: Dict[str, Any]) -> None:
+        """Store the funding plan of the session."""
+        self.plan_file.write_text(json.dumps(plan, indent=2))
+
+    def funding_transaction(self, sender: EOA, amount: int, nonce: int) -> Transaction:
+        """Build the transaction that funds a sender from the seed sender."""
+        return Transaction(
+            sender=self.seed_sender,
+            to=sender,
+            nonce=nonce,
+            gas_limit=self.gas_limit,
+            gas_price=self.gas_price,
+            value=amount,
+        ).with_signature_and_sender()
+
+    def fund(self, senders: List[EOA], amount: int) -> None:
+        """Fund all senders in a single batch and wait for all of them."""
+        fund_txs = self.seed_nonce_manager.send_transactions_batch(
+            [partial(self.funding_transaction, sender, amount) for sender in senders]
+        )
+        self.eth_rpc.wait_for_transactions(fund_txs)
+
+    def claim(self, eoa_iterator: Iterator[EOA], worker_count: int, amount: int) -> EOA | None:
+        """
+        Claim a funded sender key, funding the sender keys of all workers
+        first if this is the first claim of the session.
+
+        Returns None if all funded sender keys were already claimed.
+        """
+        with self.lock:
+            plan = self._load()
+            if plan is None:
+                senders = [next(eoa_iterator) for _ in range(worker_count)]
+                self.fund(senders, amount)
+                plan = {
+                    "senders": [{"key": str(sender.key), "state": "funded"} for sender in senders]
+                }
+            for entry in plan["senders"]:
+                if entry["state"] == "funded":
+                    entry["state"] = "claimed"
+                    self._store(plan)
+                    return EOA(key=Hash(entry["key"]), nonce=0)
+            self._store(plan)
+            return None
+
+    def release(self, sender: EOA) -> None:
+        """
+        Release a claimed sender key, and refund all released and unclaimed
+        sender keys if no sender key remains claimed.
+        """
+        with self.lock:
+            plan = self._load()
+            assert plan is not None, "sender key released before being claimed"
+            for entry in plan["senders"]:
+                if Hash(entry["key"]) == sender.key:
+                    entry["state"] = "released"
+            if all(entry["state"] != "claimed" for entry in plan["senders"]):
+                refundable = [
+                    entry for entry in plan["senders"] if entry["state"] in ("funded", "released")
+                ]
+                self.refund([EOA(key=Hash(entry["key"])) for entry in refundable])
+                for entry in refundable:
+                    entry["state"] = "refunded"
+            self._store(plan)
+
+    def refund_transaction(self, sender: EOA) -> Transaction | None:
+        """
+        Build the transaction that refunds the remaining balance of a sender
+        to the seed sender, or None if the balance does not cover its cost.
+        """
+        remaining_balance = self.eth_rpc.get_balance(sender)
+        # Double the gas price to ensure the transaction is included and
+        # overwrites any other transaction that might have been sent by the
+        # sender.
+        refund_gas_price = self.gas_price * 2
+        tx_cost = self.gas_limit * refund_gas_price
+        if (remaining_balance - 1) < tx_cost:
+            return None
+        # Use the nonce of the node in case one of the pre-alloc transactions
+        # failed.
+        return Transaction(
+            sender=sender,
+            to=self.seed_sender,
+            nonce=self.eth_rpc.get_transaction_count(sender),
+            gas_limit=self.gas_limit,
+            gas_price=refund_gas_price,
+            value=remaining_balance - tx_cost - 1,
+        ).with_signature_and_sender()
+
+    def refund(self, senders: List[EOA]) -> None:
+        """Refund the senders in a single batch and wait for all of them."""
+        refund_txs = [
+            tx for tx in (self.refund_transaction(sender) for sender in senders) if tx is not None
+        ]
+        if not refund_txs:
+            return
+        results = self.eth_rpc.send_transactions_batch(refund_txs)
+        self.eth_rpc.wait_for_transactions(
+            [tx for tx, result in zip(refund_txs, results, strict=True) if result == tx.hash]
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+
 @pytest.fixture(scope="session")
-def sender_key(
-    request: pytest.FixtureRequest,
+def seed_sender_nonce_manager(
+    seed_sender: EOA, eth_rpc: EthRPC, session_temp_folder: Path
+) -> NonceManager:
+    """
+    Get the nonce manager of the seed sender.
+
+    The seed sender is shared among different processes, and there might not
+    be a new block produced between its transactions, so its nonce is kept in
+    a file of the session temporary folder.
+    """
+    return NonceManager(seed_sender, eth_rpc, nonce_file=session_temp_folder / "seed_sender_nonce")
+
+
+@pytest.fixture(scope="session")
+def sender_funding(
     seed_sender: EOA,
-    sender_key_initial_balance: int,
-    eoa_iterator: Iterator[EOA],
+    seed_sender_nonce_manager: NonceManager,
     eth_rpc: EthRPC,
     session_temp_folder: Path,
     sender_funding_transactions_gas_price: int,
     sender_fund_refund_gas_limit: int,
+) -> SenderFunding:
+    """Get the coordinator of the funding of the sender keys."""
+    return SenderFunding(
+        seed_sender=seed_sender,
+        seed_nonce_manager=seed_sender_nonce_manager,
+        eth_rpc=eth_rpc,
+        session_temp_folder=session_temp_folder,
+        gas_limit=sender_fund_refund_gas_limit,
+        gas_price=sender_funding_transactions_gas_price,
+    )
+
+
+@pytest.fixture(scope="session")
+def sender_key(
+    request: pytest.FixtureRequest,
+    sender_funding: SenderFunding,
+    sender_key_initial_balance: int,
+    eoa_iterator: Iterator[EOA],
+    eth_rpc: EthRPC,
+    worker_count: int,
 ) -> Generator[EOA, None, None]:
     """
     Get the sender keys for all tests.
 
-    The seed sender is going to be shared among different processes, so we need
-    to lock it before we produce each funding transaction.
+    The sender keys of all workers are funded together before the first test
+    of the session, and refunded together after the last worker is done.
     """
-    # For the seed sender we do need to keep track of the nonce because it is
-    # shared among different processes, and there might not be a new block
-    # produced between the transactions.
-    seed_sender_nonce_file_name = "seed_sender_nonce"
-    seed_sender_lock_file_name = f"{seed_sender_nonce_file_name}.lock"
-    seed_sender_nonce_file = session_temp_folder / seed_sender_nonce_file_name
-    seed_sender_lock_file = session_temp_folder / seed_sender_lock_file_name
-
-    sender = next(eoa_iterator)
-
-    # prepare funding transaction
-    with FileLock(seed_sender_lock_file):
-        if seed_sender_nonce_file.exists():
-            with seed_sender_nonce_file.open("r") as f:
-                seed_sender.nonce = Number(f.read())
-        fund_tx = Transaction(
-            sender=seed_sender,
-            to=sender,
-            gas_limit=sender_fund_refund_gas_limit,
-            gas_price=sender_funding_transactions_gas_price,
-            value=sender_key_initial_balance,
-        ).with_signature_and_sender()
-        eth_rpc.send_transaction(fund_tx)
-        with seed_sender_nonce_file.open("w") as f:
-            f.write(str(seed_sender.nonce))
-    eth_rpc.wait_for_transaction(fund_tx)
+    sender = sender_funding.claim(eoa_iterator, worker_count, sender_key_initial_balance)
+    coordinated = sender is not None
+    if sender is None:
+        # All the coordinated sender keys were claimed or refunded already,
+        # e.g. by a worker that was restarted, so fund a new one.
+        sender = next(eoa_iterator)
+        sender_funding.fund([sender], sender_key_initial_balance)
 
     yield sender
 
-    # refund seed sender
     remaining_balance = eth_rpc.get_balance(sender)
-    sender.nonce = Number(eth_rpc.get_transaction_count(sender))
     used_balance = sender_key_initial_balance - remaining_balance
     request.config.stash[metadata_key]["Senders"][str(sender)] = (
         f"Used balance={used_balance / 10**18:.18f}"
     )
 
-    refund_gas_limit = sender_fund_refund_gas_limit
-    # double the gas price to ensure the transaction is included and overwrites
-    # any other transaction that might have been sent by the sender.
-    refund_gas_price = sender_funding_transactions_gas_price * 2
-    tx_cost = refund_gas_limit * refund_gas_price
-
-    if (remaining_balance - 1) < tx_cost:
-        return
-
-    # Update the nonce of the sender in case one of the pre-alloc transactions
-    # failed
-    sender.nonce = Number(eth_rpc.get_transaction_count(sender))
-
-    refund_tx = Transaction(
-        sender=sender,
-        to=seed_sender,
-        gas_limit=refund_gas_limit,
-        gas_price=refund_gas_price,
-        value=remaining_balance - tx_cost - 1,
-    ).with_signature_and_sender()
-
-    eth_rpc.send_wait_transaction(refund_tx)
+    # refund seed sender
+    if coordinated:
+        sender_funding.release(sender)
+    else:
+        sender_funding.refund([sender])
 
 
 def pytest_sessionstart(session: pytest.Session) -> None:
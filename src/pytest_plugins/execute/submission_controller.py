@@ -0,0 +1,312 @@
+"""Rate-controlled submission of transactions to a remote client."""
+
+import re
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List
+
+import requests
+
+from ethereum_test_base_types import Address, Hash
+from ethereum_test_rpc import (
+    EthRPC,
+    SendTransactionExceptionError,
+    TransactionWaitStrategy,
+    TxpoolRPC,
+)
+from ethereum_test_rpc.rpc_types import JSONRPCError, TransactionByHashResponse
+from ethereum_test_tools import Transaction
+
+from .nonce_manager import is_nonce_error
+
+CONGESTION_ERROR_PATTERN = re.compile(
+    r"txpool is full|(transaction )?pool is full|too many (requests|transactions)|"
+    r"rate limit|429|exceeds the (pool|queue) capacity",
+    re.IGNORECASE,
+)
+ALREADY_KNOWN_ERROR_PATTERN = re.compile(
+    r"already known|known transaction|already imported", re.IGNORECASE
+)
+CONNECTION_ERRORS = (requests.ConnectionError, requests.Timeout)
+"""Errors of a request that may not have reached the client."""
+
+
+def is_connection_error(error: Exception) -> bool:
+    """
+    Return whether the request of a transaction failed to connect or timed
+    out, which the RPC client reports as the cause of the rejection.
+    """
+    return isinstance(error, CONNECTION_ERRORS) or isinstance(error.__cause__, CONNECTION_ERRORS)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Return whether a transaction was rejected because of a transient
+    condition, such as a full transaction pool, rate limiting or a failed
+    connection, so it can be sent again later.
+    """
+    if is_connection_error(error):
+        return True
+    return not is_nonce_error(error) and CONGESTION_ERROR_PATTERN.search(str(error)) is not None
+
+
+@dataclass(kw_only=True)
+class SubmissionMetrics:
+    """Submission rate and inclusion latency metrics of a process."""
+
+    submitted: int = 0
+    retries: int = 0
+    rate_decreases: int = 0
+    first_submission: float | None = None
+    last_submission: float | None = None
+    inclusion_latencies: List[float] = field(default_factory=list)
+
+    @property
+    def submission_rate(self) -> float:
+        """Return the achieved submission rate in transactions per second."""
+        if self.first_submission is None or self.last_submission is None:
+            return 0.0
+        elapsed = self.last_submission - self.first_submission
+        return (self.submitted - 1) / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentile(self, percentile: int) -> float:
+        """Return a percentile of the inclusion latencies in seconds."""
+        if not self.inclusion_latencies:
+            return 0.0
+        if len(self.inclusion_latencies) == 1:
+            return self.inclusion_latencies[0]
+        return statistics.quantiles(self.inclusion_latencies, n=100, method="inclusive")[
+            percentile - 1
+        ]
+
+    def __str__(self) -> str:
+        """Return a summary of the metrics."""
+        return (
+            f"{self.submitted} txs at {self.submission_rate:.2f} txs/s "
+            f"({self.retries} retries, {self.rate_decreases} rate decreases), "
+            f"inclusion latency p50={self.latency_percentile(50):.2f}s "
+            f"p95={self.latency_percentile(95):.2f}s"
+        )
+
+
+class SubmissionController:
+    """
+    Pace the submission of transactions to a target rate.
+
+    The rate is adapted with additive-increase/multiplicative-decrease: it is
+    halved (down to `min_rate`) whenever the client signals congestion, and
+    increased by a fraction of the target rate after every accepted
+    transaction, up to the target rate.
+    """
+
+    target_rate: float
+    min_rate: float
+    rate: float
+    additive_increase: float
+    decrease_factor: float
+    next_submission: float
+    lock: threading.Lock
+
+    def __init__(
+        self,
+        target_rate: float,
+        *,
+        min_rate: float | None = None,
+        additive_increase: float | None = None,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize the controller at the target rate."""
+        assert target_rate > 0, "Target submission rate must be greater than 0"
+        self.target_rate = target_rate
+        self.min_rate = min_rate if min_rate is not None else target_rate / 100
+        self.additive_increase = (
+            additive_increase if additive_increase is not None else target_rate / 20
+        )
+        self.decrease_factor = decrease_factor
+        self.rate = target_rate
+        self.next_submission = 0.0
+        self.lock = threading.Lock()
+
+    def wait_for_slot(self) -> None:
+        """Sleep until the next transaction can be submitted at the rate."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_submission)
+            self.next_submission = slot + 1 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def on_success(self) -> None:
+        """Increase the rate after an accepted transaction."""
+        with self.lock:
+            self.rate = min(self.target_rate, self.rate + self.additive_increase)
+
+    def on_congestion(self) -> None:
+        """Decrease the rate after the client signaled congestion."""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.next_submission = time.monotonic() + 1 / self.rate
+
+
+class ControlledEthRPC(EthRPC, namespace="eth"):
+    """
+    Ethereum RPC client that submits transactions through a
+    `SubmissionController`.
+
+    In addition to the rate control:
+
+    - If the client supports `txpool_status`, the transaction pool is checked
+      periodically and the rate is decreased while the number of pending and
+      queued transactions is above `txpool_high_watermark`.
+    - At most `max_in_flight_per_sender` transactions of each sender are
+      submitted without being seen included in a block; when the cap is
+      reached, the oldest transaction of the sender is waited for first.
+    - Transactions rejected because of a transient condition are sent again
+      after a backoff, before any later transaction, so the order of the
+      transactions (and their nonces) is preserved.
+    """
+
+    controller: SubmissionController
+    txpool_rpc: TxpoolRPC | None
+    txpool_high_watermark: int
+    txpool_check_interval: float
+    last_txpool_check: float
+    max_in_flight_per_sender: int
+    max_retries: int
+    retry_backoff: float
+    in_flight: Dict[Address, Deque[Transaction]]
+    submission_times: Dict[Hash, float]
+    submission_metrics: SubmissionMetrics
+
+    def __init__(
+        self,
+        *args: Any,
+        target_rate: float,
+        max_in_flight_per_sender: int = 16,
+        max_retries: int = 5,
+        retry_backoff: float = 0.5,
+        txpool_high_watermark: int = 4096,
+        txpool_check_interval: float = 1.0,
+        **kwargs: Any,
+    ):
+        """Initialize the client with the submission controls."""
+        super().__init__(*args, **kwargs)
+        self.controller = SubmissionController(target_rate)
+        self.txpool_rpc = TxpoolRPC(self.url)
+        self.txpool_high_watermark = txpool_high_watermark
+        self.txpool_check_interval = txpool_check_interval
+        self.last_txpool_check = 0.0
+        self.max_in_flight_per_sender = max_in_flight_per_sender
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.in_flight = {}
+        self.submission_times = {}
+        self.submission_metrics = SubmissionMetrics()
+
+    def check_txpool(self) -> None:
+        """
+        Decrease the submission rate if the transaction pool of the client is
+        above the high watermark. Disabled if `txpool_status` is unsupported.
+        """
+        if self.txpool_rpc is None:
+            return
+        now = time.monotonic()
+        if now - self.last_txpool_check < self.txpool_check_interval:
+            return
+        self.last_txpool_check = now
+        try:
+            status = self.txpool_rpc.status()
+        except (JSONRPCError, requests.HTTPError):
+            self.txpool_rpc = None
+            return
+        if status.get("pending", 0) + status.get("queued", 0) >= self.txpool_high_watermark:
+            self.controller.on_congestion()
+            self.submission_metrics.rate_decreases += 1
+
+    def wait_for_capacity(self, transaction: Transaction) -> None:
+        """
+        Wait for the oldest in-flight transaction of the sender to be
+        included if the sender reached the in-flight cap.
+        """
+        assert transaction.sender is not None
+        in_flight = self.in_flight.setdefault(transaction.sender, deque())
+        if len(in_flight) >= self.max_in_flight_per_sender:
+            self.wait_for_transactions([in_flight[0]])
+
+    def send_transaction(self, transaction: Transaction) -> Hash:
+        """
+        `eth_sendRawTransaction`: Send a transaction to the client at the
+        controlled rate, retrying it on transient failures.
+        """
+        self.wait_for_capacity(transaction)
+        connection_failed = False
+        for attempt in range(self.max_retries + 1):
+            self.check_txpool()
+            self.controller.wait_for_slot()
+            try:
+                tx_hash = super().send_transaction(transaction)
+                break
+            except SendTransactionExceptionError as e:
+                if connection_failed and ALREADY_KNOWN_ERROR_PATTERN.search(str(e)):
+                    # The request that failed did reach the client.
+                    tx_hash = transaction.hash
+                    break
+                if not is_transient_error(e) or attempt == self.max_retries:
+                    raise
+                connection_failed = connection_failed or is_connection_error(e)
+                self.controller.on_congestion()
+                self.submission_metrics.retries += 1
+                self.submission_metrics.rate_decreases += 1
+                time.sleep(self.retry_backoff * 2**attempt)
+        self.controller.on_success()
+        now = time.monotonic()
+        metrics = self.submission_metrics
+        metrics.submitted += 1
+        if metrics.first_submission is None:
+            metrics.first_submission = now
+        metrics.last_submission = now
+        assert transaction.sender is not None
+        self.in_flight.setdefault(transaction.sender, deque()).append(transaction)
+        self.submission_times[tx_hash] = now
+        return tx_hash
+
+    def send_transactions_batch(
+        self, transactions: List[Transaction]
+    ) -> List[Hash | SendTransactionExceptionError]:
+        """
+        Send the transactions one by one at the controlled rate, returning the
+        rejected transactions as errors.
+        """
+        results: List[Hash | SendTransactionExceptionError] = []
+        for tx in transactions:
+            try:
+                results.append(self.send_transaction(tx))
+            except SendTransactionExceptionError as e:
+                results.append(e)
+        return results
+
+    def wait_for_transactions(
+        self,
+        transactions: List[Transaction],
+        *,
+        strategy: TransactionWaitStrategy | None = None,
+    ) -> List[TransactionByHashResponse]:
+        """
+        Wait for the transactions to be included, recording their inclusion
+        latency and releasing them from the in-flight transactions.
+        """
+        responses = super().wait_for_transactions(transactions, strategy=strategy)
+        now = time.monotonic()
+        for tx in transactions:
+            submission_time = self.submission_times.pop(tx.hash, None)
+            if submission_time is not None:
+                self.submission_metrics.inclusion_latencies.append(now - submission_time)
+            if tx.sender in self.in_flight:
+                in_flight = self.in_flight[tx.sender]
+                self.in_flight[tx.sender] = deque(
+                    in_flight_tx for in_flight_tx in in_flight if in_flight_tx.hash != tx.hash
+                )
+        return responses
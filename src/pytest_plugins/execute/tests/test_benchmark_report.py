@@ -0,0 +1,55 @@
+"""Test the aggregation of the benchmark throughput report."""
+
+import csv
+import json
+from pathlib import Path
+
+from ethereum_test_execution import BenchmarkMetrics, BlockMetrics
+
+from ..benchmark_report import BenchmarkReport
+
+
+def make_metrics(test_id: str, client: str, latency: float | None) -> BenchmarkMetrics:
+    """Create the metrics of a test with a single 100M gas block."""
+    return BenchmarkMetrics(
+        test_id=test_id,
+        client=client,
+        blocks=[
+            BlockMetrics(
+                number=1,
+                hash="0x01",
+                gas_used=100_000_000,
+                transaction_count=1,
+                timestamp=12,
+                block_time=12,
+                new_payload_latency=latency,
+            )
+        ],
+    )
+
+
+def test_benchmark_report(tmp_path: Path) -> None:
+    """Test the per-client aggregation and the written reports."""
+    report = BenchmarkReport()
+    assert not report
+    report.add(make_metrics("test_a", "geth", 0.5))
+    report.add(make_metrics("test_b", "geth", 1.5))
+    report.add(make_metrics("test_a", "reth", None))
+
+    geth, reth = report.clients()
+    assert geth.tests == 2
+    assert geth.mgas_per_second == 100
+    assert geth.min_mgas_per_second is not None and round(geth.min_mgas_per_second, 2) == 66.67
+    assert reth.mgas_per_second is None and reth.gas_used == 100_000_000
+
+    json_path, csv_path = report.write(tmp_path)
+    data = json.loads(json_path.read_text())
+    assert [c["client"] for c in data["clients"]] == ["geth", "reth"]
+    assert data["tests"][0]["mgas_per_second"] == 200
+    with open(csv_path) as f:
+        rows = list(csv.DictReader(f))
+    assert [(row["client"], row["test_id"]) for row in rows] == [
+        ("geth", "test_a"),
+        ("geth", "test_b"),
+        ("reth", "test_a"),
+    ]
@@ -0,0 +1,259 @@
+"""Test the block production of the chain builder RPC against a mock server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Generator, List
+
+import pytest
+
+from ethereum_test_base_types import Bytes, Hash
+from ethereum_test_forks import Shanghai
+from ethereum_test_rpc import EngineRPC
+from ethereum_test_tools import EOA, Transaction
+
+from ..rpc.chain_builder_eth_rpc import (
+    PAYLOAD_STABLE_POLLS,
+    BlockProductionMode,
+    ChainBuilderEthRPC,
+)
+
+
+class UnknownPayloadError(Exception):
+    """The requested payload is not being built."""
+
+
+class MockEngineServer:
+    """
+    JSON-RPC server that implements the subset of the Eth and Engine APIs used
+    by the chain builder, and records the requested methods.
+
+    Payloads are built gradually: every `engine_getPayload` request includes
+    up to `transactions_per_poll` more transactions from the mempool.
+    """
+
+    def __init__(self, *, transactions_per_poll: int):
+        """Start the server with a genesis block."""
+        genesis = {"hash": str(Hash(1)), "number": "0x0", "timestamp": "0x0"}
+        self.blocks: Dict[str, Dict[str, Any]] = {genesis["hash"]: genesis}
+        self.head = genesis["hash"]
+        self.mempool: List[str] = []
+        self.payloads: Dict[str, Dict[str, Any]] = {}
+        self.transactions_per_poll = transactions_per_poll
+        self.requests: List[str] = []
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server.lock:
+                    response = server.handle(request)
+                body = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a single JSON-RPC request."""
+        method, params = request["method"], request["params"]
+        self.requests.append(method)
+        try:
+            result = getattr(self, method.split("V")[0])(*params)
+        except UnknownPayloadError:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -38001, "message": "Unknown payload"},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def eth_getBlockByNumber(self, number: str, full: bool) -> Dict[str, Any]:  # noqa: N802
+        """Return the head block."""
+        assert number == "latest"
+        del full
+        return self.blocks[self.head] | {"transactions": []}
+
+    def eth_sendRawTransaction(self, raw: str) -> str:  # noqa: N802
+        """Add the transaction to the mempool."""
+        self.mempool.append(raw)
+        return str(Bytes(raw).keccak256())
+
+    def engine_forkchoiceUpdated(  # noqa: N802
+        self, state: Dict[str, Any], attributes: Dict[str, Any] | None
+    ) -> Dict[str, Any]:
+        """Set the head and start building a payload on top of it."""
+        assert state["headBlockHash"] in self.blocks
+        self.head = state["headBlockHash"]
+        payload_id = None
+        if attributes is not None:
+            payload_id = f"0x{len(self.payloads) + 1:016x}"
+            self.payloads[payload_id] = {
+                "parent": self.head,
+                "timestamp": attributes["timestamp"],
+                "transactions": [],
+            }
+        return {
+            "payloadStatus": {"status": "VALID", "latestValidHash": None, "validationError": None},
+            "payloadId": payload_id,
+        }
+
+    def engine_getPayload(self, payload_id: str) -> Dict[str, Any]:  # noqa: N802
+        """Include more mempool transactions in the payload and return it."""
+        if payload_id not in self.payloads:
+            raise UnknownPayloadError()
+        payload = self.payloads[payload_id]
+        parent = self.blocks[payload["parent"]]
+        candidates = [tx for tx in self.mempool if tx not in payload["transactions"]]
+        payload["transactions"] += candidates[: self.transactions_per_poll]
+        number = int(parent["number"], 16) + 1
+        block_hash = Bytes(
+            json.dumps([payload["parent"], payload["transactions"]]).encode()
+        ).keccak256()
+        return {
+            "executionPayload": {
+                "parentHash": payload["parent"],
+                "feeRecipient": "0x" + "00" * 20,
+                "stateRoot": str(Hash(0)),
+                "receiptsRoot": str(Hash(0)),
+                "logsBloom": "0x" + "00" * 256,
+                "blockNumber": hex(number),
+                "gasLimit": hex(30_000_000),
+                "gasUsed": hex(21_000 * len(payload["transactions"])),
+                "timestamp": payload["timestamp"],
+                "extraData": "0x",
+                "prevRandao": str(Hash(0)),
+                "baseFeePerGas": "0x7",
+                "blockHash": str(block_hash),
+                "transactions": payload["transactions"],
+                "withdrawals": [],
+            }
+        }
+
+    def engine_newPayload(self, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        """Import the payload and remove its transactions from the mempool."""
+        assert payload["parentHash"] == self.head
+        self.blocks[payload["blockHash"]] = {
+            "hash": payload["blockHash"],
+            "number": payload["blockNumber"],
+            "timestamp": payload["timestamp"],
+        }
+        self.mempool = [tx for tx in self.mempool if tx not in payload["transactions"]]
+        return {
+            "status": "VALID",
+            "latestValidHash": payload["blockHash"],
+            "validationError": None,
+        }
+
+
+@pytest.fixture
+def server() -> Generator[MockEngineServer, None, None]:
+    """Start the mock server."""
+    server = MockEngineServer(transactions_per_poll=2)
+    yield server
+    server.server.shutdown()
+
+
+def make_chain_builder(
+    server: MockEngineServer, tmp_path: Path, mode: BlockProductionMode, **kwargs: Any
+) -> ChainBuilderEthRPC:
+    """Create a chain builder connected to the mock server."""
+    return ChainBuilderEthRPC(
+        rpc_endpoint=server.url,
+        fork=Shanghai,
+        engine_rpc=EngineRPC(server.url),
+        transactions_per_block=5,
+        session_temp_folder=tmp_path,
+        get_payload_wait_time=kwargs.pop("get_payload_wait_time", 5.0),
+        get_payload_poll_interval=0,
+        block_production_mode=mode,
+        **kwargs,
+    )
+
+
+def send_transactions(chain_builder: ChainBuilderEthRPC, nonces: range) -> None:
+    """Send value transfers, generating a block every five transactions."""
+    sender = EOA(key=1)
+    for nonce in nonces:
+        chain_builder.send_transaction(
+            Transaction(sender=sender, to=0x1234, nonce=nonce).with_signature_and_sender()
+        )
+
+
+def test_adaptive_block_production(server: MockEngineServer, tmp_path: Path) -> None:
+    """
+    Test that the payload is polled until it contains all pending
+    transactions, and that the next payload is started with the new head.
+    """
+    chain_builder = make_chain_builder(server, tmp_path, "adaptive")
+    server.requests.clear()
+    send_transactions(chain_builder, range(5))
+    assert len(chain_builder.pending_tx_hashes) == 0
+    assert server.requests.count("engine_getPayloadV2") == 3
+    assert server.requests[-2:] == ["engine_newPayloadV2", "engine_forkchoiceUpdatedV2"]
+    assert len(server.payloads) == 2
+
+    # The next block is built from the payload started with the last head.
+    server.requests.clear()
+    send_transactions(chain_builder, range(5, 10))
+    assert server.requests.count("engine_forkchoiceUpdatedV2") == 1
+    assert len(server.payloads) == 3
+    assert len(server.blocks) == 3
+
+    metrics = chain_builder.block_production_metrics
+    assert metrics.blocks == 2
+    assert metrics.transactions_per_block == 5
+    assert metrics.blocks_per_second > 0
+
+
+def test_adaptive_block_production_stops_growing(server: MockEngineServer, tmp_path: Path) -> None:
+    """
+    Test that the payload stops being polled once its transaction count stops
+    growing, even if some pending transactions are never included.
+    """
+    chain_builder = make_chain_builder(server, tmp_path, "adaptive")
+    chain_builder.pending_tx_hashes.append(Hash(0xDEAD))
+    start = time.time()
+    send_transactions(chain_builder, range(4))
+    assert time.time() - start < 2.5
+    assert server.requests.count("engine_getPayloadV2") == 2 + PAYLOAD_STABLE_POLLS
+    assert chain_builder.block_production_metrics.transactions == 4
+    assert list(chain_builder.pending_tx_hashes) == [Hash(0xDEAD)]
+
+
+def test_adaptive_block_production_unknown_payload(
+    server: MockEngineServer, tmp_path: Path
+) -> None:
+    """Test that a new payload is started if the next one was discarded."""
+    chain_builder = make_chain_builder(server, tmp_path, "adaptive")
+    send_transactions(chain_builder, range(5))
+    server.payloads.clear()
+    send_transactions(chain_builder, range(5, 10))
+    assert chain_builder.block_production_metrics.transactions == 10
+    assert len(server.blocks) == 3
+
+
+def test_fixed_block_production(server: MockEngineServer, tmp_path: Path) -> None:
+    """Test that the payload is requested once after the fixed wait."""
+    chain_builder = make_chain_builder(server, tmp_path, "fixed", get_payload_wait_time=0.01)
+    server.requests.clear()
+    send_transactions(chain_builder, range(5))
+    assert server.requests.count("engine_getPayloadV2") == 1
+    assert server.requests[-2:] == ["engine_newPayloadV2", "engine_forkchoiceUpdatedV2"]
+    # Only two transactions were included in the payload.
+    assert chain_builder.block_production_metrics.transactions == 2
+    assert len(chain_builder.pending_tx_hashes) == 3
+    latency = chain_builder.block_import_latency(Hash(server.head))
+    assert latency is not None and latency > 0
@@ -0,0 +1,152 @@
+"""Test the registry of reusable contracts on live networks."""
+
+from itertools import count
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Address, Bytes, Hash, Storage
+from ethereum_test_forks import Prague
+from ethereum_test_rpc import BlockNumberType, EthRPC
+from ethereum_test_tools import EOA, Transaction
+from ethereum_test_vm import Opcodes as Op
+
+from ..contract_registry import ContractRegistry, code_mutates_own_state
+from ..pre_alloc import Alloc
+
+
+class FakeNetwork(EthRPC):
+    """Network where sent deployments are immediately deployed."""
+
+    def __init__(self) -> None:
+        """Initialize the network."""
+        super().__init__("http://localhost")
+        self.code: Dict[Address, Bytes] = {}
+        self.storage: Dict[Address, Dict[int, int]] = {}
+        self.balance: Dict[Address, int] = {}
+        self.sent: List[Transaction] = []
+
+    def get_transaction_count(
+        self, address: Address, block_number: BlockNumberType = "latest"
+    ) -> int:
+        """
+        Return the nonce of a deployed contract, or the number of transactions
+        sent.
+        """
+        del block_number
+        if address in self.code:
+            return 1
+        return len(self.sent)
+
+    def get_balance(self, address: Address, block_number: BlockNumberType = "latest") -> int:
+        """Return the balance of an account."""
+        del block_number
+        return self.balance.get(address, 0)
+
+    def get_code(self, address: Address, block_number: BlockNumberType = "latest") -> Bytes:
+        """Return the deployed code."""
+        del block_number
+        return self.code.get(address, Bytes(b""))
+
+    def get_storage_at(
+        self, address: Address, position: Hash, block_number: BlockNumberType = "latest"
+    ) -> Hash:
+        """Return the deployed storage."""
+        del block_number
+        return Hash(self.storage.get(address, {}).get(int.from_bytes(position), 0))
+
+    def send_transaction(self, transaction: Transaction) -> Hash:
+        """Record the transaction, deploying the code of the test contracts."""
+        self.sent.append(transaction)
+        return transaction.hash
+
+    def deploy(self, address: Address, code: Bytes, storage: Storage) -> None:
+        """Simulate the inclusion of a deployment."""
+        self.code[address] = code
+        self.storage[address] = {int(k): int(v) for k, v in storage.root.items()}
+
+
+@pytest.mark.parametrize(
+    "code,expected",
+    [
+        pytest.param(Op.SLOAD(0) + Op.STOP, False, id="read_only"),
+        pytest.param(Op.PUSH2(0x5555) + Op.STOP, False, id="sstore_in_push_data"),
+        pytest.param(Op.SSTORE(0, 1), True, id="sstore"),
+        pytest.param(Op.SELFDESTRUCT(0), True, id="selfdestruct"),
+        pytest.param(Op.DELEGATECALL(address=0x1234), True, id="delegatecall"),
+        pytest.param(Op.CALL(address=0x1234), True, id="call"),
+        pytest.param(Op.STATICCALL(address=0x1234), False, id="staticcall"),
+    ],
+)
+def test_code_mutates_own_state(code: Bytes, expected: bool) -> None:
+    """Test the detection of opcodes that can modify the contract's state."""
+    assert code_mutates_own_state(Bytes(code)) == expected
+
+
+def make_alloc(network: FakeNetwork, registry: ContractRegistry | None) -> Alloc:
+    """Create an execute pre-alloc connected to the fake network."""
+    return Alloc(
+        fork=Prague,
+        sender=EOA(key=1),
+        eth_rpc=network,
+        eoa_iterator=iter(EOA(key=i, nonce=0) for i in count(start=100)),
+        chain_id=1,
+        eoa_fund_amount_default=10**18,
+        contract_registry=registry,
+    )
+
+
+def test_contract_reuse(tmp_path: Path) -> None:
+    """
+    Test that immutable contracts are reused from a persisted registry after
+    verifying them, and that mutable contracts are always deployed.
+    """
+    registry_path = tmp_path / "registry.json"
+    network = FakeNetwork()
+    code = Op.SLOAD(0) + Op.STOP
+    storage = Storage({0: 1})
+
+    pre = make_alloc(network, ContractRegistry(registry_path, chain_id=1, eth_rpc=network))
+    first = pre.deploy_contract(code, storage=storage)
+    assert len(network.sent) == 1
+    network.deploy(first, Bytes(code), storage)
+
+    # A later session reuses the contract from the persisted registry.
+    pre = make_alloc(network, ContractRegistry(registry_path, chain_id=1, eth_rpc=network))
+    assert pre.deploy_contract(code, storage=storage, label="reused") == first
+    reused = pre[first]
+    assert reused is not None and reused.code == code
+    assert len(network.sent) == 1
+
+    # Different storage, balance, chain or mutable code are deployed again.
+    pre.deploy_contract(code, storage={0: 2})
+    pre.deploy_contract(code, storage=storage, balance=1)
+    pre.deploy_contract(Op.SSTORE(0, 1), storage=storage)
+    other_chain = ContractRegistry(registry_path, chain_id=2, eth_rpc=network)
+    make_alloc(network, other_chain).deploy_contract(code, storage=storage)
+    assert len(network.sent) == 5
+
+    # Without the registry, contracts are always deployed.
+    make_alloc(network, None).deploy_contract(code, storage=storage)
+    assert len(network.sent) == 6
+
+
+def test_stale_registry_entry(tmp_path: Path) -> None:
+    """
+    Test that entries whose code is not on chain, or whose balance changed
+    since they were deployed, are dropped.
+    """
+    network = FakeNetwork()
+    registry = ContractRegistry(tmp_path / "registry.json", chain_id=1, eth_rpc=network)
+    code = Bytes(Op.STOP)
+    registry.register(code, Storage(), Address(0x1234))
+    assert registry.lookup(code, Storage()) is None
+    assert registry.path.read_text() == "{}"
+
+    network.deploy(Address(0x1234), code, Storage())
+    registry.register(code, Storage(), Address(0x1234))
+    assert registry.lookup(code, Storage()) == Address(0x1234)
+    network.balance[Address(0x1234)] = 1
+    assert registry.lookup(code, Storage()) is None
+    assert registry.path.read_text() == "{}"
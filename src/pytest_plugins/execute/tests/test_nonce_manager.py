@@ -0,0 +1,121 @@
+"""Test the local nonce management of the execute senders."""
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from ethereum_test_base_types import Address, Hash
+from ethereum_test_rpc import BlockNumberType, EthRPC, SendTransactionExceptionError
+from ethereum_test_tools import EOA, Transaction
+
+from ..nonce_manager import NonceManager, is_nonce_error
+
+
+class FakeNode(EthRPC):
+    """Node that tracks the nonce of a single sender and rejects some txs."""
+
+    def __init__(self, nonce: int = 0):
+        """Initialize the node with the sender's nonce."""
+        super().__init__("http://localhost")
+        self.nonce = nonce
+        self.nonce_requests = 0
+        self.sent: List[Transaction] = []
+        self.reject_next: str | None = None
+
+    def get_transaction_count(
+        self, address: Address, block_number: BlockNumberType = "latest"
+    ) -> int:
+        """Return the pending nonce of the sender."""
+        del address, block_number
+        self.nonce_requests += 1
+        return self.nonce
+
+    def send_transaction(self, transaction: Transaction) -> Hash:
+        """Accept the transaction if its nonce is the next one."""
+        if self.reject_next is not None:
+            message, self.reject_next = self.reject_next, None
+            raise SendTransactionExceptionError(message, tx=transaction)
+        if transaction.nonce != self.nonce:
+            raise SendTransactionExceptionError("nonce too low", tx=transaction)
+        self.nonce += 1
+        self.sent.append(transaction)
+        return transaction.hash
+
+
+def build(sender: EOA) -> Callable[[int], Transaction]:
+    """Return a function that builds a signed transaction with a nonce."""
+    return lambda nonce: Transaction(
+        sender=sender, to=0x1234, nonce=nonce
+    ).with_signature_and_sender()
+
+
+def test_nonces_are_handed_out_locally() -> None:
+    """Test that the node is only queried once for consecutive transactions."""
+    sender = EOA(key=1)
+    node = FakeNode(nonce=5)
+    nonce_manager = NonceManager(sender, node)
+    for _ in range(3):
+        nonce_manager.send_transaction(build(sender))
+    assert [tx.nonce for tx in node.sent] == [5, 6, 7]
+    assert node.nonce_requests == 1
+    assert sender.nonce == 8
+
+
+def test_nonce_error_reconciles() -> None:
+    """Test that a nonce error reconciles the nonce and resends."""
+    sender = EOA(key=1)
+    node = FakeNode(nonce=0)
+    nonce_manager = NonceManager(sender, node)
+    nonce_manager.send_transaction(build(sender))
+    node.nonce = 10  # The sender was used externally.
+    tx = nonce_manager.send_transaction(build(sender))
+    assert tx.nonce == 10
+    assert node.nonce_requests == 2
+
+
+def test_rejected_transaction_rolls_back_nonce() -> None:
+    """Test that the nonce of a rejected transaction is reused."""
+    sender = EOA(key=1)
+    node = FakeNode(nonce=3)
+    nonce_manager = NonceManager(sender, node)
+    node.reject_next = "insufficient funds for gas * price + value"
+    with pytest.raises(SendTransactionExceptionError):
+        nonce_manager.send_transaction(build(sender))
+    assert nonce_manager.send_transaction(build(sender)).nonce == 3
+    assert node.nonce_requests == 1
+
+    # A nonce that is not the last one handed out cannot be rolled back.
+    first = nonce_manager.next_nonce()
+    nonce_manager.next_nonce()
+    nonce_manager.rollback(first)
+    assert nonce_manager.next_nonce() == node.nonce
+    assert node.nonce_requests == 2
+
+
+def test_shared_nonce_file(tmp_path: Path) -> None:
+    """Test that managers of different processes share the nonce file."""
+    sender = EOA(key=1)
+    node = FakeNode(nonce=7)
+    nonce_file = tmp_path / "seed_sender_nonce"
+    first = NonceManager(sender, node, nonce_file=nonce_file)
+    second = NonceManager(EOA(key=1), node, nonce_file=nonce_file)
+    assert first.send_transaction(build(sender)).nonce == 7
+    assert second.send_transaction(build(second.sender)).nonce == 8
+    assert first.next_nonce() == 9
+    assert node.nonce_requests == 1
+    assert nonce_file.read_text() == "10"
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        ("nonce too low: next nonce 5, tx nonce 4", True),
+        ("Nonce too high", True),
+        ("invalid nonce; got 4, expected 5", True),
+        ("insufficient funds for gas * price + value", False),
+    ],
+)
+def test_is_nonce_error(message: str, expected: bool) -> None:
+    """Test the detection of nonce errors."""
+    assert is_nonce_error(Exception(message)) == expected
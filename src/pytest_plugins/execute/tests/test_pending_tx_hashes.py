@@ -0,0 +1,92 @@
+"""Test the pending transaction hashes shared by the execute workers."""
+
+import multiprocessing
+import time
+from pathlib import Path
+from typing import List
+
+from ethereum_test_base_types import Hash
+
+from ..rpc.chain_builder_eth_rpc import PendingTxHashes
+
+
+def test_pending_tx_hashes_operations(tmp_path: Path) -> None:
+    """Test the basic operations on the pending transaction hashes."""
+    pending = PendingTxHashes(tmp_path)
+    assert len(pending) == 0
+    pending.append(Hash(1))
+    pending.extend([Hash(2), Hash(3), Hash(4), Hash(1)])
+    assert len(pending) == 4
+    assert Hash(3) in pending
+    assert Hash(5) not in pending
+    assert list(pending) == [Hash(1), Hash(2), Hash(3), Hash(4)]
+
+    pending.remove(Hash(3))
+    assert Hash(3) not in pending
+    assert pending.discard([Hash(3), Hash(4), Hash(5)]) == 1
+    assert len(pending) == 2
+
+    # A second instance, e.g. of another worker, sees the same hashes.
+    assert list(PendingTxHashes(tmp_path)) == [Hash(1), Hash(2)]
+
+    assert pending.take(1) == [Hash(1)]
+    assert pending.take(10) == [Hash(2)]
+    assert pending.take(10) == []
+    assert len(pending) == 0
+
+    pending.extend([Hash(6), Hash(7)])
+    pending.clear()
+    assert len(pending) == 0
+
+
+def produce(temp_folder: Path, first: int, count: int) -> None:
+    """Submit `count` hashes in small batches, as the execute workers do."""
+    pending = PendingTxHashes(temp_folder)
+    for i in range(first, first + count, 4):
+        pending.append(Hash(i))
+        pending.extend([Hash(j) for j in range(i + 1, min(i + 4, first + count))])
+
+
+def drain(temp_folder: Path, total: int, results: "multiprocessing.Queue[List[Hash]]") -> None:
+    """Take hashes in blocks until the shared counter reaches the total."""
+    pending = PendingTxHashes(temp_folder)
+    taken: List[Hash] = []
+    while True:
+        with pending:
+            block = pending.take(8)
+            taken.extend(block)
+            marker = temp_folder / "drained"
+            drained_count = int(marker.read_text()) if marker.exists() else 0
+            drained_count += len(block)
+            marker.write_text(str(drained_count))
+        if drained_count >= total:
+            break
+        if not block:
+            time.sleep(0.001)
+    results.put(taken)
+
+
+def test_pending_tx_hashes_multiprocess_stress(tmp_path: Path) -> None:
+    """
+    Test that hashes concurrently submitted and drained by many processes are
+    all taken exactly once.
+    """
+    producers, consumers, per_producer = 4, 2, 250
+    total = producers * per_producer
+    context = multiprocessing.get_context("spawn")
+    results: "multiprocessing.Queue[List[Hash]]" = context.Queue()
+    processes = [
+        context.Process(target=produce, args=(tmp_path, i * per_producer, per_producer))
+        for i in range(producers)
+    ] + [context.Process(target=drain, args=(tmp_path, total, results)) for _ in range(consumers)]
+    for process in processes:
+        process.start()
+    taken: List[Hash] = []
+    for _ in range(consumers):
+        taken.extend(results.get(timeout=120))
+    for process in processes:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+    assert len(taken) == total
+    assert set(taken) == {Hash(i) for i in range(total)}
+    assert len(PendingTxHashes(tmp_path)) == 0
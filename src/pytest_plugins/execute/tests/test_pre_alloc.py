@@ -1,12 +1,22 @@
 """Test the pre-allocation models used during test execution."""
 
-from typing import Any
+from itertools import count
+from typing import Any, List, Set, Tuple
 
 import pytest
 
-from ethereum_test_base_types import Address
+from ethereum_test_base_types import Address, Hash
+from ethereum_test_forks import Prague
+from ethereum_test_rpc import (
+    BlockNumberType,
+    EthRPC,
+    SendTransactionExceptionError,
+    TransactionWaitStrategy,
+)
+from ethereum_test_tools import EOA, Transaction, compute_create_address
+from ethereum_test_vm import Opcodes as Op
 
-from ..pre_alloc import AddressStubs
+from ..pre_alloc import AddressStubs, Alloc
 
 
 @pytest.mark.parametrize(
@@ -81,3 +91,103 @@ def test_address_stubs_from_files(
     filename.write_text(file_contents)
 
     assert AddressStubs.model_validate_json_or_file(str(filename)) == expected
+
+
+class FakeEthRPC(EthRPC):
+    """Records the pre-alloc transactions instead of sending them."""
+
+    def __init__(self, *, rejected_nonces: Set[int] | None = None):
+        """Initialize the fake RPC."""
+        super().__init__("http://localhost")
+        self.rejected_nonces = rejected_nonces or set()
+        self.sent: List[Transaction] = []
+        self.batches: List[List[Transaction]] = []
+        self.waits: List[Tuple[int, TransactionWaitStrategy | None]] = []
+
+    def get_transaction_count(
+        self, address: Address, block_number: BlockNumberType = "latest"
+    ) -> int:
+        """Return the nonce of a fresh sender."""
+        del address, block_number
+        return 0
+
+    def send_transaction(self, transaction: Transaction) -> Hash:
+        """Record a single transaction."""
+        self.sent.append(transaction)
+        return transaction.hash
+
+    def send_transactions_batch(
+        self, transactions: List[Transaction]
+    ) -> List[Hash | SendTransactionExceptionError]:
+        """Record a batch, rejecting the configured nonces."""
+        self.batches.append(transactions)
+        return [
+            SendTransactionExceptionError("insufficient funds", tx=tx)
+            if tx.nonce in self.rejected_nonces
+            else tx.hash
+            for tx in transactions
+        ]
+
+    def wait_for_transactions(
+        self,
+        transactions: List[Transaction],
+        *,
+        strategy: TransactionWaitStrategy | None = None,
+    ) -> List[Any]:
+        """Record the wait."""
+        self.waits.append((len(transactions), strategy))
+        return []
+
+
+def make_alloc(eth_rpc: EthRPC, *, deferred: bool) -> Alloc:
+    """Create an execute pre-alloc connected to the fake RPC."""
+    return Alloc(
+        fork=Prague,
+        sender=EOA(key=1),
+        eth_rpc=eth_rpc,
+        eoa_iterator=iter(EOA(key=i, nonce=0) for i in count(start=100)),
+        chain_id=1,
+        eoa_fund_amount_default=10**18,
+        deferred=deferred,
+    )
+
+
+@pytest.mark.parametrize("deferred", [True, False])
+def test_deferred_deployment(deferred: bool) -> None:
+    """
+    Test that deferred pre-alloc transactions are sent in a single batch and
+    waited for at once, with the same addresses as immediate deployments.
+    """
+    eth_rpc = FakeEthRPC()
+    pre = make_alloc(eth_rpc, deferred=deferred)
+    contracts = [pre.deploy_contract(Op.SSTORE(0, i) + Op.STOP) for i in range(3)]
+    pre.fund_eoa()
+    pre.fund_address(contracts[0], 1)
+    sender = EOA(key=1)
+    assert contracts == [compute_create_address(address=sender, nonce=n) for n in range(3)]
+    if deferred:
+        assert eth_rpc.sent == [] and eth_rpc.batches == []
+    pre.wait_for_transactions()
+    if deferred:
+        assert [[int(tx.nonce) for tx in batch] for batch in eth_rpc.batches] == [[0, 1, 2, 3, 4]]
+        assert eth_rpc.waits == [(5, "blocks")]
+    else:
+        assert [int(tx.nonce) for tx in eth_rpc.sent] == [0, 1, 2, 3, 4]
+        assert eth_rpc.waits == [(5, None)]
+
+
+def test_deferred_deployment_errors() -> None:
+    """Test that every rejected deferred transaction is reported."""
+    eth_rpc = FakeEthRPC(rejected_nonces={1, 2})
+    pre = make_alloc(eth_rpc, deferred=True)
+    pre.deploy_contract(Op.STOP, label="first")
+    second = pre.deploy_contract(Op.STOP, label="second")
+    eoa = pre.fund_eoa(label="funded")
+    with pytest.raises(Exception) as e:
+        pre.wait_for_transactions()
+    message = str(e.value)
+    assert "2 of 3 pre-alloc transactions were rejected" in message
+    assert f"deploy_contract of second at {second} (nonce 1): insufficient funds" in message
+    assert "fund_eoa of funded (nonce 2)" in message
+    assert "first" not in message
+    assert eoa.label == "funded"
@@ -0,0 +1,163 @@
+"""Test the coordinated funding of the sender keys of all workers."""
+
+from itertools import count
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from ethereum_test_base_types import Address, Hash
+from ethereum_test_rpc import BlockNumberType, EthRPC, SendTransactionExceptionError
+from ethereum_test_rpc.rpc_types import TransactionByHashResponse
+from ethereum_test_tools import EOA, Transaction
+
+from ..nonce_manager import NonceManager
+from ..sender import SenderFunding
+
+GAS_LIMIT = 21_000
+GAS_PRICE = 10
+
+
+class MockChain(EthRPC):
+    """
+    Chain that executes value transfers as soon as they are sent and records
+    the RPC traffic of the tests.
+    """
+
+    def __init__(self, balances: Dict[Address, int]):
+        """Initialize the chain with the balances of the accounts."""
+        super().__init__("http://localhost")
+        self.balances = dict(balances)
+        self.nonces: Dict[Address, int] = {}
+        self.traffic: List[Tuple[str, int]] = []
+
+    def get_balance(self, address: Address, block_number: BlockNumberType = "latest") -> int:
+        """Return the balance of the account."""
+        del block_number
+        self.traffic.append(("eth_getBalance", 1))
+        return self.balances.get(address, 0)
+
+    def get_transaction_count(
+        self, address: Address, block_number: BlockNumberType = "latest"
+    ) -> int:
+        """Return the nonce of the account."""
+        del block_number
+        self.traffic.append(("eth_getTransactionCount", 1))
+        return self.nonces.get(address, 0)
+
+    def execute(self, tx: Transaction) -> Hash | SendTransactionExceptionError:
+        """Execute a value transfer."""
+        assert tx.sender is not None and tx.to is not None
+        if tx.nonce != self.nonces.get(tx.sender, 0):
+            return SendTransactionExceptionError("nonce too low", tx=tx)
+        cost = tx.value + tx.gas_limit * (tx.gas_price or 0)
+        if self.balances.get(tx.sender, 0) < cost:
+            return SendTransactionExceptionError("insufficient funds", tx=tx)
+        self.nonces[tx.sender] = int(tx.nonce) + 1
+        self.balances[tx.sender] -= cost
+        self.balances[tx.to] = self.balances.get(tx.to, 0) + int(tx.value)
+        return tx.hash
+
+    def send_transaction(self, transaction: Transaction) -> Hash:
+        """Send a single transaction."""
+        self.traffic.append(("eth_sendRawTransaction", 1))
+        result = self.execute(transaction)
+        if isinstance(result, SendTransactionExceptionError):
+            raise result
+        return result
+
+    def send_transactions_batch(
+        self, transactions: List[Transaction]
+    ) -> List[Hash | SendTransactionExceptionError]:
+        """Send a batch of transactions."""
+        self.traffic.append(("eth_sendRawTransaction", len(transactions)))
+        return [self.execute(tx) for tx in transactions]
+
+    def wait_for_transactions(
+        self, transactions: List[Transaction], **kwargs: str | None
+    ) -> List[TransactionByHashResponse]:
+        """Record the wait, all transactions are already included."""
+        del kwargs
+        self.traffic.append(("wait_for_transactions", len(transactions)))
+        return []
+
+
+def make_worker(chain: MockChain, seed_sender: EOA, tmp_path: Path) -> SenderFunding:
+    """Create the funding coordinator of a worker of the session."""
+    return SenderFunding(
+        seed_sender=seed_sender,
+        seed_nonce_manager=NonceManager(
+            seed_sender, chain, nonce_file=tmp_path / "seed_sender_nonce"
+        ),
+        eth_rpc=chain,
+        session_temp_folder=tmp_path,
+        gas_limit=GAS_LIMIT,
+        gas_price=GAS_PRICE,
+    )
+
+
+def eoa_iterator(start: int) -> Iterator[EOA]:
+    """Return the EOA iterator of a worker."""
+    return iter(EOA(key=i, nonce=0) for i in count(start=start))
+
+
+def test_coordinated_funding(tmp_path: Path) -> None:
+    """
+    Test that the senders of all workers are funded with a single batch and
+    refunded with a single batch by the last worker.
+    """
+    seed_sender = EOA(key=1)
+    chain = MockChain({seed_sender: 10**18})
+    workers = [make_worker(chain, seed_sender, tmp_path) for _ in range(3)]
+
+    senders = [
+        worker.claim(eoa_iterator(1000 * (i + 1)), 3, 10**15) for i, worker in enumerate(workers)
+    ]
+    assert chain.traffic == [
+        ("eth_getTransactionCount", 1),
+        ("eth_sendRawTransaction", 3),
+        ("wait_for_transactions", 3),
+    ]
+    assert all(sender is not None for sender in senders)
+    assert len({sender.key for sender in senders if sender is not None}) == 3
+    assert all(chain.balances[sender] == 10**15 for sender in senders if sender is not None)
+
+    # A restarted worker finds no sender left to claim.
+    assert make_worker(chain, seed_sender, tmp_path).claim(eoa_iterator(5000), 3, 10**15) is None
+
+    chain.traffic.clear()
+    for worker, sender in zip(workers, senders, strict=True):
+        assert sender is not None
+        worker.release(sender)
+    assert chain.traffic.count(("eth_sendRawTransaction", 3)) == 1
+    assert chain.traffic.count(("wait_for_transactions", 3)) == 1
+    assert [method for method, _ in chain.traffic].count("eth_sendRawTransaction") == 1
+    refund_cost = GAS_LIMIT * GAS_PRICE * 2 + 1
+    assert all(chain.balances[sender] == 1 for sender in senders if sender is not None)
+    assert chain.balances[seed_sender] == 10**18 - 3 * (GAS_LIMIT * GAS_PRICE + refund_cost)
+
+
+def test_unclaimed_senders_are_refunded(tmp_path: Path) -> None:
+    """
+    Test that senders of workers that never claimed them are refunded, and
+    that they cannot be claimed after the refund.
+    """
+    seed_sender = EOA(key=1)
+    chain = MockChain({seed_sender: 10**18})
+    worker = make_worker(chain, seed_sender, tmp_path)
+    sender = worker.claim(eoa_iterator(1000), 2, 10**15)
+    assert sender is not None
+    worker.release(sender)
+    assert chain.traffic.count(("eth_sendRawTransaction", 2)) == 2
+    assert make_worker(chain, seed_sender, tmp_path).claim(eoa_iterator(2000), 2, 10**15) is None
+
+
+def test_senders_without_balance_are_not_refunded(tmp_path: Path) -> None:
+    """Test that senders whose balance does not cover a refund are skipped."""
+    seed_sender = EOA(key=1)
+    chain = MockChain({seed_sender: 10**18})
+    worker = make_worker(chain, seed_sender, tmp_path)
+    sender = worker.claim(eoa_iterator(1000), 1, 10**15)
+    assert sender is not None
+    chain.balances[sender] = GAS_LIMIT * GAS_PRICE * 2
+    chain.traffic.clear()
+    worker.release(sender)
+    assert [method for method, _ in chain.traffic] == ["eth_getBalance"]
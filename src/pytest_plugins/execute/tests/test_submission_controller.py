@@ -0,0 +1,233 @@
+"""Test the rate-controlled submission of transactions."""
+
+import time
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from ethereum_test_base_types import Bytes, Hash, to_json
+from ethereum_test_rpc import SendTransactionExceptionError
+from ethereum_test_rpc.tests.helpers import FakeJSONRPCServer, FakeResponse
+from ethereum_test_tools import EOA, Transaction
+
+from ..submission_controller import (
+    ControlledEthRPC,
+    SubmissionController,
+    SubmissionMetrics,
+    is_transient_error,
+)
+
+
+class FakeNode(FakeJSONRPCServer):
+    """
+    Node that rejects transactions with scripted errors, includes every
+    accepted transaction immediately, and records the requests.
+    """
+
+    def __init__(self, transactions: List[Transaction]):
+        """Initialize the node with the transactions that will be sent."""
+        self.transactions = {tx.hash: tx for tx in transactions}
+        self.errors: List[str] = []
+        self.accepted: List[Hash] = []
+        self.txpool_status: Dict[str, str] | None = {"pending": "0x0", "queued": "0x0"}
+        self.requests: List[str] = []
+
+    def handle(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Answer a single request."""
+        self.requests.append(method)
+        if method == "eth_sendRawTransaction":
+            if self.errors:
+                return {"error": {"code": -32000, "message": self.errors.pop(0)}}
+            tx_hash = Bytes(params[0]).keccak256()
+            self.accepted.append(tx_hash)
+            return {"result": str(tx_hash)}
+        if method == "eth_getTransactionByHash":
+            tx = self.transactions[Hash(params[0])]
+            return {
+                "result": to_json(tx)
+                | {
+                    "hash": str(tx.hash),
+                    "from": str(tx.sender),
+                    "blockNumber": "0x1",
+                    "blockHash": str(Hash(1)),
+                }
+            }
+        if method == "txpool_status":
+            if self.txpool_status is None:
+                return {"error": {"code": -32601, "message": "method not found"}}
+            return {"result": self.txpool_status}
+        raise Exception(f"Unexpected method {method}")
+
+
+def make_transactions(count: int) -> List[Transaction]:
+    """Create signed transactions of a single sender."""
+    sender = EOA(key=1)
+    return [
+        Transaction(sender=sender, to=0x1234, nonce=i).with_signature_and_sender()
+        for i in range(count)
+    ]
+
+
+def make_eth_rpc(node: FakeNode, **kwargs: Any) -> ControlledEthRPC:
+    """Create a controlled client connected to the fake node."""
+    eth_rpc = ControlledEthRPC(
+        "http://localhost", poll_interval=0, retry_backoff=0, target_rate=1_000, **kwargs
+    )
+    node.connect(eth_rpc)
+    assert eth_rpc.txpool_rpc is not None
+    node.connect(eth_rpc.txpool_rpc)
+    return eth_rpc
+
+
+def test_controller_aimd() -> None:
+    """Test the additive increase and multiplicative decrease of the rate."""
+    controller = SubmissionController(100, min_rate=10, additive_increase=5)
+    controller.on_congestion()
+    assert controller.rate == 50
+    controller.on_congestion()
+    controller.on_congestion()
+    controller.on_congestion()
+    assert controller.rate == 10
+    for _ in range(5):
+        controller.on_success()
+    assert controller.rate == 35
+    for _ in range(20):
+        controller.on_success()
+    assert controller.rate == 100
+
+
+def test_controller_pacing() -> None:
+    """Test that submissions are spaced at the controlled rate."""
+    controller = SubmissionController(100)
+    start = time.monotonic()
+    for _ in range(6):
+        controller.wait_for_slot()
+    assert time.monotonic() - start >= 0.05
+
+
+@pytest.mark.parametrize(
+    "message,transient",
+    [
+        ("txpool is full", True),
+        ("429 Too Many Requests", True),
+        ("nonce too low", False),
+        ("insufficient funds for gas * price + value", False),
+    ],
+)
+def test_is_transient_error(message: str, transient: bool) -> None:
+    """Test the classification of the transaction rejections."""
+    assert is_transient_error(SendTransactionExceptionError(message)) == transient
+
+
+def test_connection_errors_are_retried() -> None:
+    """
+    Test that failed connections are retried, and that a transaction that
+    reached the client before the connection failed is not sent again.
+    """
+    assert is_transient_error(requests.ConnectionError("Connection aborted."))
+    assert is_transient_error(requests.Timeout("Read timed out."))
+    transactions = make_transactions(2)
+    node = FakeNode(transactions)
+    eth_rpc = make_eth_rpc(node)
+    make_request = node.make_request
+    failures = [requests.ConnectionError("Connection aborted."), requests.Timeout()]
+
+    def flaky_make_request(url: str, payload: Any, headers: Any, timeout: Any) -> FakeResponse:
+        if payload["method"] == "eth_sendRawTransaction" and failures:
+            raise failures.pop(0)
+        return make_request(url, payload, headers, timeout)
+
+    eth_rpc._make_request = flaky_make_request  # type: ignore[assignment]
+    eth_rpc.send_transaction(transactions[0])
+    assert node.accepted == [transactions[0].hash]
+    assert eth_rpc.submission_metrics.retries == 2
+
+    failures = [requests.Timeout()]
+    node.errors = ["already known"]
+    assert eth_rpc.send_transaction(transactions[1]) == transactions[1].hash
+    assert eth_rpc.submission_metrics.submitted == 2
+
+
+def test_transient_errors_are_retried_in_order() -> None:
+    """Test that rejected transactions are sent again before the next one."""
+    transactions = make_transactions(3)
+    node = FakeNode(transactions)
+    eth_rpc = make_eth_rpc(node)
+    node.errors = ["txpool is full", "txpool is full"]
+    eth_rpc.send_transactions(transactions)
+    assert node.accepted == [tx.hash for tx in transactions]
+    assert eth_rpc.submission_metrics.retries == 2
+    assert eth_rpc.submission_metrics.submitted == 3
+    assert eth_rpc.controller.rate < eth_rpc.controller.target_rate
+
+
+def test_permanent_errors_are_raised() -> None:
+    """Test that non-transient rejections are raised without retries."""
+    transactions = make_transactions(1)
+    node = FakeNode(transactions)
+    eth_rpc = make_eth_rpc(node)
+    node.errors = ["insufficient funds"]
+    with pytest.raises(SendTransactionExceptionError, match="insufficient funds"):
+        eth_rpc.send_transaction(transactions[0])
+    assert node.requests.count("eth_sendRawTransaction") == 1
+    assert eth_rpc.send_transactions_batch(transactions) == [transactions[0].hash]
+
+
+def test_retries_are_limited() -> None:
+    """Test that a transaction is rejected after the maximum retries."""
+    transactions = make_transactions(1)
+    node = FakeNode(transactions)
+    eth_rpc = make_eth_rpc(node, max_retries=2)
+    node.errors = ["txpool is full"] * 3
+    with pytest.raises(SendTransactionExceptionError, match="txpool is full"):
+        eth_rpc.send_transaction(transactions[0])
+    assert node.requests.count("eth_sendRawTransaction") == 3
+
+
+def test_in_flight_cap() -> None:
+    """
+    Test that the oldest transaction of a sender is waited for when the
+    sender reaches the in-flight cap, and that latencies are recorded.
+    """
+    transactions = make_transactions(3)
+    node = FakeNode(transactions)
+    eth_rpc = make_eth_rpc(node, max_in_flight_per_sender=2)
+    eth_rpc.send_transactions(transactions[:2])
+    assert "eth_getTransactionByHash" not in node.requests
+    eth_rpc.send_transaction(transactions[2])
+    assert node.requests.index("eth_getTransactionByHash") < len(node.requests) - 1
+    assert len(eth_rpc.submission_metrics.inclusion_latencies) == 1
+    eth_rpc.wait_for_transactions(transactions)
+    assert len(eth_rpc.submission_metrics.inclusion_latencies) == 3
+    assert all(not in_flight for in_flight in eth_rpc.in_flight.values())
+
+
+def test_txpool_status() -> None:
+    """
+    Test that a large transaction pool decreases the rate, and that the check
+    is disabled if the client does not support `txpool_status`.
+    """
+    transactions = make_transactions(2)
+    node = FakeNode(transactions)
+    eth_rpc = make_eth_rpc(node, txpool_high_watermark=10, txpool_check_interval=0)
+    node.txpool_status = {"pending": "0x8", "queued": "0x2"}
+    eth_rpc.send_transaction(transactions[0])
+    assert eth_rpc.submission_metrics.rate_decreases == 1
+    node.txpool_status = None
+    eth_rpc.send_transaction(transactions[1])
+    assert eth_rpc.txpool_rpc is None
+    assert node.requests.count("txpool_status") == 2
+
+
+def test_submission_metrics() -> None:
+    """Test the achieved rate and latency percentiles."""
+    metrics = SubmissionMetrics(
+        submitted=11,
+        first_submission=0.0,
+        last_submission=2.0,
+        inclusion_latencies=[float(i) for i in range(1, 101)],
+    )
+    assert metrics.submission_rate == 5
+    assert metrics.latency_percentile(50) == pytest.approx(50.5)
+    assert "11 txs at 5.00 txs/s" in str(metrics)
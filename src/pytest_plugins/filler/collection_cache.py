@@ -0,0 +1,595 @@
+"""
+Pytest plugin that caches the collection of the fill command across sessions.
+
+Each collected file (Python test module or static filler file) is cached
+under a key that covers:
+
+- The content of the file, of the conftest files that apply to it and of all
+  the modules it imports, transitively, from the repository.
+- The code of the plugins that parametrize the tests.
+- The selected forks and the command-line options that change the collected
+  test cases.
+
+Static filler files are fully served from the cache: their test items are
+rebuilt from the cached ids, markers and parameters, and the file is only
+parsed once one of its items is set up. For Python test modules, the fork
+validity and the fork parametrization (ids, markers and values) of every test
+function are reused from the cache. A parametrization is only cached if all
+its values are forks, booleans, integers or strings and all its markers can be
+serialized; otherwise only the fork validity of the function is cached.
+
+In verification mode, the items of every cached file are built from the cache
+and compared, by id and markers, with a fresh collection of the same file.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Set, Tuple, cast
+
+import pytest
+from _pytest.mark.structures import Mark, MarkDecorator, ParameterSet
+
+from ethereum_test_forks import ALL_FORKS_WITH_TRANSITIONS, Fork
+
+CACHE_VERSION = 2
+SRC_DIR = Path(__file__).parents[2]
+FRAMEWORK_MODULES = [
+    Path(__file__),
+    SRC_DIR / "pytest_plugins" / "filler" / "filler.py",
+    SRC_DIR / "pytest_plugins" / "filler" / "static_filler.py",
+    SRC_DIR / "pytest_plugins" / "forks" / "forks.py",
+    SRC_DIR / "pytest_plugins" / "shared" / "execute_fill.py",
+]
+"""Plugins whose code determines how the tests are parametrized."""
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command-line options to pytest."""
+    collection_cache_group = parser.getgroup(
+        "collection_cache", "Arguments defining the collection cache"
+    )
+    collection_cache_group.addoption(
+        "--collect-cache",
+        action="store_true",
+        dest="collect_cache",
+        default=False,
+        help=(
+            "Cache the collected test cases of every test module and static filler file in "
+            "pytest's cache directory, and reuse them for unchanged files in later sessions."
+        ),
+    )
+    collection_cache_group.addoption(
+        "--collect-cache-clear",
+        action="store_true",
+        dest="collect_cache_clear",
+        default=False,
+        help="Remove all entries from the collection cache before collecting.",
+    )
+    collection_cache_group.addoption(
+        "--collect-cache-verify",
+        action="store_true",
+        dest="collect_cache_verify",
+        default=False,
+        help=(
+            "Build the test cases of unchanged files from the cache and fail if they differ "
+            "from a fresh collection of the same files. Implies --collect-cache."
+        ),
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Initialize the collection cache if requested."""
+    verify = config.getoption("collect_cache_verify")
+    if not (config.getoption("collect_cache") or verify):
+        return
+    if not hasattr(config, "cache"):
+        pytest.exit(
+            "The collection cache requires pytest's cacheprovider plugin.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    directory = config.cache.mkdir("fill-collection-cache")
+    if config.getoption("collect_cache_clear") and not hasattr(config, "workerinput"):
+        shutil.rmtree(directory)
+        directory.mkdir()
+    config.collection_cache = CollectionCache(  # type: ignore[attr-defined]
+        directory,
+        rootdir=config.rootpath,
+        context=collection_context(config),
+        verify=verify,
+    )
+    config.pluginmanager.register(CollectionCachePlugin(config), "collection-cache")
+
+
+def collection_context(config: pytest.Config) -> Dict[str, Any]:
+    """
+    Return the fork selection and command-line options that change the
+    collected test cases.
+    """
+    filling_session = config.filling_session  # type: ignore[attr-defined]
+    return {
+        "version": CACHE_VERSION,
+        "python": list(sys.version_info[:2]),
+        "pytest": pytest.__version__,
+        "forks": sorted(fork.name() for fork in config.selected_fork_set),  # type: ignore
+        "unsupported_forks": sorted(
+            fork.name()
+            for fork in config.unsupported_forks  # type: ignore[attr-defined]
+        ),
+        # Named in the skip reason of the unsupported forks; no t8n tool is
+        # instantiated when only collecting.
+        "t8n": type(config.t8n).__name__ if hasattr(config, "t8n") else None,
+        "phase": str(filling_session.phase_manager.current_phase),
+        "previous_phases": sorted(str(p) for p in filling_session.phase_manager.previous_phases),
+        "generate_all_formats": filling_session.format_selector.generate_all_formats,
+        "fill_static_tests": config.getoption("fill_static_tests_enabled", False),
+        "skipped_forks_listed": config.getoption("verbose") >= 2,
+    }
+
+
+@cache
+def get_forks_by_name() -> Dict[str, Fork]:
+    """Return all forks, including transition forks, by name."""
+    return {fork.name(): fork for fork in ALL_FORKS_WITH_TRANSITIONS}
+
+
+def resolve_module(parts: List[str], roots: List[Path]) -> List[Path]:
+    """
+    Return the files of the module and its parent packages if the module can
+    be found in one of the roots.
+    """
+    for root in roots:
+        files = []
+        for i in range(1, len(parts) + 1):
+            package_init = root.joinpath(*parts[:i], "__init__.py")
+            if package_init.is_file():
+                files.append(package_init)
+        module_file = root.joinpath(*parts).with_suffix(".py")
+        if module_file.is_file():
+            files.append(module_file)
+        if files and (module_file.is_file() or root.joinpath(*parts, "__init__.py").is_file()):
+            return files
+    return []
+
+
+def local_imports(path: Path, roots: Tuple[Path, ...]) -> Tuple[Path, ...]:
+    """Return the repository modules directly imported by a file."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except SyntaxError:
+        return ()
+    imported: Set[Path] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imported.update(resolve_module(alias.name.split("."), list(roots)))
+        elif isinstance(node, ast.ImportFrom):
+            module_parts = node.module.split(".") if node.module else []
+            search_roots = list(roots)
+            if node.level:
+                package_dir = path.parent
+                for _ in range(node.level - 1):
+                    package_dir = package_dir.parent
+                search_roots = [package_dir]
+            imported.update(resolve_module(module_parts, search_roots) if module_parts else [])
+            for alias in node.names:
+                # `from package import module` imports a submodule.
+                imported.update(resolve_module(module_parts + [alias.name], search_roots))
+    imported.discard(path)
+    return tuple(sorted(imported))
+
+
+def is_json_value(value: Any) -> bool:
+    """Return whether the value is preserved by a JSON round trip."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return True
+    if isinstance(value, list):
+        return all(is_json_value(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and is_json_value(v) for k, v in value.items())
+    return False
+
+
+def serialize_mark(mark: Mark | MarkDecorator) -> Dict[str, Any] | None:
+    """
+    Return the mark as a JSON-serializable dictionary, or None if its
+    arguments can't be serialized.
+    """
+    plain_mark = mark.mark if isinstance(mark, MarkDecorator) else mark
+    args = list(plain_mark.args)
+    kwargs = dict(plain_mark.kwargs)
+    if not (is_json_value(args) and is_json_value(kwargs)):
+        return None
+    return {
+        "name": plain_mark.name,
+        "args": args,
+        "kwargs": kwargs,
+        "decorator": isinstance(mark, MarkDecorator),
+    }
+
+
+def deserialize_mark(data: Dict[str, Any]) -> Mark | MarkDecorator:
+    """Return the mark of a dictionary created by `serialize_mark`."""
+    mark = Mark(data["name"], tuple(data["args"]), data["kwargs"], _ispytest=True)
+    return MarkDecorator(mark, _ispytest=True) if data["decorator"] else mark
+
+
+def item_summary(item: pytest.Item) -> Tuple[str, List[str]]:
+    """Return the id and marker names of a collected item."""
+    return item.nodeid, sorted(marker.name for marker in item.iter_markers())
+
+
+def collect_items(collector: pytest.Collector) -> Generator[pytest.Item, None, None]:
+    """Collect the items of a collector and of all its child collectors."""
+    for node in collector.collect():
+        if isinstance(node, pytest.Item):
+            yield node
+        else:
+            yield from collect_items(node)
+
+
+@dataclass(kw_only=True)
+class CacheEntry:
+    """The cached collection of a single file."""
+
+    path: str
+    fork_sets: Dict[str, List[str]] = field(default_factory=dict)
+    """Forks in which each test function of a Python module is valid."""
+    fork_parameters: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    """Fork parametrization of each test function of a Python module."""
+    static_items: List[Dict[str, Any]] | None = None
+    """Data required to rebuild the items of a static filler file."""
+
+
+class SourceFiles:
+    """
+    Hashes of the files of the repository and of the repository modules they
+    import, memoized for the lifetime of the instance.
+    """
+
+    rootdir: Path
+    roots: Tuple[Path, ...]
+    digests: Dict[Path, str]
+    imports: Dict[Path, Tuple[Path, ...]]
+
+    def __init__(self, rootdir: Path):
+        """Initialize the hashes of the files below the given rootdir."""
+        self.rootdir = rootdir
+        self.roots = (SRC_DIR, rootdir)
+        self.digests = {}
+        self.imports = {}
+
+    def file_digest(self, path: Path) -> str:
+        """Return the hash of the content of a file."""
+        if path not in self.digests:
+            self.digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self.digests[path]
+
+    def files_digest(self, files: Set[Path]) -> str:
+        """Return the hash of the paths and content of the files."""
+        digest = hashlib.sha256()
+        for file in sorted(str(file) for file in files):
+            digest.update(f"{file}:{self.file_digest(Path(file))}".encode())
+        return digest.hexdigest()
+
+    def import_closure(self, paths: List[Path], known: Set[Path] | None = None) -> Set[Path]:
+        """
+        Return the files and all the repository modules they import, skipping
+        the imports of the files that are already `known`.
+        """
+        if known is None:
+            known = set()
+        closure: Set[Path] = set()
+        pending = list(paths)
+        while pending:
+            path = pending.pop()
+            if path in closure or path in known:
+                continue
+            closure.add(path)
+            if path.suffix == ".py":
+                if path not in self.imports:
+                    self.imports[path] = local_imports(path, self.roots)
+                pending.extend(self.imports[path])
+        return closure
+
+    def conftest_files(self, path: Path) -> List[Path]:
+        """Return the conftest files that apply to a file."""
+        conftests = []
+        directory = path.parent
+        while directory == self.rootdir or self.rootdir in directory.parents:
+            conftest = directory / "conftest.py"
+            if conftest.is_file():
+                conftests.append(conftest)
+            directory = directory.parent
+        return conftests
+
+
+class CollectionCache(SourceFiles):
+    """
+    Persistent cache of the collected test cases of each file.
+
+    Every entry is stored in its own JSON file, named after its key, so that
+    the xdist workers of a session can read and write entries concurrently.
+    In verification mode, the ids and marker names of the items built from
+    the cached entries are recorded to compare them with a fresh collection.
+    """
+
+    directory: Path
+    context_digest: str
+    framework_files: Set[Path]
+    framework_digest: str
+    verify: bool
+    bypass: bool
+    keys: Dict[Path, str]
+    entries: Dict[Path, CacheEntry | None]
+    pending: Dict[Path, CacheEntry]
+    collected: Dict[Path, List[Tuple[str, List[str]]]]
+    hits: int
+    misses: int
+    mismatches: List[str]
+
+    def __init__(self, directory: Path, *, rootdir: Path, context: Dict[str, Any], verify: bool):
+        """Initialize the cache stored in the given directory."""
+        super().__init__(rootdir)
+        self.directory = directory
+        self.context_digest = hashlib.sha256(
+            json.dumps(context, sort_keys=True).encode()
+        ).hexdigest()
+        self.verify = verify
+        self.bypass = False
+        self.keys = {}
+        self.entries = {}
+        self.pending = {}
+        self.collected = {}
+        self.hits = 0
+        self.misses = 0
+        self.mismatches = []
+        self.framework_files = self.import_closure(FRAMEWORK_MODULES)
+        self.framework_digest = self.files_digest(self.framework_files)
+
+    def key(self, path: Path) -> str:
+        """Return the cache key of a file."""
+        if path not in self.keys:
+            files = self.import_closure(
+                [path, *self.conftest_files(path)], known=self.framework_files
+            )
+            self.keys[path] = hashlib.sha256(
+                ":".join(
+                    [
+                        self.context_digest,
+                        self.framework_digest,
+                        self.relative_path(path),
+                        self.files_digest(files),
+                    ]
+                ).encode()
+            ).hexdigest()
+        return self.keys[path]
+
+    def relative_path(self, path: Path) -> str:
+        """Return the path of the file relative to the rootdir."""
+        return os.path.relpath(path, self.rootdir)
+
+    def entry_path(self, path: Path) -> Path:
+        """Return the path of the cache entry of a file."""
+        return self.directory / f"{self.key(path)}.json"
+
+    def read(self, entry_path: Path) -> Any:
+        """Read a JSON file of the cache, or return None if it's missing."""
+        if not entry_path.exists():
+            return None
+        try:
+            return json.loads(entry_path.read_text())
+        except json.JSONDecodeError:
+            return None
+
+    def write(self, entry_path: Path, data: Any) -> None:
+        """Atomically write a JSON file of the cache."""
+        temporary_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(data))
+        os.replace(temporary_path, entry_path)
+
+    def load(self, path: Path) -> CacheEntry | None:
+        """Return the cached entry of a file."""
+        data = self.read(self.entry_path(path))
+        return CacheEntry(**data) if data is not None else None
+
+    def get(self, path: Path) -> CacheEntry | None:
+        """
+        Return the cached entry of a file, or None if the file must be
+        collected from scratch, in which case a new entry is started.
+        """
+        if self.bypass:
+            return None
+        if path not in self.entries:
+            entry = self.load(path)
+            self.entries[path] = entry
+            if entry is None:
+                self.pending[path] = CacheEntry(path=self.relative_path(path))
+                self.misses += 1
+            else:
+                if self.verify:
+                    self.collected[path] = []
+                self.hits += 1
+        return self.entries[path]
+
+    @contextmanager
+    def bypassed(self) -> Generator[None, None, None]:
+        """Collect from scratch, without reading or recording entries."""
+        self.bypass = True
+        try:
+            yield
+        finally:
+            self.bypass = False
+
+    def fork_set(self, path: Path, function_id: str) -> Set[Fork] | None:
+        """Return the cached forks in which a test function is valid."""
+        entry = self.get(path)
+        if entry is None or function_id not in entry.fork_sets:
+            return None
+        forks_by_name = get_forks_by_name()
+        fork_names = entry.fork_sets[function_id]
+        if any(fork_name not in forks_by_name for fork_name in fork_names):
+            return None
+        return {forks_by_name[fork_name] for fork_name in fork_names}
+
+    def record_fork_set(self, path: Path, function_id: str, forks: Set[Fork]) -> None:
+        """Record the forks in which a test function is valid."""
+        if path in self.pending:
+            self.pending[path].fork_sets[function_id] = sorted(fork.name() for fork in forks)
+
+    def fork_parameters(
+        self, path: Path, function_id: str
+    ) -> Tuple[List[str], List[ParameterSet], List[str]] | None:
+        """
+        Return the cached names, values and indirect names of the fork
+        parameters of a test function.
+        """
+        entry = self.get(path)
+        if entry is None or function_id not in entry.fork_parameters:
+            return None
+        forks_by_name = get_forks_by_name()
+        data = entry.fork_parameters[function_id]
+        argnames: List[str] = data["argnames"]
+        parameter_sets: List[ParameterSet] = []
+        for parameter_set in data["parameter_sets"]:
+            values = list(parameter_set["values"])
+            for i, name in enumerate(argnames):
+                if name == "fork":
+                    if values[i] not in forks_by_name:
+                        return None
+                    values[i] = forks_by_name[values[i]]
+            parameter_sets.append(
+                pytest.param(
+                    *values,
+                    id=parameter_set["id"],
+                    marks=[deserialize_mark(mark) for mark in parameter_set["marks"]],
+                )
+            )
+        return argnames, parameter_sets, data["indirect"]
+
+    def record_fork_parameters(
+        self,
+        path: Path,
+        function_id: str,
+        argnames: List[str],
+        parameter_sets: List[ParameterSet],
+        indirect: List[str],
+    ) -> None:
+        """
+        Record the fork parametrization of a test function, unless one of its
+        values or markers can't be serialized.
+        """
+        if path not in self.pending:
+            return
+        serialized_sets: List[Dict[str, Any]] = []
+        for parameter_set in parameter_sets:
+            values: List[Any] = []
+            for name, value in zip(argnames, parameter_set.values, strict=True):
+                if name == "fork":
+                    values.append(cast(Fork, value).name())
+                elif type(value) in (bool, int, str):
+                    # Subclasses, e.g. enums, would not survive the round trip.
+                    values.append(value)
+                else:
+                    return
+            marks = [serialize_mark(mark) for mark in parameter_set.marks]
+            if any(mark is None for mark in marks):
+                return
+            serialized_sets.append({"values": values, "id": parameter_set.id, "marks": marks})
+        self.pending[path].fork_parameters[function_id] = {
+            "argnames": argnames,
+            "parameter_sets": serialized_sets,
+            "indirect": indirect,
+        }
+
+    def record_static_items(self, path: Path, static_items: List[Dict[str, Any]] | None) -> None:
+        """Record the data required to rebuild the items of a static file."""
+        if path in self.pending:
+            self.pending[path].static_items = static_items
+
+    def record_item(self, item: pytest.Item) -> None:
+        """Record an item built from a cached entry in verification mode."""
+        if item.path in self.collected:
+            self.collected[item.path].append(item_summary(item))
+
+    def verify_file(self, collector: pytest.File) -> None:
+        """
+        Compare the items built from the cached entry of a file with a fresh
+        collection of the same file.
+        """
+        fresh_collector = type(collector).from_parent(collector.parent, path=collector.path)
+        path = self.relative_path(collector.path)
+        with self.bypassed():
+            try:
+                fresh = [item_summary(item) for item in collect_items(fresh_collector)]
+            except Exception as e:
+                self.mismatches.append(f"{path} (fresh collection failed: {e})")
+                return
+        if fresh != self.collected[collector.path]:
+            self.mismatches.append(path)
+
+    def save(self) -> None:
+        """Write the pending entries."""
+        for path, entry in self.pending.items():
+            self.write(self.entry_path(path), vars(entry))
+        self.pending = {}
+
+
+class CollectionCachePlugin:
+    """Pytest plugin class that records and verifies the cached entries."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the plugin with the given pytest config."""
+        self.config = config
+        self.collection_cache: CollectionCache = config.collection_cache  # type: ignore
+        self.cached_files: List[pytest.File] = []
+
+    def pytest_collectstart(self, collector: pytest.Collector) -> None:
+        """
+        Look up the entry of every collected file, keeping the files built
+        from the cache in verification mode.
+        """
+        if isinstance(collector, pytest.File):
+            entry = self.collection_cache.get(collector.path)
+            if entry is not None and self.collection_cache.verify:
+                self.cached_files.append(collector)
+
+    def pytest_itemcollected(self, item: pytest.Item) -> None:
+        """Record the collected item."""
+        self.collection_cache.record_item(item)
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        """
+        Write the new entries, and compare the cached files with a fresh
+        collection in verification mode.
+        """
+        del session
+        self.collection_cache.save()
+        for collector in self.cached_files:
+            self.collection_cache.verify_file(collector)
+        if self.collection_cache.mismatches:
+            pytest.exit(
+                "Collection cache verification failed, cached test cases differ for:\n"
+                + "\n".join(f"  {path}" for path in self.collection_cache.mismatches),
+                returncode=pytest.ExitCode.TESTS_FAILED,
+            )
+
+    def pytest_report_collectionfinish(self, config: pytest.Config) -> List[str]:
+        """Report the cache hits and misses."""
+        del config
+        collection_cache = self.collection_cache
+        if collection_cache.verify:
+            return [
+                f"Collection cache verified: the test cases of {len(self.cached_files)} "
+                "cached files match."
+            ]
+        total = collection_cache.hits + collection_cache.misses
+        return [f"Collection cache: {collection_cache.hits} of {total} files reused."]
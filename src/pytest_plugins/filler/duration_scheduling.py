@@ -0,0 +1,318 @@
+"""
+Pytest plugin that schedules the longest tests first when filling with
+pytest-xdist.
+
+The fill duration of every test is recorded in pytest's cache. With
+`--schedule-by-duration`, the tests predicted to take at least
+`LONG_TEST_DURATION` are sent to the workers first, longest first, one at a
+time to the next free worker (longest processing time first scheduling). The
+remaining tests follow in collection order, in batches, as with xdist's
+`load` distribution.
+
+Tests without recorded duration are predicted from the recorded durations of
+the other parametrizations of the same test function, or, if there are none,
+from a heuristic based on the fixture format and the benchmark gas value in
+the test id. The number of blocks of a test is only known once it is
+filled, so it is accounted for by the recorded durations only.
+"""
+
+import heapq
+import re
+from itertools import cycle, islice
+from typing import Callable, Dict, List, Sequence
+
+import pytest
+from _pytest.terminal import TerminalReporter
+from xdist.remote import Producer
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+from ethereum_test_fixtures import LabeledFixtureFormat
+from ethereum_test_types import EnvironmentDefaults
+
+from ..shared.helpers import is_help_or_collectonly_mode
+
+DURATIONS_CACHE_KEY = "fill/durations"
+LONG_TEST_DURATION = 1.0
+"""Predicted duration, in seconds, from which tests are scheduled first."""
+BASE_DURATION = 0.05
+"""Predicted duration, in seconds, of a state test without any history."""
+FORMAT_WEIGHTS = {
+    "state_test": 1.0,
+    "transaction_test": 0.5,
+    "eof_test": 0.5,
+    "blockchain_test": 2.0,
+    "blockchain_test_engine": 3.0,
+    "blockchain_test_engine_x": 3.0,
+    "blockchain_test_sync": 4.0,
+}
+"""Relative fill duration of each fixture format."""
+BENCHMARK_WEIGHT = 20.0
+"""Relative fill duration of the tests in the benchmark directory."""
+GAS_BENCHMARK_VALUE_PATTERN = re.compile(r"benchmark-gas-value_(\d+)M")
+MAX_RECORDED_DURATIONS = 250_000
+"""
+Number of test durations kept in the pytest cache; the tests whose duration
+was recorded least recently are dropped first.
+"""
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command-line options to pytest."""
+    scheduling_group = parser.getgroup("scheduling", "Arguments defining test scheduling")
+    scheduling_group.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        dest="schedule_by_duration",
+        default=False,
+        help=(
+            "When filling with xdist (-n), send the tests with the longest recorded (or "
+            f"estimated) fill duration to the workers first. Tests predicted to take at least "
+            f"{LONG_TEST_DURATION}s are scheduled longest first, the remaining tests keep their "
+            "collection order."
+        ),
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the plugin that records the fill duration of the tests."""
+    if is_help_or_collectonly_mode(config) or hasattr(config, "workerinput"):
+        return
+    if not hasattr(config, "cache"):
+        return
+    config.pluginmanager.register(DurationSchedulingPlugin(config), "duration-scheduling")
+
+
+def fixture_format_weight(nodeid: str) -> float:
+    """Return the relative duration of the fixture format in a test id."""
+    parameters = nodeid.partition("[")[2].rstrip("]").split("-")
+    for parameter in parameters:
+        if parameter in FORMAT_WEIGHTS:
+            return FORMAT_WEIGHTS[parameter]
+        if parameter in LabeledFixtureFormat.registered_labels:
+            fixture_format = LabeledFixtureFormat.registered_labels[parameter].format
+            return FORMAT_WEIGHTS.get(fixture_format.format_name, 1.0)
+    return 1.0
+
+
+def heuristic_duration(nodeid: str) -> float:
+    """Return the estimated fill duration of a test without any history."""
+    duration = BASE_DURATION * fixture_format_weight(nodeid)
+    if nodeid.startswith("tests/benchmark/"):
+        duration *= BENCHMARK_WEIGHT
+    if match := GAS_BENCHMARK_VALUE_PATTERN.search(nodeid):
+        gas_benchmark_value = int(match.group(1)) * 1_000_000
+        duration *= max(1.0, gas_benchmark_value / EnvironmentDefaults.gas_limit)
+    return duration
+
+
+def predicted_makespan(durations: Sequence[float], workers: int) -> float:
+    """
+    Return the makespan of the durations if each is assigned, in order, to the
+    worker that finishes first.
+    """
+    if not durations or workers < 1:
+        return 0.0
+    loads = [0.0] * workers
+    for duration in durations:
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+class DurationHistory:
+    """Fill durations of the tests recorded in previous sessions."""
+
+    durations: Dict[str, float]
+    function_durations: Dict[str, float]
+    recorded: Dict[str, float]
+
+    def __init__(self, durations: Dict[str, float]):
+        """Initialize the history with the recorded durations."""
+        self.durations = durations
+        function_totals: Dict[str, List[float]] = {}
+        for nodeid, duration in durations.items():
+            function_totals.setdefault(nodeid.partition("[")[0], []).append(duration)
+        self.function_durations = {
+            function_id: sum(totals) / len(totals)
+            for function_id, totals in function_totals.items()
+        }
+        self.recorded = {}
+
+    def predict(self, nodeid: str) -> float:
+        """Return the predicted fill duration of a test."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        function_id = nodeid.partition("[")[0]
+        if function_id in self.function_durations:
+            return self.function_durations[function_id]
+        return heuristic_duration(nodeid)
+
+    def has_history(self, nodeid: str) -> bool:
+        """Return whether the duration of the test was recorded."""
+        return nodeid in self.durations
+
+    def record(self, nodeid: str, duration: float) -> None:
+        """Add the duration of a setup, call or teardown phase of a test."""
+        self.recorded[nodeid] = self.recorded.get(nodeid, 0.0) + duration
+
+    def merged(self) -> Dict[str, float]:
+        """
+        Return the previous durations updated with the recorded ones, at most
+        `MAX_RECORDED_DURATIONS`, ordered from the least to the most recently
+        recorded.
+
+        Renamed or removed tests are never collected again, so their
+        durations are eventually dropped.
+        """
+        durations = {
+            nodeid: duration
+            for nodeid, duration in self.durations.items()
+            if nodeid not in self.recorded
+        }
+        durations |= {nodeid: round(duration, 4) for nodeid, duration in self.recorded.items()}
+        excess = len(durations) - MAX_RECORDED_DURATIONS
+        if excess > 0:
+            durations = dict(islice(durations.items(), excess, None))
+        return durations
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    Load scheduling that sends the long tests first, longest first, to the
+    next free worker.
+
+    Workers only start running a test once they have received the next one,
+    so each worker is kept at two pending tests while long tests remain.
+    """
+
+    predict: Callable[[str], float]
+    predictions: List[float]
+    predicted_makespan: float | None
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        log: Producer | None,
+        predict: Callable[[str], float],
+    ) -> None:
+        """Initialize the scheduler with the predictor of test durations."""
+        super().__init__(config, log)
+        self.predict = predict
+        self.predictions = []
+        self.predicted_makespan = None
+
+    def is_long(self, index: int) -> bool:
+        """Return whether the test is scheduled longest first."""
+        return self.predictions[index] >= LONG_TEST_DURATION
+
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None:
+        """Send the next long test, or fall back to batches of short tests."""
+        if node.shutting_down:
+            return
+        if self.pending and self.is_long(self.pending[0]):
+            node_pending = self.node2pending[node]
+            if len(node_pending) < 2:
+                self._send_tests(node, 2 - len(node_pending))
+            return
+        super().check_schedule(node, duration=duration)
+
+    def schedule(self) -> None:
+        """Order the collection by predicted duration and start sending."""
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.predictions = [self.predict(nodeid) for nodeid in self.collection]
+        long_tests = sorted(
+            (i for i in range(len(self.collection)) if self.is_long(i)),
+            key=lambda i: -self.predictions[i],
+        )
+        short_tests = [i for i in range(len(self.collection)) if not self.is_long(i)]
+        self.pending[:] = long_tests + short_tests
+        self.predicted_makespan = predicted_makespan(
+            [self.predictions[i] for i in self.pending], len(self.nodes)
+        )
+        if not self.collection:
+            return
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+
+        # Hand out the long tests round-robin, so that the longest tests
+        # start on different workers.
+        nodes = cycle(self.nodes)
+        for _ in range(2 * len(self.nodes)):
+            if not self.pending or not self.is_long(self.pending[0]):
+                break
+            self._send_tests(next(nodes), 1)
+        items_per_node = len(self.collection) // len(self.nodes)
+        node_chunksize = max(min(items_per_node // 4, self.maxschedchunk), 2)
+        for node in self.nodes:
+            node_pending = len(self.node2pending[node])
+            if node_pending < 2:
+                self._send_tests(node, node_chunksize - node_pending)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+
+class DurationSchedulingPlugin:
+    """
+    Pytest plugin class that records the fill durations and provides the
+    duration-aware xdist scheduler.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the plugin with the history of the pytest cache."""
+        self.config = config
+        assert config.cache is not None
+        self.history = DurationHistory(config.cache.get(DURATIONS_CACHE_KEY, {}))
+        self.scheduler: DurationScheduling | None = None
+        self.worker_durations: Dict[str, float] = {}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(
+        self, config: pytest.Config, log: Producer
+    ) -> DurationScheduling | None:
+        """Return the duration-aware scheduler for the load distribution."""
+        if not config.getoption("schedule_by_duration") or config.getoption("dist") != "load":
+            return None
+        self.scheduler = DurationScheduling(config, log, self.history.predict)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Record the duration of every phase of a test."""
+        self.history.record(report.nodeid, report.duration)
+        node = getattr(report, "node", None)
+        if node is not None:
+            worker_id = node.gateway.id
+            self.worker_durations[worker_id] = (
+                self.worker_durations.get(worker_id, 0.0) + report.duration
+            )
+
+    def pytest_sessionfinish(self) -> None:
+        """Store the recorded durations in the pytest cache."""
+        assert self.config.cache is not None
+        if self.history.recorded:
+            self.config.cache.set(DURATIONS_CACHE_KEY, self.history.merged())
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Report the predicted and the actual makespan of the session."""
+        scheduler = self.scheduler
+        if scheduler is None or scheduler.predicted_makespan is None or not scheduler.collection:
+            return
+        with_history = sum(
+            1 for nodeid in scheduler.collection if self.history.has_history(nodeid)
+        )
+        actual_makespan = max(self.worker_durations.values(), default=0.0)
+        terminalreporter.write_line(
+            f"Duration scheduling: predicted makespan {scheduler.predicted_makespan:.1f}s, "
+            f"actual {actual_makespan:.1f}s over {len(self.worker_durations)} workers "
+            f"(recorded durations for {with_history} of {len(scheduler.collection)} tests)."
+        )
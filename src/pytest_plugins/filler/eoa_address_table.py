@@ -0,0 +1,246 @@
+"""
+Memory-mapped table of the addresses of the EOAs of the tests filled in
+pre-allocation group mode.
+
+In pre-allocation group mode, the private keys of the EOAs of a test are
+`(start_key + i) % SECP256K1N`, where the start key is derived from the test's
+node id (the same for every fork and fixture format of the test). The table
+stores the addresses of the first `ADDRESSES_PER_START_KEY` keys of every
+start key, so that the public keys are derived once instead of for every
+fork, fixture format, phase and xdist worker.
+
+File layout: a header (magic, number of start keys, addresses per start key),
+the sorted 32-byte start keys, then the addresses of each start key.
+"""
+
+import mmap
+import os
+import random
+import struct
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Set
+
+from filelock import FileLock
+
+from ethereum_test_base_types import Address
+from ethereum_test_types import EOA
+
+SECP256K1N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+ADDRESSES_PER_START_KEY = 4
+"""Number of EOAs of each test stored in the table."""
+PARALLEL_DERIVATION_MIN_START_KEYS = 1_000
+"""Number of missing start keys from which addresses are derived in a pool."""
+SPOT_CHECKS = 8
+"""Number of addresses derived again to validate a table when it is opened."""
+
+MAGIC = b"EOAADDR1"
+HEADER = struct.Struct(">8sII")
+KEY_SIZE = 32
+ADDRESS_SIZE = 20
+
+
+def eoa_key(start_key: int, index: int) -> int:
+    """Return the private key of the EOA of a test at an index."""
+    return (start_key + index) % SECP256K1N
+
+
+def has_valid_keys(start_key: int) -> bool:
+    """
+    Return whether the first EOA keys of a start key are valid private keys,
+    i.e. none wraps around to zero. Other start keys are not stored.
+    """
+    return all(eoa_key(start_key, index) != 0 for index in range(ADDRESSES_PER_START_KEY))
+
+
+def derive_addresses(start_keys: List[int]) -> bytes:
+    """
+    Derive the addresses of the first EOAs of each start key, in a worker
+    process.
+    """
+    return b"".join(
+        EOA.address_of_key(eoa_key(start_key, index))
+        for start_key in start_keys
+        for index in range(ADDRESSES_PER_START_KEY)
+    )
+
+
+class StartKeys:
+    """Sorted start keys of a table, read from the memory-mapped file."""
+
+    def __init__(self, buffer: mmap.mmap, count: int):
+        """Initialize the view of the start keys."""
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self) -> int:
+        """Return the number of start keys."""
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        """Return the start key at an index."""
+        offset = HEADER.size + index * KEY_SIZE
+        return self.buffer[offset : offset + KEY_SIZE]
+
+
+class EOAAddressTable:
+    """Read-only table of the addresses of the first EOAs of start keys."""
+
+    def __init__(self, path: Path):
+        """
+        Map the table file into memory and validate it, raising `ValueError`
+        if it is invalid.
+        """
+        self.path = path
+        with path.open("rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.buffer) < HEADER.size:
+            raise ValueError(f"EOA address table {path} is truncated")
+        magic, count, addresses_per_start_key = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or addresses_per_start_key != ADDRESSES_PER_START_KEY:
+            raise ValueError(f"EOA address table {path} has an unsupported format")
+        self.start_keys = StartKeys(self.buffer, count)
+        self.addresses_offset = HEADER.size + count * KEY_SIZE
+        if len(self.buffer) != self.addresses_offset + count * (
+            ADDRESSES_PER_START_KEY * ADDRESS_SIZE
+        ):
+            raise ValueError(f"EOA address table {path} is truncated")
+        self.spot_check()
+
+    def __len__(self) -> int:
+        """Return the number of start keys in the table."""
+        return len(self.start_keys)
+
+    def __contains__(self, start_key: int) -> bool:
+        """Return whether the table contains the addresses of a start key."""
+        return self.row(start_key) is not None
+
+    def row(self, start_key: int) -> int | None:
+        """Return the row of a start key, if the table contains it."""
+        key = start_key.to_bytes(KEY_SIZE, "big")
+        row = bisect_left(self.start_keys, key)
+        if row < len(self.start_keys) and self.start_keys[row] == key:
+            return row
+        return None
+
+    def row_addresses(self, row: int) -> List[Address]:
+        """Return the addresses of the first EOAs of the start key at a row."""
+        offset = self.addresses_offset + row * ADDRESSES_PER_START_KEY * ADDRESS_SIZE
+        return [
+            Address(self.buffer[start : start + ADDRESS_SIZE])
+            for start in range(
+                offset, offset + ADDRESSES_PER_START_KEY * ADDRESS_SIZE, ADDRESS_SIZE
+            )
+        ]
+
+    def addresses(self, start_key: int) -> List[Address]:
+        """
+        Return the addresses of the first EOAs of a start key, or an empty
+        list if the table does not contain it.
+        """
+        row = self.row(start_key)
+        if row is None:
+            return []
+        return self.row_addresses(row)
+
+    def spot_check(self) -> None:
+        """Derive random addresses of the table again, raising on mismatch."""
+        for row in random.sample(range(len(self)), min(SPOT_CHECKS, len(self))):
+            start_key = int.from_bytes(self.start_keys[row], "big")
+            index = random.randrange(ADDRESSES_PER_START_KEY)
+            if self.row_addresses(row)[index] != EOA.address_of_key(eoa_key(start_key, index)):
+                raise ValueError(
+                    f"EOA address table {self.path} has a wrong address for start key "
+                    f"{start_key:#x} and index {index}"
+                )
+
+    def close(self) -> None:
+        """Unmap the table file."""
+        self.buffer.close()
+
+    @classmethod
+    def build(
+        cls,
+        path: Path,
+        start_keys: Iterable[int],
+        *,
+        previous: "EOAAddressTable | None" = None,
+        max_workers: int | None = None,
+    ) -> "EOAAddressTable":
+        """
+        Write the table of the start keys and of the start keys of the previous
+        table to the file and return it.
+
+        Only the addresses of the start keys missing from the previous table
+        are derived, in a process pool if at least
+        `PARALLEL_DERIVATION_MIN_START_KEYS` are missing.
+        """
+        all_start_keys: Set[int] = set(filter(has_valid_keys, start_keys))
+        if previous is not None:
+            all_start_keys.update(
+                int.from_bytes(previous.start_keys[row], "big") for row in range(len(previous))
+            )
+        missing = sorted(
+            start_key
+            for start_key in all_start_keys
+            if previous is None or start_key not in previous
+        )
+        if len(missing) < PARALLEL_DERIVATION_MIN_START_KEYS:
+            derived = derive_addresses(missing)
+        else:
+            if max_workers is None:
+                max_workers = os.cpu_count() or 1
+            chunk_size = -(-len(missing) // max_workers)
+            chunks = [missing[i : i + chunk_size] for i in range(0, len(missing), chunk_size)]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                derived = b"".join(executor.map(derive_addresses, chunks))
+
+        row_size = ADDRESSES_PER_START_KEY * ADDRESS_SIZE
+        derived_rows = {
+            start_key: derived[i * row_size : (i + 1) * row_size]
+            for i, start_key in enumerate(missing)
+        }
+        sorted_start_keys = sorted(all_start_keys)
+        rows: List[bytes] = []
+        for start_key in sorted_start_keys:
+            row = derived_rows.get(start_key)
+            if row is None:
+                assert previous is not None
+                row = b"".join(previous.addresses(start_key))
+            rows.append(row)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temporary_path.open("wb") as f:
+            f.write(HEADER.pack(MAGIC, len(sorted_start_keys), ADDRESSES_PER_START_KEY))
+            f.write(
+                b"".join(start_key.to_bytes(KEY_SIZE, "big") for start_key in sorted_start_keys)
+            )
+            f.write(b"".join(rows))
+        os.replace(temporary_path, path)
+        return cls(path)
+
+    @classmethod
+    def load_or_build(cls, path: Path, start_keys: Iterable[int]) -> "EOAAddressTable":
+        """
+        Return the table of the file, extended with the missing start keys.
+
+        The file is built once by the first of the processes (e.g. xdist
+        workers) that need it; the other processes map the built file. An
+        invalid file is built again.
+        """
+        start_keys = set(filter(has_valid_keys, start_keys))
+        with FileLock(path.with_suffix(".lock")):
+            table: EOAAddressTable | None = None
+            if path.is_file():
+                try:
+                    table = cls(path)
+                except ValueError:
+                    table = None
+            if table is not None and all(start_key in table for start_key in start_keys):
+                return table
+            new_table = cls.build(path, start_keys, previous=table)
+            if table is not None:
+                table.close()
+            return new_table
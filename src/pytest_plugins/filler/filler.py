@@ -740,19 +740,7 @@ def pytest_configure(config: pytest.Config) -> None:
     # Instantiate the transition tool here to check that the binary path/trace
     # option is valid. This ensures we only raise an error once, if
     # appropriate, instead of for every test.
-    evm_bin = config.getoption("evm_bin")
-    trace = config.getoption("evm_collect_traces")
-    t8n_server_url = config.getoption("t8n_server_url")
-    kwargs = {
-        "trace": trace,
-    }
-    if t8n_server_url is not None:
-        kwargs["server_url"] = t8n_server_url
-    if evm_bin is None:
-        assert TransitionTool.default_tool is not None, "No default transition tool found"
-        t8n = TransitionTool.default_tool(**kwargs)
-    else:
-        t8n = TransitionTool.from_binary_path(binary_path=evm_bin, **kwargs)
+    t8n = create_transition_tool(config)
 
     if (
         isinstance(config.getoption("numprocesses"), int)
@@ -781,6 +769,22 @@ def pytest_configure(config: pytest.Config) -> None:
     config.stash[metadata_key]["Command-line args"] = f"<code>{command_line_args}</code>"
 
 
+def create_transition_tool(config: pytest.Config) -> TransitionTool:
+    """Instantiate the transition tool defined by the command-line options."""
+    evm_bin = config.getoption("evm_bin")
+    trace = config.getoption("evm_collect_traces")
+    t8n_server_url = config.getoption("t8n_server_url")
+    kwargs = {
+        "trace": trace,
+    }
+    if t8n_server_url is not None:
+        kwargs["server_url"] = t8n_server_url
+    if evm_bin is None:
+        assert TransitionTool.default_tool is not None, "No default transition tool found"
+        return TransitionTool.default_tool(**kwargs)
+    return TransitionTool.from_binary_path(binary_path=evm_bin, **kwargs)
+
+
 @pytest.hookimpl(trylast=True)
 def pytest_report_header(config: pytest.Config) -> List[str]:
     """Add lines to pytest's console output header."""
@@ -1326,7 +1330,21 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                 session: FillingSession = request.config.filling_session  # type: ignore
 
                 # Phase 1: Generate pre-allocation groups
+                incremental_fill = getattr(request.config, "incremental_fill", None)
                 if session.phase_manager.is_pre_alloc_generation:
+                    if incremental_fill is not None:
+                        # Record the contribution of the test, the groups are
+                        # rebuilt from all contributions at the end of the
+                        # session (--incremental)
+                        incremental_fill.add_pre_alloc(
+                            request.node,
+                            fork,
+                            fixture_format,
+                            pre_alloc_hash=self.compute_pre_alloc_group_hash(fork=fork),
+                            environment=self.get_genesis_environment(fork),
+                            pre=self.pre,  # type: ignore[has-type]
+                        )
+                        return
                     # Use the original update_pre_alloc_groups method which
                     # returns the groups
                     self.update_pre_alloc_groups(
@@ -1334,62 +1352,69 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                     )
                     return  # Skip fixture generation in phase 1
 
-                # Phase 2: Use pre-allocation groups (only for
-                # BlockchainEngineXFixture)
-                pre_alloc_hash = None
-                if FixtureFillingPhase.PRE_ALLOC_GENERATION in fixture_format.format_phases:
-                    pre_alloc_hash = self.compute_pre_alloc_group_hash(fork=fork)
-                    group = session.get_pre_alloc_group(pre_alloc_hash)
-                    self.pre = group.pre
-                try:
-                    fixture = self.generate(
-                        t8n=t8n,
-                        fork=fork,
-                        fixture_format=fixture_format,
-                    )
-                finally:
-                    if (
-                        request.config.op_mode  # type: ignore[attr-defined]
-                        == OpMode.OPTIMIZE_GAS
-                        or request.config.op_mode  # type: ignore[attr-defined]
-                        == OpMode.OPTIMIZE_GAS_POST_PROCESSING
-                    ):
-                        gas_optimized_tests = (
-                            request.config.gas_optimized_tests  # type: ignore
-                        )
-                        assert gas_optimized_tests is not None
-                        # Force adding something to the list, even if it's
-                        # None, to keep track of failed tests in the output
-                        # file.
-                        gas_optimized_tests[request.node.nodeid] = self._gas_optimization
-
-                # Post-process for Engine X format (add pre_hash and state
-                # diff)
-                if (
-                    FixtureFillingPhase.PRE_ALLOC_GENERATION in fixture_format.format_phases
-                    and pre_alloc_hash is not None
-                ):
-                    fixture.pre_hash = pre_alloc_hash
-
-                    # Calculate state diff for efficiency
-                    if hasattr(fixture, "post_state") and fixture.post_state is not None:
+                # Reuse the fixture of the previous session if none of the
+                # test's inputs changed (--incremental)
+                fixture = None
+                if incremental_fill is not None:
+                    fixture = incremental_fill.load_fixture(request.node, fork, fixture_format)
+
+                if fixture is None:
+                    # Phase 2: Use pre-allocation groups (only for
+                    # BlockchainEngineXFixture)
+                    pre_alloc_hash = None
+                    if FixtureFillingPhase.PRE_ALLOC_GENERATION in fixture_format.format_phases:
+                        pre_alloc_hash = self.compute_pre_alloc_group_hash(fork=fork)
                         group = session.get_pre_alloc_group(pre_alloc_hash)
-                        fixture.post_state_diff = calculate_post_state_diff(
-                            fixture.post_state, group.pre
+                        self.pre = group.pre
+                    try:
+                        fixture = self.generate(
+                            t8n=t8n,
+                            fork=fork,
+                            fixture_format=fixture_format,
                         )
+                    finally:
+                        if (
+                            request.config.op_mode  # type: ignore[attr-defined]
+                            == OpMode.OPTIMIZE_GAS
+                            or request.config.op_mode  # type: ignore[attr-defined]
+                            == OpMode.OPTIMIZE_GAS_POST_PROCESSING
+                        ):
+                            gas_optimized_tests = (
+                                request.config.gas_optimized_tests  # type: ignore
+                            )
+                            assert gas_optimized_tests is not None
+                            # Force adding something to the list, even if it's
+                            # None, to keep track of failed tests in the output
+                            # file.
+                            gas_optimized_tests[request.node.nodeid] = self._gas_optimization
+
+                    # Post-process for Engine X format (add pre_hash and state
+                    # diff)
+                    if (
+                        FixtureFillingPhase.PRE_ALLOC_GENERATION in fixture_format.format_phases
+                        and pre_alloc_hash is not None
+                    ):
+                        fixture.pre_hash = pre_alloc_hash
+
+                        # Calculate state diff for efficiency
+                        if hasattr(fixture, "post_state") and fixture.post_state is not None:
+                            group = session.get_pre_alloc_group(pre_alloc_hash)
+                            fixture.post_state_diff = calculate_post_state_diff(
+                                fixture.post_state, group.pre
+                            )
+
+                    fixture.fill_info(
+                        t8n.version(),
+                        test_case_description,
+                        fixture_source_url=fixture_source_url,
+                        ref_spec=reference_spec,
+                        _info_metadata=t8n._info_metadata,
+                    )
 
-                fixture.fill_info(
-                    t8n.version(),
-                    test_case_description,
-                    fixture_source_url=fixture_source_url,
-                    ref_spec=reference_spec,
-                    _info_metadata=t8n._info_metadata,
-                )
-
-                # Generate witness data if witness functionality is enabled via
-                # the witness plugin
-                if witness_generator is not None:
-                    witness_generator(fixture)
+                    # Generate witness data if witness functionality is enabled
+                    # via the witness plugin
+                    if witness_generator is not None:
+                        witness_generator(fixture)
 
                 fixture_path = fixture_collector.add_fixture(
                     node_to_test_info(request.node),
@@ -1402,6 +1427,10 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                     fixture_path.relative_to(output_dir)
                 )
                 request.node.config.fixture_format = fixture_format.format_name
+                if incremental_fill is not None:
+                    incremental_fill.add_fixture(
+                        request.node, fork, fixture_format, fixture_path.relative_to(output_dir)
+                    )
 
         return BaseTestWrapper
 
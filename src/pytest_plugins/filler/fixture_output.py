@@ -37,6 +37,10 @@ class FixtureOutput(BaseModel):
         default=False,
         description="Generate all fixture formats including BlockchainEngineXFixture.",
     )
+    incremental: bool = Field(
+        default=False,
+        description="Reuse the unchanged fixtures of the previous output directory.",
+    )
 
     @property
     def directory(self) -> Path:
@@ -50,6 +54,14 @@ class FixtureOutput(BaseModel):
             return self.directory
         return self.directory / ".meta"
 
+    @property
+    def previous_directory(self) -> Path:
+        """
+        Return the directory the previous fixtures are moved to in incremental
+        mode.
+        """
+        return self.directory.with_name(f"{self.directory.name}.previous")
+
     @property
     def is_tarball(self) -> bool:
         """Return True if the output should be packaged as a tarball."""
@@ -152,8 +164,11 @@ class FixtureOutput(BaseModel):
         """
         Create output and metadata directories if needed.
 
-        If clean flag is set, remove and recreate the directory. Otherwise,
-        verify the directory is empty before proceeding.
+        If clean flag is set, remove and recreate the directory. In
+        incremental mode, move the previous fixtures out of the way (unless
+        using the pre-allocation groups of phase 1), or discard the output of
+        an incomplete incremental session if they were not removed.
+        Otherwise, verify the directory is empty before proceeding.
         """
         if self.is_stdout:
             return
@@ -166,6 +181,15 @@ class FixtureOutput(BaseModel):
         if self.directory.exists() and self.clean:
             shutil.rmtree(self.directory)
 
+        if self.incremental and not self.use_pre_alloc_groups:
+            if self.previous_directory.exists():
+                # The last incremental session did not complete: resume from
+                # the fixtures of the session before it.
+                if self.directory.exists():
+                    shutil.rmtree(self.directory)
+            elif not self.is_directory_empty():
+                self.directory.rename(self.previous_directory)
+
         if self.directory.exists() and not self.is_directory_usable_for_phase():
             summary = self.get_directory_summary()
 
@@ -226,4 +250,5 @@ class FixtureOutput(BaseModel):
             generate_pre_alloc_groups=config.getoption("generate_pre_alloc_groups"),
             use_pre_alloc_groups=config.getoption("use_pre_alloc_groups"),
             should_generate_all_formats=should_generate_all_formats,
+            incremental=config.getoption("incremental"),
         )
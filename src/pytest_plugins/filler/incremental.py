@@ -0,0 +1,617 @@
+"""
+Pytest plugin that reuses the fixtures of the previous fill session for the
+tests whose inputs did not change.
+
+For every filled fixture, a fingerprint of its inputs is recorded in the
+metadata directory of the output:
+
+- The content of the test file, of the conftest files that apply to it, of
+  all the modules it imports from the repository and of the data files next
+  to it.
+- The code of the fill plugins and of the framework modules they import.
+- The fork, the fixture format and the test id.
+- The transition tool and its version, and the command-line options that
+  change the generated fixtures.
+
+With `--incremental`, the previous output directory is moved aside and every
+test whose fingerprint matches copies its fixture from there instead of
+running the transition tool. The index and tarball are generated as usual.
+
+In phase 1 (`--generate-pre-alloc-groups`), the contribution of every test to
+the pre-allocation groups is recorded instead, and only the tests whose
+fingerprint changed are run. The groups are then rebuilt from the recorded
+contributions in collection order, so that they are identical to the groups
+of a session that runs every test.
+"""
+
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Set, Tuple, Type
+
+import pytest
+import xdist
+from _pytest.terminal import TerminalReporter
+from filelock import FileLock
+
+from ethereum_clis import TransitionTool
+from ethereum_test_fixtures import BaseFixture, FixtureFillingPhase, PreAllocGroups
+from ethereum_test_forks import Fork, ForkAdapter
+from ethereum_test_types import Alloc, Environment
+
+from ..shared.helpers import is_help_or_collectonly_mode, item_fork_and_format
+from .collection_cache import SRC_DIR, SourceFiles
+from .filler import create_transition_tool
+
+INCREMENTAL_VERSION = 1
+FINGERPRINTS_FILE_NAME = "fingerprints.jsonl"
+"""File of the metadata directory with the fingerprint of every fixture."""
+PRE_ALLOC_CONTRIBUTIONS_FILE_NAME = "pre_alloc_contributions.jsonl"
+"""
+File of the metadata directory with the contribution of every test to the
+pre-allocation groups.
+"""
+FINGERPRINT_OPTIONS = [
+    "block_gas_limit",
+    "evm_code_type",
+    "fill_static_tests_enabled",
+    "filler_path",
+    "gas_benchmark_value",
+    "single_fixture_per_file",
+    "solc_bin",
+    "strict_alloc",
+    "test_contract_address_increments",
+    "test_contract_start_address",
+    "witness",
+]
+"""Command-line options that change the generated fixtures."""
+CONTEXT_CHANGE_REASONS = {
+    "version": "fingerprint version changed",
+    "python": "Python version changed",
+    "t8n": "transition tool changed",
+    "framework": "framework code changed",
+    "options": "command-line options changed",
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command-line options to pytest."""
+    incremental_group = parser.getgroup("incremental", "Arguments defining incremental filling")
+    incremental_group.addoption(
+        "--incremental",
+        action="store_true",
+        dest="incremental",
+        default=False,
+        help=(
+            "Reuse the fixtures of the previous session in the output directory for the tests "
+            "whose inputs did not change, instead of filling them again."
+        ),
+    )
+    incremental_group.addoption(
+        "--incremental-dry-run",
+        action="store_true",
+        dest="incremental_dry_run",
+        default=False,
+        help=(
+            "List the tests that an incremental fill would fill again, and why, without "
+            "filling any test. Implies --collect-only."
+        ),
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config: pytest.Config) -> None:
+    """Only collect the tests when listing the tests to fill again."""
+    if config.getoption("incremental_dry_run"):
+        config.option.collectonly = True
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Load the fingerprints of the previous session if requested."""
+    dry_run = config.getoption("incremental_dry_run")
+    if not (config.getoption("incremental") or dry_run):
+        return
+    if not dry_run and is_help_or_collectonly_mode(config):
+        return
+    fixture_output = config.fixture_output  # type: ignore[attr-defined]
+    if fixture_output.is_stdout:
+        pytest.exit(
+            "Incremental filling requires an output directory.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    if config.getoption("optimize_gas", False):
+        pytest.exit(
+            "Incremental filling can't be combined with --optimize-gas.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    if config.filling_session.phase_manager.is_pre_alloc_generation:  # type: ignore
+        if dry_run:
+            return
+        incremental_pre_alloc = IncrementalPreAllocGeneration(
+            rootdir=config.rootpath,
+            context=incremental_context(config, None),
+            previous_directory=fixture_output.previous_directory,
+            fingerprints_path=fixture_output.metadata_dir / PRE_ALLOC_CONTRIBUTIONS_FILE_NAME,
+        )
+        if not hasattr(config, "workerinput"):
+            incremental_pre_alloc.write_context()
+        config.incremental_fill = incremental_pre_alloc  # type: ignore[attr-defined]
+        config.pluginmanager.register(IncrementalPreAllocPlugin(config), "incremental-fill")
+        return
+
+    t8n: TransitionTool = create_transition_tool(config) if dry_run else config.t8n  # type: ignore
+    incremental_fill = IncrementalFill(
+        rootdir=config.rootpath,
+        context=incremental_context(config, t8n),
+        previous_directory=(
+            fixture_output.directory if dry_run else fixture_output.previous_directory
+        ),
+        fingerprints_path=fixture_output.metadata_dir / FINGERPRINTS_FILE_NAME,
+    )
+    if not dry_run and not hasattr(config, "workerinput"):
+        incremental_fill.write_context()
+    config.incremental_fill = incremental_fill  # type: ignore[attr-defined]
+    config.pluginmanager.register(IncrementalFillPlugin(config, dry_run), "incremental-fill")
+
+
+def incremental_context(config: pytest.Config, t8n: TransitionTool | None) -> Dict[str, Any]:
+    """
+    Return the inputs of the session that apply to all fixtures, except for
+    the framework code.
+
+    The pre-allocation groups of phase 1 don't depend on the transition tool.
+    """
+    context: Dict[str, Any] = {
+        "version": INCREMENTAL_VERSION,
+        "python": list(sys.version_info[:2]),
+        "options": {option: str(config.getoption(option, None)) for option in FINGERPRINT_OPTIONS},
+    }
+    if t8n is not None:
+        context["t8n"] = f"{t8n.__class__.__name__} {t8n.version()}"
+    return context
+
+
+def framework_modules() -> List[Path]:
+    """Return the modules of the plugins used to fill the tests."""
+    return [
+        path
+        for path in sorted((SRC_DIR / "pytest_plugins").rglob("*.py"))
+        if "tests" not in path.relative_to(SRC_DIR).parts
+    ]
+
+
+class IncrementalFill(SourceFiles):
+    """
+    Fingerprints of the fixtures of the previous and the current session.
+
+    The fingerprints are appended, one JSON object per line, to a file in
+    the metadata directory, so that the xdist workers can record them
+    concurrently. The first line holds the inputs that apply to all fixtures.
+    """
+
+    context: Dict[str, Any]
+    context_digest: str
+    framework_files: Set[Path]
+    previous_directory: Path
+    previous_context: Dict[str, Any] | None
+    previous_fingerprints: Dict[str, Dict[str, Any]]
+    fingerprints_path: Path
+    sources: Dict[Path, str]
+    data_files: Dict[Path, Set[Path]]
+    fixture_file: Tuple[Path, Dict[str, Any]] | None
+    pending: Dict[str, Dict[str, Any]]
+    reused: Set[str]
+
+    def __init__(
+        self,
+        *,
+        rootdir: Path,
+        context: Dict[str, Any],
+        previous_directory: Path,
+        fingerprints_path: Path,
+    ):
+        """Initialize the fingerprints and load the previous ones."""
+        super().__init__(rootdir)
+        self.framework_files = self.import_closure(framework_modules())
+        self.context = context | {"framework": self.files_digest(self.framework_files)}
+        self.context_digest = hashlib.sha256(
+            json.dumps(self.context, sort_keys=True).encode()
+        ).hexdigest()
+        self.previous_directory = previous_directory
+        self.fingerprints_path = fingerprints_path
+        self.sources = {}
+        self.data_files = {}
+        self.fixture_file = None
+        self.pending = {}
+        self.reused = set()
+        self.previous_context = None
+        self.previous_fingerprints = {}
+        self.load_previous()
+
+    def load_previous(self) -> None:
+        """Load the fingerprints recorded by the previous session."""
+        previous_path = self.previous_directory / ".meta" / self.fingerprints_path.name
+        if not previous_path.exists():
+            return
+        with open(previous_path) as f:
+            for line in f:
+                record = json.loads(line)
+                if "context" in record:
+                    self.previous_context = record["context"]
+                else:
+                    self.previous_fingerprints[record["id"]] = record
+
+    def write_context(self) -> None:
+        """Start the fingerprints file of the current session."""
+        self.fingerprints_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fingerprints_path.write_text(json.dumps({"context": self.context}) + "\n")
+
+    def data_files_of(self, directory: Path) -> Set[Path]:
+        """Return the files other than Python modules below a directory."""
+        if directory not in self.data_files:
+            self.data_files[directory] = {
+                path
+                for path in directory.rglob("*")
+                if path.is_file() and path.suffix not in {".py", ".pyc"}
+            }
+        return self.data_files[directory]
+
+    def sources_digest(self, path: Path) -> str:
+        """Return the hash of the sources of a test file."""
+        if path not in self.sources:
+            files = self.import_closure(
+                [path, *self.conftest_files(path)], known=self.framework_files
+            )
+            if path.suffix == ".py":
+                files |= self.data_files_of(path.parent)
+            self.sources[path] = self.files_digest(files)
+        return self.sources[path]
+
+    def fingerprint(self, item: pytest.Item, fork: Fork, fixture_format: Type[BaseFixture]) -> str:
+        """Return the fingerprint of the inputs of a fixture."""
+        return hashlib.sha256(
+            ":".join(
+                [
+                    self.context_digest,
+                    self.sources_digest(item.path),
+                    item.nodeid,
+                    fork.name(),
+                    fixture_format.format_name,
+                ]
+            ).encode()
+        ).hexdigest()
+
+    def refill_reason(
+        self, item: pytest.Item, fork: Fork, fixture_format: Type[BaseFixture]
+    ) -> str | None:
+        """
+        Return why the fixture of a test must be filled again, or None if the
+        fixture of the previous session can be reused.
+        """
+        if FixtureFillingPhase.PRE_ALLOC_GENERATION in fixture_format.format_phases:
+            return "fixture depends on its pre-allocation group"
+        previous = self.previous_fingerprints.get(item.nodeid)
+        if previous is None:
+            return "no previous fixture"
+        if reason := self.changed_inputs(item, fork, fixture_format, previous):
+            return reason
+        if not (self.previous_directory / previous["path"]).exists():
+            return "previous fixture file missing"
+        return None
+
+    def changed_inputs(
+        self,
+        item: pytest.Item,
+        fork: Fork,
+        fixture_format: Type[BaseFixture],
+        previous: Dict[str, Any],
+    ) -> str | None:
+        """
+        Return which inputs of a test changed since the previous session, or
+        None if its fingerprint matches the previous one.
+        """
+        if previous["fingerprint"] == self.fingerprint(item, fork, fixture_format):
+            return None
+        assert self.previous_context is not None
+        changed = [
+            reason
+            for key, reason in CONTEXT_CHANGE_REASONS.items()
+            if self.previous_context.get(key) != self.context.get(key)
+        ]
+        if changed:
+            return ", ".join(changed)
+        if previous["sources"] != self.sources_digest(item.path):
+            return "test sources changed"
+        return "fingerprint changed"
+
+    def load_fixture(
+        self, item: pytest.Item, fork: Fork, fixture_format: Type[BaseFixture]
+    ) -> BaseFixture | None:
+        """Return the fixture of the previous session if it can be reused."""
+        if self.refill_reason(item, fork, fixture_format) is not None:
+            return None
+        path = self.previous_directory / self.previous_fingerprints[item.nodeid]["path"]
+        # The tests of a module run consecutively, keep their file loaded.
+        if self.fixture_file is None or self.fixture_file[0] != path:
+            with open(path) as f:
+                self.fixture_file = (path, json.load(f))
+        fixture_json = self.fixture_file[1].get(item.nodeid)
+        if fixture_json is None:
+            return None
+        self.reused.add(item.nodeid)
+        return fixture_format.model_validate(fixture_json)
+
+    def add_fixture(
+        self,
+        item: pytest.Item,
+        fork: Fork,
+        fixture_format: Type[BaseFixture],
+        fixture_path: Path,
+    ) -> None:
+        """Hold the fingerprint of a fixture until its test passes."""
+        self.pending[item.nodeid] = {
+            "id": item.nodeid,
+            "fingerprint": self.fingerprint(item, fork, fixture_format),
+            "sources": self.sources_digest(item.path),
+            "path": str(fixture_path),
+        }
+
+    def record(self, nodeid: str) -> bool | None:
+        """
+        Record the fingerprint of the fixture of a passed test, and return
+        whether the fixture was reused, or None if the test has no fixture.
+        """
+        fingerprint = self.pending.pop(nodeid, None)
+        if fingerprint is None:
+            return None
+        with FileLock(self.fingerprints_path.with_suffix(".lock")):
+            with open(self.fingerprints_path, "a") as f:
+                f.write(json.dumps(fingerprint) + "\n")
+        return nodeid in self.reused
+
+
+class IncrementalPreAllocGeneration(IncrementalFill):
+    """
+    Contributions of the tests to the pre-allocation groups of the previous
+    and the current phase 1 session.
+
+    Besides the fingerprint of a test, its record holds the index of the test
+    in the collection and, for every spec it filled, the group hash, the
+    genesis environment and the pre-allocation.
+    """
+
+    order: Dict[str, int]
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the contributions and load the previous ones."""
+        super().__init__(**kwargs)
+        self.order = {}
+
+    def refill_reason(
+        self, item: pytest.Item, fork: Fork, fixture_format: Type[BaseFixture]
+    ) -> str | None:
+        """
+        Return why the contribution of a test must be computed again, or None
+        if the contribution of the previous session can be reused.
+        """
+        previous = self.previous_fingerprints.get(item.nodeid)
+        if previous is None:
+            return "no previous pre-allocation"
+        return self.changed_inputs(item, fork, fixture_format, previous)
+
+    def reuse(self, nodeids: List[str]) -> None:
+        """Record the previous contributions of the unchanged tests."""
+        with FileLock(self.fingerprints_path.with_suffix(".lock")):
+            with open(self.fingerprints_path, "a") as f:
+                for nodeid in nodeids:
+                    record = self.previous_fingerprints[nodeid] | {"index": self.order[nodeid]}
+                    f.write(json.dumps(record) + "\n")
+
+    def add_pre_alloc(
+        self,
+        item: pytest.Item,
+        fork: Fork,
+        fixture_format: Type[BaseFixture],
+        *,
+        pre_alloc_hash: str,
+        environment: Environment,
+        pre: Alloc,
+    ) -> None:
+        """Hold the contribution of a test until it passes."""
+        if item.nodeid not in self.pending:
+            self.pending[item.nodeid] = {
+                "id": item.nodeid,
+                "index": self.order[item.nodeid],
+                "fingerprint": self.fingerprint(item, fork, fixture_format),
+                "sources": self.sources_digest(item.path),
+                "contributions": [],
+            }
+        self.pending[item.nodeid]["contributions"].append(
+            {
+                "hash": pre_alloc_hash,
+                "fork": fork.name(),
+                "environment": environment.model_dump(mode="json", by_alias=True),
+                # Merging accounts only overwrites the fields that are set.
+                "pre": pre.model_dump(mode="json", exclude_unset=True),
+            }
+        )
+
+    def pre_alloc_groups(self) -> Tuple[PreAllocGroups, int]:
+        """
+        Return the pre-allocation groups built from the contributions of the
+        current session, and the number of tests that contributed.
+        """
+        with open(self.fingerprints_path) as f:
+            records = [json.loads(line) for line in f]
+        records = sorted(
+            (record for record in records if "context" not in record),
+            key=lambda record: record["index"],
+        )
+        pre_alloc_groups = PreAllocGroups(root={})
+        for record in records:
+            for contribution in record["contributions"]:
+                pre_alloc_groups.add_test(
+                    contribution["hash"],
+                    test_id=record["id"],
+                    fork=ForkAdapter.validate_python(contribution["fork"]),
+                    environment=Environment.model_validate(contribution["environment"]),
+                    pre=Alloc.model_validate(contribution["pre"]),
+                )
+        return pre_alloc_groups, len(records)
+
+
+class IncrementalFillPlugin:
+    """Pytest plugin class that records fingerprints and reports reuse."""
+
+    def __init__(self, config: pytest.Config, dry_run: bool) -> None:
+        """Initialize the plugin with the given pytest config."""
+        self.config = config
+        self.dry_run = dry_run
+        self.incremental_fill: IncrementalFill = config.incremental_fill  # type: ignore
+        self.refills: List[Tuple[str, str]] = []
+        self.collected = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: List[pytest.Item]) -> None:
+        """Determine the tests that must be filled again in dry-run mode."""
+        if not self.dry_run:
+            return
+        for item in items:
+            fork_and_format = item_fork_and_format(item)
+            if fork_and_format is None:
+                continue
+            self.collected += 1
+            reason = self.incremental_fill.refill_reason(item, *fork_and_format)
+            if reason is not None:
+                self.refills.append((item.nodeid, reason))
+
+    def pytest_report_collectionfinish(self, config: pytest.Config) -> List[str]:
+        """List the tests that must be filled again in dry-run mode."""
+        del config
+        if not self.dry_run:
+            return []
+        lines = ["Tests to fill again:"] if self.refills else []
+        lines += [f"  {nodeid}: {reason}" for nodeid, reason in self.refills]
+        lines.append(
+            f"Incremental fill dry run: {len(self.refills)} of {self.collected} tests would be "
+            "filled again."
+        )
+        return lines
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(
+        self, item: pytest.Item, call: Any
+    ) -> Generator[None, None, None]:
+        """Record the fingerprint of the fixture of every passed test."""
+        outcome = yield
+        report = outcome.get_result()  # type: ignore[attr-defined]
+        if call.when != "call":
+            return
+        if not report.passed:
+            self.incremental_fill.pending.pop(item.nodeid, None)
+            return
+        reused = self.incremental_fill.record(item.nodeid)
+        if reused is not None:
+            report.user_properties.append(("incremental_reused", reused))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Report how many fixtures were reused from the previous session."""
+        if self.dry_run or hasattr(self.config, "workerinput"):
+            return
+        reused = [
+            dict(report.user_properties).get("incremental_reused")
+            for report in terminalreporter.stats.get("passed", [])
+        ]
+        total = sum(1 for r in reused if r is not None)
+        terminalreporter.write_line(
+            f"Incremental fill: {sum(1 for r in reused if r)} of {total} fixtures reused from "
+            "the previous session."
+        )
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """
+        Remove the fixtures of the previous session, unless the session did not
+        complete and the next one must still be able to reuse them.
+        """
+        if self.dry_run or xdist.is_xdist_worker(session):
+            return
+        if session.exitstatus != pytest.ExitCode.OK:
+            return
+        shutil.rmtree(self.incremental_fill.previous_directory, ignore_errors=True)
+
+
+class IncrementalPreAllocPlugin(IncrementalFillPlugin):
+    """
+    Pytest plugin class that only runs the tests whose contribution to the
+    pre-allocation groups may have changed, and rebuilds the groups.
+    """
+
+    incremental_fill: IncrementalPreAllocGeneration
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the plugin with the given pytest config."""
+        super().__init__(config, dry_run=False)
+        self.contributed = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: List[pytest.Item]) -> None:
+        """Deselect the tests whose previous contribution can be reused."""
+        self.incremental_fill.order = {item.nodeid: i for i, item in enumerate(items)}
+        selected: List[pytest.Item] = []
+        reused: List[pytest.Item] = []
+        for item in items:
+            fork_and_format = item_fork_and_format(item)
+            if (
+                fork_and_format is not None
+                and self.incremental_fill.refill_reason(item, *fork_and_format) is None
+            ):
+                reused.append(item)
+            else:
+                selected.append(item)
+        if not reused:
+            return
+        # All workers deselect the same tests, only one records them.
+        if xdist.get_xdist_worker_id(items[0].session) in ("master", "gw0"):
+            self.incremental_fill.reuse([item.nodeid for item in reused])
+        self.config.hook.pytest_deselected(items=reused)
+        items[:] = selected
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """
+        Rebuild the pre-allocation groups before the filling session saves
+        them.
+
+        The fixtures of the previous session are kept for phase 2
+        (`--use-pre-alloc-groups --incremental`), which reuses them and
+        removes them once it completes.
+        """
+        if xdist.is_xdist_worker(session):
+            return
+        filling_session = self.config.filling_session  # type: ignore[attr-defined]
+        filling_session.pre_alloc_groups, self.contributed = (
+            self.incremental_fill.pre_alloc_groups()
+        )
+        if session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED and self.contributed:
+            # Every test was deselected because its contribution was reused.
+            session.exitstatus = pytest.ExitCode.OK
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Report how many contributions were reused from the last session."""
+        if hasattr(self.config, "workerinput"):
+            return
+        recomputed = sum(
+            1
+            for report in terminalreporter.stats.get("passed", [])
+            if "incremental_reused" in dict(report.user_properties)
+        )
+        terminalreporter.write_line(
+            f"Incremental pre-allocation: {self.contributed - recomputed} of "
+            f"{self.contributed} tests reused from the previous session, {recomputed} "
+            "recomputed."
+        )
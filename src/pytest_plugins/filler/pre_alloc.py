@@ -5,7 +5,7 @@ from enum import IntEnum
 from functools import cache
 from hashlib import sha256
 from itertools import count
-from typing import Any, Iterator, List, Literal
+from typing import Any, Iterator, List, Literal, Set
 
 import pytest
 from pydantic import PrivateAttr
@@ -33,6 +33,9 @@ from ethereum_test_types import Alloc as BaseAlloc
 from ethereum_test_types.eof.v1 import Container
 from ethereum_test_vm import Bytecode, EVMCodeType, Opcodes
 
+from ..shared.helpers import item_fork_and_format
+from .eoa_address_table import EOAAddressTable, eoa_key
+
 CONTRACT_START_ADDRESS_DEFAULT = 0x1000000000000000000000000000000000001000
 CONTRACT_ADDRESS_INCREMENTS_DEFAULT = 0x100
 
@@ -79,6 +82,35 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """
+    Map the table of the addresses of the first EOAs of the collected tests
+    when filling for pre-allocation groups, building the missing entries.
+    """
+    config = session.config
+    if not (
+        config.getoption("generate_pre_alloc_groups", default=False)
+        or config.getoption("use_pre_alloc_groups", default=False)
+    ) or not hasattr(config, "cache"):
+        return
+    start_keys: Set[int] = set()
+    for item in session.items:
+        fork_and_format = item_fork_and_format(item)
+        if fork_and_format is None:
+            continue
+        fork, _ = fork_and_format
+        try:
+            start_keys.add(sha256_from_string(strip_node_id_for_entropy(item.nodeid, fork)))
+        except FixtureFormatNotInNodeIdError:
+            continue
+    if not start_keys:
+        return
+    path = config.cache.mkdir("fill-eoa-address-table") / "eoa_addresses.bin"
+    config.eoa_address_table = EOAAddressTable.load_or_build(  # type: ignore[attr-defined]
+        path, start_keys
+    )
+
+
 class AllocMode(IntEnum):
     """Allocation mode for the state."""
 
@@ -355,22 +387,30 @@ def node_id_for_entropy(request: pytest.FixtureRequest, fork: Fork | None) -> st
     hashing results in the contracts and senders addresses being the same
     across fixture types and forks for the same test.
     """
-    node_id: str = request.node.nodeid
     if fork is None:
         # FIXME: Static tests don't have a fork, so we need to get it from the
         # node.
         assert hasattr(request.node, "fork")
         fork = request.node.fork
+    return strip_node_id_for_entropy(request.node.nodeid, fork)
+
+
+class FixtureFormatNotInNodeIdError(Exception):
+    """The node id of a test does not contain the name of a fixture format."""
+
+
+def strip_node_id_for_entropy(node_id: str, fork: Fork) -> str:
+    """Return the node id without the fixture format name and the fork name."""
     for fixture_format_name in ALL_FIXTURE_FORMAT_NAMES:
         if fixture_format_name in node_id:
-            parts = request.node.nodeid.split("::")
+            parts = node_id.split("::")
             test_file_path = parts[0]
             test_name = "::".join(parts[1:])
             stripped_test_name = test_name.replace(fixture_format_name, "").replace(
                 fork.name(), ""
             )
             return f"{test_file_path}::{stripped_test_name}"
-    raise Exception(f"Fixture format name not found in test {node_id}")
+    raise FixtureFormatNotInNodeIdError(f"Fixture format name not found in test {node_id}")
 
 
 @pytest.fixture(scope="function")
@@ -414,18 +454,31 @@ def eoa_iterator(
         default=False,
     ) or request.config.getoption("use_pre_alloc_groups", default=False):
         # Use a starting address that is derived from the test node
-        eoa_start_pk = sha256_from_string(node_id_for_entropy)
-        return iter(
-            EOA(
-                key=(eoa_start_pk + i)
-                % 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,
-                nonce=0,
-            )
-            for i in count()
+        return pre_alloc_group_eoa_iterator(
+            sha256_from_string(node_id_for_entropy),
+            getattr(request.config, "eoa_address_table", None),
         )
     return iter(eoa_by_index(i).copy() for i in count())
 
 
+def pre_alloc_group_eoa_iterator(
+    eoa_start_pk: int, eoa_address_table: EOAAddressTable | None
+) -> Iterator[EOA]:
+    """
+    Return iterator over the EOAs of a test in pre-allocation group mode,
+    taking the addresses of the first EOAs from the table if it contains them.
+    """
+    addresses = eoa_address_table.addresses(eoa_start_pk) if eoa_address_table else []
+    return iter(
+        EOA(
+            addresses[i] if i < len(addresses) else None,
+            key=eoa_key(eoa_start_pk, i),
+            nonce=0,
+        )
+        for i in count()
+    )
+
+
 @pytest.fixture(autouse=True)
 def evm_code_type(request: pytest.FixtureRequest) -> EVMCodeType:
     """Return default EVM code type for all tests (LEGACY)."""
@@ -0,0 +1,63 @@
+"""
+Pytest plugin that persists the signatures of the transactions and
+authorization tuples across fill sessions.
+
+The signatures are cached by `ethereum_test_types.signature_cache` for the
+duration of a process. With `--signature-cache`, every process (including
+each xdist worker) loads the signatures stored in pytest's cache directory
+when it starts, and appends the signatures it computed when it finishes.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from ethereum_test_types.signature_cache import signature_cache
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command-line options to pytest."""
+    signature_cache_group = parser.getgroup(
+        "signature_cache", "Arguments defining the signature cache"
+    )
+    signature_cache_group.addoption(
+        "--signature-cache",
+        action="store_true",
+        dest="signature_cache",
+        default=False,
+        help=(
+            "Store the signatures of the transactions and authorizations in pytest's cache "
+            "directory and reuse them in later sessions. Cleared by --cache-clear."
+        ),
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Load the stored signatures if requested."""
+    if not config.getoption("signature_cache"):
+        return
+    if not hasattr(config, "cache"):
+        pytest.exit(
+            "The signature cache requires pytest's cacheprovider plugin.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    path = config.cache.mkdir("fill-signature-cache") / "signatures.bin"
+    config.pluginmanager.register(SignatureCachePlugin(path), "signature-cache")
+
+
+class SignatureCachePlugin:
+    """Pytest plugin class that stores the new signatures of the session."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Load the stored signatures into the signature cache and record the
+        new signatures to save.
+        """
+        self.path = path
+        signature_cache.persistent = True
+        signature_cache.load(path)
+
+    def pytest_sessionfinish(self) -> None:
+        """Append the signatures computed in this process to the file."""
+        signature_cache.save(self.path)
@@ -22,7 +22,8 @@ from ethereum_test_specs import BaseStaticTest, BaseTest
 from ethereum_test_tools.tools_code.yul import Yul
 
 from ..forks.forks import ValidityMarker
-from ..shared.helpers import labeled_format_parameter_set
+from ..shared.helpers import get_spec_format_for_item, labeled_format_parameter_set
+from .collection_cache import deserialize_mark, get_forks_by_name, serialize_mark
 
 
 def get_test_id_from_arg_names_and_values(
@@ -154,156 +155,194 @@ class FillerFile(pytest.File):
     test fixtures.
     """
 
+    fill_functions: Dict[str, Callable] | None = None
+
+    def load(self) -> Dict[str, Any]:
+        """Load the test cases of the static file."""
+        with open(self.path, "r") as file:
+            return (
+                json.load(file)
+                if self.path.suffix == ".json"
+                else yaml.load(file, Loader=NoIntResolver)
+            )
+
+    def fill_function(self, key: str) -> Callable:
+        """
+        Return the fill function of a test case of the static file, parsing
+        the file on first use.
+        """
+        if self.fill_functions is None:
+            self.fill_functions = {
+                test_key: BaseStaticTest.model_validate(test_case).fill_function()
+                for test_key, test_case in self.load().items()
+            }
+        return self.fill_functions[key]
+
     def collect(self: "FillerFile") -> Generator["FillerTestItem", None, None]:
-        """Collect test cases from a single static file."""
+        """
+        Collect test cases from a single static file, or rebuild them from the
+        collection cache if the file is unchanged.
+        """
         if not self.path.stem.endswith("Filler"):
             return
-        with open(self.path, "r") as file:
-            try:
-                loaded_file = (
-                    json.load(file)
-                    if self.path.suffix == ".json"
-                    else yaml.load(file, Loader=NoIntResolver)
-                )
-                for key in loaded_file:
-                    filler = BaseStaticTest.model_validate(loaded_file[key])
-
-                    func = filler.fill_function()
-
-                    function_marks: List[pytest.Mark] = []
-                    if hasattr(func, "pytestmark"):
-                        function_marks = func.pytestmark[:]
-                    parametrize_marks: List[pytest.Mark] = [
-                        mark for mark in function_marks if mark.name == "parametrize"
-                    ]
-
-                    func_parameters = inspect.signature(func).parameters
-
-                    fixture_formats: List[Type[BaseFixture] | LabeledFixtureFormat] = []
-                    spec_parameter_name = ""
-                    for test_type in BaseTest.spec_types.values():
-                        if test_type.pytest_parameter_name() in func_parameters:
-                            assert not spec_parameter_name, "Multiple spec parameters found"
-                            spec_parameter_name = test_type.pytest_parameter_name()
-                            session = self.config.filling_session  # type: ignore[attr-defined]
-                            fixture_formats.extend(
-                                fixture_format
-                                for fixture_format in test_type.supported_fixture_formats
-                                if session.should_generate_format(fixture_format)
-                            )
+        collection_cache = getattr(self.config, "collection_cache", None)
+        if collection_cache is not None:
+            entry = collection_cache.get(self.path)
+            if entry is not None and entry.static_items is not None:
+                for static_item in entry.static_items:
+                    yield FillerTestItem.from_cache(self, static_item)
+                return
+        items = list(self.collect_from_file())
+        if collection_cache is not None:
+            static_items = [item.to_cache() for item in items]
+            collection_cache.record_static_items(
+                self.path,
+                None if any(item is None for item in static_items) else static_items,
+            )
+        yield from items
+
+    def collect_from_file(self: "FillerFile") -> Generator["FillerTestItem", None, None]:
+        """Collect test cases by parsing the static file."""
+        try:
+            loaded_file = self.load()
+            for key in loaded_file:
+                filler = BaseStaticTest.model_validate(loaded_file[key])
+
+                func = filler.fill_function()
+
+                function_marks: List[pytest.Mark] = []
+                if hasattr(func, "pytestmark"):
+                    function_marks = func.pytestmark[:]
+                parametrize_marks: List[pytest.Mark] = [
+                    mark for mark in function_marks if mark.name == "parametrize"
+                ]
+
+                func_parameters = inspect.signature(func).parameters
+
+                fixture_formats: List[Type[BaseFixture] | LabeledFixtureFormat] = []
+                spec_parameter_name = ""
+                for test_type in BaseTest.spec_types.values():
+                    if test_type.pytest_parameter_name() in func_parameters:
+                        assert not spec_parameter_name, "Multiple spec parameters found"
+                        spec_parameter_name = test_type.pytest_parameter_name()
+                        session = self.config.filling_session  # type: ignore[attr-defined]
+                        fixture_formats.extend(
+                            fixture_format
+                            for fixture_format in test_type.supported_fixture_formats
+                            if session.should_generate_format(fixture_format)
+                        )
 
-                    test_fork_set = ValidityMarker.get_test_fork_set_from_markers(
-                        iter(function_marks)
+                test_fork_set = ValidityMarker.get_test_fork_set_from_markers(iter(function_marks))
+                if not test_fork_set:
+                    pytest.fail(
+                        "The test function's "
+                        f"'{key}' fork validity markers generate "
+                        "an empty fork range. Please check the arguments to its "
+                        f"markers:  @pytest.mark.valid_from and "
+                        f"@pytest.mark.valid_until."
                     )
-                    if not test_fork_set:
-                        pytest.fail(
-                            "The test function's "
-                            f"'{key}' fork validity markers generate "
-                            "an empty fork range. Please check the arguments to its "
-                            f"markers:  @pytest.mark.valid_from and "
-                            f"@pytest.mark.valid_until."
-                        )
-                    intersection_set = test_fork_set & self.config.selected_fork_set  # type: ignore
-
-                    extra_function_marks: List[pytest.Mark] = [
-                        mark
-                        for mark in function_marks
-                        if mark.name != "parametrize"
-                        and not ValidityMarker.is_validity_or_filter_marker(mark.name)
-                    ]
-
-                    for format_with_or_without_label in fixture_formats:
-                        fixture_format_parameter_set = labeled_format_parameter_set(
-                            format_with_or_without_label
-                        )
-                        fixture_format = (
-                            format_with_or_without_label.format
-                            if isinstance(format_with_or_without_label, LabeledFixtureFormat)
-                            else format_with_or_without_label
-                        )
-                        for fork in sorted(intersection_set):
-                            params: Dict[str, Any] = {spec_parameter_name: fixture_format}
-                            fixturenames = [
-                                spec_parameter_name,
-                            ]
-                            marks: List[pytest.Mark] = [
-                                mark  # type: ignore
-                                for mark in fixture_format_parameter_set.marks
-                                if mark.name != "parametrize"
-                            ]
-                            test_id = f"fork_{fork.name()}-{fixture_format_parameter_set.id}"
-                            if "fork" in func_parameters:
-                                params["fork"] = fork
-                            if "pre" in func_parameters:
-                                fixturenames.append("pre")
-                            if "request" in func_parameters:
-                                fixturenames.append("request")
-
-                            if parametrize_marks:
-                                parameter_names, parameter_set_list = (
-                                    get_all_combinations_from_parametrize_marks(parametrize_marks)
+                intersection_set = test_fork_set & self.config.selected_fork_set  # type: ignore
+
+                extra_function_marks: List[pytest.Mark] = [
+                    mark
+                    for mark in function_marks
+                    if mark.name != "parametrize"
+                    and not ValidityMarker.is_validity_or_filter_marker(mark.name)
+                ]
+
+                for format_with_or_without_label in fixture_formats:
+                    fixture_format_parameter_set = labeled_format_parameter_set(
+                        format_with_or_without_label
+                    )
+                    fixture_format = (
+                        format_with_or_without_label.format
+                        if isinstance(format_with_or_without_label, LabeledFixtureFormat)
+                        else format_with_or_without_label
+                    )
+                    for fork in sorted(intersection_set):
+                        params: Dict[str, Any] = {spec_parameter_name: fixture_format}
+                        fixturenames = [
+                            spec_parameter_name,
+                        ]
+                        marks: List[pytest.Mark] = [
+                            mark  # type: ignore
+                            for mark in fixture_format_parameter_set.marks
+                            if mark.name != "parametrize"
+                        ]
+                        test_id = f"fork_{fork.name()}-{fixture_format_parameter_set.id}"
+                        if "fork" in func_parameters:
+                            params["fork"] = fork
+                        if "pre" in func_parameters:
+                            fixturenames.append("pre")
+                        if "request" in func_parameters:
+                            fixturenames.append("request")
+
+                        if parametrize_marks:
+                            parameter_names, parameter_set_list = (
+                                get_all_combinations_from_parametrize_marks(parametrize_marks)
+                            )
+                            for parameter_set in parameter_set_list:
+                                # Copy and extend the params with the
+                                # parameter set
+                                case_marks = (
+                                    marks[:]
+                                    + [
+                                        mark
+                                        for mark in parameter_set.marks
+                                        if mark.name != "parametrize"
+                                    ]
+                                    + extra_function_marks
+                                )
+                                case_params = params.copy() | dict(
+                                    zip(parameter_names, parameter_set.values, strict=True)
                                 )
-                                for parameter_set in parameter_set_list:
-                                    # Copy and extend the params with the
-                                    # parameter set
-                                    case_marks = (
-                                        marks[:]
-                                        + [
-                                            mark
-                                            for mark in parameter_set.marks
-                                            if mark.name != "parametrize"
-                                        ]
-                                        + extra_function_marks
-                                    )
-                                    case_params = params.copy() | dict(
-                                        zip(parameter_names, parameter_set.values, strict=True)
-                                    )
-
-                                    yield FillerTestItem.from_parent(
-                                        self,
-                                        original_name=key,
-                                        func=func,
-                                        params=case_params,
-                                        fixturenames=fixturenames,
-                                        name=f"{key}[{test_id}-{parameter_set.id}]",
-                                        fork=fork,
-                                        fixture_format=fixture_format,
-                                        marks=case_marks,
-                                    )
-                            else:
+
                                 yield FillerTestItem.from_parent(
                                     self,
                                     original_name=key,
                                     func=func,
-                                    params=params,
+                                    params=case_params,
                                     fixturenames=fixturenames,
-                                    name=f"{key}[{test_id}]",
+                                    name=f"{key}[{test_id}-{parameter_set.id}]",
                                     fork=fork,
                                     fixture_format=fixture_format,
-                                    marks=marks,
+                                    marks=case_marks,
                                 )
-            except Exception as e:
-                pytest.fail(f"Error loading file {self.path} as a test: {e}")
-                warnings.warn(f"Error loading file {self.path} as a test: {e}", stacklevel=1)
-                return
+                        else:
+                            yield FillerTestItem.from_parent(
+                                self,
+                                original_name=key,
+                                func=func,
+                                params=params,
+                                fixturenames=fixturenames,
+                                name=f"{key}[{test_id}]",
+                                fork=fork,
+                                fixture_format=fixture_format,
+                                marks=marks,
+                            )
+        except Exception as e:
+            pytest.fail(f"Error loading file {self.path} as a test: {e}")
+            warnings.warn(f"Error loading file {self.path} as a test: {e}", stacklevel=1)
+            return
 
 
 class FillerTestItem(pytest.Item):
     """Filler test item produced from a single test from a static file."""
 
     originalname: str
-    func: Callable
+    func: Callable | None
     params: Dict[str, Any]
     fixturenames: List[str]
     github_url: str = ""
     fork: Fork
     fixture_format: Type[BaseFixture]
+    marks: List[pytest.Mark]
 
     def __init__(
         self,
         *args: Any,
         original_name: str,
-        func: Callable,
+        func: Callable | None,
         params: Dict[str, Any],
         fixturenames: List[str],
         fork: Fork,
@@ -311,7 +350,11 @@ class FillerTestItem(pytest.Item):
         marks: List[pytest.Mark],
         **kwargs: Any,
     ) -> None:
-        """Initialize the filler test item."""
+        """
+        Initialize the filler test item.
+
+        If `func` is None, it is loaded from the static file on setup.
+        """
         super().__init__(*args, **kwargs)
         self.originalname = original_name
         self.func = func
@@ -319,14 +362,68 @@ class FillerTestItem(pytest.Item):
         self.fixturenames = fixturenames
         self.fork = fork
         self.fixture_format = fixture_format
+        self.marks = marks
         for marker in marks:
             if type(marker) is pytest.Mark:
                 self.own_markers.append(marker)
             else:
                 self.add_marker(marker)  # type: ignore
 
+    def to_cache(self) -> Dict[str, Any] | None:
+        """
+        Return the data required to rebuild the item without parsing the
+        static file, or None if the item can't be cached.
+        """
+        spec_type, _ = get_spec_format_for_item(self.params)
+        spec_parameter_name = spec_type.pytest_parameter_name()
+        params: Dict[str, Any] = {}
+        for name, value in self.params.items():
+            if name in (spec_parameter_name, "fork"):
+                continue
+            if not isinstance(value, (bool, int, str)):
+                return None
+            params[name] = value
+        marks = [serialize_mark(mark) for mark in self.marks]
+        if any(mark is None for mark in marks):
+            return None
+        return {
+            "name": self.name,
+            "original_name": self.originalname,
+            "spec_parameter_name": spec_parameter_name,
+            "fixture_format": self.fixture_format.format_name,
+            "fork": self.fork.name(),
+            "fork_parameter": "fork" in self.params,
+            "params": params,
+            "fixturenames": self.fixturenames,
+            "marks": marks,
+        }
+
+    @classmethod
+    def from_cache(cls, parent: FillerFile, data: Dict[str, Any]) -> "FillerTestItem":
+        """Rebuild an item from the data returned by `to_cache`."""
+        fork = get_forks_by_name()[data["fork"]]
+        fixture_format = BaseFixture.formats[data["fixture_format"]]
+        params: Dict[str, Any] = {data["spec_parameter_name"]: fixture_format}
+        if data["fork_parameter"]:
+            params["fork"] = fork
+        params |= data["params"]
+        return cls.from_parent(
+            parent,
+            original_name=data["original_name"],
+            func=None,
+            params=params,
+            fixturenames=data["fixturenames"],
+            name=data["name"],
+            fork=fork,
+            fixture_format=fixture_format,
+            marks=[deserialize_mark(mark) for mark in data["marks"]],
+        )
+
     def setup(self) -> None:
         """Resolve and apply fixtures before test execution."""
+        if self.func is None:
+            assert isinstance(self.parent, FillerFile)
+            self.func = self.parent.fill_function(self.originalname)
         self._fixtureinfo = self.session._fixturemanager.getfixtureinfo(
             self,
             None,
@@ -344,6 +441,7 @@ class FillerTestItem(pytest.Item):
 
     def runtest(self) -> None:
         """Execute the test logic for this specific static test."""
+        assert self.func is not None
         self.func(**self.params)
 
     def reportinfo(self) -> Tuple[Path, int, str]:
@@ -0,0 +1,154 @@
+"""Test the collection cache of the fill command."""
+
+import json
+import shutil
+import textwrap
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+test_module = textwrap.dedent(
+    """\
+    import pytest
+
+    from ethereum_test_tools import Environment
+
+    @pytest.mark.valid_from("Cancun")
+    @pytest.mark.with_all_tx_types
+    def test_cached(state_test, tx_type) -> None:
+        state_test(env=Environment(), pre={}, post={}, tx=None)
+
+    @pytest.mark.valid_from("Cancun")
+    @pytest.mark.with_all_evm_code_types
+    def test_enum_parameter(state_test, evm_code_type) -> None:
+        state_test(env=Environment(), pre={}, post={}, tx=None)
+    """
+)
+
+STATIC_TEST_FILE = (
+    Path(__file__).parents[4]
+    / "tests"
+    / "static"
+    / "state_tests"
+    / "stExample"
+    / "add11_ymlFiller.yml"
+)
+
+
+@pytest.fixture
+def tests_dir(pytester: pytest.Pytester) -> Path:
+    """Create a Python test module and a static filler file."""
+    tests_dir = pytester.mkdir("tests")
+    module_dir = tests_dir / "cancun" / "cached_module"
+    module_dir.mkdir(parents=True)
+    (module_dir / "test_cached.py").write_text(test_module)
+    static_dir = tests_dir / "static" / "state_tests" / "stExample"
+    static_dir.mkdir(parents=True)
+    (static_dir / "__init__.py").write_text("")
+    shutil.copy(STATIC_TEST_FILE, static_dir)
+    pytester.copy_example(name="src/cli/pytest_commands/pytest_ini_files/pytest-fill.ini")
+    return tests_dir
+
+
+def collect(pytester: pytest.Pytester, *args: str) -> pytest.RunResult:
+    """Collect the tests with the fill configuration."""
+    return pytester.runpytest(
+        "-c",
+        "pytest-fill.ini",
+        "--until",
+        "Prague",
+        "--fill-static-tests",
+        "tests/",
+        "--collect-only",
+        "-q",
+        *args,
+    )
+
+
+def collected_ids(result: pytest.RunResult) -> List[str]:
+    """Return the collected test ids."""
+    return [line for line in result.outlines if "::" in line]
+
+
+def cache_entries(pytester: pytest.Pytester) -> Dict[Path, Dict[str, Any]]:
+    """Return the entries of the collection cache by their path."""
+    cache_dir = pytester.path / ".pytest_cache" / "d" / "fill-collection-cache"
+    return {
+        entry_path: json.loads(entry_path.read_text()) for entry_path in cache_dir.glob("*.json")
+    }
+
+
+def test_collection_cache_reuses_unchanged_files(
+    pytester: pytest.Pytester, tests_dir: Path
+) -> None:
+    """Test that a second session rebuilds the same test cases from cache."""
+    uncached = collect(pytester)
+    assert uncached.ret == 0, "\n".join(uncached.outlines)
+
+    first = collect(pytester, "--collect-cache")
+    assert first.ret == 0, "\n".join(first.outlines)
+    first.stdout.fnmatch_lines(["Collection cache: 0 of 3 files reused."])
+    # The enum values of the EVM code types are not cached.
+    module_entry = next(
+        entry for entry in cache_entries(pytester).values() if entry["path"].endswith(".py")
+    )
+    assert [function_id.split("::")[-1] for function_id in module_entry["fork_parameters"]] == [
+        "test_cached"
+    ]
+
+    second = collect(pytester, "--collect-cache")
+    assert second.ret == 0, "\n".join(second.outlines)
+    second.stdout.fnmatch_lines(["Collection cache: 3 of 3 files reused."])
+    assert collected_ids(second) == collected_ids(first) == collected_ids(uncached)
+    assert any("add11_ymlFiller.yml::add11_yml[fork_Cancun" in i for i in collected_ids(second))
+
+    # Changing a module invalidates its entry only.
+    test_file = tests_dir / "cancun" / "cached_module" / "test_cached.py"
+    test_file.write_text(test_module.replace("Cancun", "Prague"))
+    changed = collect(pytester, "--collect-cache")
+    changed.stdout.fnmatch_lines(["Collection cache: 2 of 3 files reused."])
+    assert not any("test_cached[fork_Cancun" in i for i in collected_ids(changed))
+
+    cleared = collect(pytester, "--collect-cache", "--collect-cache-clear")
+    cleared.stdout.fnmatch_lines(["Collection cache: 0 of 3 files reused."])
+
+
+def test_collection_cache_verify(pytester: pytest.Pytester, tests_dir: Path) -> None:
+    """
+    Test that the verification mode compares the test cases built from the
+    cache with a fresh collection and detects stale cached entries.
+    """
+    del tests_dir
+    assert collect(pytester, "--collect-cache").ret == 0
+
+    verified = collect(pytester, "--collect-cache-verify")
+    assert verified.ret == 0, "\n".join(verified.outlines)
+    verified.stdout.fnmatch_lines(
+        ["Collection cache verified: the test cases of 3 cached files match."]
+    )
+
+    # Drop a fork of every cached test function and a test case of every
+    # cached static file.
+    for entry_path, entry in cache_entries(pytester).items():
+        for fork_names in entry["fork_sets"].values():
+            fork_names.remove("Prague")
+        for fork_parameters in entry["fork_parameters"].values():
+            fork_parameters["parameter_sets"] = [
+                parameter_set
+                for parameter_set in fork_parameters["parameter_sets"]
+                if "Prague" not in parameter_set["values"]
+            ]
+        if entry["static_items"]:
+            entry["static_items"].pop()
+        entry_path.write_text(json.dumps(entry))
+
+    stale = collect(pytester, "--collect-cache-verify")
+    assert stale.ret == pytest.ExitCode.TESTS_FAILED
+    stale.stdout.fnmatch_lines(
+        [
+            "*cached test cases differ for:*",
+            "*tests/cancun/cached_module/test_cached.py",
+            "*tests/static/state_tests/stExample/add11_ymlFiller.yml*",
+        ]
+    )
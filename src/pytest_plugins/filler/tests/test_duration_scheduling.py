@@ -0,0 +1,144 @@
+"""Test the duration-aware scheduling of the fill command."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from ethereum_test_types import EnvironmentDefaults
+
+from .. import duration_scheduling
+from ..duration_scheduling import (
+    BASE_DURATION,
+    FORMAT_WEIGHTS,
+    DurationHistory,
+    DurationScheduling,
+    fixture_format_weight,
+    heuristic_duration,
+    predicted_makespan,
+)
+
+
+class FakeConfig:
+    """Configuration with the options read by the xdist load scheduler."""
+
+    def __init__(self, workers: int):
+        """Initialize the configuration for the number of workers."""
+        self.options: Dict[str, Any] = {"tx": [f"{workers}*popen"], "maxschedchunk": None}
+
+    def getvalue(self, name: str) -> Any:
+        """Return the value of an option."""
+        return self.options[name]
+
+    def getoption(self, name: str) -> Any:
+        """Return the value of an option."""
+        return self.options[name]
+
+
+class FakeNode:
+    """Worker that records the indices of the tests sent to it."""
+
+    def __init__(self, name: str):
+        """Initialize the worker."""
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent: List[int] = []
+
+    def send_runtest_some(self, indices: List[int]) -> None:
+        """Record the tests sent to the worker."""
+        self.sent.extend(indices)
+
+    def shutdown(self) -> None:
+        """Mark the worker as shutting down."""
+        self.shutting_down = True
+
+
+def test_fixture_format_weight() -> None:
+    """Test that the fixture format is read from the test id."""
+    assert fixture_format_weight("tests/a.py::test_a[fork_Cancun-state_test]") == 1.0
+    assert (
+        fixture_format_weight("tests/a.py::test_a[fork_Cancun-blockchain_test_engine-x]")
+        == FORMAT_WEIGHTS["blockchain_test_engine"]
+    )
+    assert fixture_format_weight("tests/a.py::test_a") == 1.0
+
+
+@pytest.mark.parametrize(
+    "nodeid,expected_duration",
+    [
+        ("tests/cancun/a.py::test_a[fork_Cancun-state_test]", BASE_DURATION),
+        (
+            "tests/cancun/a.py::test_a[fork_Cancun-blockchain_test]",
+            BASE_DURATION * FORMAT_WEIGHTS["blockchain_test"],
+        ),
+        ("tests/benchmark/a.py::test_a[fork_Prague-state_test]", BASE_DURATION * 20),
+        (
+            "tests/benchmark/a.py::test_a[fork_Prague-state_test-benchmark-gas-value_360M]",
+            BASE_DURATION * 20 * 360_000_000 / EnvironmentDefaults.gas_limit,
+        ),
+    ],
+)
+def test_heuristic_duration(nodeid: str, expected_duration: float) -> None:
+    """Test the duration estimate of tests without history."""
+    assert heuristic_duration(nodeid) == pytest.approx(expected_duration)
+
+
+def test_predicted_makespan() -> None:
+    """Test the makespan of the greedy assignment of the durations."""
+    assert predicted_makespan([], 4) == 0.0
+    assert predicted_makespan([3, 2, 2, 1], 1) == 8
+    assert predicted_makespan([3, 2, 2, 1], 2) == 4
+    assert predicted_makespan([1, 1, 1, 1, 4], 2) == 6
+
+
+def test_duration_history() -> None:
+    """Test the prediction from recorded durations and their fallbacks."""
+    history = DurationHistory(
+        {
+            "tests/a.py::test_a[fork_Cancun-state_test]": 2.0,
+            "tests/a.py::test_a[fork_Prague-state_test]": 4.0,
+        }
+    )
+    assert history.predict("tests/a.py::test_a[fork_Cancun-state_test]") == 2.0
+    assert history.predict("tests/a.py::test_a[fork_Osaka-state_test]") == 3.0
+    assert history.predict("tests/b.py::test_b[fork_Osaka-state_test]") == BASE_DURATION
+    assert not history.has_history("tests/a.py::test_a[fork_Osaka-state_test]")
+
+    history.record("tests/a.py::test_a[fork_Osaka-state_test]", 0.5)
+    history.record("tests/a.py::test_a[fork_Osaka-state_test]", 0.25)
+    assert history.merged()["tests/a.py::test_a[fork_Osaka-state_test]"] == 0.75
+    assert history.merged()["tests/a.py::test_a[fork_Cancun-state_test]"] == 2.0
+
+
+def test_duration_history_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the least recently recorded durations are dropped first."""
+    monkeypatch.setattr(duration_scheduling, "MAX_RECORDED_DURATIONS", 3)
+    history = DurationHistory({"old_1": 1.0, "old_2": 2.0, "old_3": 3.0})
+    history.record("old_1", 1.5)
+    history.record("new_1", 0.5)
+    assert history.merged() == {"old_3": 3.0, "old_1": 1.5, "new_1": 0.5}
+
+
+def test_duration_scheduling_sends_longest_tests_first() -> None:
+    """Test that long tests are sent longest first, one at a time."""
+    durations = {"long_1": 5.0, "long_2": 20.0, "long_3": 10.0}
+    collection = ["short_1", "long_1", "short_2", "long_2", "short_3", "long_3", "short_4"]
+    scheduler = DurationScheduling(
+        FakeConfig(workers=2),  # type: ignore[arg-type]
+        None,
+        lambda nodeid: durations.get(nodeid, 0.1),
+    )
+    nodes = [FakeNode("gw0"), FakeNode("gw1")]
+    for node in nodes:
+        scheduler.add_node(node)  # type: ignore[arg-type]
+        scheduler.add_node_collection(node, collection)  # type: ignore[arg-type]
+
+    scheduler.schedule()
+
+    assert scheduler.predicted_makespan == 20.0
+    assert [collection[i] for i in nodes[0].sent] == ["long_2", "long_1"]
+    assert [collection[i] for i in nodes[1].sent] == ["long_3", "short_1"]
+    assert [collection[i] for i in scheduler.pending] == ["short_2", "short_3", "short_4"]
+
+    scheduler.mark_test_complete(nodes[1], nodes[1].sent[0])  # type: ignore[arg-type]
+    assert [collection[i] for i in nodes[1].sent] == ["long_3", "short_1", "short_2"]
@@ -0,0 +1,98 @@
+"""Test the table of the addresses of the EOAs of pre-allocation groups."""
+
+from itertools import islice
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ethereum_test_types import EOA
+
+from .. import eoa_address_table as eoa_address_table_module
+from ..eoa_address_table import (
+    ADDRESSES_PER_START_KEY,
+    HEADER,
+    KEY_SIZE,
+    SECP256K1N,
+    EOAAddressTable,
+    eoa_key,
+)
+from ..pre_alloc import pre_alloc_group_eoa_iterator, sha256_from_string
+
+
+def start_keys_of_tests(count: int) -> List[int]:
+    """Return the start keys of the EOAs of a number of tests."""
+    return [sha256_from_string(f"tests/test_module.py::test_{i}[]") for i in range(count)]
+
+
+def test_addresses(tmp_path: Path) -> None:
+    """Test that the table contains the derived addresses of the EOAs."""
+    start_keys = start_keys_of_tests(3) + [SECP256K1N - 1 - ADDRESSES_PER_START_KEY]
+    # The keys of the start key wrap around to zero, an invalid private key.
+    invalid_start_key = SECP256K1N - 2
+    table = EOAAddressTable.build(tmp_path / "eoa_addresses.bin", start_keys + [invalid_start_key])
+    assert len(table) == len(start_keys)
+    for start_key in start_keys:
+        assert table.addresses(start_key) == [
+            EOA.address_of_key(eoa_key(start_key, i)) for i in range(ADDRESSES_PER_START_KEY)
+        ]
+    assert table.addresses(invalid_start_key) == []
+    assert table.addresses(1) == []
+
+
+def test_load_or_build(tmp_path: Path) -> None:
+    """Test that a table is extended with the missing start keys."""
+    path = tmp_path / "eoa_addresses.bin"
+    start_keys = start_keys_of_tests(4)
+    table = EOAAddressTable.load_or_build(path, start_keys[:2])
+    assert len(table) == 2
+    data = path.read_bytes()
+    assert EOAAddressTable.load_or_build(path, start_keys[1:2]).addresses(start_keys[1])
+    assert path.read_bytes() == data
+
+    table = EOAAddressTable.load_or_build(path, start_keys[2:])
+    assert len(table) == 4
+    full_table = EOAAddressTable.build(tmp_path / "full.bin", start_keys)
+    assert path.read_bytes() == full_table.path.read_bytes()
+
+
+def test_invalid_table(tmp_path: Path) -> None:
+    """Test that a table with wrong addresses is detected and rebuilt."""
+    path = tmp_path / "eoa_addresses.bin"
+    start_keys = start_keys_of_tests(1)
+    expected_addresses = EOAAddressTable.build(path, start_keys).addresses(start_keys[0])
+    data = bytearray(path.read_bytes())
+    addresses_offset = HEADER.size + KEY_SIZE
+    data[addresses_offset:] = bytes(len(data) - addresses_offset)
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="wrong address"):
+        EOAAddressTable(path)
+    path.write_bytes(bytes(data[:-1]))
+    with pytest.raises(ValueError, match="truncated"):
+        EOAAddressTable(path)
+
+    assert EOAAddressTable.load_or_build(path, start_keys).addresses(start_keys[0]) == (
+        expected_addresses
+    )
+
+
+def test_parallel_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that deriving the addresses in a pool gives the same table."""
+    start_keys = start_keys_of_tests(16)
+    EOAAddressTable.build(tmp_path / "serial.bin", start_keys)
+    monkeypatch.setattr(eoa_address_table_module, "PARALLEL_DERIVATION_MIN_START_KEYS", 4)
+    EOAAddressTable.build(tmp_path / "parallel.bin", start_keys, max_workers=2)
+    assert (tmp_path / "parallel.bin").read_bytes() == (tmp_path / "serial.bin").read_bytes()
+
+
+def test_eoa_iterator(tmp_path: Path) -> None:
+    """Test that the EOAs of a test do not depend on the table."""
+    start_keys = start_keys_of_tests(2)
+    table = EOAAddressTable.build(tmp_path / "eoa_addresses.bin", start_keys[:1])
+    eoa_count = ADDRESSES_PER_START_KEY + 2
+    for start_key in start_keys:
+        expected_eoas = list(islice(pre_alloc_group_eoa_iterator(start_key, None), eoa_count))
+        eoas = list(islice(pre_alloc_group_eoa_iterator(start_key, table), eoa_count))
+        assert eoas == expected_eoas
+        assert [eoa.key for eoa in eoas] == [eoa.key for eoa in expected_eoas]
+        assert all(eoa.nonce == 0 for eoa in eoas)
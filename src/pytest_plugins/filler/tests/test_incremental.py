@@ -0,0 +1,300 @@
+"""Test the incremental mode of the fill command."""
+
+import json
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+
+import pytest
+
+from ethereum_clis import TransitionTool
+from ethereum_test_base_types import Account
+from ethereum_test_fixtures import BlockchainEngineXFixture, PreAllocGroups, StateFixture
+from ethereum_test_forks import Cancun, Prague
+from ethereum_test_types import Alloc, Environment
+
+from ..fixture_output import FixtureOutput
+from ..incremental import (
+    FINGERPRINTS_FILE_NAME,
+    PRE_ALLOC_CONTRIBUTIONS_FILE_NAME,
+    IncrementalFill,
+    IncrementalPreAllocGeneration,
+)
+
+test_module = textwrap.dedent(
+    """\
+    import pytest
+
+    from ethereum_test_tools import Transaction
+
+    @pytest.mark.valid_from("Cancun")
+    @pytest.mark.parametrize("value", [0, 1])
+    def test_incremental(state_test, pre, value) -> None:
+        tx = Transaction(to=0, value=value, gas_limit=21_000, sender=pre.fund_eoa())
+        state_test(pre=pre, post={}, tx=tx)
+    """
+)
+
+
+@pytest.fixture
+def test_paths(pytester: pytest.Pytester) -> Dict[str, Path]:
+    """Create two test modules of which only one is changed later on."""
+    tests_dir = pytester.mkdir("tests")
+    paths = {}
+    for name in ["unchanged", "changed"]:
+        module_dir = tests_dir / "cancun" / f"{name}_module"
+        module_dir.mkdir(parents=True)
+        paths[name] = module_dir / f"test_{name}.py"
+        paths[name].write_text(test_module)
+    pytester.copy_example(name="src/cli/pytest_commands/pytest_ini_files/pytest-fill.ini")
+    return paths
+
+
+@pytest.fixture
+def output_dir(pytester: pytest.Pytester) -> Path:
+    """Return the output directory of the fill sessions."""
+    return pytester.path / "fixtures"
+
+
+@pytest.fixture
+def run_fill(
+    pytester: pytest.Pytester,
+    test_paths: Dict[str, Path],
+    output_dir: Path,
+    default_t8n: TransitionTool,
+) -> Callable[..., pytest.RunResult]:
+    """Return a function that fills the test modules."""
+    del test_paths
+
+    def _run_fill(*args: str) -> pytest.RunResult:
+        return pytester.runpytest(
+            "-c",
+            "pytest-fill.ini",
+            "-m",
+            "state_test",
+            "--until=Prague",
+            f"--output={output_dir}",
+            f"--t8n-server-url={default_t8n.server_url}",
+            "tests/",
+            *args,
+        )
+
+    return _run_fill
+
+
+def fixture_files(output_dir: Path) -> Dict[str, str]:
+    """Return the content of the fixture files of the output directory."""
+    return {
+        str(path.relative_to(output_dir)): path.read_text()
+        for path in sorted(output_dir.glob("state_tests/**/*.json"))
+    }
+
+
+def test_incremental_fill_reuses_unchanged_fixtures(
+    run_fill: Callable[..., pytest.RunResult],
+    test_paths: Dict[str, Path],
+    output_dir: Path,
+) -> None:
+    """Test that a second session only fills the changed test module."""
+    first = run_fill("--incremental")
+    assert first.ret == 0, "\n".join(first.outlines)
+    first.stdout.fnmatch_lines(["Incremental fill: 0 of 8 fixtures reused*"])
+    filled = fixture_files(output_dir)
+    assert len(filled) == 2
+    assert (output_dir / ".meta" / FINGERPRINTS_FILE_NAME).exists()
+
+    second = run_fill("--incremental")
+    assert second.ret == 0, "\n".join(second.outlines)
+    second.stdout.fnmatch_lines(["Incremental fill: 8 of 8 fixtures reused*"])
+    assert fixture_files(output_dir) == filled
+    assert (output_dir / ".meta" / "index.json").exists()
+    assert not FixtureOutput(output_path=output_dir).previous_directory.exists()
+
+    test_paths["changed"].write_text(test_module.replace("[0, 1]", "[0, 2]"))
+    dry_run = run_fill("--incremental-dry-run")
+    assert dry_run.ret == 0, "\n".join(dry_run.outlines)
+    dry_run.stdout.fnmatch_lines(["*test_changed.py::test_incremental*2*: no previous fixture"])
+    dry_run.stdout.fnmatch_lines(["*test_changed.py::test_incremental*0*: test sources changed"])
+    dry_run.stdout.fnmatch_lines(["Incremental fill dry run: 4 of 8 tests would be filled again."])
+    assert fixture_files(output_dir) == filled
+
+    third = run_fill("--incremental")
+    assert third.ret == 0, "\n".join(third.outlines)
+    third.stdout.fnmatch_lines(["Incremental fill: 4 of 8 fixtures reused*"])
+    refilled = fixture_files(output_dir)
+    unchanged_file = "state_tests/cancun/unchanged_module/unchanged/incremental.json"
+    assert refilled[unchanged_file] == filled[unchanged_file]
+
+
+def test_create_directories_moves_previous_fixtures(tmp_path: Path) -> None:
+    """
+    Test that the previous fixtures are moved aside in incremental mode.
+    """
+    output_dir = tmp_path / "fixtures"
+    (output_dir / ".meta").mkdir(parents=True)
+    (output_dir / ".meta" / "index.json").write_text("{}")
+    fixture_output = FixtureOutput(output_path=output_dir, incremental=True)
+
+    fixture_output.create_directories(is_master=True)
+
+    assert not any(output_dir.rglob("*.json"))
+    assert (fixture_output.previous_directory / ".meta" / "index.json").exists()
+    assert fixture_output.previous_directory == tmp_path / "fixtures.previous"
+
+
+def test_create_directories_resumes_incomplete_session(tmp_path: Path) -> None:
+    """
+    Test that the output of an incomplete incremental session is discarded
+    and the fixtures of the session before it are kept.
+    """
+    output_dir = tmp_path / "fixtures"
+    previous_dir = tmp_path / "fixtures.previous"
+    for directory, name in [(previous_dir, "complete.json"), (output_dir, "partial.json")]:
+        (directory / ".meta").mkdir(parents=True)
+        (directory / ".meta" / name).write_text("{}")
+    fixture_output = FixtureOutput(output_path=output_dir, incremental=True)
+
+    fixture_output.create_directories(is_master=True)
+
+    assert not any(output_dir.rglob("*.json"))
+    assert (previous_dir / ".meta" / "complete.json").exists()
+
+
+def test_refill_reason_compares_fingerprints(tmp_path: Path) -> None:
+    """
+    Test that a fixture is only reused if its fingerprint matches, and that
+    the changed inputs are reported otherwise.
+    """
+    (tmp_path / "tests").mkdir()
+    test_file = tmp_path / "tests" / "test_module.py"
+    test_file.write_text("")
+    previous_dir = tmp_path / "fixtures.previous"
+    (previous_dir / ".meta").mkdir(parents=True)
+    (previous_dir / "fixture.json").write_text("{}")
+    item: Any = SimpleNamespace(nodeid="tests/test_module.py::test_0", path=test_file)
+
+    def incremental_fill(version: int) -> IncrementalFill:
+        return IncrementalFill(
+            rootdir=tmp_path,
+            context={"version": version},
+            previous_directory=previous_dir,
+            fingerprints_path=tmp_path / FINGERPRINTS_FILE_NAME,
+        )
+
+    previous = incremental_fill(1)
+    record = {
+        "id": item.nodeid,
+        "fingerprint": previous.fingerprint(item, Prague, StateFixture),
+        "sources": previous.sources_digest(test_file),
+        "path": "fixture.json",
+    }
+    (previous_dir / ".meta" / FINGERPRINTS_FILE_NAME).write_text(
+        f"{json.dumps({'context': previous.context})}\n{json.dumps(record)}\n"
+    )
+
+    assert incremental_fill(1).refill_reason(item, Prague, StateFixture) is None
+    assert incremental_fill(1).refill_reason(item, Cancun, StateFixture) == "fingerprint changed"
+    assert (
+        incremental_fill(2).refill_reason(item, Prague, StateFixture)
+        == "fingerprint version changed"
+    )
+    test_file.write_text("VALUE = 1\n")
+    assert incremental_fill(1).refill_reason(item, Prague, StateFixture) == "test sources changed"
+
+
+def test_incremental_pre_alloc_generation_reuses_unchanged_tests(
+    run_fill: Callable[..., pytest.RunResult],
+    test_paths: Dict[str, Path],
+    output_dir: Path,
+) -> None:
+    """
+    Test that phase 1 only runs the changed tests and rebuilds identical
+    pre-allocation groups.
+    """
+    # Phase 1 only fills the formats that use pre-allocation groups.
+    phase_1_args = ("--generate-pre-alloc-groups", "-m", "blockchain_test_engine_x")
+
+    def pre_alloc_files() -> Dict[str, str]:
+        return {
+            path.name: path.read_text()
+            for path in sorted(
+                FixtureOutput(output_path=output_dir).pre_alloc_groups_folder_path.glob("*.json")
+            )
+        }
+
+    first = run_fill(*phase_1_args, "--incremental")
+    assert first.ret == 0, "\n".join(first.outlines)
+    first.stdout.fnmatch_lines(["Incremental pre-allocation: 0 of 8 tests reused*8 recomputed."])
+    assert (output_dir / ".meta" / PRE_ALLOC_CONTRIBUTIONS_FILE_NAME).exists()
+    groups = pre_alloc_files()
+
+    second = run_fill(*phase_1_args, "--incremental")
+    assert second.ret == 0, "\n".join(second.outlines)
+    second.stdout.fnmatch_lines(["Incremental pre-allocation: 8 of 8 tests reused*0 recomputed."])
+    assert pre_alloc_files() == groups
+
+    test_paths["changed"].write_text(test_module.replace("[0, 1]", "[0, 2]"))
+    third = run_fill(*phase_1_args, "--incremental")
+    assert third.ret == 0, "\n".join(third.outlines)
+    third.stdout.fnmatch_lines(["Incremental pre-allocation: 4 of 8 tests reused*4 recomputed."])
+    incremental_groups = pre_alloc_files()
+    clean = run_fill(*phase_1_args, "--clean")
+    assert clean.ret == 0, "\n".join(clean.outlines)
+    assert pre_alloc_files() == incremental_groups
+
+
+def test_pre_alloc_groups_rebuilt_in_collection_order(tmp_path: Path) -> None:
+    """
+    Test that the groups rebuilt from the recorded contributions are
+    identical to the groups updated in collection order.
+    """
+    test_file = tmp_path / "test_module.py"
+    test_file.write_text("")
+    fork = Prague
+    environment = Environment().set_fork_requirements(fork)
+    system_contract = next(iter(fork.pre_allocation_blockchain()))
+    pres = [
+        Alloc({0x1000: Account(balance=1), system_contract: Account(storage={1: 1})}),
+        Alloc({0x1000: Account(balance=1), 0x2000: Account(code=b"\x00")}),
+        Alloc({0x3000: Account(nonce=1)}),
+    ]
+    hashes = ["0x01", "0x01", "0x02"]
+    nodeids = [f"test_module.py::test_{i}" for i in range(len(pres))]
+
+    expected = PreAllocGroups(root={})
+    for nodeid, pre_alloc_hash, pre in zip(nodeids, hashes, pres, strict=True):
+        expected.add_test(
+            pre_alloc_hash, test_id=nodeid, fork=fork, environment=environment, pre=pre
+        )
+
+    incremental_pre_alloc = IncrementalPreAllocGeneration(
+        rootdir=tmp_path,
+        context={},
+        previous_directory=tmp_path / "fixtures.previous",
+        fingerprints_path=tmp_path / PRE_ALLOC_CONTRIBUTIONS_FILE_NAME,
+    )
+    incremental_pre_alloc.write_context()
+    incremental_pre_alloc.order = {nodeid: i for i, nodeid in enumerate(nodeids)}
+    # Record the contributions in a different order than the collection.
+    for i in reversed(range(len(pres))):
+        item = SimpleNamespace(nodeid=nodeids[i], path=test_file)
+        incremental_pre_alloc.add_pre_alloc(
+            item,  # type: ignore[arg-type]
+            fork,
+            BlockchainEngineXFixture,
+            pre_alloc_hash=hashes[i],
+            environment=environment,
+            pre=pres[i],
+        )
+        incremental_pre_alloc.record(nodeids[i])
+
+    rebuilt, contributed = incremental_pre_alloc.pre_alloc_groups()
+
+    assert contributed == len(pres)
+    assert rebuilt.keys() == expected.keys()
+    for pre_alloc_hash, group in expected.items():
+        assert rebuilt[pre_alloc_hash].model_dump_json(by_alias=True) == group.model_dump_json(
+            by_alias=True
+        )
+    assert rebuilt["0x01"].pre[system_contract].code != b""  # type: ignore[union-attr]
@@ -18,12 +18,15 @@ from ethereum_test_forks import (
     ALL_FORKS,
     ALL_FORKS_WITH_TRANSITIONS,
     Fork,
+    ForkMethodCacheMutationError,
     ForkSetAdapter,
     InvalidForkError,
+    clear_fork_method_caches,
     get_deployed_forks,
     get_selected_fork_set,
     get_transition_forks,
     transition_fork_to,
+    verify_fork_method_caches,
 )
 from pytest_plugins.custom_logging import get_logger
 
@@ -567,6 +570,20 @@ def pytest_report_header(config: pytest.Config, start_path: Any) -> List[str]:
     return header
 
 
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item: pytest.Item) -> None:
+    """
+    Fail the test if it modified a cached result of a fork method, which would
+    change the result for every later test of the session.
+    """
+    del item
+    try:
+        verify_fork_method_caches()
+    except ForkMethodCacheMutationError:
+        clear_fork_method_caches()
+        raise
+
+
 @pytest.fixture(autouse=True)
 def fork(request: pytest.FixtureRequest) -> None:
     """Parametrize test cases by fork."""
@@ -952,10 +969,23 @@ class ValidForBPOForks(ValidityMarker, marker_name="valid_for_bpo_forks", flag=T
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     """Pytest hook used to dynamically generate test cases."""
     test_name = metafunc.function.__name__
-    try:
-        test_fork_set = ValidityMarker.get_test_fork_set_from_metafunc(metafunc)
-    except Exception as e:
-        pytest.fail(f"Error generating tests for {test_name}: {e}")
+    collection_cache = getattr(metafunc.config, "collection_cache", None)
+    cached_fork_set = (
+        collection_cache.fork_set(metafunc.definition.path, metafunc.definition.nodeid)
+        if collection_cache is not None
+        else None
+    )
+    if cached_fork_set is not None:
+        test_fork_set = cached_fork_set
+    else:
+        try:
+            test_fork_set = ValidityMarker.get_test_fork_set_from_metafunc(metafunc)
+        except Exception as e:
+            pytest.fail(f"Error generating tests for {test_name}: {e}")
+        if collection_cache is not None and test_fork_set:
+            collection_cache.record_fork_set(
+                metafunc.definition.path, metafunc.definition.nodeid, test_fork_set
+            )
 
     if not test_fork_set:
         pytest.fail(
@@ -991,27 +1021,44 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
             ]
             metafunc.parametrize("fork", pytest_params, scope="function")
     else:
-        unsupported_forks: Set[Fork] = metafunc.config.unsupported_forks  # type: ignore
-        pytest_params = [
-            (
-                ForkParametrizer(
-                    fork=fork,
-                    marks=[
-                        pytest.mark.skip(
-                            reason=(
-                                f"Fork '{fork}' unsupported by "
-                                f"{metafunc.config.t8n.__class__.__name__}."  # type: ignore
+        cached_parameters = (
+            collection_cache.fork_parameters(metafunc.definition.path, metafunc.definition.nodeid)
+            if collection_cache is not None
+            else None
+        )
+        if cached_parameters is not None:
+            param_names, param_values, indirect = cached_parameters
+        else:
+            unsupported_forks: Set[Fork] = metafunc.config.unsupported_forks  # type: ignore
+            pytest_params = [
+                (
+                    ForkParametrizer(
+                        fork=fork,
+                        marks=[
+                            pytest.mark.skip(
+                                reason=(
+                                    f"Fork '{fork}' unsupported by "
+                                    f"{metafunc.config.t8n.__class__.__name__}."  # type: ignore
+                                )
                             )
-                        )
-                    ],
+                        ],
+                    )
+                    if fork in sorted(unsupported_forks)
+                    else ForkParametrizer(fork=fork)
                 )
-                if fork in sorted(unsupported_forks)
-                else ForkParametrizer(fork=fork)
-            )
-            for fork in sorted(intersection_set)
-        ]
-        add_fork_covariant_parameters(metafunc, pytest_params)
-        parametrize_fork(metafunc, pytest_params)
+                for fork in sorted(intersection_set)
+            ]
+            add_fork_covariant_parameters(metafunc, pytest_params)
+            param_names, param_values, indirect = fork_parameters(metafunc, pytest_params)
+            if collection_cache is not None:
+                collection_cache.record_fork_parameters(
+                    metafunc.definition.path,
+                    metafunc.definition.nodeid,
+                    param_names,
+                    param_values,
+                    indirect,
+                )
+        metafunc.parametrize(param_names, param_values, scope="function", indirect=indirect)
 
 
 def add_fork_covariant_parameters(
@@ -1081,8 +1128,13 @@ def parameters_from_fork_parametrizer_list(
     return param_names, param_values
 
 
-def parametrize_fork(metafunc: Metafunc, fork_parametrizers: List[ForkParametrizer]) -> None:
-    """Add the fork parameters to the test function."""
+def fork_parameters(
+    metafunc: Metafunc, fork_parametrizers: List[ForkParametrizer]
+) -> Tuple[List[str], List[ParameterSet], List[str]]:
+    """
+    Return the names, values and indirect names of the fork parameters of the
+    test function.
+    """
     param_names, param_values = parameters_from_fork_parametrizer_list(fork_parametrizers)
 
     # Collect all parameters that should be indirect from the decorators
@@ -1095,4 +1147,4 @@ def parametrize_fork(metafunc: Metafunc, fork_parametrizers: List[ForkParametriz
             # Add all argnames from this decorator to indirect list
             indirect.extend(covariant_descriptor.marker_parameter_names)
 
-    metafunc.parametrize(param_names, param_values, scope="function", indirect=indirect)
+    return param_names, param_values, indirect
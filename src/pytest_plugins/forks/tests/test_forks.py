@@ -201,3 +201,24 @@ def test_from_paris_until_paris_option_no_validity_marker(
         skipped=0,
         errors=0,
     )
+
+
+def test_cached_fork_method_mutation(pytester: pytest.Pytester) -> None:
+    """Test that a test modifying a cached fork method result fails."""
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.valid_at("Prague")
+        def test_mutation(fork):
+            fork.precompiles().pop()
+
+        @pytest.mark.valid_at("Prague")
+        def test_after_mutation(fork):
+            assert len(fork.precompiles()) == 17
+        """
+    )
+    result = pytester.runpytest("-p", "pytest_plugins.forks.forks", "--until=Prague", "-v")
+    result.assert_outcomes(passed=2, errors=1)
+    result.stdout.fnmatch_lines(["*ERROR at teardown of test_mutation*"])
+    result.stdout.fnmatch_lines(["*ForkMethodCacheMutationError*Prague.precompiles()*"])
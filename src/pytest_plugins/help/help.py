@@ -86,6 +86,10 @@ def pytest_configure(config: pytest.Config) -> None:
                 "solc",
                 "fork range",
                 "filler location",
+                "collection cache",
+                "incremental filling",
+                "test scheduling",
+                "signature cache",
                 "defining debug",
                 "pre-allocation behavior during test filling",
                 "ported",
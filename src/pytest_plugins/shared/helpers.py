@@ -3,10 +3,12 @@
 from typing import Any, Dict, Tuple, Type
 
 import pytest
+from _pytest.compat import NotSetType
 from _pytest.mark.structures import ParameterSet
 
 from ethereum_test_execution import ExecuteFormat, LabeledExecuteFormat
-from ethereum_test_fixtures import FixtureFormat, LabeledFixtureFormat
+from ethereum_test_fixtures import BaseFixture, FixtureFormat, LabeledFixtureFormat
+from ethereum_test_forks import Fork
 from ethereum_test_tools import BaseTest
 
 
@@ -74,3 +76,18 @@ def get_spec_format_for_item(
         if spec_type.pytest_parameter_name() in params:
             return spec_type, params[spec_type.pytest_parameter_name()]
     raise ValueError("No spec type format found in the test item.")
+
+
+def item_fork_and_format(item: pytest.Item) -> Tuple[Fork, Type[BaseFixture]] | None:
+    """Return the fork and the fixture format of a test, if it fills one."""
+    params: Dict[str, Any] | None = None
+    if isinstance(item, pytest.Function):
+        params = item.callspec.params if hasattr(item, "callspec") else None
+    elif hasattr(item, "params"):
+        params = item.params
+    if not params or params.get("fork") is None:
+        return None
+    _, fixture_format = get_spec_format_for_item(params)
+    if isinstance(fixture_format, NotSetType):
+        return None
+    return params["fork"], fixture_format
@@ -1,3 +1,3 @@
-from .methods import is_xdist_worker
+from .methods import get_xdist_worker_id, is_xdist_worker
 
-__all__ = ("is_xdist_worker",)
+__all__ = ("get_xdist_worker_id", "is_xdist_worker")
@@ -1,3 +1,4 @@
 import pytest
 
 def is_xdist_worker(session: pytest.Session) -> bool: ...
+def get_xdist_worker_id(request_or_session: pytest.FixtureRequest | pytest.Session) -> str: ...
@@ -0,0 +1,6 @@
+from typing import Any
+
+class Producer:
+    def __init__(self, name: str, *, enabled: bool = True) -> None: ...
+    def __call__(self, *a: Any, **k: Any) -> None: ...
+    def __getattr__(self, name: str) -> "Producer": ...
@@ -0,0 +1,3 @@
+from .load import LoadScheduling
+
+__all__ = ("LoadScheduling",)
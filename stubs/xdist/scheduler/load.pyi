@@ -0,0 +1,29 @@
+import pytest
+
+from ..remote import Producer
+from ..workermanage import WorkerController
+
+class LoadScheduling:
+    numnodes: int
+    node2collection: dict[WorkerController, list[str]]
+    node2pending: dict[WorkerController, list[int]]
+    pending: list[int]
+    collection: list[str] | None
+    log: Producer
+    config: pytest.Config
+    maxschedchunk: int | None
+
+    def __init__(self, config: pytest.Config, log: Producer | None = None) -> None: ...
+    @property
+    def nodes(self) -> list[WorkerController]: ...
+    @property
+    def collection_is_completed(self) -> bool: ...
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None: ...
+    def schedule(self) -> None: ...
+    def _send_tests(self, node: WorkerController, num: int) -> None: ...
+    def _check_nodes_have_same_collection(self) -> bool: ...
+    def add_node(self, node: WorkerController) -> None: ...
+    def add_node_collection(self, node: WorkerController, collection: list[str]) -> None: ...
+    def mark_test_complete(
+        self, node: WorkerController, item_index: int, duration: float = 0
+    ) -> None: ...
@@ -0,0 +1,8 @@
+from typing import Any, Sequence
+
+class WorkerController:
+    gateway: Any
+    shutting_down: bool
+
+    def send_runtest_some(self, indices: Sequence[int]) -> None: ...
+    def shutdown(self) -> None: ...